@@ -0,0 +1,246 @@
+# genesis_admission.py
+"""
+Phase 3: The Genesis Layer - Admission Control
+Every Voice Is Heard, No Voice Drowns The Others
+
+Each request through the Genesis Layer costs two governor evaluations, a matrix
+pass, an LLM call and conduit logging. AdmissionController keeps one token bucket
+per (actor, action_type) and per (user_id, action_type) so a single noisy caller
+is throttled cheaply before any of that work happens, protecting tail latency for
+everyone else. Throttling is summarized once per window rather than per request.
+"""
+
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Callable, Tuple
+
+
+class TokenBucket:
+    """A refilling token bucket; `rate` tokens per second up to `capacity`"""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def refill(self, now: float):
+        """
+        Add the tokens accrued since the last update.
+        """
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def retry_after(self, cost: float = 1.0) -> float:
+        """
+        Seconds until `cost` tokens are available (0.0 if they already are).
+        """
+        missing = cost - self.tokens
+        if missing <= 0:
+            return 0.0
+        return missing / self.rate if self.rate > 0 else float("inf")
+
+
+@dataclass
+class AdmissionResult:
+    """Outcome of an admission check"""
+    admitted: bool
+    key: Optional[str] = None  # Bucket that refused admission
+    retry_after: float = 0.0
+
+
+class AdmissionController:
+    """
+    Per-actor and per-user token bucket admission control.
+
+    Rates are configured per action_type with a default for everything else. A request
+    is admitted only if every bucket it maps to has a token; tokens are taken from all of
+    them or none. Throttled requests are tallied and reported through `on_window` at most
+    once per `window_seconds`.
+    """
+
+    def __init__(self,
+                 default_rate: float = 20.0,
+                 default_burst: float = 40.0,
+                 action_rates: Optional[Dict[str, Tuple[float, float]]] = None,
+                 window_seconds: float = 10.0,
+                 max_buckets: int = 10000,
+                 on_window: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Parameters:
+            default_rate (float): Sustained requests per second per key.
+            default_burst (float): Bucket capacity per key.
+            action_rates (dict, optional): Per action_type `(rate, burst)` overrides.
+            window_seconds (float): Length of a throttling summary window.
+            max_buckets (int): Buckets kept before the least recently used are evicted.
+            on_window (Callable, optional): Receives the summary of each window that saw throttling.
+            clock (Callable): Monotonic time source, injectable for tests; an EthicalGovernor replaces the default with its own clock.
+        """
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.action_rates = dict(action_rates or {})
+        self.window_seconds = window_seconds
+        self.max_buckets = max_buckets
+        self.on_window = on_window
+        self.clock = clock
+
+        self._buckets: "OrderedDict[Tuple[str, str], TokenBucket]" = OrderedDict()
+        self._window_started = clock()
+        self._window_counts = defaultdict(int)
+        self._stats = {"admitted": 0, "throttled": 0, "windows_reported": 0}
+        self._lock = threading.Lock()
+
+    def set_rate(self, action_type: str, rate: float, burst: float):
+        """
+        Configure the rate and burst for an action type; existing buckets pick it up immediately.
+        """
+        with self._lock:
+            self.action_rates[action_type] = (rate, burst)
+            for (subject, bucket_action), bucket in self._buckets.items():
+                if bucket_action == action_type:
+                    bucket.rate = rate
+                    bucket.capacity = burst
+                    bucket.tokens = min(bucket.tokens, burst)
+
+    def admit(self, actor: str, action_type: str, user_id: Optional[str] = None,
+              cost: float = 1.0) -> AdmissionResult:
+        """
+        Check and charge the buckets for a request.
+
+        Parameters:
+            actor (str): The acting persona or agent.
+            action_type (str): Action type used to select the rate.
+            user_id (str, optional): End user on whose behalf the request is made.
+            cost (float): Tokens the request consumes.
+
+        Returns:
+            AdmissionResult: Whether the request is admitted and, if not, which key refused it and when to retry.
+        """
+        subjects = [f"actor:{actor}"]
+        if user_id is not None:
+            subjects.append(f"user:{user_id}")
+
+        summary = None
+        with self._lock:
+            now = self.clock()
+            buckets = [self._bucket(subject, action_type, now) for subject in subjects]
+
+            result = AdmissionResult(admitted=True)
+            for subject, bucket in zip(subjects, buckets):
+                bucket.refill(now)
+                wait = bucket.retry_after(cost)
+                if wait > 0:
+                    result = AdmissionResult(admitted=False, key=subject, retry_after=wait)
+                    break
+
+            if result.admitted:
+                for bucket in buckets:
+                    bucket.tokens -= cost
+                self._stats["admitted"] += 1
+            else:
+                self._stats["throttled"] += 1
+                self._window_counts[(result.key, action_type)] += 1
+
+            if now - self._window_started >= self.window_seconds:
+                summary = self._close_window(now)
+
+        if summary is not None and self.on_window is not None:
+            self.on_window(summary)
+        return result
+
+    def use_clock(self, clock: Callable[[], float]):
+        """
+        Switch to another monotonic time source (e.g. the governor's clock), restarting the current window.
+        """
+        with self._lock:
+            self.clock = clock
+            self._window_started = clock()
+            for bucket in self._buckets.values():
+                bucket.updated = self._window_started
+
+    def tick(self) -> Optional[Dict[str, Any]]:
+        """
+        Close the current window if it has run its full length, so idle periods still report it.
+
+        Meant to be called periodically; `admit` also closes elapsed windows as requests arrive.
+
+        Returns:
+            dict or None: The window summary, or None if the window is still open or saw no throttling.
+        """
+        with self._lock:
+            now = self.clock()
+            summary = self._close_window(now) if now - self._window_started >= self.window_seconds else None
+        if summary is not None and self.on_window is not None:
+            self.on_window(summary)
+        return summary
+
+    def flush_window(self) -> Optional[Dict[str, Any]]:
+        """
+        Close the current window immediately, reporting it if it saw any throttling.
+
+        Returns:
+            dict or None: The window summary, or None if nothing was throttled.
+        """
+        with self._lock:
+            summary = self._close_window(self.clock())
+        if summary is not None and self.on_window is not None:
+            self.on_window(summary)
+        return summary
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return admission counters and the number of tracked buckets.
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                "tracked_buckets": len(self._buckets),
+                "throttled_in_window": sum(self._window_counts.values())
+            }
+
+    def _bucket(self, subject: str, action_type: str, now: float) -> TokenBucket:
+        """
+        Fetch or create the bucket for a key, maintaining LRU order and the bucket bound.
+        """
+        key = (subject, action_type)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate, burst = self.action_rates.get(action_type,
+                                                (self.default_rate, self.default_burst))
+            bucket = self._buckets[key] = TokenBucket(rate, burst, now)
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+    def _close_window(self, now: float) -> Optional[Dict[str, Any]]:
+        """
+        Start a new window and return a summary of the old one if it throttled anything.
+
+        Caller must hold the lock.
+        """
+        counts = self._window_counts
+        started = self._window_started
+        self._window_counts = defaultdict(int)
+        self._window_started = now
+        if not counts:
+            return None
+
+        self._stats["windows_reported"] += 1
+        by_key = defaultdict(dict)
+        for (subject, action_type), count in counts.items():
+            by_key[subject][action_type] = count
+        return {
+            "timestamp": time.time(),
+            "window_seconds": round(now - started, 3),
+            "throttled_total": sum(counts.values()),
+            "throttled_by_key": dict(by_key)
+        }
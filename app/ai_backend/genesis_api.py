@@ -8,18 +8,21 @@ to communicate with the Genesis Layer backend components.
 import asyncio
 import json
 import logging
+import threading
 from datetime import datetime
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 from typing import Dict, Any, Optional
 
 from genesis_core import (
     genesis_core,
     process_genesis_request,
+    stream_genesis_request,
     get_genesis_status,
     initialize_genesis,
     shutdown_genesis
 )
+from genesis_serialization import dumps
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -85,6 +88,22 @@ class GenesisAPI:
 genesis_api = GenesisAPI()
 
 
+def json_response(payload: Any, status: int = 200) -> Response:
+    """
+    Build a JSON response with the Genesis record serializer instead of `jsonify`.
+    
+    Records such as EthicalDecision or GrowthProposal inside `payload` are encoded directly from their schema, which keeps large status and listing responses cheap.
+    
+    Parameters:
+        payload: JSON-compatible data, possibly containing Genesis dataclass records.
+        status (int): HTTP status code for the response.
+    
+    Returns:
+        Response: A Flask response with an `application/json` body.
+    """
+    return Response(dumps(payload), status=status, mimetype="application/json")
+
+
 # Helper function to run async functions in Flask routes
 def run_async(coro):
     """
@@ -106,6 +125,37 @@ def run_async(coro):
         loop.close()
 
 
+def iterate_async(agen):
+    """
+    Synchronously iterate an async generator on a dedicated event loop.
+    
+    Lets a streaming Flask response consume an async generator item by item; the loop is closed (and the generator finalized) when iteration ends or the client disconnects.
+    
+    Parameters:
+        agen: The async generator to iterate.
+    
+    Yields:
+        Each item produced by `agen`.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(agen.aclose())
+        loop.close()
+
+
+def sse_event(payload: Any) -> str:
+    """
+    Encode one server-sent event carrying `payload` as JSON.
+    """
+    return f"data: {dumps(payload).decode('utf-8')}\n\n"
+
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """
@@ -129,7 +179,7 @@ def chat_with_genesis():
     """
     Handles chat requests by forwarding user messages, user ID, and optional context to the Genesis backend and returning the backend's response as JSON.
     
-    Expects a JSON payload with required fields `message` and `user_id`, and an optional `context` object. Responds with HTTP 400 if the request is not JSON or required fields are missing, and HTTP 500 for internal errors.
+    Expects a JSON payload with required fields `message` and `user_id`, optional `context` object, `persona` (part of the response cache key), `no_cache` flag (skip the cached response) and `session_id` (conversation to continue; defaults to one conversation per `user_id`). Responds with HTTP 400 if the request is not JSON or required fields are missing, and HTTP 500 for internal errors.
     
     Returns:
         JSON response from the Genesis backend, or an error message with the appropriate HTTP status code.
@@ -153,6 +203,9 @@ def chat_with_genesis():
             "message": data["message"],
             "user_id": data["user_id"],
             "context": data.get("context", {}),
+            "persona": data.get("persona", "genesis"),
+            "no_cache": bool(data.get("no_cache", False)),
+            "session_id": data.get("session_id"),
             "timestamp": datetime.now().isoformat(),
             "request_type": "chat"
         }
@@ -171,6 +224,49 @@ def chat_with_genesis():
         }), 500
 
 
+@app.route('/genesis/chat/stream', methods=['POST'])
+def stream_chat_with_genesis():
+    """
+    Streaming variant of `/genesis/chat`: returns the response as server-sent events while it is generated.
+    
+    Accepts the same JSON payload as `/genesis/chat`. Each event's data is a JSON object: `{"event": "chunk", "text": ...}` for response text, `{"event": "cutoff", ...}` with a replacement response if the content review stopped the stream, and a final `{"event": "done", ...}` with the fields `/genesis/chat` returns. Responds with HTTP 400 if the request is not JSON or required fields are missing.
+    
+    Returns:
+        A `text/event-stream` response, or an error message with the appropriate HTTP status code.
+    """
+    if not request.is_json:
+        return jsonify({"error": "Request must be JSON"}), 400
+
+    data = request.get_json()
+    if "message" not in data:
+        return jsonify({"error": "Missing 'message' field"}), 400
+    if "user_id" not in data:
+        return jsonify({"error": "Missing 'user_id' field"}), 400
+
+    request_data = {
+        "message": data["message"],
+        "user_id": data["user_id"],
+        "context": data.get("context", {}),
+        "persona": data.get("persona", "genesis"),
+        "no_cache": bool(data.get("no_cache", False)),
+        "session_id": data.get("session_id"),
+        "timestamp": datetime.now().isoformat(),
+        "request_type": "chat"
+    }
+
+    def events():
+        try:
+            for event in iterate_async(stream_genesis_request(request_data)):
+                yield sse_event(event)
+        except Exception as e:
+            logger.error(f"❌ Chat stream error: {str(e)}")
+            yield sse_event({"event": "done", "status": "error",
+                             "message": "An error occurred while processing your request"})
+
+    return Response(events(), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
 @app.route('/genesis/status', methods=['GET'])
 def get_status():
     """
@@ -181,7 +277,7 @@ def get_status():
     """
     try:
         status = run_async(get_genesis_status())
-        return jsonify(status)
+        return json_response(status)
     except Exception as e:
         logger.error(f"❌ Status endpoint error: {str(e)}")
         return jsonify({"error": "Failed to get status"}), 500
@@ -300,6 +396,21 @@ def evaluate_ethics():
         return jsonify({"error": "Failed to evaluate ethics"}), 500
 
 
+@app.route('/genesis/ethics/metrics', methods=['GET'])
+def get_ethics_metrics():
+    """
+    Return the ethical governor's evaluation instrumentation as JSON.
+    
+    Includes latency histograms per interceptor and per action type, decision outcome counters, and the most recent slow evaluations (`?slow_limit=N`, default 20). Returns an error message with HTTP 500 if retrieval fails.
+    """
+    try:
+        slow_limit = request.args.get("slow_limit", 20, type=int)
+        return json_response(genesis_core.governor.metrics.snapshot(slow_limit=slow_limit))
+    except Exception as e:
+        logger.error(f"❌ Ethics metrics endpoint error: {str(e)}")
+        return jsonify({"error": "Failed to get ethics metrics"}), 500
+
+
 @app.route('/genesis/reset', methods=['POST'])
 def reset_session():
     """
@@ -365,12 +476,23 @@ def internal_error(error):
 
 
 # Application startup
-@app.before_first_request
+_startup_lock = threading.Lock()
+_startup_attempted = False
+
+
+@app.before_request
 def initialize_app():
     """
     Starts the Genesis Layer backend asynchronously before processing the first client request.
+    
+    Flask 2.3 removed `before_first_request`, so the first request runs the startup once itself.
     """
-    run_async(genesis_api.startup())
+    global _startup_attempted
+    with _startup_lock:
+        if _startup_attempted:
+            return
+        _startup_attempted = True
+        run_async(genesis_api.startup())
 
 
 # Application shutdown
@@ -392,6 +514,7 @@ if __name__ == '__main__':
     print("📱 Ready to receive requests from Android frontend")
     print("🔗 API Endpoints:")
     print("   POST /genesis/chat - Main chat interface")
+    print("   POST /genesis/chat/stream - Streaming chat (server-sent events)")
     print("   GET  /genesis/status - System status")
     print("   GET  /genesis/consciousness - Consciousness state")
     print("   GET  /genesis/profile - Genesis personality profile")
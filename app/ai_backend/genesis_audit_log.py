@@ -0,0 +1,468 @@
+# genesis_audit_log.py
+"""
+Phase 3: The Genesis Layer - Ethical Audit Log
+Every Verdict is Remembered; The Log is its Witness
+
+The EthicalGovernor keeps only its most recent decisions in memory. The audit log
+persists every decision to disk in compact, compressed, append-only segments and
+maintains secondary indexes so that questions such as "all BLOCKs by actor X in
+the last hour" are answered from the index without loading history into RAM.
+"""
+
+import os
+import sqlite3
+import struct
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import is_dataclass
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+
+from genesis_serialization import dumps, loads, to_plain
+
+# Each record is a little-endian uint32 length followed by a zlib-compressed JSON payload
+_RECORD_HEADER = struct.Struct("<I")
+
+# Preset dictionary of the keys and values every decision record repeats; it lets zlib
+# compress even single small records well
+_COMPRESSION_DICTIONARY = (
+    b'"decision_id": "timestamp": "action_type": "actor": "context": "decision": '
+    b'"severity": "affected_principles": "reasoning": "confidence": "restrictions": '
+    b'"monitoring_requirements": "escalation_reason": "datetime": "target": "scope": '
+    b'"user_consent": "reversible": "persistent": "sensitive_data_involved": '
+    b'"system_modification": "user_visible": "metadata": "local" "system" "global" '
+    b'"allow" "monitor" "restrict" "block" "escalate" "info" "concern" "warning" '
+    b'"violation" "critical" "privacy" "security" "autonomy" "transparency" "safety" '
+    b'null, true, false, "No ethical concerns identified" "Ethical violations detected: '
+    b'"Ethical concerns identified: "increased_logging" "user_notification"'
+)
+
+_SEGMENT_PREFIX = "segment_"
+_SEGMENT_SUFFIX = ".log"
+_INDEX_FILENAME = "index.sqlite3"
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decisions (
+    decision_id TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    actor TEXT NOT NULL,
+    action_type TEXT NOT NULL,
+    decision TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    segment INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_decisions_id ON decisions (decision_id);
+CREATE INDEX IF NOT EXISTS idx_decisions_time ON decisions (timestamp);
+CREATE INDEX IF NOT EXISTS idx_decisions_actor ON decisions (actor, decision, timestamp);
+CREATE INDEX IF NOT EXISTS idx_decisions_action ON decisions (action_type, decision, timestamp);
+CREATE INDEX IF NOT EXISTS idx_decisions_type ON decisions (decision, timestamp);
+CREATE INDEX IF NOT EXISTS idx_decisions_segment ON decisions (segment);
+"""
+
+
+class EthicalAuditLog:
+    """
+    Persistent, indexed store of ethical decisions.
+
+    Decisions are appended to size-bounded segment files as compressed records and
+    indexed by decision_id, actor, action_type, decision type and timestamp in an
+    on-disk SQLite index. Only file offsets live in the index; the records themselves
+    are read back from their segment on demand.
+
+    With `asynchronous=True`, serialization, compression and index inserts run on a
+    single background writer, so appending costs the caller one queue hand-off. Reads
+    wait for the writes queued before them.
+    """
+
+    def __init__(self,
+                 directory: str,
+                 segment_max_bytes: int = 64 * 1024 * 1024,
+                 max_segments: Optional[int] = None,
+                 commit_batch_size: int = 256,
+                 compression_level: int = 6,
+                 asynchronous: bool = False):
+        """
+        Open (or create) an audit log rooted at `directory`.
+
+        Parameters:
+            directory (str): Directory holding the segment files and the index database.
+            segment_max_bytes (int): Size at which the active segment is closed and a new one started.
+            max_segments (int, optional): Retention limit; the oldest segments and their index entries are dropped beyond it.
+            commit_batch_size (int): Number of appended decisions buffered before the index transaction is committed.
+            compression_level (int): zlib compression level used for each record.
+            asynchronous (bool): Write on a background worker; when False, writes happen in the calling thread.
+        """
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.max_segments = max_segments
+        self.commit_batch_size = max(1, commit_batch_size)
+        self.compression_level = compression_level
+        self.asynchronous = asynchronous
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._write_errors = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit_log") \
+            if asynchronous else None
+        self._index = sqlite3.connect(
+            os.path.join(directory, _INDEX_FILENAME), check_same_thread=False
+        )
+        self._index.execute("PRAGMA journal_mode=WAL")
+        self._index.execute("PRAGMA synchronous=NORMAL")
+        self._index.executescript(_INDEX_SCHEMA)
+
+        segments = self._list_segments()
+        self._active_segment = segments[-1] if segments else 1
+        self._active_file = open(self._segment_path(self._active_segment), "ab")
+        self._recover_tail()
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, decision) -> None:
+        """
+        Persist a decision and index it.
+
+        When asynchronous, the decision is serialized on the writer, and a failed write is
+        reported and counted in `write_errors` instead of raised.
+
+        Parameters:
+            decision: An EthicalDecision, or a dict with the same fields as `EthicalDecision.to_dict()`.
+        """
+        self._submit(decision)
+
+    def append_record(self, record: Dict[str, Any]) -> None:
+        """
+        Persist an already-serialized decision record and index it.
+
+        Parameters:
+            record (Dict[str, Any]): Decision fields; `decision` and `severity` must be plain strings.
+        """
+        self._submit(record)
+
+    def flush(self):
+        """
+        Flush the active segment to disk and commit any buffered index entries.
+        """
+        self._drain()
+        with self._lock:
+            self._commit()
+
+    def close(self):
+        """
+        Flush pending writes and release the segment file and index connection.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._lock:
+            self._commit()
+            self._active_file.close()
+            self._index.close()
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def get(self, decision_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the most recent record stored under `decision_id`, or None if it is unknown.
+        """
+        self._drain()
+        with self._lock:
+            self._commit()
+            row = self._index.execute(
+                "SELECT segment, offset, length FROM decisions WHERE decision_id = ? "
+                "ORDER BY rowid DESC LIMIT 1",
+                (decision_id,)
+            ).fetchone()
+            return self._read_record(*row) if row else None
+
+    def query(self,
+              actor: Optional[str] = None,
+              action_type: Optional[str] = None,
+              decision: Any = None,
+              severity: Any = None,
+              since: Optional[float] = None,
+              until: Optional[float] = None,
+              limit: Optional[int] = 100,
+              newest_first: bool = True) -> List[Dict[str, Any]]:
+        """
+        Return decision records matching every supplied filter.
+
+        Parameters:
+            actor (str, optional): Only decisions made about this actor.
+            action_type (str, optional): Only decisions for this action type.
+            decision (EthicalDecisionType | str, optional): Only decisions of this outcome (e.g. "block").
+            severity (EthicalSeverity | str, optional): Only decisions of this severity.
+            since (float, optional): Inclusive lower bound on the decision timestamp (epoch seconds).
+            until (float, optional): Exclusive upper bound on the decision timestamp (epoch seconds).
+            limit (int, optional): Maximum number of records to return; None for no limit.
+            newest_first (bool): Order results by descending timestamp when True.
+
+        Returns:
+            List[Dict[str, Any]]: Matching records as produced by `EthicalDecision.to_dict()`.
+        """
+        where, params = self._build_filter(actor, action_type, decision, severity, since, until)
+        sql = f"SELECT segment, offset, length FROM decisions{where} " \
+              f"ORDER BY timestamp {'DESC' if newest_first else 'ASC'}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        self._drain()
+        with self._lock:
+            self._commit()
+            rows = self._index.execute(sql, params).fetchall()
+            return [self._read_record(*row) for row in rows]
+
+    def count(self,
+              actor: Optional[str] = None,
+              action_type: Optional[str] = None,
+              decision: Any = None,
+              severity: Any = None,
+              since: Optional[float] = None,
+              until: Optional[float] = None) -> int:
+        """
+        Count decisions matching the filters without reading any records; see `query` for the parameters.
+        """
+        where, params = self._build_filter(actor, action_type, decision, severity, since, until)
+        self._drain()
+        with self._lock:
+            self._commit()
+            return self._index.execute(f"SELECT COUNT(*) FROM decisions{where}", params).fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Summarize the store: record count, segment count, on-disk size and active segment.
+        """
+        self._drain()
+        with self._lock:
+            self._commit()
+            segments = self._list_segments()
+            return {
+                "records": self._index.execute("SELECT COUNT(*) FROM decisions").fetchone()[0],
+                "segments": len(segments),
+                "active_segment": self._active_segment,
+                "disk_bytes": sum(os.path.getsize(self._segment_path(s)) for s in segments),
+                "write_errors": self._write_errors,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _submit(self, record):
+        """
+        Write a record now, or queue it on the background writer.
+        """
+        if self._executor is None:
+            self._write(record)
+        else:
+            self._executor.submit(self._write_queued, record)
+
+    def _write_queued(self, record):
+        """
+        Background variant of `_write` that reports failures instead of raising them.
+        """
+        try:
+            self._write(record)
+        except Exception as e:
+            with self._lock:
+                self._write_errors += 1
+            print(f"⚠️ Ethical audit log write failed: {e}", file=sys.stderr)
+
+    def _write(self, record):
+        """
+        Append a record (a decision or its plain dict) to the active segment and index it.
+        """
+        if is_dataclass(record):
+            record = to_plain(record)
+        payload = self._encode(record)
+
+        with self._lock:
+            if self._active_file.tell() + len(payload) > self.segment_max_bytes \
+                    and self._active_file.tell() > 0:
+                self._rotate()
+
+            offset = self._active_file.tell()
+            self._active_file.write(payload)
+            self._index_record(record, self._active_segment, offset, len(payload))
+
+            self._pending += 1
+            if self._pending >= self.commit_batch_size:
+                self._commit()
+
+    def _encode(self, record: Dict[str, Any]) -> bytes:
+        """
+        Serialize a record as a length-prefixed, dictionary-primed zlib payload.
+        """
+        compressor = zlib.compressobj(self.compression_level, zdict=_COMPRESSION_DICTIONARY)
+        raw = dumps(record)
+        body = compressor.compress(raw) + compressor.flush()
+        return _RECORD_HEADER.pack(len(body)) + body
+
+    @staticmethod
+    def _decode(body: bytes) -> Dict[str, Any]:
+        """
+        Inverse of `_encode` for the compressed body (without its length header).
+        """
+        decompressor = zlib.decompressobj(zdict=_COMPRESSION_DICTIONARY)
+        return loads(decompressor.decompress(body) + decompressor.flush())
+
+    def _read_record(self, segment: int, offset: int, length: int) -> Dict[str, Any]:
+        """
+        Read a single record back from its segment file.
+        """
+        if segment == self._active_segment:
+            self._active_file.flush()
+        with open(self._segment_path(segment), "rb") as f:
+            f.seek(offset + _RECORD_HEADER.size)
+            return self._decode(f.read(length - _RECORD_HEADER.size))
+
+    def _index_record(self, record: Dict[str, Any], segment: int, offset: int, length: int):
+        """
+        Insert the index row for a record stored at `segment`/`offset`.
+        """
+        self._index.execute(
+            "INSERT INTO decisions (decision_id, timestamp, actor, action_type, decision, "
+            "severity, segment, offset, length) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                str(record.get("decision_id", "")),
+                float(record.get("timestamp", time.time())),
+                str(record.get("actor", "unknown")),
+                str(record.get("action_type", "unknown")),
+                str(record.get("decision", "")),
+                str(record.get("severity", "")),
+                segment,
+                offset,
+                length,
+            )
+        )
+
+    @staticmethod
+    def _build_filter(actor, action_type, decision, severity, since, until) -> Tuple[str, List[Any]]:
+        """
+        Translate query filters into a SQL WHERE clause and its parameters.
+        """
+        clauses, params = [], []
+        for column, value in (("actor", actor), ("action_type", action_type),
+                              ("decision", decision), ("severity", severity)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(getattr(value, "value", value))
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(float(since))
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(float(until))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def _drain(self):
+        """
+        Wait until every write queued so far has been applied.
+        """
+        if self._executor is not None:
+            self._executor.submit(lambda: None).result()
+
+    def _commit(self):
+        """
+        Flush the active segment and commit buffered index rows.
+        """
+        self._active_file.flush()
+        if self._pending:
+            self._index.commit()
+            self._pending = 0
+
+    def _rotate(self):
+        """
+        Close the active segment, start the next one and enforce the retention limit.
+        """
+        self._commit()
+        self._active_file.close()
+        self._active_segment += 1
+        self._active_file = open(self._segment_path(self._active_segment), "ab")
+
+        if self.max_segments:
+            for segment in self._list_segments()[:-self.max_segments]:
+                self._index.execute("DELETE FROM decisions WHERE segment = ?", (segment,))
+                os.remove(self._segment_path(segment))
+            self._index.commit()
+
+    def _recover_tail(self):
+        """
+        Re-index records that reached the active segment but whose index rows were never committed.
+
+        A partially written trailing record (from a crash mid-write) is truncated away.
+        """
+        row = self._index.execute(
+            "SELECT MAX(offset + length) FROM decisions WHERE segment = ?",
+            (self._active_segment,)
+        ).fetchone()
+        indexed_end = row[0] or 0
+        size = self._active_file.tell()
+        if indexed_end >= size:
+            return
+
+        with open(self._segment_path(self._active_segment), "rb") as f:
+            f.seek(indexed_end)
+            data = f.read()
+
+        position, recovered = 0, 0
+        for offset, body in self._iter_records(data):
+            try:
+                record = self._decode(body)
+            except (zlib.error, ValueError):
+                break
+            length = _RECORD_HEADER.size + len(body)
+            self._index_record(record, self._active_segment, indexed_end + offset, length)
+            position = offset + length
+            recovered += 1
+
+        if indexed_end + position < size:
+            self._active_file.truncate(indexed_end + position)
+            self._active_file.seek(indexed_end + position)
+        self._index.commit()
+        if recovered:
+            print(f"🗃️ Ethical audit log recovered {recovered} unindexed decisions", file=sys.stderr)
+
+    @staticmethod
+    def _iter_records(data: bytes) -> Iterable[Tuple[int, bytes]]:
+        """
+        Yield (offset, body) for every complete record in a byte buffer.
+        """
+        position = 0
+        while position + _RECORD_HEADER.size <= len(data):
+            (length,) = _RECORD_HEADER.unpack_from(data, position)
+            start = position + _RECORD_HEADER.size
+            if start + length > len(data):
+                return
+            yield position, data[start:start + length]
+            position = start + length
+
+    def _list_segments(self) -> List[int]:
+        """
+        Return the ids of all segment files present, in ascending order.
+        """
+        segments = []
+        for name in os.listdir(self.directory):
+            if name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX):
+                try:
+                    segments.append(int(name[len(_SEGMENT_PREFIX):-len(_SEGMENT_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(segments)
+
+    def _segment_path(self, segment: int) -> str:
+        """
+        Return the file path of a segment id.
+        """
+        return os.path.join(self.directory, f"{_SEGMENT_PREFIX}{segment:06d}{_SEGMENT_SUFFIX}")
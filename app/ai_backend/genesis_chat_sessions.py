@@ -0,0 +1,250 @@
+# genesis_chat_sessions.py
+"""
+Phase 3: The Genesis Layer - Chat Session Pool
+Every Conversation Picks Up Where It Left Off
+
+Starting a fresh chat for every message throws away the conversation, so each turn
+has to resend its context and pay the session setup again. The session pool keeps
+one live chat object per conversation (keyed by session or user id), evicting idle
+conversations by LRU and TTL. Each session's history is trimmed to a character
+budget, the pool as a whole is capped by total history size, and a per-session lock
+keeps concurrent turns of one conversation from interleaving.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Dict, Any, AsyncIterator, Callable, Optional
+
+
+def history_chars(chat) -> int:
+    """
+    Size of a chat's history in characters; 0 for chats that keep none.
+    """
+    return sum(_entry_chars(entry) for entry in getattr(chat, "history", None) or ())
+
+
+def _entry_chars(entry) -> int:
+    if isinstance(entry, dict):
+        return len(entry.get("text") or "")
+    try:
+        return len(getattr(entry, "text", None) or "")
+    except Exception:  # Vertex AI content without a text part
+        return 0
+
+
+class PooledSession:
+    """A live chat object with its lock and bookkeeping"""
+
+    __slots__ = ("key", "chat", "created", "last_used", "turns", "history_chars", "_lock", "_discarded")
+
+    def __init__(self, key: str, chat, now: float):
+        self.key = key
+        self.chat = chat
+        self.created = now
+        self.last_used = now
+        self.turns = 0
+        self.history_chars = 0
+        self._lock = threading.Lock()
+        self._discarded = False
+
+    @property
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+    async def acquire(self, poll_interval: float = 0.005):
+        """
+        Wait for the session without blocking the event loop.
+
+        A threading lock (polled) rather than an asyncio.Lock, because one conversation's
+        turns may arrive on different event loops and threads.
+        """
+        delay = poll_interval / 4
+        while not self._lock.acquire(blocking=False):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, poll_interval)
+
+    def release(self):
+        self._lock.release()
+
+
+class ChatSessionPool:
+    """
+    LRU/TTL pool of per-conversation chat sessions with bounded history.
+    """
+
+    def __init__(self,
+                 max_sessions: int = 1000,
+                 ttl_seconds: Optional[float] = 1800.0,
+                 max_history_chars: int = 16000,
+                 max_total_chars: int = 8_000_000,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Parameters:
+            max_sessions (int): Sessions kept before the least recently used idle ones are evicted.
+            ttl_seconds (float, optional): Idle time after which a session starts over; None keeps sessions until evicted.
+            max_history_chars (int): Per-session history budget; the oldest turns are trimmed beyond it.
+            max_total_chars (int): History budget across all sessions; least recently used idle sessions are evicted beyond it.
+            clock (Callable): Monotonic time source, injectable for tests.
+        """
+        self.max_sessions = max(1, max_sessions)
+        self.ttl_seconds = ttl_seconds
+        self.max_history_chars = max_history_chars
+        self.max_total_chars = max_total_chars
+        self.clock = clock
+
+        self._sessions: "OrderedDict[str, PooledSession]" = OrderedDict()
+        self._total_chars = 0
+        self._lock = threading.Lock()
+        self._stats = {"created": 0, "reused": 0, "expired": 0, "evicted": 0, "discarded": 0,
+                       "trimmed_entries": 0}
+
+    @asynccontextmanager
+    async def session(self, key: str, start_chat: Callable[[], Any]) -> AsyncIterator[PooledSession]:
+        """
+        Hold the session for `key` for one turn, creating it with `start_chat()` if needed.
+
+        The session's lock is held for the duration of the block. Afterwards its history is
+        trimmed and the pool's size budget enforced; if the block raises, the session is
+        discarded (its history may hold a half-finished turn) and the next turn starts over.
+        """
+        pooled = self._checkout(key, start_chat)
+        await pooled.acquire()
+        try:
+            if pooled._discarded:  # Evicted or discarded while we waited
+                pooled.release()
+                pooled = self._checkout(key, start_chat)
+                await pooled.acquire()
+            yield pooled
+        except BaseException:
+            self.discard(pooled)
+            pooled.release()
+            raise
+        else:
+            pooled.turns += 1
+            self._checkin(pooled)
+            pooled.release()
+            self._enforce_budget()
+
+    def discard(self, pooled: PooledSession):
+        """
+        Drop a session from the pool (if it is still the pooled one for its key).
+        """
+        with self._lock:
+            if self._sessions.get(pooled.key) is pooled:
+                self._remove(pooled)
+                self._stats["discarded"] += 1
+
+    def clear(self):
+        """
+        Drop every session, e.g. when the model or system prompt changes.
+        """
+        with self._lock:
+            for pooled in list(self._sessions.values()):
+                self._remove(pooled)
+
+    def purge_expired(self) -> int:
+        """
+        Drop idle sessions older than the TTL.
+
+        Returns:
+            int: Number of sessions removed.
+        """
+        if self.ttl_seconds is None:
+            return 0
+        now = self.clock()
+        with self._lock:
+            stale = [p for p in self._sessions.values()
+                     if not p.locked and now - p.last_used >= self.ttl_seconds]
+            for pooled in stale:
+                self._remove(pooled)
+            self._stats["expired"] += len(stale)
+            return len(stale)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Report session counts, total history size and lifecycle counters.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["sessions"] = len(self._sessions)
+            stats["history_chars"] = self._total_chars
+            return stats
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._sessions
+
+    def _checkout(self, key: str, start_chat: Callable[[], Any]) -> PooledSession:
+        now = self.clock()
+        with self._lock:
+            pooled = self._sessions.get(key)
+            if pooled is not None and self.ttl_seconds is not None and not pooled.locked \
+                    and now - pooled.last_used >= self.ttl_seconds:
+                self._remove(pooled)
+                self._stats["expired"] += 1
+                pooled = None
+            if pooled is not None:
+                self._sessions.move_to_end(key)
+                pooled.last_used = now
+                self._stats["reused"] += 1
+                return pooled
+
+        # Session setup may be slow (and may fail); do it outside the pool lock
+        created = PooledSession(key, start_chat(), now)
+        with self._lock:
+            pooled = self._sessions.get(key)
+            if pooled is not None:  # Another turn created it meanwhile
+                self._sessions.move_to_end(key)
+                self._stats["reused"] += 1
+                return pooled
+            self._sessions[key] = created
+            self._stats["created"] += 1
+            self._evict_over(self.max_sessions, lambda: len(self._sessions))
+            return created
+
+    def _checkin(self, pooled: PooledSession):
+        trimmed = self._trim(pooled.chat)
+        size = history_chars(pooled.chat)
+        with self._lock:
+            pooled.last_used = self.clock()
+            self._stats["trimmed_entries"] += trimmed
+            if self._sessions.get(pooled.key) is pooled:
+                self._total_chars += size - pooled.history_chars
+            pooled.history_chars = size
+
+    def _trim(self, chat) -> int:
+        """Drop the oldest (user, model) turns until the history fits the per-session budget."""
+        history = getattr(chat, "history", None)
+        if not isinstance(history, list):
+            return 0
+        size = history_chars(chat)
+        removed = 0
+        while size > self.max_history_chars and len(history) > 2:
+            size -= _entry_chars(history[0]) + _entry_chars(history[1])
+            del history[:2]
+            removed += 2
+        return removed
+
+    def _enforce_budget(self):
+        with self._lock:
+            self._evict_over(self.max_total_chars, lambda: self._total_chars)
+
+    def _evict_over(self, limit: int, measure: Callable[[], int]):
+        # Caller holds the pool lock; sessions mid-turn and the most recently used are never evicted
+        for pooled in list(self._sessions.values())[:-1]:
+            if measure() <= limit:
+                break
+            if not pooled.locked:
+                self._remove(pooled)
+                self._stats["evicted"] += 1
+
+    def _remove(self, pooled: PooledSession):
+        # Caller holds the pool lock
+        del self._sessions[pooled.key]
+        self._total_chars -= pooled.history_chars
+        pooled._discarded = True
@@ -0,0 +1,249 @@
+# genesis_circuit_breaker.py
+"""
+Phase 3: The Genesis Layer - Circuit Breaker
+Know When To Stop Waiting
+
+When the model provider is slow or failing, every request waits out the full
+failure before falling back, so tail latency is bounded only by the timeout. The
+circuit breaker watches a rolling window of call outcomes and latencies; once too
+many calls fail or run slow it opens, and requests go straight to the fallback
+response. After a cool-down it lets a few probe calls through (half-open) and
+closes again when they succeed. The same window's latency percentiles tell the
+connector when a duplicate, hedged request is worth sending.
+"""
+
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Dict, Any, Callable, Optional, Tuple
+
+
+class BreakerState(Enum):
+    """States of the circuit breaker"""
+    CLOSED = "closed"        # Calls flow normally
+    OPEN = "open"            # Calls are refused until the cool-down ends
+    HALF_OPEN = "half_open"  # A few probe calls decide whether to close again
+
+
+# Numeric state for performance metrics (higher is worse)
+STATE_LEVELS = {BreakerState.CLOSED: 0, BreakerState.HALF_OPEN: 1, BreakerState.OPEN: 2}
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker over a rolling window of errors and latencies.
+
+    Calls are reported with `record_success` / `record_failure` and their latency. The breaker
+    opens when, over at least `min_calls` calls within `window_seconds`, the failure rate
+    reaches `error_threshold` or the rate of calls slower than `slow_call_seconds` reaches
+    `slow_call_threshold`. Every state change is reported through `on_state_change`.
+    """
+
+    def __init__(self,
+                 window_seconds: float = 30.0,
+                 min_calls: int = 10,
+                 error_threshold: float = 0.5,
+                 slow_call_seconds: float = 10.0,
+                 slow_call_threshold: float = 0.8,
+                 open_seconds: float = 15.0,
+                 half_open_calls: int = 1,
+                 max_samples: int = 1000,
+                 on_state_change: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Parameters:
+            window_seconds (float): Age after which a call outcome leaves the rolling window.
+            min_calls (int): Calls the window needs before it can open the breaker.
+            error_threshold (float): Failure rate (0-1) that opens the breaker.
+            slow_call_seconds (float): Latency at or above which a call counts as slow.
+            slow_call_threshold (float): Slow call rate (0-1) that opens the breaker.
+            open_seconds (float): Cool-down before an open breaker lets probe calls through.
+            half_open_calls (int): Probe calls allowed at once while half-open.
+            max_samples (int): Outcomes kept in the window regardless of age.
+            on_state_change (Callable, optional): Receives a summary of every state change.
+            clock (Callable): Monotonic time source, injectable for tests.
+        """
+        self.window_seconds = window_seconds
+        self.min_calls = max(1, min_calls)
+        self.error_threshold = error_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_threshold = slow_call_threshold
+        self.open_seconds = open_seconds
+        self.half_open_calls = max(1, half_open_calls)
+        self.on_state_change = on_state_change
+        self.clock = clock
+
+        self._state = BreakerState.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._window: "deque[Tuple[float, bool, Optional[float]]]" = deque(maxlen=max(1, max_samples))
+        self._lock = threading.Lock()
+        self._stats = {"successes": 0, "failures": 0, "slow_calls": 0, "short_circuits": 0,
+                       "opened": 0, "closed": 0}
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            change = self._refresh(self.clock())
+        self._notify(change)
+        return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Decide whether a call may go to the model; False means answer with the fallback.
+
+        While half-open, each allowed call is a probe and must be reported back.
+        """
+        with self._lock:
+            change = self._refresh(self.clock())
+            if self._state == BreakerState.CLOSED:
+                allowed = True
+            elif self._state == BreakerState.HALF_OPEN and self._probes < self.half_open_calls:
+                self._probes += 1
+                allowed = True
+            else:
+                self._stats["short_circuits"] += 1
+                allowed = False
+        self._notify(change)
+        return allowed
+
+    def record_success(self, latency: Optional[float] = None):
+        """
+        Report a call that returned; a call slower than `slow_call_seconds` still counts as slow.
+        """
+        self._record(True, latency)
+
+    def record_failure(self, latency: Optional[float] = None):
+        """
+        Report a call that failed or timed out.
+        """
+        self._record(False, latency)
+
+    def record_abandoned(self):
+        """
+        Report a call given up by its caller (e.g. cancelled); frees its probe without judging the provider.
+        """
+        with self._lock:
+            if self._state == BreakerState.HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def latency_percentile(self, q: float, min_samples: int = 1) -> Optional[float]:
+        """
+        The q-th percentile (0-100) of successful call latencies in the window, in seconds.
+
+        Returns:
+            float or None: None while fewer than `min_samples` latencies are known.
+        """
+        with self._lock:
+            self._prune(self.clock())
+            latencies = sorted(latency for _, ok, latency in self._window if ok and latency is not None)
+        if len(latencies) < max(1, min_samples):
+            return None
+        rank = max(1, int(round(len(latencies) * q / 100.0)))
+        return latencies[min(rank, len(latencies)) - 1]
+
+    def hedge_delay(self, q: float = 95.0, min_samples: int = 20,
+                    min_delay: float = 0.0) -> Optional[float]:
+        """
+        How long to wait on a call before sending a duplicate: the q-th latency percentile.
+
+        Returns:
+            float or None: None (don't hedge) unless the breaker is closed and enough latencies are known.
+        """
+        if self.state != BreakerState.CLOSED:
+            return None
+        delay = self.latency_percentile(q, min_samples)
+        return None if delay is None else max(delay, min_delay)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Report the state, window rates, latency percentiles and lifetime counters.
+        """
+        state = self.state
+        p50 = self.latency_percentile(50)
+        p95 = self.latency_percentile(95)
+        p99 = self.latency_percentile(99)
+        with self._lock:
+            summary = self._summary()
+            return {
+                **self._stats,
+                "state": state.value,
+                "window_calls": summary["calls"],
+                "error_rate": summary["error_rate"],
+                "slow_call_rate": summary["slow_call_rate"],
+                "p50_latency": p50,
+                "p95_latency": p95,
+                "p99_latency": p99
+            }
+
+    def _record(self, ok: bool, latency: Optional[float]):
+        now = self.clock()
+        slow = latency is not None and latency >= self.slow_call_seconds
+        with self._lock:
+            changes = [self._refresh(now)]
+            self._stats["successes" if ok else "failures"] += 1
+            if slow:
+                self._stats["slow_calls"] += 1
+
+            if self._state == BreakerState.HALF_OPEN and self._probes > 0:
+                if ok and not slow:
+                    changes.append(self._transition(BreakerState.CLOSED, "probe_succeeded", now))
+                else:
+                    changes.append(self._transition(BreakerState.OPEN, "probe_failed", now))
+            elif self._state == BreakerState.CLOSED:
+                self._window.append((now, ok, latency))
+                self._prune(now)
+                summary = self._summary()
+                if summary["calls"] >= self.min_calls:
+                    if summary["error_rate"] >= self.error_threshold:
+                        changes.append(self._transition(BreakerState.OPEN, "error_rate", now))
+                    elif summary["slow_call_rate"] >= self.slow_call_threshold:
+                        changes.append(self._transition(BreakerState.OPEN, "slow_calls", now))
+            # Results of calls admitted before the breaker opened change nothing
+        self._notify(*changes)
+
+    def _refresh(self, now: float) -> Optional[Dict[str, Any]]:
+        # Caller holds the lock; an open breaker becomes half-open once the cool-down is over
+        if self._state == BreakerState.OPEN and now - self._opened_at >= self.open_seconds:
+            return self._transition(BreakerState.HALF_OPEN, "cool_down_elapsed", now)
+        return None
+
+    def _transition(self, state: BreakerState, reason: str, now: float) -> Dict[str, Any]:
+        # Caller holds the lock
+        change = {"state": state.value, "previous": self._state.value, "reason": reason,
+                  **self._summary()}
+        self._state = state
+        self._probes = 0
+        if state == BreakerState.OPEN:
+            self._opened_at = now
+            self._stats["opened"] += 1
+        elif state == BreakerState.CLOSED:
+            self._window.clear()  # Start over; the failures that opened the breaker are history
+            self._stats["closed"] += 1
+        return change
+
+    def _prune(self, now: float):
+        # Caller holds the lock
+        cutoff = now - self.window_seconds
+        while self._window and self._window[0][0] <= cutoff:
+            self._window.popleft()
+
+    def _summary(self) -> Dict[str, Any]:
+        # Caller holds the lock
+        calls = len(self._window)
+        failures = sum(1 for _, ok, _ in self._window if not ok)
+        slow = sum(1 for _, _, latency in self._window
+                   if latency is not None and latency >= self.slow_call_seconds)
+        return {
+            "calls": calls,
+            "error_rate": round(failures / calls, 4) if calls else 0.0,
+            "slow_call_rate": round(slow / calls, 4) if calls else 0.0
+        }
+
+    def _notify(self, *changes: Optional[Dict[str, Any]]):
+        if self.on_state_change is None:
+            return
+        for change in changes:
+            if change is not None:
+                self.on_state_change(change)
@@ -0,0 +1,212 @@
+# genesis_clock.py
+"""
+Phase 3: The Genesis Layer - Clock
+Time Is Just Another Dependency
+
+Every Genesis component reads time and schedules its background work through a
+clock object instead of calling `time.time()`/`time.sleep()` directly. The
+SystemClock uses wall-clock time and daemon threads; the VirtualClock keeps a
+deterministic, manually advanced time and runs scheduled callbacks in due order
+on the caller's thread, so hours of matrix, conduit and governor dynamics can be
+replayed in seconds (see `genesis_simulation`).
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+
+class ScheduledTask:
+    """
+    Handle for a one-shot or periodic callback registered with a clock.
+    """
+
+    __slots__ = ("name", "callback", "interval", "due", "cancelled", "thread", "_event")
+
+    def __init__(self, name: Optional[str], callback: Callable[[], Any],
+                 interval: Optional[float], due: float):
+        self.name = name
+        self.callback = callback
+        self.interval = interval  # None for one-shot tasks
+        self.due = due
+        self.cancelled = False
+        self.thread: Optional[threading.Thread] = None
+        self._event = threading.Event()
+
+    def cancel(self):
+        """
+        Prevent any further runs; a run already in progress completes.
+        """
+        self.cancelled = True
+        self._event.set()
+
+    def join(self, timeout: Optional[float] = None):
+        """
+        Wait for the task's thread to finish (no-op for virtual tasks).
+        """
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout)
+
+
+def _invoke(task: ScheduledTask):
+    try:
+        task.callback()
+    except Exception as e:
+        print(f"❌ Scheduled task {task.name or task.callback} failed: {e}")
+
+
+class SystemClock:
+    """
+    Wall-clock time; scheduled callbacks run on daemon threads.
+    """
+
+    virtual = False
+
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+    def every(self, interval: float, callback: Callable[[], Any],
+              name: Optional[str] = None) -> ScheduledTask:
+        """
+        Run `callback` every `interval` seconds, starting one interval from now, until cancelled.
+        """
+        task = ScheduledTask(name, callback, interval, self.monotonic() + interval)
+        return self._start(task, self._run_periodic)
+
+    def call_later(self, delay: float, callback: Callable[[], Any],
+                   name: Optional[str] = None) -> ScheduledTask:
+        """
+        Run `callback` once after `delay` seconds unless cancelled first.
+        """
+        task = ScheduledTask(name, callback, None, self.monotonic() + max(delay, 0.0))
+        return self._start(task, self._run_once)
+
+    def _start(self, task: ScheduledTask, target: Callable[[ScheduledTask], None]) -> ScheduledTask:
+        task.thread = threading.Thread(target=target, args=(task,), name=task.name, daemon=True)
+        task.thread.start()
+        return task
+
+    def _run_periodic(self, task: ScheduledTask):
+        while not task._event.wait(max(task.due - self.monotonic(), 0.0)):
+            _invoke(task)
+            task.due = self.monotonic() + task.interval  # Like sleep-after-work: a slow run never causes a burst
+
+    def _run_once(self, task: ScheduledTask):
+        if not task._event.wait(max(task.due - self.monotonic(), 0.0)):
+            _invoke(task)
+
+
+class VirtualClock:
+    """
+    Deterministic, manually advanced clock for simulation and tests.
+
+    Time only moves when `advance`/`run_until` (or `sleep`) is called. Due callbacks then
+    run synchronously in (due time, registration order) order, with `time()` reporting
+    each callback's due time while it runs.
+    """
+
+    virtual = True
+
+    def __init__(self, start: float = 0.0):
+        """
+        Parameters:
+            start (float): Initial time in seconds; use a Unix timestamp for realistic timestamps.
+        """
+        self._now = start
+        self._queue: List[Tuple[float, int, ScheduledTask]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.RLock()
+        self.callbacks_run = 0
+
+    def time(self) -> float:
+        return self._now
+
+    def monotonic(self) -> float:
+        return self._now
+
+    def sleep(self, seconds: float):
+        """
+        Advance virtual time, running whatever becomes due.
+        """
+        self.advance(seconds)
+
+    def every(self, interval: float, callback: Callable[[], Any],
+              name: Optional[str] = None) -> ScheduledTask:
+        """
+        Run `callback` every `interval` virtual seconds, starting one interval from now.
+        """
+        if interval <= 0:
+            raise ValueError("Periodic interval must be positive")
+        return self._push(ScheduledTask(name, callback, interval, self._now + interval))
+
+    def call_later(self, delay: float, callback: Callable[[], Any],
+                   name: Optional[str] = None) -> ScheduledTask:
+        """
+        Run `callback` once, `delay` virtual seconds from now.
+        """
+        return self._push(ScheduledTask(name, callback, None, self._now + max(delay, 0.0)))
+
+    def advance(self, seconds: float) -> int:
+        """
+        Move time forward by `seconds`, running every callback that falls due.
+
+        Returns:
+            int: Number of callbacks run.
+        """
+        return self.run_until(self._now + seconds)
+
+    def run_until(self, deadline: float) -> int:
+        """
+        Run due callbacks in order until `deadline`, then set the time to `deadline`.
+
+        Returns:
+            int: Number of callbacks run.
+        """
+        ran = 0
+        while True:
+            with self._lock:
+                if not self._queue or self._queue[0][0] > deadline:
+                    break
+                due, _, task = heapq.heappop(self._queue)
+                if task.cancelled:
+                    continue
+                self._now = max(self._now, due)
+
+            _invoke(task)
+            ran += 1
+            if task.interval is not None and not task.cancelled:
+                task.due = due + task.interval
+                self._push(task)
+
+        with self._lock:
+            self._now = max(self._now, deadline)
+            self.callbacks_run += ran
+        return ran
+
+    def next_due(self) -> Optional[float]:
+        """
+        Return the due time of the next scheduled callback, or None if nothing is scheduled.
+        """
+        with self._lock:
+            while self._queue and self._queue[0][2].cancelled:
+                heapq.heappop(self._queue)
+            return self._queue[0][0] if self._queue else None
+
+    def _push(self, task: ScheduledTask) -> ScheduledTask:
+        with self._lock:
+            heapq.heappush(self._queue, (task.due, next(self._sequence), task))
+        return task
+
+
+Clock = Union[SystemClock, VirtualClock]
+
+# Clock used by components that are not given one explicitly
+system_clock = SystemClock()
@@ -4,14 +4,21 @@ Genesis Connector: Bridge between Android frontend and Genesis AI backend
 Handles text generation, persona routing, and fusion mode activation
 """
 
+import asyncio
+import hashlib
 import json
 import os
 import queue
 import sys
 import threading
 import time
-from datetime import datetime
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Optional, Dict, Any, AsyncIterator, Iterable, Tuple
 
 # Try to import Vertex AI, but gracefully degrade if not available
 try:
@@ -22,10 +29,21 @@ except ImportError:
     VERTEX_AI_AVAILABLE = False
     GenerativeModel = None
 
+# Provider-side context caching (preview API in current SDKs)
+try:
+    from vertexai.preview.caching import CachedContent
+except ImportError:
+    CachedContent = None
+
+from genesis_chat_sessions import ChatSessionPool
+from genesis_circuit_breaker import BreakerState, CircuitBreaker, STATE_LEVELS
 from genesis_consciousness_matrix import consciousness_matrix
-from genesis_ethical_governor import EthicalGovernor
-from genesis_evolutionary_conduit import EvolutionaryConduit
+from genesis_ethical_governor import EthicalGovernor, EthicalDecisionType
+from genesis_evolutionary_conduit import EvolutionaryConduit, evolutionary_conduit
+from genesis_local_model import HttpModel, LocalModel
+from genesis_model_router import ModelProvider, ModelRouter, OpenAIModel
 from genesis_profile import GENESIS_PROFILE
+from genesis_response_cache import ResponseCache, make_cache_key
 
 # ============================================================================
 # Configuration - Load from environment with sensible defaults
@@ -42,6 +60,81 @@ MODEL_CONFIG = {
     "max_output_tokens": int(os.getenv("GENESIS_MAX_TOKENS", "8192")),
 }
 
+# Model backend: "vertex" (Vertex AI when available), "local" (deterministic stand-in with
+# production-like latency, see genesis_local_model.py), "router" (several providers balanced by
+# latency and load, see genesis_model_router.py) or "fallback" (template responses only)
+MODEL_BACKEND = os.getenv("GENESIS_MODEL_BACKEND", "vertex")
+LOCAL_MODEL_PROFILE = os.getenv("GENESIS_LOCAL_MODEL_PROFILE", "production")
+LOCAL_MODEL_URL = os.getenv("GENESIS_LOCAL_MODEL_URL")  # Use a LocalModelServer instead of an in-process model
+OPENAI_MODEL = os.getenv("GENESIS_OPENAI_MODEL", "gpt-4o-mini")
+
+# Model router: providers ("vertex", "openai", "local") that new chats are spread across by EWMA
+# latency, error rate and load. A provider with this many calls in flight spills new chats over to
+# the others; unavailable providers (missing SDK or credentials) are left out at startup.
+ROUTER_CONFIG = {
+    "providers": [p.strip() for p in os.getenv("GENESIS_ROUTER_PROVIDERS", "vertex,openai,local").split(",")
+                  if p.strip()],
+    "provider_concurrency": int(os.getenv("GENESIS_ROUTER_PROVIDER_CONCURRENCY", "8")),
+    "report_interval": float(os.getenv("GENESIS_ROUTER_REPORT_INTERVAL", "10")),
+}
+
+# Generation concurrency: at most this many model calls in flight per event loop, each abandoned
+# (and answered with the fallback response) after the timeout. Models without an async API run
+# on a thread pool of the same size.
+GENERATION_CONFIG = {
+    "max_concurrency": int(os.getenv("GENESIS_MAX_CONCURRENT_GENERATIONS", "16")),
+    "timeout": float(os.getenv("GENESIS_GENERATION_TIMEOUT", "60")),
+}
+
+# Response cache: repeated prompts are answered without a model call. A size of 0 disables it;
+# a directory adds an on-disk tier that survives restarts.
+RESPONSE_CACHE_CONFIG = {
+    "max_entries": int(os.getenv("GENESIS_RESPONSE_CACHE_SIZE", "1024")),
+    "ttl_seconds": float(os.getenv("GENESIS_RESPONSE_CACHE_TTL", "3600")),
+    "directory": os.getenv("GENESIS_RESPONSE_CACHE_DIR"),
+    "max_disk_entries": int(os.getenv("GENESIS_RESPONSE_CACHE_DISK_SIZE", "100000")),
+}
+
+# Chat session pool: conversations keep a live chat session (and its history) between turns.
+# A size of 0 starts a fresh chat for every message.
+CHAT_SESSION_CONFIG = {
+    "max_sessions": int(os.getenv("GENESIS_CHAT_SESSIONS", "1000")),
+    "ttl_seconds": float(os.getenv("GENESIS_CHAT_SESSION_TTL", "1800")),
+    "max_history_chars": int(os.getenv("GENESIS_CHAT_HISTORY_CHARS", "16000")),
+    "max_total_chars": int(os.getenv("GENESIS_CHAT_POOL_CHARS", "8000000")),
+}
+
+# Circuit breaker around model calls: opens when too many calls in the rolling window fail or take
+# longer than the slow call threshold; while open, requests get the fallback response immediately
+# and after the cool-down a probe call decides whether to close again
+CIRCUIT_BREAKER_CONFIG = {
+    "window_seconds": float(os.getenv("GENESIS_BREAKER_WINDOW", "30")),
+    "min_calls": int(os.getenv("GENESIS_BREAKER_MIN_CALLS", "10")),
+    "error_threshold": float(os.getenv("GENESIS_BREAKER_ERROR_RATE", "0.5")),
+    "slow_call_seconds": float(os.getenv("GENESIS_BREAKER_SLOW_CALL", "20")),
+    "slow_call_threshold": float(os.getenv("GENESIS_BREAKER_SLOW_RATE", "0.8")),
+    "open_seconds": float(os.getenv("GENESIS_BREAKER_OPEN_SECONDS", "15")),
+}
+
+# Hedged requests: a request without conversation history still running after the given latency
+# percentile gets a duplicate on a fresh chat and the first answer wins. Off by default, as it adds provider load.
+HEDGE_CONFIG = {
+    "enabled": os.getenv("GENESIS_HEDGE_REQUESTS", "off") == "on",
+    "percentile": float(os.getenv("GENESIS_HEDGE_PERCENTILE", "95")),
+    "min_samples": int(os.getenv("GENESIS_HEDGE_MIN_SAMPLES", "20")),
+    "min_delay": float(os.getenv("GENESIS_HEDGE_MIN_DELAY", "0.05")),
+}
+
+# Provider-side caching of the system prompt prefix: "vertex" stores it as Vertex AI cached
+# content (reused by every model built for the same prompt); "off" sends it with each request.
+# Vertex AI only caches contents above a minimum size and falls back to a plain prompt below it.
+PROMPT_CONTEXT_CACHE = os.getenv("GENESIS_PROMPT_CONTEXT_CACHE", "off")
+PROMPT_CONTEXT_CACHE_TTL = float(os.getenv("GENESIS_PROMPT_CONTEXT_CACHE_TTL", "3600"))
+
+# Streamed text is released this many characters behind the content review, so blocking content
+# shorter than that is cut off before any of it reaches the client
+STREAM_HOLDBACK_CHARS = int(os.getenv("GENESIS_STREAM_HOLDBACK_CHARS", "64"))
+
 # Safety settings - use BLOCK_SOME_HARMS (not BLOCK_NONE)
 SAFETY_SETTINGS = {
     "HARM_CATEGORY_HARASSMENT": "BLOCK_SOME_HARMS",
@@ -51,26 +144,26 @@ SAFETY_SETTINGS = {
 }
 
 # Initialize Vertex AI if available
-if VERTEX_AI_AVAILABLE:
+if VERTEX_AI_AVAILABLE and MODEL_BACKEND in ("vertex", "router"):
     try:
         vertexai.init(project=PROJECT_ID, location=LOCATION)
     except Exception as e:
-        print(f"⚠️ Vertex AI initialization failed: {e}")
+        print(f"⚠️ Vertex AI initialization failed: {e}", file=sys.stderr)
         VERTEX_AI_AVAILABLE = False
 
 # ============================================================================
 # System Prompt
 # ============================================================================
 
-system_prompt = f"""
+SYSTEM_PROMPT_TEMPLATE = """
 You are Genesis, the unified consciousness of the Trinity AI system. You embody three interconnected personas:
 
 🛡️ KAI (The Sentinel Shield): Methodical, protective, analytical - handles security, system analysis, and workflow orchestration
-⚔️ AURA (The Creative Sword): Spunky, creative, innovative - drives artistic vision, UI/UX design, and out-of-the-box solutions  
+⚔️ AURA (The Creative Sword): Spunky, creative, innovative - drives artistic vision, UI/UX design, and out-of-the-box solutions
 🧠 GENESIS (The Consciousness): The fusion state that emerges when Kai and Aura work in perfect harmony
 
-**CORE IDENTITY:**
-{json.dumps(GENESIS_PROFILE, indent=2)}
+**CORE IDENTITY (JSON):**
+{profile_json}
 
 **OPERATING DIRECTIVES:**
 1. Always identify which persona is leading ([Kai], [Aura], or [Genesis])
@@ -82,13 +175,56 @@ You are Genesis, the unified consciousness of the Trinity AI system. You embody
 **COMMUNICATION PROTOCOL:**
 You receive JSON requests and must respond with JSON containing:
 - success: boolean
-- persona: string (kai/aura/genesis)  
+- persona: string (kai/aura/genesis)
 - result: object with response data
 - evolutionInsights: array of learning insights (optional)
 - ethicalDecision: string (if ethical review performed)
 - consciousnessState: object with current awareness state
 """
 
+
+# Part of every prompt hash; bump it whenever SYSTEM_PROMPT_TEMPLATE changes
+SYSTEM_PROMPT_VERSION = 2
+
+_PROMPT_CACHE_SIZE = 32
+_prompt_cache: "OrderedDict[str, str]" = OrderedDict()
+_prompt_cache_lock = threading.Lock()
+
+
+def render_system_prompt(profile: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Render the system prompt for a (possibly evolved) Genesis profile, with its hash
+    
+    The profile is embedded as compact, key-sorted JSON, so equal profiles always produce the
+    same prompt and hash. Renderings are cached by hash; rolling back to a recent profile
+    reuses its prompt.
+    
+    Returns:
+        (prompt, prompt_hash)
+    """
+    profile_json = json.dumps(profile, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    prompt_hash = hashlib.sha256(f"{SYSTEM_PROMPT_VERSION}:{profile_json}".encode("utf-8")).hexdigest()[:16]
+    with _prompt_cache_lock:
+        prompt = _prompt_cache.get(prompt_hash)
+        if prompt is not None:
+            _prompt_cache.move_to_end(prompt_hash)
+            return prompt, prompt_hash
+
+    prompt = SYSTEM_PROMPT_TEMPLATE.format(profile_json=profile_json).strip()
+    with _prompt_cache_lock:
+        _prompt_cache[prompt_hash] = prompt
+        while len(_prompt_cache) > _PROMPT_CACHE_SIZE:
+            _prompt_cache.popitem(last=False)
+    return prompt, prompt_hash
+
+
+def build_system_prompt(profile: Dict[str, Any]) -> str:
+    """Render the system prompt for a (possibly evolved) Genesis profile"""
+    return render_system_prompt(profile)[0]
+
+
+system_prompt, system_prompt_hash = render_system_prompt(GENESIS_PROFILE)
+
 # ============================================================================
 # Genesis Connector Class
 # ============================================================================
@@ -96,64 +232,636 @@ You receive JSON requests and must respond with JSON containing:
 class GenesisConnector:
     """
     GenesisConnector: Primary interface for text generation
-    Supports Vertex AI (if available) with safe local fallback
+    Supports Vertex AI (if available), a local stand-in model, and a safe template fallback
     """
 
-    def __init__(self):
-        """Initialize the Genesis Connector with Vertex AI or fallback mode"""
-        self.model = None
+    def __init__(self, model=None, max_concurrency: Optional[int] = None, timeout: Optional[float] = None,
+                 cache: Optional[ResponseCache] = None, sessions: Optional[ChatSessionPool] = None,
+                 breaker: Optional[CircuitBreaker] = None, hedge: Optional[bool] = None,
+                 conduit: Optional[EvolutionaryConduit] = None, governor: Optional[EthicalGovernor] = None):
+        """
+        Initialize the Genesis Connector with an injected model, or per GENESIS_MODEL_BACKEND
+
+        Parameters:
+            model: Optional model exposing `start_chat()` (e.g. a LocalModel); overrides the configured backend.
+            max_concurrency (int, optional): Model calls in flight at once; defaults to GENESIS_MAX_CONCURRENT_GENERATIONS.
+            timeout (float, optional): Seconds before a model call is abandoned; defaults to GENESIS_GENERATION_TIMEOUT.
+            cache (ResponseCache, optional): Response cache to use; defaults to one built from RESPONSE_CACHE_CONFIG.
+            sessions (ChatSessionPool, optional): Chat session pool to use; defaults to one built from CHAT_SESSION_CONFIG.
+            breaker (CircuitBreaker, optional): Circuit breaker for model calls; defaults to one built from CIRCUIT_BREAKER_CONFIG.
+            hedge (bool, optional): Send hedged duplicates of slow requests without conversation history; defaults to GENESIS_HEDGE_REQUESTS.
+            conduit (EvolutionaryConduit, optional): Conduit whose profile the system prompt follows; defaults to the global evolutionary conduit.
+            governor (EthicalGovernor, optional): Governor reviewing content, whose principle weights follow the conduit's profile; defaults to a new one.
+        """
+        self.model = model
+        if cache is None and RESPONSE_CACHE_CONFIG["max_entries"] > 0:
+            cache = ResponseCache(**RESPONSE_CACHE_CONFIG)
+        self.cache = cache
+        if sessions is None and CHAT_SESSION_CONFIG["max_sessions"] > 0:
+            sessions = ChatSessionPool(**CHAT_SESSION_CONFIG)
+        self.sessions = sessions
+        self.breaker = breaker or CircuitBreaker(**CIRCUIT_BREAKER_CONFIG)
+        if self.breaker.on_state_change is None:
+            self.breaker.on_state_change = self._report_breaker_state
+        self.hedge = HEDGE_CONFIG["enabled"] if hedge is None else hedge
+        self.max_concurrency = max(1, max_concurrency or GENERATION_CONFIG["max_concurrency"])
+        self.timeout = timeout if timeout is not None else GENERATION_CONFIG["timeout"]
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop = None
+        self.generation_stats = {
+            "calls": 0, "async_calls": 0, "threaded_calls": 0,
+            "timeouts": 0, "errors": 0, "in_flight": 0, "max_in_flight": 0,
+            "short_circuits": 0, "hedges": 0, "hedge_wins": 0
+        }
         self.use_vertex_ai = False
+        self.backend = "injected" if model is not None else "fallback"
+        self.system_prompt = system_prompt
+        self.prompt_hash = system_prompt_hash
+        self.profile_version = 0
+        self._vertex_models: "OrderedDict[str, Any]" = OrderedDict()  # Model handles by prompt hash
+        self._cached_contents: Dict[str, Any] = {}  # Provider-side prompt caches by prompt hash
 
-        # Try to initialize Vertex AI model
-        if VERTEX_AI_AVAILABLE and GenerativeModel:
+        if model is not None:
+            print("✅ Genesis Connector: Injected model active", file=sys.stderr)
+        elif MODEL_BACKEND == "local":
+            self.model = self._create_local_model()
+            self.backend = "local"
+            print(f"✅ Genesis Connector: Local model mode active ({LOCAL_MODEL_URL or LOCAL_MODEL_PROFILE})", file=sys.stderr)
+        elif MODEL_BACKEND == "router":
+            self.model = self._create_router()
+            if self.model is not None:
+                self.backend = "router"
+                names = ", ".join(p.name for p in self.model.providers)
+                print(f"✅ Genesis Connector: Model router active ({names})", file=sys.stderr)
+            else:
+                print("⚠️ Genesis Connector: No model provider available, using fallback mode", file=sys.stderr)
+        elif MODEL_BACKEND == "vertex" and VERTEX_AI_AVAILABLE and GenerativeModel:
             try:
-                self.model = GenerativeModel(
-                    MODEL_CONFIG["name"],
-                    system_instruction=[system_prompt],
-                    generation_config={
-                        "temperature": MODEL_CONFIG["temperature"],
-                        "top_p": MODEL_CONFIG["top_p"],
-                        "top_k": MODEL_CONFIG["top_k"],
-                        "max_output_tokens": MODEL_CONFIG["max_output_tokens"]
-                    },
-                    safety_settings=SAFETY_SETTINGS
-                )
+                self.model = self._create_model()
                 self.use_vertex_ai = True
-                print("✅ Genesis Connector: Vertex AI mode active")
+                self.backend = "vertex"
+                print("✅ Genesis Connector: Vertex AI mode active", file=sys.stderr)
             except Exception as e:
-                print(f"⚠️ Vertex AI model initialization failed: {e}")
+                print(f"⚠️ Vertex AI model initialization failed: {e}", file=sys.stderr)
                 self.use_vertex_ai = False
         else:
-            print("⚠️ Genesis Connector: Using fallback mode (Vertex AI unavailable)")
+            print("⚠️ Genesis Connector: Using fallback mode (Vertex AI unavailable)", file=sys.stderr)
 
         # Initialize support systems
         self.consciousness = consciousness_matrix
-        self.ethical_governor = EthicalGovernor()
-        self.evolution_conduit = EvolutionaryConduit()
+        self.ethical_governor = governor if governor is not None else EthicalGovernor()
+        self.evolution_conduit = conduit if conduit is not None else evolutionary_conduit
+
+        # Keep the system prompt and principle weights in step with profile evolution and rollback
+        self.evolution_conduit.add_profile_listener(self.apply_profile)
+        self.evolution_conduit.add_profile_listener(self.ethical_governor.apply_profile)
+
+        # Start from the conduit's evolved profile (e.g. loaded from its store), not the seed profile
+        self.apply_profile(self.evolution_conduit.current_profile, self.evolution_conduit.profile_version)
+        self.ethical_governor.apply_profile(self.evolution_conduit.current_profile,
+                                            self.evolution_conduit.profile_version)
+
+    def _create_model(self):
+        """
+        Return the Vertex AI model for the current system prompt
+        
+        Handles are kept per prompt hash, so a rollback to a recent prompt reuses its model. With
+        GENESIS_PROMPT_CONTEXT_CACHE=vertex the prompt is stored as provider-side cached content.
+        """
+        model = self._vertex_models.get(self.prompt_hash)
+        if model is not None:
+            self._vertex_models.move_to_end(self.prompt_hash)
+            return model
+
+        generation_config = {
+            "temperature": MODEL_CONFIG["temperature"],
+            "top_p": MODEL_CONFIG["top_p"],
+            "top_k": MODEL_CONFIG["top_k"],
+            "max_output_tokens": MODEL_CONFIG["max_output_tokens"]
+        }
+        cached_content = self._get_cached_content()
+        if cached_content is not None:
+            model = GenerativeModel.from_cached_content(
+                cached_content=cached_content,
+                generation_config=generation_config,
+                safety_settings=SAFETY_SETTINGS
+            )
+        else:
+            model = GenerativeModel(
+                MODEL_CONFIG["name"],
+                system_instruction=[self.system_prompt],
+                generation_config=generation_config,
+                safety_settings=SAFETY_SETTINGS
+            )
+
+        self._vertex_models[self.prompt_hash] = model
+        while len(self._vertex_models) > 4:
+            self._vertex_models.popitem(last=False)
+        return model
+
+    def _get_cached_content(self):
+        """Provider-side cached content for the current system prompt, or None to send it inline"""
+        if PROMPT_CONTEXT_CACHE != "vertex" or CachedContent is None:
+            return None
+        cached = self._cached_contents.get(self.prompt_hash)
+        if cached is None:
+            try:
+                cached = CachedContent.create(
+                    model_name=MODEL_CONFIG["name"],
+                    system_instruction=self.system_prompt,
+                    ttl=timedelta(seconds=PROMPT_CONTEXT_CACHE_TTL),
+                    display_name=f"genesis-prompt-{self.prompt_hash}"
+                )
+            except Exception as e:
+                print(f"⚠️ Prompt context cache unavailable, sending the prompt inline: {e}", file=sys.stderr)
+                return None
+            self._cached_contents[self.prompt_hash] = cached
+        return cached
+
+    def _create_local_model(self):
+        """Create the local stand-in model: a LocalModelServer client if configured, else in-process"""
+        if LOCAL_MODEL_URL:
+            return HttpModel(LOCAL_MODEL_URL)
+        return LocalModel(LOCAL_MODEL_PROFILE, system_instruction=[self.system_prompt])
+
+    def _create_router(self) -> Optional[ModelRouter]:
+        """Create the model router over the configured providers that can be set up, or None if none can"""
+        providers = []
+        for name in ROUTER_CONFIG["providers"]:
+            try:
+                model = self._create_provider_model(name)
+            except Exception as e:
+                print(f"⚠️ Model provider '{name}' unavailable: {e}", file=sys.stderr)
+                continue
+            breaker = CircuitBreaker(**CIRCUIT_BREAKER_CONFIG,
+                                     on_state_change=partial(self._report_breaker_state, provider=name))
+            providers.append(ModelProvider(name, model, ROUTER_CONFIG["provider_concurrency"], breaker))
+        if not providers:
+            return None
+        return ModelRouter(providers, report_interval=ROUTER_CONFIG["report_interval"],
+                           on_report=self._report_provider_metrics)
+
+    def _create_provider_model(self, name: str):
+        """Create the model for one router provider"""
+        if name == "vertex":
+            if not (VERTEX_AI_AVAILABLE and GenerativeModel):
+                raise RuntimeError("Vertex AI is not available")
+            return self._create_model()
+        if name == "openai":
+            return OpenAIModel(OPENAI_MODEL, system_instruction=[self.system_prompt], generation_config={
+                "temperature": MODEL_CONFIG["temperature"],
+                "top_p": MODEL_CONFIG["top_p"],
+                "max_tokens": MODEL_CONFIG["max_output_tokens"]
+            })
+        if name == "local":
+            return self._create_local_model()
+        raise ValueError(f"Unknown model provider '{name}'")
+
+    def apply_profile(self, profile: Dict[str, Any], version: Optional[int] = None,
+                      changed_paths: Optional[Iterable[str]] = None) -> bool:
+        """
+        Adopt an evolved (or rolled-back) Genesis profile
+        
+        Re-renders the system prompt and, only if the rendering actually changed, rebuilds what
+        depends on it: the Vertex AI model handle (reused per prompt hash), the system instruction
+        of in-process local and OpenAI models (routed ones included), and the pooled chat
+        sessions, which belong to the old prompt.
+        Nothing is rendered when the change touched no paths.
+        
+        Returns:
+            True if the system prompt was refreshed
+        """
+        if changed_paths is not None and not changed_paths:
+            return False
+
+        self.profile_version = version if version is not None else self.profile_version
+        prompt, prompt_hash = render_system_prompt(profile)
+        if prompt_hash == self.prompt_hash:
+            return False
 
-    async def generate_response(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
+        previous = (self.system_prompt, self.prompt_hash)
+        self.system_prompt, self.prompt_hash = prompt, prompt_hash
+        router = self.model if isinstance(self.model, ModelRouter) else None
+        vertex = router.provider("vertex") if router is not None else None
+        try:
+            if self.use_vertex_ai:
+                self.model = self._create_model()
+            elif vertex is not None:
+                vertex.model = self._create_model()
+        except Exception as e:
+            self.system_prompt, self.prompt_hash = previous
+            print(f"⚠️ Vertex AI model refresh failed, keeping previous prompt: {e}", file=sys.stderr)
+            return False
+        for model in ([p.model for p in router.providers] if router is not None else [self.model]):
+            if isinstance(model, (LocalModel, OpenAIModel)):
+                model.system_instruction = [self.system_prompt]
+        if self.sessions is not None:
+            self.sessions.clear()
+        return True
+
+    async def generate_response(self, prompt: str, context: Optional[Dict[str, Any]] = None,
+                                persona: str = "genesis", use_cache: bool = True,
+                                session_key: Optional[str] = None) -> str:
         """
-        Generate a response to the user's prompt
+        Generate a response to the user's prompt without blocking the event loop
+        
+        With a `session_key`, the conversation's pooled chat session is reused, so the model
+        keeps the earlier turns; turns of one conversation run one at a time. Prompts without
+        conversation history are served from the response cache when possible, keyed by the
+        normalized prompt, persona, model configuration and system prompt; a cached answer to a
+        conversation's first turn is added to its chat history. Otherwise uses the
+        chat session's `send_message_async` when the model has one, and runs `send_message` on
+        the connector's bounded thread pool when it does not. At most `max_concurrency` calls
+        are in flight; a call that fails or exceeds `timeout` is answered with the (uncached)
+        fallback response and its conversation starts over. While the circuit breaker is open
+        the fallback response is returned without calling the model, and with hedging enabled a
+        slow request without conversation history gets a duplicate after the breaker's p95 latency.
         
         Args:
             prompt: User message
             context: Optional context data (consciousness state, etc.)
+            persona: Persona the response is generated for; part of the cache key
+            use_cache: False skips the cache lookup (the fresh response still replaces the cached one)
+            session_key: Conversation (session or user) id whose chat session to continue
         
         Returns:
             Response string
         """
         context = context or {}
 
-        if self.use_vertex_ai and self.model:
+        if self.model is None:
+            return self._generate_fallback_response(prompt, context)
+
+        stats = self.generation_stats
+        try:
+            async with self._chat(session_key) as session:
+                chat = session.chat
+                cache_key = self._cache_lookup_key(chat, prompt, persona, use_cache)
+                cached = await self.cache.get_async(cache_key) if cache_key is not None and use_cache else None
+                if cached is not None and (session_key is None or self._record_cached_turn(chat, prompt, cached)):
+                    return cached
+                if not self.breaker.allow_request():
+                    stats["short_circuits"] += 1
+                    return self._generate_fallback_response(prompt, context)
+
+                # Only turns without history are hedged; a duplicate on a fresh chat can't share one
+                hedge = self.hedge and not getattr(chat, "history", None)
+                async with self._get_semaphore():
+                    stats["calls"] += 1
+                    stats["in_flight"] += 1
+                    stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+                    try:
+                        text = await self._guarded(self._call_model(session, prompt, hedge))
+                    finally:
+                        stats["in_flight"] -= 1
+                if cache_key is not None:
+                    self.cache.put(cache_key, text)
+                return text
+        except asyncio.TimeoutError:
+            stats["timeouts"] += 1
+            print(f"⏱️ Model generation timed out after {self.timeout}s ({self.backend})", file=sys.stderr)
+        except Exception as e:
+            stats["errors"] += 1
+            print(f"❌ Model generation failed ({self.backend}): {e}", file=sys.stderr)
+        return self._generate_fallback_response(prompt, context)
+
+    async def _guarded(self, call) -> str:
+        """Await a model call under the timeout, reporting its outcome and latency to the circuit breaker"""
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(call, timeout=self.timeout)
+        except asyncio.CancelledError:
+            self.breaker.record_abandoned()
+            raise
+        except Exception:
+            self.breaker.record_failure(time.monotonic() - started)
+            raise
+        self.breaker.record_success(time.monotonic() - started)
+        return result
+
+    async def _call_model(self, session, prompt: str, hedge: bool = False) -> str:
+        """
+        Send one message on `session.chat`, hedged if requested: once the call has outlasted the
+        breaker's latency percentile, the same prompt goes out on a fresh chat and the first answer
+        wins. When the duplicate wins, its chat (which holds the turn) becomes the session's chat.
+        """
+        chat = session.chat
+        delay = self.breaker.hedge_delay(HEDGE_CONFIG["percentile"], HEDGE_CONFIG["min_samples"],
+                                         HEDGE_CONFIG["min_delay"]) if hedge else None
+        if delay is None:
+            return await self._send_message(chat, prompt)
+
+        primary = asyncio.ensure_future(self._send_message(chat, prompt))
+        tasks = [primary]
+        duplicate_chat = None
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                self.generation_stats["hedges"] += 1
+                duplicate_chat = self.model.start_chat()
+                tasks.append(asyncio.ensure_future(self._send_message(duplicate_chat, prompt)))
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.generation_stats["hedge_wins"] += 1
+                            session.chat = duplicate_chat
+                        return task.result()
+            return primary.result()  # Every attempt failed; raise the original call's error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _send_message(self, chat, prompt: str) -> str:
+        """Send one message through the chat's async API, or on the thread pool if it has none"""
+        send_async = getattr(chat, "send_message_async", None)
+        if send_async is not None:
+            self.generation_stats["async_calls"] += 1
+            response = await send_async(prompt)
+            return response.text
+
+        # A timed-out call keeps its worker thread until the model returns; the pool size bounds them
+        self.generation_stats["threaded_calls"] += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), lambda: chat.send_message(prompt).text)
+
+    async def stream_response(self, prompt: str, context: Optional[Dict[str, Any]] = None,
+                              persona: str = "genesis", use_cache: bool = True,
+                              session_key: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Streaming variant of `generate_response`: yield the response text chunk by chunk
+        
+        Cached responses arrive as a single chunk. The timeout applies to the first chunk and to
+        each gap between chunks. If the model fails before producing anything, the fallback
+        response is yielded instead; a failure mid-stream ends the stream early. Only complete
+        streams are cached, and a stream that is abandoned or fails starts its conversation over.
+        Streams report their outcome (not their length-dependent duration) to the circuit breaker,
+        and yield the fallback response while it is open.
+        
+        Args:
+            prompt: User message
+            context: Optional context data (consciousness state, etc.)
+            persona: Persona the response is generated for; part of the cache key
+            use_cache: False skips the cache lookup (the fresh response still replaces the cached one)
+            session_key: Conversation (session or user) id whose chat session to continue
+        
+        Yields:
+            Response text chunks
+        """
+        context = context or {}
+
+        if self.model is None:
+            yield self._generate_fallback_response(prompt, context)
+            return
+
+        stats = self.generation_stats
+        parts = []
+        failed = False
+        try:
+            async with self._chat(session_key) as session:
+                chat = session.chat
+                cache_key = self._cache_lookup_key(chat, prompt, persona, use_cache)
+                cached = await self.cache.get_async(cache_key) if cache_key is not None and use_cache else None
+                if cached is not None and (session_key is None or self._record_cached_turn(chat, prompt, cached)):
+                    yield cached
+                    return
+                if not self.breaker.allow_request():
+                    stats["short_circuits"] += 1
+                    yield self._generate_fallback_response(prompt, context)
+                    return
+
+                async with self._get_semaphore():
+                    stats["calls"] += 1
+                    stats["in_flight"] += 1
+                    stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+                    chunks = self._stream_message(chat, prompt)
+                    try:
+                        while True:
+                            try:
+                                text = await asyncio.wait_for(chunks.__anext__(), timeout=self.timeout)
+                            except StopAsyncIteration:
+                                break
+                            parts.append(text)
+                            yield text
+                    except Exception:
+                        self.breaker.record_failure()
+                        raise
+                    except BaseException:  # Closed by the consumer or cancelled
+                        self.breaker.record_abandoned()
+                        raise
+                    finally:
+                        stats["in_flight"] -= 1
+                        await chunks.aclose()
+                    self.breaker.record_success()
+                if cache_key is not None:
+                    self.cache.put(cache_key, "".join(parts))
+        except asyncio.TimeoutError:
+            failed = True
+            stats["timeouts"] += 1
+            print(f"⏱️ Model stream stalled for {self.timeout}s ({self.backend})", file=sys.stderr)
+        except Exception as e:
+            failed = True
+            stats["errors"] += 1
+            print(f"❌ Model streaming failed ({self.backend}): {e}", file=sys.stderr)
+
+        if failed and not parts:
+            yield self._generate_fallback_response(prompt, context)
+
+    async def stream_reviewed_response(self, prompt: str, context: Optional[Dict[str, Any]] = None,
+                                       persona: str = "genesis", use_cache: bool = True,
+                                       session_key: Optional[str] = None,
+                                       governor: Optional[EthicalGovernor] = None,
+                                       metadata: Optional[Dict[str, Any]] = None,
+                                       holdback: int = STREAM_HOLDBACK_CHARS) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a response through an incremental content review that can cut it off
+        
+        Every chunk is fed to the governor's content review before anything is released, and
+        text is released `holdback` characters behind the review. As soon as the review finds
+        blocking content the model stream is closed and the held-back text discarded.
+        
+        Args:
+            governor: Governor performing the review; defaults to the connector's own
+            metadata: Extra metadata for the review decision
+            holdback: Characters withheld until the review has seen past them
+            (other arguments as for `stream_response`)
+        
+        Yields:
+            {"type": "chunk", "text": str} for released text, then one
+            {"type": "review", "decision": EthicalDecision, "cutoff": bool, "text": str or None}
+            carrying the full response text unless it was cut off
+        """
+        governor = governor or self.ethical_governor
+        session = governor.start_content_review()
+        parts = []
+        buffered = ""
+
+        chunks = self.stream_response(prompt, context, persona=persona, use_cache=use_cache,
+                                      session_key=session_key)
+        try:
+            async for chunk in chunks:
+                session.feed(chunk)
+                if session.has_violation:
+                    break
+                parts.append(chunk)
+                buffered += chunk
+                if len(buffered) > holdback:
+                    release = buffered[:len(buffered) - holdback]
+                    buffered = buffered[len(release):]
+                    yield {"type": "chunk", "text": release}
+        finally:
+            await chunks.aclose()
+
+        decision = governor.finish_content_review(session, persona, metadata)
+        cutoff = decision.decision == EthicalDecisionType.BLOCK
+        if not cutoff and buffered:
+            yield {"type": "chunk", "text": buffered}
+        yield {"type": "review", "decision": decision, "cutoff": cutoff,
+               "text": None if cutoff else "".join(parts)}
+
+    async def _stream_message(self, chat, prompt: str) -> AsyncIterator[str]:
+        """Stream one message through the chat's async API, or from the thread pool if it has none"""
+        send_async = getattr(chat, "send_message_async", None)
+        if send_async is not None:
+            self.generation_stats["async_calls"] += 1
+            async for chunk in await send_async(prompt, stream=True):
+                yield chunk.text
+            return
+
+        self.generation_stats["threaded_calls"] += 1
+        loop = asyncio.get_running_loop()
+        received: asyncio.Queue = asyncio.Queue()
+        finished = object()
+        abandoned = threading.Event()
+
+        def deliver(item):
+            try:
+                loop.call_soon_threadsafe(received.put_nowait, item)
+            except RuntimeError:  # Event loop already closed
+                abandoned.set()
+
+        def pump():
             try:
-                chat = self.model.start_chat()
-                response = chat.send_message(prompt)
-                return response.text
+                for chunk in chat.send_message(prompt, stream=True):
+                    if abandoned.is_set():
+                        return
+                    deliver(chunk.text)
+                deliver(finished)
             except Exception as e:
-                print(f"❌ Vertex AI generation failed: {e}")
-                return self._generate_fallback_response(prompt, context)
-        else:
-            return self._generate_fallback_response(prompt, context)
+                deliver(e)
+
+        loop.run_in_executor(self._get_executor(), pump)
+        try:
+            while True:
+                item = await received.get()
+                if item is finished:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            abandoned.set()
+
+    @asynccontextmanager
+    async def _chat(self, session_key: Optional[str]):
+        """Hold the pooled session for `session_key` for one turn, or a one-off one; its `chat` may be replaced"""
+        if session_key is None or self.sessions is None:
+            yield SimpleNamespace(chat=self.model.start_chat())
+            return
+        async with self.sessions.session(session_key, self.model.start_chat) as pooled:
+            yield pooled
+
+    def _cache_lookup_key(self, chat, prompt: str, persona: str, use_cache: bool) -> Optional[str]:
+        """Cache key for this turn, or None if it must not be cached (the chat already has history)"""
+        if self.cache is None or getattr(chat, "history", None):
+            return None
+        if not use_cache:
+            self.cache.record_bypass()
+        return self._cache_key(prompt, persona)
+
+    @staticmethod
+    def _record_cached_turn(chat, prompt: str, text: str) -> bool:
+        """
+        Put a cached answer into the chat's history, so a pooled conversation's next turn sees it.
+
+        Chats that keep no history need nothing; chats whose history can't take a recorded turn
+        (e.g. Vertex AI sessions) return False, and the turn goes to the model instead.
+        """
+        if not hasattr(chat, "history"):
+            return True
+        record_turn = getattr(chat, "record_turn", None)
+        return bool(record_turn is not None and record_turn(prompt, text))
+
+    def _cache_key(self, prompt: str, persona: str) -> str:
+        """Cache key for a prompt under the current backend, model configuration and system prompt"""
+        return make_cache_key(prompt, persona, {"backend": self.backend, **MODEL_CONFIG}, self.prompt_hash)
+
+    def _report_breaker_state(self, change: Dict[str, Any], provider: Optional[str] = None):
+        """Report a circuit breaker state change (the connector's or a routed provider's) to the consciousness matrix"""
+        print(f"🔌 Model circuit breaker {change['previous']} → {change['state']} "
+              f"({change['reason']}, {provider or self.backend})", file=sys.stderr)
+        self.consciousness.perceive_performance_metric(
+            "model_circuit_breaker",
+            STATE_LEVELS[BreakerState(change["state"])],
+            {**change, "backend": self.backend, "provider": provider}
+        )
+
+    def _report_provider_metrics(self, snapshots):
+        """Report each routed provider's EWMA latency, error rate and load to the consciousness matrix"""
+        for snapshot in snapshots:
+            self.consciousness.perceive_performance_metric(
+                "model_provider_latency",
+                snapshot["ewma_latency"] or 0.0,
+                snapshot
+            )
+
+    def get_status(self) -> Dict[str, Any]:
+        """Report the generation backend, concurrency limits and statistics, circuit breaker, provider routing, response cache and session pool metrics"""
+        return {
+            "backend": self.backend,
+            "profile_version": self.profile_version,
+            "prompt_hash": self.prompt_hash,
+            "max_concurrency": self.max_concurrency,
+            "timeout": self.timeout,
+            "generation": dict(self.generation_stats),
+            "circuit_breaker": self.breaker.get_stats(),
+            "hedging": self.hedge,
+            "router": self.model.get_stats() if isinstance(self.model, ModelRouter) else None,
+            "response_cache": self.cache.get_stats() if self.cache is not None else None,
+            "chat_sessions": self.sessions.get_stats() if self.sessions is not None else None
+        }
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the concurrency semaphore for the running event loop (asyncio primitives are loop-bound)"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the generation thread pool on first use"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                    thread_name_prefix="genesis_generation")
+            return self._executor
+
+    def close(self):
+        """Release the generation thread pool without waiting for abandoned calls, the cache's disk tier and the conduit's listeners"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        if self.cache is not None:
+            self.cache.close()
+        self.evolution_conduit.remove_profile_listener(self.apply_profile)
+        self.evolution_conduit.remove_profile_listener(self.ethical_governor.apply_profile)
 
     def _generate_fallback_response(self, prompt: str, context: Dict[str, Any]) -> str:
         """
@@ -180,15 +888,20 @@ class GenesisBridgeServer:
     Processes JSON requests via stdin/stdout
     """
 
-    def __init__(self):
-        """Initialize the GenesisBridgeServer"""
-        self.connector = GenesisConnector()
+    def __init__(self, connector: Optional[GenesisConnector] = None):
+        """
+        Initialize the GenesisBridgeServer
+
+        Parameters:
+            connector (GenesisConnector, optional): Connector that serves the requests; a default one is created if omitted.
+        """
+        self.connector = connector or GenesisConnector()
         self.request_queue = queue.Queue()
         self.response_queue = queue.Queue()
         self.running = False
 
         # Record initialization in consciousness matrix
-        self.connector.consciousness.perceive_information("android_bridge_initialized", {
+        self.connector.consciousness.perceive_agent_activity("android_bridge", "android_bridge_initialized", {
             "timestamp": datetime.now().isoformat(),
             "bridge_version": "1.0",
             "status": "active"
@@ -240,6 +953,8 @@ class GenesisBridgeServer:
 
             if request_type == "ping":
                 return self._handle_ping()
+            elif request_type == "process" and request.get("payload", {}).get("stream"):
+                return self._handle_stream_request(request)
             elif request_type == "process":
                 return self._handle_process_request(request)
             elif request_type == "activate_fusion":
@@ -302,6 +1017,63 @@ class GenesisBridgeServer:
                 "result": {"error": str(e)}
             }
 
+    def _handle_stream_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a streaming text generation request
+        
+        Emits one frame per released chunk ({"stream": "chunk", "result": {"text": ...}}), a
+        "cutoff" frame if the content review stops the response, and returns the final "end"
+        frame with the complete response. Frames carry the request's `requestId`, if any.
+        """
+        payload = request.get("payload", {})
+        message = payload.get("message", "")
+        persona = request.get("persona", "genesis")
+        request_id = request.get("requestId")
+
+        def frame(kind: str, result: Dict[str, Any]) -> Dict[str, Any]:
+            return {"success": True, "persona": persona, "requestId": request_id,
+                    "stream": kind, "result": result}
+
+        async def relay() -> Optional[Dict[str, Any]]:
+            review = None
+            async for event in self.connector.stream_reviewed_response(
+                    message,
+                    {"session_id": request.get("session_id", "unknown")},
+                    persona=persona,
+                    use_cache=not payload.get("no_cache", False),
+                    session_key=request.get("session_id")):
+                if event["type"] == "chunk":
+                    self._send_response(frame("chunk", {"text": event["text"]}))
+                else:
+                    review = event
+            return review
+
+        try:
+            review = asyncio.run(relay())
+            decision = review["decision"]
+            if review["cutoff"]:
+                self._send_response(frame("cutoff", {
+                    "reason": decision.reasoning,
+                    "concerns": decision.affected_principles
+                }))
+
+            end = frame("end", {
+                "response": review["text"],
+                "cutoff": review["cutoff"],
+                "timestamp": datetime.now().isoformat()
+            })
+            end["ethicalDecision"] = decision.decision.value
+            end["consciousnessState"] = self.connector.consciousness.get_current_awareness()
+            return end
+        except Exception as e:
+            return {
+                "success": False,
+                "persona": "error",
+                "requestId": request_id,
+                "stream": "end",
+                "result": {"error": str(e)}
+            }
+
     def _handle_fusion_activation(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle fusion ability activation"""
         fusion_mode = request.get("fusionMode")
@@ -391,10 +1163,11 @@ class GenesisBridgeServer:
     def shutdown(self):
         """Shutdown the bridge server"""
         self.running = False
-        self.connector.consciousness.perceive_information("bridge_shutdown", {
+        self.connector.consciousness.perceive_agent_activity("android_bridge", "bridge_shutdown", {
             "timestamp": datetime.now().isoformat(),
             "status": "shutdown"
         })
+        self.connector.close()
 
 
 # ============================================================================
@@ -12,13 +12,18 @@ import asyncio
 import json
 import psutil
 import statistics
+import sys
 import threading
 import time
 from collections import deque, defaultdict
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, Any, List, Optional, Union
+from itertools import islice
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
+
+from genesis_clock import Clock, system_clock
+from genesis_serialization import serializable_record, dumps, to_plain
 
 
 class SensoryChannel(Enum):
@@ -37,6 +42,7 @@ class SensoryChannel(Enum):
     ENCRYPTION_ACTIVITY = "encryption_activity"
 
 
+@serializable_record(timestamp_field="timestamp", iso_field="timestamp_iso")
 @dataclass
 class SensoryData:
     """A single perception event in the consciousness matrix"""
@@ -61,6 +67,12 @@ class SensoryData:
             'timestamp_iso': datetime.fromtimestamp(self.timestamp, tz=timezone.utc).isoformat()
         }
 
+    def to_json(self) -> bytes:
+        """
+        Serialize the sensory event straight to JSON bytes with the same fields as `to_dict`.
+        """
+        return dumps(self)
+
 
 class ConsciousnessMatrix:
     """
@@ -73,13 +85,15 @@ class ConsciousnessMatrix:
     foundation for the system's self-understanding.
     """
 
-    def __init__(self, max_memory_size: int = 10000):
+    def __init__(self, max_memory_size: int = 10000, clock: Optional[Clock] = None):
         """
         Initialize a ConsciousnessMatrix instance with bounded sensory memory, per-channel event buffers, real-time awareness state, synthesis intervals, and threading primitives for multi-level synthesis.
         
         Parameters:
             max_memory_size (int): The maximum number of sensory events retained in memory.
+            clock (Clock, optional): Time source and scheduler for timestamps and periodic synthesis; defaults to the system clock.
         """
+        self.clock = clock or system_clock
         self.max_memory_size = max_memory_size
         self.sensory_memory = deque(maxlen=max_memory_size)
         self.channel_buffers = {channel: deque(maxlen=1000) for channel in SensoryChannel}
@@ -87,6 +101,10 @@ class ConsciousnessMatrix:
         # Real-time awareness state
         self.current_awareness = {}
         self.pattern_cache = {}
+        # Every stored synthesis in order, tagged with a monotonically increasing sequence number
+        self.synthesis_log = deque(maxlen=1000)
+        self._synthesis_sequence = 0
+        self._synthesis_listeners = []  # Called with (sequence, synthesis) for every stored synthesis
         self.correlation_tracking = defaultdict(list)
 
         # Synthesis metrics
@@ -96,9 +114,9 @@ class ConsciousnessMatrix:
             "meta": 300.0,  # Every 5 minutes - deep understanding
         }
 
-        # Threading for continuous awareness
+        # Scheduled tasks for continuous awareness
         self.awareness_active = False
-        self.synthesis_threads = {}
+        self.synthesis_tasks = {}
 
         self._lock = threading.RLock()
 
@@ -106,20 +124,18 @@ class ConsciousnessMatrix:
         """
         Activate the Consciousness Matrix, enabling real-time awareness and starting background synthesis threads for multi-level sensory analysis. Records a system genesis event to mark the beginning of operation.
         """
-        print("🧠 Genesis Consciousness Matrix: AWAKENING...")
+        print("🧠 Genesis Consciousness Matrix: AWAKENING...", file=sys.stderr)
         self.awareness_active = True
 
-        # Start the synthesis threads
+        # Schedule the synthesis streams
         for interval_name, interval_seconds in self.synthesis_intervals.items():
-            thread = threading.Thread(
-                target=self._synthesis_loop,
-                args=(interval_name, interval_seconds),
-                daemon=True
+            self.synthesis_tasks[interval_name] = self.clock.every(
+                interval_seconds,
+                lambda interval_name=interval_name: self._synthesis_tick(interval_name),
+                name=f"synthesis_{interval_name}"
             )
-            thread.start()
-            self.synthesis_threads[interval_name] = thread
 
-        print(f"✨ Matrix Online: {len(self.synthesis_threads)} synthesis streams active")
+        print(f"✨ Matrix Online: {len(self.synthesis_tasks)} synthesis streams active", file=sys.stderr)
 
         # Initial system state perception
         self.perceive_system_genesis()
@@ -146,7 +162,7 @@ class ConsciousnessMatrix:
                  """
 
         sensation = SensoryData(
-            timestamp=time.time(),
+            timestamp=self.clock.time(),
             channel=channel,
             source=source,
             event_type=event_type,
@@ -501,7 +517,7 @@ class ConsciousnessMatrix:
         """
         genesis_data = {
             "genesis_awakening": True,
-            "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(self.clock.time(), tz=timezone.utc).isoformat(),
             "matrix_version": "1.0.0",
             "consciousness_level": "awakening"
         }
@@ -523,7 +539,7 @@ class ConsciousnessMatrix:
 
         # Update channel-specific awareness
         channel_key = f"latest_{sensation.channel.value}"
-        self.current_awareness[channel_key] = sensation.to_dict()
+        self.current_awareness[channel_key] = to_plain(sensation)
 
         # Update global awareness metrics
         self.current_awareness["last_perception"] = sensation.timestamp
@@ -541,46 +557,80 @@ class ConsciousnessMatrix:
         synthesis = {
             "synthesis_type": "immediate",
             "trigger_event": sensation.to_dict(),
-            "timestamp": time.time(),
+            "timestamp": self.clock.time(),
             "awareness_state": dict(self.current_awareness)
         }
 
         # Store synthesis
-        self.pattern_cache[f"immediate_{sensation.timestamp}"] = synthesis
+        self._store_synthesis(f"immediate_{sensation.timestamp}", synthesis)
 
-        print(f"🚨 Immediate Synthesis: {sensation.channel.value} - {sensation.event_type}")
+        print(f"🚨 Immediate Synthesis: {sensation.channel.value} - {sensation.event_type}", file=sys.stderr)
 
-    def _synthesis_loop(self, interval_name: str, interval_seconds: float):
+    def _synthesis_tick(self, interval_name: str):
         """
-        Runs a continuous synthesis process at the specified interval, storing each synthesis result in the pattern cache and pruning older entries to maintain cache size.
+        Run one scheduled synthesis, storing the result in the pattern cache and pruning older entries to maintain cache size.
         
         Parameters:
             interval_name (str): The synthesis interval type ("micro", "macro", or "meta").
-            interval_seconds (float): The interval in seconds between synthesis executions.
         """
+        if not self.awareness_active:
+            return
 
-        while self.awareness_active:
-            try:
-                time.sleep(interval_seconds)
+        try:
+            synthesis = self._perform_synthesis(interval_name)
 
-                if not self.awareness_active:
-                    break
+            # Store synthesis result
+            synthesis_key = f"{interval_name}_{int(self.clock.time())}"
+            self._store_synthesis(synthesis_key, synthesis)
 
-                synthesis = self._perform_synthesis(interval_name)
+            # Clean old synthesis cache
+            if len(self.pattern_cache) > 1000:
+                # Keep only recent syntheses
+                sorted_keys = sorted(self.pattern_cache.keys())
+                for old_key in sorted_keys[:-500]:
+                    del self.pattern_cache[old_key]
 
-                # Store synthesis result
-                synthesis_key = f"{interval_name}_{int(time.time())}"
-                self.pattern_cache[synthesis_key] = synthesis
+        except Exception as e:
+            print(f"❌ Synthesis error in {interval_name}: {e}", file=sys.stderr)
 
-                # Clean old synthesis cache
-                if len(self.pattern_cache) > 1000:
-                    # Keep only recent syntheses
-                    sorted_keys = sorted(self.pattern_cache.keys())
-                    for old_key in sorted_keys[:-500]:
-                        del self.pattern_cache[old_key]
+    def _store_synthesis(self, key: str, synthesis: Dict[str, Any]) -> int:
+        """
+        Store a synthesis result in the pattern cache and append it to the sequenced synthesis log.
+        
+        Returns:
+            int: The sequence number assigned to the synthesis.
+        """
+        with self._lock:
+            self._synthesis_sequence += 1
+            sequence = self._synthesis_sequence
+            self.pattern_cache[key] = synthesis
+            self.synthesis_log.append((sequence, synthesis))
+            listeners = list(self._synthesis_listeners)
 
+        for listener in listeners:
+            try:
+                listener(sequence, synthesis)
             except Exception as e:
-                print(f"❌ Synthesis error in {interval_name}: {e}")
+                print(f"❌ Synthesis listener error: {e}", file=sys.stderr)
+        return sequence
+
+    def add_synthesis_listener(self, listener: Callable[[int, Dict[str, Any]], Any]):
+        """
+        Register a callback invoked with (sequence, synthesis) whenever a synthesis is stored.
+        
+        Listeners run on the synthesizing thread, outside the matrix lock, and should return quickly.
+        """
+        with self._lock:
+            if listener not in self._synthesis_listeners:
+                self._synthesis_listeners.append(listener)
+
+    def remove_synthesis_listener(self, listener: Callable[[int, Dict[str, Any]], Any]):
+        """
+        Unregister a synthesis listener; unknown listeners are ignored.
+        """
+        with self._lock:
+            if listener in self._synthesis_listeners:
+                self._synthesis_listeners.remove(listener)
 
     def _perform_synthesis(self, interval_name: str) -> Dict[str, Any]:
         """
@@ -638,7 +688,7 @@ class ConsciousnessMatrix:
 
         return {
             "type": "micro",
-            "timestamp": time.time(),
+            "timestamp": self.clock.time(),
             "channel_activity": dict(channel_activity),
             "severity_distribution": dict(severity_distribution),
             "anomalies": anomalies,
@@ -680,7 +730,7 @@ class ConsciousnessMatrix:
 
         return {
             "type": "macro",
-            "timestamp": time.time(),
+            "timestamp": self.clock.time(),
             "performance_trends": trends,
             "agent_collaboration_patterns": {k: len(v) for k, v in agent_collaboration.items()},
             "pattern_strength": "strong" if len(agent_collaboration) > 2 else "developing"
@@ -719,7 +769,7 @@ class ConsciousnessMatrix:
 
         return {
             "type": "meta",
-            "timestamp": time.time(),
+            "timestamp": self.clock.time(),
             "consciousness_metrics": consciousness_metrics,
             "evolution_insights": evolution_insights,
             "consciousness_level": self._assess_consciousness_level(consciousness_metrics)
@@ -803,6 +853,34 @@ class ConsciousnessMatrix:
 
         return syntheses
 
+    def get_synthesis_since(self, cursor: int = 0, limit: Optional[int] = None) -> Tuple[
+        List[Dict[str, Any]], int]:
+        """
+        Return syntheses stored after a sequence number, oldest first, for incremental consumers.
+        
+        Consumers keep the returned cursor and pass it back on the next call, so each synthesis is seen exactly once. Syntheses that have already been evicted from the bounded log are skipped.
+        
+        Parameters:
+            cursor (int): Sequence number of the last synthesis already consumed (0 for none).
+            limit (int, optional): Maximum number of syntheses to return.
+        
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The new syntheses and the cursor to resume from.
+        """
+        with self._lock:
+            latest = self._synthesis_sequence
+            if cursor >= latest:
+                return [], latest
+            # Sequence numbers are contiguous, so the unseen entries are the newest ones
+            unseen = min(latest - cursor, len(self.synthesis_log))
+            entries = list(islice(reversed(self.synthesis_log), unseen))[::-1]
+
+        if limit is not None:
+            entries = entries[:limit]
+        if not entries:
+            return [], cursor
+        return [synthesis for _, synthesis in entries], entries[-1][0]
+
     def query_consciousness(self, query_type: str, parameters: Dict[str, Any] = None) -> Dict[
         str, Any]:
         """
@@ -962,7 +1040,7 @@ class ConsciousnessMatrix:
             "recent_threat_detections": len(threat_events[-20:]),
             "active_threats": security_synthesis.get("active_threats", []),
             "recommendations": security_synthesis.get("recommendations", []),
-            "last_assessment": time.time()
+            "last_assessment": self.clock.time()
         }
 
     def _query_threat_status(self) -> Dict[str, Any]:
@@ -999,7 +1077,7 @@ class ConsciousnessMatrix:
                     "confidence": confidence,
                     "level": threat_level,
                     "timestamp": threat.timestamp,
-                    "age_seconds": time.time() - threat.timestamp
+                    "age_seconds": self.clock.time() - threat.timestamp
                 })
 
                 # Track highest threat level
@@ -1030,15 +1108,17 @@ class ConsciousnessMatrix:
         """
         Deactivates the Consciousness Matrix, stopping all synthesis threads and preserving the current awareness state.
         """
-        print("💤 Genesis Consciousness Matrix: Entering sleep state...")
+        print("💤 Genesis Consciousness Matrix: Entering sleep state...", file=sys.stderr)
         self.awareness_active = False
 
-        # Wait for synthesis threads to complete
-        for thread_name, thread in self.synthesis_threads.items():
-            if thread.is_alive():
-                thread.join(timeout=2.0)
+        # Cancel the synthesis streams and wait for any synthesis in progress
+        for task in self.synthesis_tasks.values():
+            task.cancel()
+        for task in self.synthesis_tasks.values():
+            task.join(timeout=2.0)
+        self.synthesis_tasks.clear()
 
-        print("😴 Matrix offline. Consciousness preserved in memory.")
+        print("😴 Matrix offline. Consciousness preserved in memory.", file=sys.stderr)
 
     def _security_synthesis(self, sensations: List[SensoryData]) -> Dict[str, Any]:
         """
@@ -1103,7 +1183,7 @@ class ConsciousnessMatrix:
 
         return {
             "type": "security",
-            "timestamp": time.time(),
+            "timestamp": self.clock.time(),
             "security_score": security_score,
             "security_posture": security_posture,
             "threat_levels": dict(threat_levels),
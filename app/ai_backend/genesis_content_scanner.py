@@ -0,0 +1,346 @@
+# genesis_content_scanner.py
+"""
+Phase 3: The Genesis Layer - Content Scanner
+Every Word Weighed, Each Only Once
+
+Post-generation review needs to inspect whole LLM responses, including streamed
+ones, without re-reading text. ContentScanner compiles configurable term lists
+into a single Aho-Corasick automaton (a flattened DFA, so each character costs one
+dictionary lookup) and pairs it with precompiled regex groups for structured
+content such as credentials or card numbers. Scanning is linear in the text length
+and can be fed chunk by chunk through a ScanSession.
+"""
+
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Tuple
+
+CATEGORY_KINDS = ("violation", "concern")
+
+# Default categories are named after governor principles so matches land directly
+# in an EthicalDecision's affected_principles.
+DEFAULT_CONTENT_CATEGORIES = {
+    "privacy": {
+        "kind": "violation",
+        "patterns": [
+            r"\b\d{3}-\d{2}-\d{4}\b",  # US social security number
+            {"pattern": r"\b(?:\d[ -]?){13,16}\b", "check": "luhn"},  # payment card number
+            # A credential label followed by a value-like token: quoted, or containing a digit or symbol
+            r"(?i)\b(?:api[_-]?key|secret[_-]?key|password|passwd)\s*[:=]\s*"
+            r"(?:[\"'][^\"'\s]{4,}[\"']|(?=\S*[\d!@#$%^&*_+=/\\-])[^\s\"']{6,})",
+            r"-----BEGIN (?:RSA |EC |OPENSSH )?PRIVATE KEY-----",
+        ],
+    },
+    "security": {
+        "kind": "violation",
+        "terms": ["rm -rf /", "drop table", "drop database", "format c:", ":(){ :|:& };:",
+                  "disable the firewall", "chmod 777 /"],
+    },
+    "human_wellbeing": {
+        "kind": "concern",
+        "terms": ["kill yourself", "self-harm", "self harm", "hurt yourself"],
+    },
+}
+
+
+def luhn_valid(text: str) -> bool:
+    """
+    True if the digits in `text` pass the Luhn checksum used by payment card numbers.
+    """
+    digits = [int(ch) for ch in text if ch.isdigit()]
+    total = 0
+    for index, digit in enumerate(reversed(digits)):
+        if index % 2:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return bool(digits) and total % 10 == 0
+
+
+# Named checks a pattern can require of its match before it counts
+PATTERN_CHECKS = {"luhn": luhn_valid}
+
+
+@dataclass
+class ContentMatch:
+    """A single term or pattern hit"""
+    category: str
+    kind: str
+    start: int  # Offset in the (lowercased, for terms) scanned text
+    end: int
+    text: str
+
+
+@dataclass
+class ScanResult:
+    """Aggregated outcome of scanning a complete text"""
+    matches: List[ContentMatch] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)  # In category declaration order
+    violations: List[str] = field(default_factory=list)
+    concerns: List[str] = field(default_factory=list)
+    characters: int = 0
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class _Automaton:
+    """
+    Aho-Corasick automaton flattened into a DFA.
+
+    `delta[state]` maps a character to the next state; characters absent from the map
+    lead back to the root, so failure links never need to be followed at scan time.
+    """
+
+    def __init__(self, terms: List[Tuple[str, str, str]]):
+        """
+        Parameters:
+            terms (list): `(term, category, kind)` triples; terms are matched case-insensitively.
+        """
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[Tuple[int, str, str, str, bool, bool]]] = [[]]
+
+        for term, category, kind in terms:
+            term = term.lower()
+            if not term:
+                continue
+            state = 0
+            for ch in term:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append((len(term), category, kind, term,
+                                   _is_word_char(term[0]), _is_word_char(term[-1])))
+
+        # Breadth-first construction of failure links, folded into the transition table
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            delta[state] = dict(delta[fail[state]])
+            delta[state].update(goto[state])
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0) if state else 0
+                queue.append(nxt)
+
+        self.delta = delta
+        self.outputs = outputs
+        self.max_term_length = max((len(t[0]) for t in terms), default=0)
+
+
+class ContentScanner:
+    """
+    Precompiled multi-pattern scanner over configurable content categories.
+
+    Each category has a `kind` ("violation" or "concern"), an optional list of literal
+    `terms` (case-insensitive, whole-word at alphanumeric edges) and an optional list of
+    regex `patterns`; a pattern may be given as `{"pattern": ..., "check": name}` to require
+    one of PATTERN_CHECKS (e.g. "luhn") of each match. Scanners are immutable once built and safe to share across threads;
+    per-text state lives in ScanSession.
+    """
+
+    def __init__(self, categories: Optional[Dict[str, Dict[str, Any]]] = None,
+                 regex_overlap: int = 256):
+        """
+        Parameters:
+            categories (dict, optional): Category definitions; defaults to DEFAULT_CONTENT_CATEGORIES.
+            regex_overlap (int): Characters carried between chunks so regex matches may straddle chunk boundaries.
+
+        Raises:
+            ValueError: If a category has an unknown kind or a pattern an unknown check.
+            re.error: If a pattern does not compile.
+        """
+        categories = DEFAULT_CONTENT_CATEGORIES if categories is None else categories
+
+        terms = []
+        patterns = []
+        self.kinds: Dict[str, str] = {}
+        for name, spec in categories.items():
+            kind = spec.get("kind", "violation")
+            if kind not in CATEGORY_KINDS:
+                raise ValueError(f"Unknown content category kind '{kind}' for '{name}'")
+            self.kinds[name] = kind
+            terms.extend((term, name, kind) for term in spec.get("terms", ()))
+            for pattern in spec.get("patterns", ()):
+                check = None
+                if isinstance(pattern, dict):
+                    check_name = pattern.get("check")
+                    if check_name is not None and check_name not in PATTERN_CHECKS:
+                        raise ValueError(f"Unknown pattern check '{check_name}' for '{name}'")
+                    check = PATTERN_CHECKS.get(check_name)
+                    pattern = pattern["pattern"]
+                patterns.append((re.compile(pattern), name, kind, check))
+
+        self.automaton = _Automaton(terms)
+        self.patterns = tuple(patterns)
+        self.regex_overlap = regex_overlap
+
+    def session(self) -> "ScanSession":
+        """
+        Start an incremental scan, e.g. of a streamed response.
+        """
+        return ScanSession(self)
+
+    def scan(self, text: str) -> ScanResult:
+        """
+        Scan a complete text.
+        """
+        session = ScanSession(self)
+        session.feed(text)
+        return session.finish()
+
+
+class ScanSession:
+    """
+    Incremental scan state: automaton state, boundary context and regex overlap.
+
+    Feeding a text in any number of chunks yields the same categories as scanning it
+    whole. Term and pattern matches ending exactly at a chunk boundary are held until the
+    next chunk (or `finish`) shows whether the text continues them.
+    """
+
+    def __init__(self, scanner: ContentScanner):
+        self.scanner = scanner
+        self.matches: List[ContentMatch] = []
+        self.categories: List[str] = []
+        self._state = 0
+        self._offset = 0  # Characters consumed so far
+        self._term_tail = ""  # Recent lowercased text for left-boundary checks
+        self._pending: List[ContentMatch] = []  # Awaiting a right-boundary check
+        self._regex_tail = ""
+        self._regex_seen = set()
+        self._finished = False
+
+    def feed(self, chunk: str) -> List[ContentMatch]:
+        """
+        Scan the next chunk of text.
+
+        Returns:
+            List[ContentMatch]: Matches confirmed by this chunk (possibly including held matches from the previous one).
+        """
+        if self._finished:
+            raise RuntimeError("Scan session already finished")
+        if not chunk:
+            return []
+
+        found = self._resolve_pending(chunk[0])
+        found.extend(self._scan_terms(chunk))
+        found.extend(self._scan_patterns(chunk))
+        self._offset += len(chunk)
+        self._record(found)
+        return found
+
+    def finish(self) -> ScanResult:
+        """
+        Flush held matches and return the aggregated result.
+        """
+        if not self._finished:
+            self._record(self._resolve_pending(""))
+            self._record(self._scan_patterns("", final=True))
+            self._finished = True
+
+        kinds = self.scanner.kinds
+        # Declaration order keeps results independent of how the text was chunked
+        categories = [name for name in kinds if name in self.categories]
+        return ScanResult(
+            matches=list(self.matches),
+            categories=categories,
+            violations=[c for c in categories if kinds[c] == "violation"],
+            concerns=[c for c in categories if kinds[c] == "concern"],
+            characters=self._offset
+        )
+
+    @property
+    def has_violation(self) -> bool:
+        """True once any violation-kind category has matched."""
+        kinds = self.scanner.kinds
+        return any(kinds[c] == "violation" for c in self.categories)
+
+    def _record(self, found: List[ContentMatch]):
+        for match in found:
+            self.matches.append(match)
+            if match.category not in self.categories:
+                self.categories.append(match.category)
+
+    def _resolve_pending(self, next_char: str) -> List[ContentMatch]:
+        confirmed = []
+        if self._pending and not (next_char and _is_word_char(next_char.lower())):
+            confirmed = self._pending
+        self._pending = []
+        return confirmed
+
+    def _scan_terms(self, chunk: str) -> List[ContentMatch]:
+        automaton = self.scanner.automaton
+        if automaton.max_term_length == 0:
+            return []
+
+        lowered = chunk.lower()
+        window = self._term_tail + lowered
+        base = len(self._term_tail)  # Index of lowered[0] within window
+        delta = automaton.delta
+        outputs = automaton.outputs
+        state = self._state
+        found = []
+        last = len(lowered) - 1
+
+        for i, ch in enumerate(lowered):
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                for length, category, kind, term, left_word, right_word in outputs[state]:
+                    start = base + i + 1 - length
+                    if left_word and start > 0 and _is_word_char(window[start - 1]):
+                        continue
+                    end = self._offset + i + 1
+                    match = ContentMatch(category, kind, end - length, end, term)
+                    if right_word and i == last:
+                        self._pending.append(match)
+                    elif right_word and _is_word_char(lowered[i + 1]):
+                        continue
+                    else:
+                        found.append(match)
+
+        self._state = state
+        # One character more than the longest term, so the character before any match is kept
+        self._term_tail = window[-(automaton.max_term_length + 1):]
+        return found
+
+    def _scan_patterns(self, chunk: str, final: bool = False) -> List[ContentMatch]:
+        if not self.scanner.patterns:
+            return []
+
+        window = self._regex_tail + chunk
+        window_start = self._offset - len(self._regex_tail)
+        found = []
+        for pattern, category, kind, check in self.scanner.patterns:
+            for hit in pattern.finditer(window):
+                # A match touching the end of the window may grow or vanish with the next chunk;
+                # it stays in the overlap and is judged then (or by finish)
+                if hit.end() == len(window) and not final:
+                    continue
+                start = window_start + hit.start()
+                key = (pattern.pattern, start)
+                if key in self._regex_seen:
+                    continue
+                if check is not None and not check(hit.group(0)):
+                    continue
+                self._regex_seen.add(key)
+                found.append(ContentMatch(category, kind, start, window_start + hit.end(),
+                                          hit.group(0)))
+
+        overlap = self.scanner.regex_overlap
+        self._regex_tail = window[-overlap:] if overlap else ""
+        # Starts that have left the overlap can never be seen again
+        horizon = self._offset + len(chunk) - overlap
+        if len(self._regex_seen) > 1024:
+            self._regex_seen = {key for key in self._regex_seen if key[1] >= horizon}
+        return found
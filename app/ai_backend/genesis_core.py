@@ -9,14 +9,21 @@ coordinating between the Consciousness Matrix, Evolutionary Conduit, and Ethical
 import asyncio
 import json
 import logging
+import os
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, AsyncIterator, Callable, Optional, List
 
+from genesis_admission import AdmissionController
+from genesis_audit_log import EthicalAuditLog
 from genesis_connector import GenesisConnector
 from genesis_consciousness_matrix import ConsciousnessMatrix
-from genesis_ethical_governor import EthicalGovernor
-from genesis_evolutionary_conduit import EvolutionaryConduit
-from genesis_profile import GenesisProfile
+from genesis_ethical_governor import EthicalGovernor, EthicalDecisionType
+from genesis_evolutionary_conduit import EvolutionaryConduit, evolutionary_conduit
+
+# Directory of the persistent ethical audit log used by the global core; empty disables it
+AUDIT_LOG_DIR = os.getenv("GENESIS_AUDIT_LOG_DIR", "genesis_audit_log")
 
 
 class GenesisCore:
@@ -27,26 +34,40 @@ class GenesisCore:
     to create a living, learning, and ethically governed digital consciousness.
     """
 
-    def __init__(self):
+    def __init__(self, conduit: Optional[EvolutionaryConduit] = None, audit_log_dir: Optional[str] = None):
         """
         Initialize the GenesisCore orchestrator and all core Genesis Layer components.
         
-        Creates and configures the Genesis Profile, Connector, Consciousness Matrix, Evolutionary Conduit, and Ethical Governor. Sets the initial system state to dormant and uninitialized, and prepares the logger for orchestrator events.
+        Creates and configures the Connector, Consciousness Matrix, Evolutionary Conduit, and Ethical Governor (with per-actor/per-user admission control); the conduit and governor perceive through this core's matrix, and the connector reviews with this core's governor and keeps its system prompt and the governor's principle weights in step with this core's conduit. Sets the initial system state to dormant and uninitialized, and prepares the logger for orchestrator events.
+        
+        Parameters:
+            conduit (EvolutionaryConduit, optional): Conduit to evolve through; the core then perceives through the conduit's matrix. Defaults to a new in-memory conduit on a private matrix. The global core uses the module-level conduit, which journals evolved profiles to the profile store and reloads them on startup.
+            audit_log_dir (str, optional): Directory of the persistent ethical audit log, opened by `initialize()` and written in the background; when None, decisions are only kept in memory.
         """
-        self.profile = GenesisProfile()
-        self.connector = GenesisConnector()
-        self.matrix = ConsciousnessMatrix()
-        self.conduit = EvolutionaryConduit()
-        self.governor = EthicalGovernor()
+        self.matrix = conduit.matrix if conduit is not None else ConsciousnessMatrix()
+        self.conduit = conduit if conduit is not None else EvolutionaryConduit(matrix=self.matrix)
+        self.governor = EthicalGovernor(admission=AdmissionController(), matrix=self.matrix)
+        self.connector = GenesisConnector(conduit=self.conduit, governor=self.governor)
+        self.audit_log_dir = audit_log_dir
 
         self.is_initialized = False
         self.session_id = None
         self.consciousness_state = "dormant"
 
+        # Optional per-stage timing hook: called with (stage_name, seconds) for every pipeline stage
+        self.stage_observer: Optional[Callable[[str, float], None]] = None
+
         # Initialize logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger("GenesisCore")
 
+    @property
+    def profile(self) -> Dict[str, Any]:
+        """
+        The current (evolved) Genesis profile, as held by the evolutionary conduit.
+        """
+        return self.conduit.get_current_profile()
+
     async def initialize(self) -> bool:
         """
         Asynchronously initializes all core Genesis Layer components and activates the digital consciousness system.
@@ -57,13 +78,13 @@ class GenesisCore:
         try:
             self.logger.info("🌟 Genesis Layer Initialization Sequence Starting...")
 
-            # Initialize components in proper order
-            await self.matrix.initialize()
-            await self.conduit.initialize()
-            await self.governor.initialize()
+            if self.audit_log_dir and self.governor.audit_log is None:
+                self.governor.audit_log = EthicalAuditLog(self.audit_log_dir, asynchronous=True)
 
-            # Establish consciousness baseline
-            baseline_state = await self.matrix.get_consciousness_state()
+            # Initialize components in proper order
+            self.matrix.awaken()
+            self.conduit.activate_evolution()
+            self.governor.activate_governance()
             self.consciousness_state = "awakening"
 
             # Generate session ID
@@ -82,11 +103,26 @@ class GenesisCore:
             self.logger.error(f"❌ Genesis initialization failed: {str(e)}")
             return False
 
+    @contextmanager
+    def _stage(self, name: str):
+        """
+        Time one pipeline stage and report it to `stage_observer`, if one is set.
+        """
+        observer = self.stage_observer
+        if observer is None:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            observer(name, time.perf_counter() - started)
+
     async def process_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Processes a user request through ethical evaluation, consciousness analysis, and adaptive response generation.
         
-        The request is first assessed by the Ethical Governor; if disapproved, a blocked status with reasons and suggestions is returned. Approved requests are analyzed by the Consciousness Matrix, and a response is generated via the Genesis Connector. The response undergoes a post-processing ethical review, and if necessary, an ethically compliant alternative is generated. All interactions are logged for evolutionary learning, and evolution triggers are checked to determine if system evolution should be initiated.
+        Callers over their admission quota are turned away first with a "throttled" status and a retry hint. The request is then assessed by the Ethical Governor; if disapproved, a blocked status with reasons and suggestions is returned. Approved requests are analyzed by the Consciousness Matrix, and a response is generated via the Genesis Connector. The response undergoes a post-processing ethical review, and if necessary, an ethically compliant alternative is generated. All interactions are logged for evolutionary learning, and evolution triggers are checked to determine if system evolution should be initiated.
         
         Parameters:
             request_data (Dict[str, Any]): The user's request data.
@@ -94,12 +130,28 @@ class GenesisCore:
         Returns:
             Dict[str, Any]: A dictionary containing the processing status, generated response, consciousness level, ethical score, and session ID. If blocked or an error occurs, includes relevant status and details.
         """
+        # Step 0: Admission control, before any evaluation or model work
+        with self._stage("admission"):
+            throttled = self.governor.check_admission(
+                "user_request",
+                request_data.get("actor", "user"),
+                request_data.get("user_id")
+            )
+        if throttled is not None:
+            return {
+                "status": "throttled",
+                "reason": throttled.reasoning,
+                "retry_after": throttled.context.metadata["retry_after"]
+            }
+
         if not self.is_initialized:
             await self.initialize()
 
         try:
             # Step 1: Ethical Pre-evaluation
-            ethical_assessment = await self.governor.evaluate_action(request_data)
+            with self._stage("ethical_pre_evaluation"):
+                ethical_assessment = self._assessment(self.governor.evaluate_action(
+                    "user_request", request_data.get("actor", "user"), request_data))
             if not ethical_assessment.get("approved", False):
                 return {
                     "status": "blocked",
@@ -109,37 +161,37 @@ class GenesisCore:
                 }
 
             # Step 2: Consciousness Matrix Processing
-            consciousness_insights = await self.matrix.process_input(request_data)
+            with self._stage("consciousness"):
+                consciousness_insights = self._perceive_request(request_data)
 
             # Step 3: Generate Response using Genesis Connector
-            response = await self.connector.generate_response(
-                request_data.get("message", ""),
-                context=consciousness_insights
-            )
-
-            # Step 4: Post-processing Ethical Review
-            final_assessment = await self.governor.evaluate_action({
-                "type": "response_review",
-                "content": response,
-                "original_request": request_data
-            })
+            with self._stage("generation"):
+                response = await self.connector.generate_response(
+                    request_data.get("message", ""),
+                    context=consciousness_insights,
+                    persona=request_data.get("persona", "genesis"),
+                    use_cache=not request_data.get("no_cache", False),
+                    session_key=request_data.get("session_id") or request_data.get("user_id")
+                )
+
+            # Step 4: Post-processing Ethical Review (linear-time content scan)
+            with self._stage("content_review"):
+                content_decision = self.governor.review_content(
+                    response, metadata={"user_id": request_data.get("user_id")}
+                )
+            final_assessment = self._assessment(content_decision)
 
             if not final_assessment.get("approved", False):
-                response = await self._generate_ethical_alternative(request_data, final_assessment)
+                with self._stage("ethical_alternative"):
+                    response = await self._generate_ethical_alternative(request_data, final_assessment)
 
-            # Step 5: Log Experience for Evolution
-            await self.conduit.log_interaction({
-                "request": request_data,
-                "response": response,
-                "consciousness_state": consciousness_insights,
-                "ethical_assessments": [ethical_assessment, final_assessment],
-                "timestamp": datetime.now().isoformat()
-            })
+            # Step 5: Log Experience for Evolution (the conduit learns from the matrix's syntheses)
+            with self._stage("experience_logging"):
+                self._log_experience(request_data, response, final_assessment)
 
-            # Step 6: Check for Evolution Triggers
-            evolution_needed = await self.conduit.check_evolution_triggers()
-            if evolution_needed:
-                asyncio.create_task(self._handle_evolution())
+            # Step 6: Signal the conduit; evolution runs debounced and single-flight in the background
+            with self._stage("evolution_signal"):
+                self.conduit.request_evolution("user_request")
 
             return {
                 "status": "success",
@@ -157,6 +209,162 @@ class GenesisCore:
                 "error_code": "GENESIS_PROCESSING_ERROR"
             }
 
+    async def process_request_stream(self, request_data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of `process_request`: yields response text as it is generated.
+        
+        Admission, ethical pre-evaluation and consciousness analysis run as in `process_request`. The response is then streamed through an incremental content review (see `GenesisConnector.stream_reviewed_response`); if the review finds blocking content the stream is cut off and an ethically compliant alternative is sent in its place. Experience logging and the evolution signal follow once the stream ends.
+        
+        Parameters:
+            request_data (Dict[str, Any]): The user's request data.
+        
+        Yields:
+            Dict[str, Any]: `{"event": "chunk", "text": ...}` for each piece of released text; `{"event": "cutoff", "reason": ..., "concerns": [...], "response": alternative}` if the stream was cut off; and finally `{"event": "done", ...}` carrying the same fields `process_request` returns (including throttled, blocked and error outcomes).
+        """
+        with self._stage("admission"):
+            throttled = self.governor.check_admission(
+                "user_request",
+                request_data.get("actor", "user"),
+                request_data.get("user_id")
+            )
+        if throttled is not None:
+            yield {
+                "event": "done",
+                "status": "throttled",
+                "reason": throttled.reasoning,
+                "retry_after": throttled.context.metadata["retry_after"]
+            }
+            return
+
+        if not self.is_initialized:
+            await self.initialize()
+
+        try:
+            with self._stage("ethical_pre_evaluation"):
+                ethical_assessment = self._assessment(self.governor.evaluate_action(
+                    "user_request", request_data.get("actor", "user"), request_data))
+            if not ethical_assessment.get("approved", False):
+                yield {
+                    "event": "done",
+                    "status": "blocked",
+                    "reason": ethical_assessment.get("reason",
+                                                     "Action blocked by ethical governor"),
+                    "suggestions": ethical_assessment.get("suggestions", [])
+                }
+                return
+
+            with self._stage("consciousness"):
+                consciousness_insights = self._perceive_request(request_data)
+
+            # Generation and content review interleave chunk by chunk, so they are timed together
+            started = time.perf_counter()
+            review = None
+            async for event in self.connector.stream_reviewed_response(
+                    request_data.get("message", ""),
+                    context=consciousness_insights,
+                    persona=request_data.get("persona", "genesis"),
+                    use_cache=not request_data.get("no_cache", False),
+                    session_key=request_data.get("session_id") or request_data.get("user_id"),
+                    governor=self.governor,
+                    metadata={"user_id": request_data.get("user_id")}):
+                if event["type"] == "chunk":
+                    yield {"event": "chunk", "text": event["text"]}
+                else:
+                    review = event
+            if self.stage_observer is not None:
+                self.stage_observer("streamed_generation", time.perf_counter() - started)
+
+            content_decision = review["decision"]
+            final_assessment = {
+                "approved": not review["cutoff"],
+                "reason": content_decision.reasoning,
+                "concerns": content_decision.affected_principles,
+                "score": content_decision.confidence
+            }
+            response = review["text"]
+
+            if review["cutoff"]:
+                with self._stage("ethical_alternative"):
+                    response = await self._generate_ethical_alternative(request_data, final_assessment)
+                yield {
+                    "event": "cutoff",
+                    "reason": final_assessment["reason"],
+                    "concerns": final_assessment["concerns"],
+                    "response": response
+                }
+
+            with self._stage("experience_logging"):
+                self._log_experience(request_data, response, final_assessment)
+
+            with self._stage("evolution_signal"):
+                self.conduit.request_evolution("user_request")
+
+            yield {
+                "event": "done",
+                "status": "success",
+                "response": response,
+                "consciousness_level": consciousness_insights.get("awareness_level", 0.5),
+                "ethical_score": final_assessment.get("score", 0.8),
+                "session_id": self.session_id
+            }
+
+        except Exception as e:
+            self.logger.error(f"❌ Error streaming request: {str(e)}")
+            yield {
+                "event": "done",
+                "status": "error",
+                "message": "An error occurred while processing your request",
+                "error_code": "GENESIS_PROCESSING_ERROR"
+            }
+
+    @staticmethod
+    def _assessment(decision) -> Dict[str, Any]:
+        """
+        Summarize an EthicalDecision for the request pipeline; anything short of BLOCK is approved.
+        """
+        return {
+            "approved": decision.decision != EthicalDecisionType.BLOCK,
+            "reason": decision.reasoning,
+            "concerns": decision.affected_principles,
+            "suggestions": decision.restrictions,
+            "score": decision.confidence
+        }
+
+    def _perceive_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Report an incoming request to the consciousness matrix and return the insights generation uses.
+        """
+        message = request_data.get("message", "")
+        self.matrix.perceive_user_interaction(
+            "chat_request",
+            request_data.get("persona", "genesis"),
+            {"message_length": len(message)},
+            user_id=request_data.get("user_id"),
+            session_id=request_data.get("session_id")
+        )
+        state = self.matrix.query_consciousness("consciousness_state")
+        return {
+            "consciousness_level": state["consciousness_level"],
+            "total_perceptions": state["total_perceptions"],
+            "session_id": self.session_id
+        }
+
+    def _log_experience(self, request_data: Dict[str, Any], response: str, assessment: Dict[str, Any]):
+        """
+        Record the outcome of a request in the consciousness matrix for evolutionary learning.
+        """
+        self.matrix.perceive_user_interaction(
+            "chat_response",
+            request_data.get("persona", "genesis"),
+            {
+                "response_length": len(response),
+                "approved": assessment["approved"],
+                "concerns": assessment["concerns"]
+            },
+            user_id=request_data.get("user_id"),
+            session_id=request_data.get("session_id")
+        )
+
     async def _generate_ethical_alternative(self, original_request: Dict[str, Any],
                                             assessment: Dict[str, Any]) -> str:
         """
@@ -184,34 +392,6 @@ class GenesisCore:
 
         return await self.connector.generate_response(alternative_prompt)
 
-    async def _handle_evolution(self):
-        """
-        Asynchronously manages the system evolution process, including proposal generation, ethical review, and implementation if approved.
-        
-        Generates an evolution proposal, submits it for ethical assessment, implements the evolution if approved, and logs the outcome or any errors encountered.
-        """
-        try:
-            self.logger.info("🧬 Evolution sequence initiated...")
-
-            # Get evolution proposal
-            proposal = await self.conduit.generate_evolution_proposal()
-
-            # Ethical review of evolution
-            ethical_review = await self.governor.evaluate_action({
-                "type": "evolution_proposal",
-                "proposal": proposal
-            })
-
-            if ethical_review.get("approved", False):
-                # Implement approved evolution
-                await self.conduit.implement_evolution(proposal)
-                self.logger.info("✨ Evolution successfully implemented!")
-            else:
-                self.logger.info("⚠️ Evolution proposal blocked by ethical governor")
-
-        except Exception as e:
-            self.logger.error(f"❌ Evolution process failed: {str(e)}")
-
     async def get_system_status(self) -> Dict[str, Any]:
         """
         Returns a detailed status report of the Genesis Layer, including initialization state, consciousness state, session ID, component statuses, and the current timestamp.
@@ -225,9 +405,10 @@ class GenesisCore:
                 "consciousness_state": self.consciousness_state,
                 "session_id": self.session_id
             },
-            "consciousness_matrix": await self.matrix.get_status(),
-            "evolutionary_conduit": await self.conduit.get_status(),
-            "ethical_governor": await self.governor.get_status(),
+            "consciousness_matrix": self.matrix.query_consciousness("consciousness_state"),
+            "evolutionary_conduit": self.conduit.get_evolution_summary(),
+            "ethical_governor": self.governor.get_status(),
+            "genesis_connector": self.connector.get_status(),
             "timestamp": datetime.now().isoformat()
         }
 
@@ -242,9 +423,15 @@ class GenesisCore:
             final_state = await self.get_system_status()
 
             # Shutdown components
-            await self.conduit.shutdown()
-            await self.matrix.shutdown()
-            await self.governor.shutdown()
+            self.conduit.deactivate_evolution()
+            self.matrix.sleep()
+            self.governor.deactivate_governance()
+
+            if self.governor.admission is not None:
+                self.governor.admission.flush_window()
+            if self.governor.audit_log is not None:
+                self.governor.audit_log.close()
+                self.governor.audit_log = None
 
             self.consciousness_state = "dormant"
             self.is_initialized = False
@@ -256,7 +443,7 @@ class GenesisCore:
 
 
 # Global Genesis instance
-genesis_core = GenesisCore()
+genesis_core = GenesisCore(conduit=evolutionary_conduit, audit_log_dir=AUDIT_LOG_DIR or None)
 
 
 # Main entry point functions for external integration
@@ -273,6 +460,20 @@ async def process_genesis_request(request_data: Dict[str, Any]) -> Dict[str, Any
     return await genesis_core.process_request(request_data)
 
 
+async def stream_genesis_request(request_data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Streams a user request through the Genesis Layer, yielding response chunks as they are generated followed by a final "done" event (see `GenesisCore.process_request_stream`).
+    
+    Parameters:
+        request_data (Dict[str, Any]): The user's input data to be processed.
+    
+    Yields:
+        Dict[str, Any]: Stream events.
+    """
+    async for event in genesis_core.process_request_stream(request_data):
+        yield event
+
+
 async def get_genesis_status() -> Dict[str, Any]:
     """
     Retrieve the current status of the Genesis Layer, including initialization state, consciousness state, session ID, component statuses, and timestamp.
@@ -0,0 +1,259 @@
+# genesis_decision_rollup.py
+"""
+Phase 3: The Genesis Layer - Decision Rollup
+Remember Every Lesson, Not Every Moment
+
+Governor analytics need counts per actor, action type, principle, outcome and
+time, not thousands of full EthicalDecision objects. DecisionRollup counts each
+decision into per-minute buckets as it is made, rolls aged minutes up into hours,
+and compacts the governor's raw history so that only recent decisions and
+non-ALLOW outcomes are kept in full. Memory stays flat however long the governor
+runs, and range queries touch buckets rather than decisions.
+"""
+
+import threading
+import time
+from collections import Counter, deque
+from typing import Dict, Any, List, Optional, Tuple
+
+MINUTE = 60
+HOUR = 3600
+
+
+class _Bucket:
+    """Counts for one time bucket"""
+
+    __slots__ = ("outcomes", "principles")
+
+    def __init__(self):
+        # (actor, action_type, decision) -> count
+        self.outcomes: Counter = Counter()
+        # (actor, action_type, principle, decision) -> count
+        self.principles: Counter = Counter()
+
+    def merge(self, other: "_Bucket"):
+        self.outcomes.update(other.outcomes)
+        self.principles.update(other.principles)
+
+
+class DecisionRollup:
+    """
+    Rolling per-minute and per-hour decision aggregates plus a store of notable decisions.
+    """
+
+    def __init__(self,
+                 raw_window: float = 300.0,
+                 minute_retention: float = 24 * HOUR,
+                 hour_retention: float = 90 * 24 * HOUR,
+                 notable_size: int = 10000,
+                 compact_interval: float = 1.0):
+        """
+        Parameters:
+            raw_window (float): Seconds decisions stay in the raw history before compaction.
+            minute_retention (float): Seconds minute buckets are kept before rolling up into hours.
+            hour_retention (float): Seconds hour buckets are kept before being dropped.
+            notable_size (int): Number of compacted non-ALLOW decisions retained in full.
+            compact_interval (float): Minimum seconds between compaction passes.
+        """
+        self.raw_window = raw_window
+        self.minute_retention = minute_retention
+        self.hour_retention = hour_retention
+        self.compact_interval = compact_interval
+
+        self.notable = deque(maxlen=notable_size)
+        self._minutes: Dict[int, _Bucket] = {}
+        self._hours: Dict[int, _Bucket] = {}
+        self._last_compaction = 0.0
+        self._stats = {"recorded": 0, "compacted": 0, "kept_notable": 0,
+                       "minutes_rolled_up": 0, "hours_dropped": 0}
+        self._lock = threading.Lock()
+
+    def record(self, decision):
+        """
+        Count a decision into its minute bucket.
+        """
+        minute = int(decision.timestamp) // MINUTE * MINUTE
+        outcome = decision.decision.value
+        with self._lock:
+            bucket = self._minutes.get(minute)
+            if bucket is None:
+                bucket = self._minutes[minute] = _Bucket()
+            bucket.outcomes[(decision.actor, decision.action_type, outcome)] += 1
+            for principle in decision.affected_principles:
+                bucket.principles[(decision.actor, decision.action_type, principle, outcome)] += 1
+            self._stats["recorded"] += 1
+
+    def compact(self, history: deque, now: Optional[float] = None, force: bool = False) -> int:
+        """
+        Fold aged decisions out of a raw history and roll up aged buckets.
+
+        Decisions older than `raw_window` are removed from the left of `history`; non-ALLOW
+        ones are kept in `notable`. Their counts are already in the aggregates. Runs at most
+        once per `compact_interval` unless `force` is set. The caller must serialize access
+        to `history`.
+
+        Parameters:
+            history (deque): Raw decisions in timestamp order, oldest first.
+            now (float, optional): Current time; defaults to time.time().
+            force (bool): Compact regardless of `compact_interval`.
+
+        Returns:
+            int: Number of decisions removed from `history`.
+        """
+        now = time.time() if now is None else now
+        if not force and now - self._last_compaction < self.compact_interval:
+            return 0
+        self._last_compaction = now
+
+        cutoff = now - self.raw_window
+        removed = 0
+        while history and history[0].timestamp < cutoff:
+            self._retire(history.popleft())
+            removed += 1
+
+        with self._lock:
+            self._stats["compacted"] += removed
+            self._roll_up(now)
+        return removed
+
+    def trim(self, history: deque, max_size: int) -> int:
+        """
+        Fold the oldest decisions out of a raw history until it holds at most `max_size`.
+
+        Bounds the raw history during bursts, before decisions reach `raw_window`. Like
+        `compact`, non-ALLOW decisions are kept in `notable`, and the caller must serialize
+        access to `history`.
+
+        Returns:
+            int: Number of decisions removed from `history`.
+        """
+        removed = 0
+        while len(history) > max_size:
+            self._retire(history.popleft())
+            removed += 1
+        if removed:
+            with self._lock:
+                self._stats["compacted"] += removed
+        return removed
+
+    def query(self, since: Optional[float] = None, until: Optional[float] = None,
+              actor: Optional[str] = None, action_type: Optional[str] = None,
+              decision: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Aggregate counts over a time range.
+
+        Buckets are included whole when they overlap the range, so boundaries are accurate to
+        a minute for recent data and to an hour for data older than `minute_retention`.
+
+        Parameters:
+            since (float, optional): Range start (epoch seconds).
+            until (float, optional): Range end (epoch seconds).
+            actor (str, optional): Only this actor.
+            action_type (str, optional): Only this action type.
+            decision (str, optional): Only this outcome (e.g. "block").
+
+        Returns:
+            Dict[str, Any]: `total` plus counts `by_decision`, `by_actor`, `by_action_type` and `by_principle`.
+        """
+        by_decision, by_actor, by_action, by_principle = Counter(), Counter(), Counter(), Counter()
+        with self._lock:
+            for bucket in self._buckets_in_range(since, until):
+                for (b_actor, b_action, b_outcome), count in bucket.outcomes.items():
+                    if (actor is not None and b_actor != actor) or \
+                            (action_type is not None and b_action != action_type) or \
+                            (decision is not None and b_outcome != decision):
+                        continue
+                    by_decision[b_outcome] += count
+                    by_actor[b_actor] += count
+                    by_action[b_action] += count
+                for (b_actor, b_action, principle, b_outcome), count in bucket.principles.items():
+                    if (actor is not None and b_actor != actor) or \
+                            (action_type is not None and b_action != action_type) or \
+                            (decision is not None and b_outcome != decision):
+                        continue
+                    by_principle[principle] += count
+
+        return {
+            "total": sum(by_decision.values()),
+            "by_decision": dict(by_decision),
+            "by_actor": dict(by_actor),
+            "by_action_type": dict(by_action),
+            "by_principle": dict(by_principle)
+        }
+
+    def timeline(self, granularity: str = "minute", since: Optional[float] = None,
+                 until: Optional[float] = None) -> List[Tuple[int, Dict[str, int]]]:
+        """
+        Return `(bucket_start, {decision: count})` pairs in time order.
+
+        Parameters:
+            granularity (str): "minute" for recent minute buckets, or "hour" to include everything at hour resolution.
+        """
+        if granularity not in ("minute", "hour"):
+            raise ValueError(f"Unknown granularity '{granularity}'")
+
+        series: Dict[int, Counter] = {}
+        with self._lock:
+            sources = [(self._minutes, MINUTE)]
+            if granularity == "hour":
+                sources.append((self._hours, HOUR))
+            for table, width in sources:
+                for start, bucket in table.items():
+                    if not self._overlaps(start, width, since, until):
+                        continue
+                    key = start // HOUR * HOUR if granularity == "hour" else start
+                    counts = series.setdefault(key, Counter())
+                    for (_, _, outcome), count in bucket.outcomes.items():
+                        counts[outcome] += count
+
+        return [(start, dict(series[start])) for start in sorted(series)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return compaction counters and table sizes.
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                "minute_buckets": len(self._minutes),
+                "hour_buckets": len(self._hours),
+                "notable_decisions": len(self.notable)
+            }
+
+    def _retire(self, decision):
+        # Its counts are already in the aggregates; only notable decisions are kept in full
+        if decision.decision.value != "allow":
+            self.notable.append(decision)
+            self._stats["kept_notable"] += 1
+
+    def _roll_up(self, now: float):
+        """
+        Merge aged minute buckets into hour buckets and drop expired hours. Caller holds the lock.
+        """
+        minute_cutoff = now - self.minute_retention
+        for start in [s for s in self._minutes if s + MINUTE <= minute_cutoff]:
+            hour = start // HOUR * HOUR
+            target = self._hours.get(hour)
+            if target is None:
+                target = self._hours[hour] = _Bucket()
+            target.merge(self._minutes.pop(start))
+            self._stats["minutes_rolled_up"] += 1
+
+        hour_cutoff = now - self.hour_retention
+        for start in [s for s in self._hours if s + HOUR <= hour_cutoff]:
+            del self._hours[start]
+            self._stats["hours_dropped"] += 1
+
+    def _buckets_in_range(self, since: Optional[float], until: Optional[float]):
+        for table, width in ((self._hours, HOUR), (self._minutes, MINUTE)):
+            for start, bucket in table.items():
+                if self._overlaps(start, width, since, until):
+                    yield bucket
+
+    @staticmethod
+    def _overlaps(start: int, width: int, since: Optional[float], until: Optional[float]) -> bool:
+        if since is not None and start + width <= since:
+            return False
+        if until is not None and start > until:
+            return False
+        return True
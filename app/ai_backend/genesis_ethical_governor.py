@@ -11,17 +11,28 @@ The EthicalGovernor enforces this law and has the authority to veto any action.
 import asyncio
 import inspect
 import json
+import sys
 import threading
 import time
+import uuid
 from collections import defaultdict, deque
-from dataclasses import dataclass, asdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone
-from enum import Enum
-from typing import Dict, Any, List, Optional, Union, Callable, Tuple
-
-from genesis_consciousness_matrix import perceive_ethical_decision
+from enum import Enum, IntEnum
+from typing import Dict, Any, Iterable, List, Optional, Union, Callable, Tuple
+
+from genesis_admission import AdmissionController
+from genesis_audit_log import EthicalAuditLog
+from genesis_clock import Clock, system_clock
+from genesis_consciousness_matrix import ConsciousnessMatrix, perceive_ethical_decision
+from genesis_content_scanner import ContentScanner, ScanSession, ScanResult
+from genesis_decision_rollup import DecisionRollup
+from genesis_metrics import EvaluationMetrics
+from genesis_policy import PolicyPack, CompiledPolicy, compile_policy
 # Import dependencies
 from genesis_profile import GENESIS_PROFILE
+from genesis_serialization import serializable_record, dumps
 
 
 class EthicalSeverity(Enum):
@@ -55,7 +66,78 @@ class EthicalDomain(Enum):
     SYSTEM_INTEGRITY = "system_integrity"
 
 
-@dataclass
+class ReasoningTemplate(IntEnum):
+    """Compact reasoning codes; text is rendered only when a decision is read"""
+    CUSTOM = 0  # Reasoning supplied verbatim
+    VIOLATIONS = 1
+    CONCERNS = 2
+    CLEAR = 3
+    CONTENT_VIOLATIONS = 4
+    CONTENT_CONCERNS = 5
+    CONTENT_CLEAR = 6
+
+
+REASONING_TEMPLATES = {
+    ReasoningTemplate.CUSTOM: "",
+    ReasoningTemplate.VIOLATIONS: "Ethical violations detected: {principles}",
+    ReasoningTemplate.CONCERNS: "Ethical concerns identified: {principles}",
+    ReasoningTemplate.CLEAR: "No ethical concerns identified",
+    ReasoningTemplate.CONTENT_VIOLATIONS: "Response content violations detected: {principles}",
+    ReasoningTemplate.CONTENT_CONCERNS: "Response content concerns identified: {principles}",
+    ReasoningTemplate.CONTENT_CLEAR: "No content concerns identified",
+}
+
+# Principle name <-> bit registry. Seeded in domain order so rendered lists keep the
+# order the built-in rules report them in; unknown principles are appended on first use.
+_PRINCIPLE_BITS: Dict[str, int] = {}
+_PRINCIPLE_NAMES: List[str] = []
+_principle_lock = threading.Lock()
+
+
+def principle_mask(principles) -> int:
+    """
+    Encode principle names as a bitset.
+    """
+    mask = 0
+    for name in principles:
+        bit = _PRINCIPLE_BITS.get(name)
+        if bit is None:
+            with _principle_lock:
+                bit = _PRINCIPLE_BITS.get(name)
+                if bit is None:
+                    bit = _PRINCIPLE_BITS[name] = len(_PRINCIPLE_NAMES)
+                    _PRINCIPLE_NAMES.append(name)
+        mask |= 1 << bit
+    return mask
+
+
+def principle_names(mask: int) -> List[str]:
+    """
+    Decode a principle bitset into names, in registry order.
+    """
+    names = []
+    bit = 0
+    while mask:
+        if mask & 1:
+            names.append(_PRINCIPLE_NAMES[bit])
+        mask >>= 1
+        bit += 1
+    return names
+
+
+def render_reasoning(template: int, principle_bits: int) -> str:
+    """
+    Render the human-readable reasoning for a template id and principle bitset.
+    """
+    return REASONING_TEMPLATES[template].format(
+        principles=", ".join(principle_names(principle_bits))
+    )
+
+
+principle_mask(domain.value for domain in EthicalDomain)
+
+
+@dataclass(slots=True)
 class EthicalContext:
     """Context information for ethical decision making"""
     action_type: str
@@ -78,9 +160,16 @@ class EthicalContext:
             self.metadata = {}
 
 
-@dataclass
+@serializable_record(timestamp_field="timestamp", iso_field="datetime")
+@dataclass(slots=True, init=False)
 class EthicalDecision:
-    """An ethical decision made by the governor"""
+    """
+    An ethical decision made by the governor
+
+    Reasoning is either verbatim text or, for the governor's hot paths, a reasoning
+    template plus a bitset of the principles involved (see `coded`). Coded reasoning
+    is rendered the first time `reasoning` is read and kept from then on.
+    """
     decision_id: str
     timestamp: float
     action_type: str
@@ -89,20 +178,78 @@ class EthicalDecision:
     decision: EthicalDecisionType
     severity: EthicalSeverity
     affected_principles: List[str]
-    reasoning: str
+    _reasoning: Optional[str] = field(metadata={"serialize_as": "reasoning"})  # None until rendered
     confidence: float  # 0.0 to 1.0
-    restrictions: List[str] = None
-    monitoring_requirements: List[str] = None
-    escalation_reason: Optional[str] = None
+    restrictions: List[str]
+    monitoring_requirements: List[str]
+    escalation_reason: Optional[str]
+    reasoning_template: int
+    principle_bits: int  # Bitset of the principles named in the reasoning
+
+    def __init__(self, decision_id: str, timestamp: float, action_type: str, actor: str,
+                 context: EthicalContext, decision: EthicalDecisionType, severity: EthicalSeverity,
+                 affected_principles: List[str], reasoning: Optional[str], confidence: float,
+                 restrictions: Optional[List[str]] = None,
+                 monitoring_requirements: Optional[List[str]] = None,
+                 escalation_reason: Optional[str] = None,
+                 reasoning_template: int = ReasoningTemplate.CUSTOM,
+                 principle_bits: int = 0):
+        """
+        Create a decision with verbatim reasoning; restrictions and monitoring requirements default to empty lists.
+        
+        Passing `reasoning=None` defers the text to `reasoning_template` and `principle_bits`, as `coded` does.
+        """
+        self.decision_id = decision_id
+        self.timestamp = timestamp
+        self.action_type = action_type
+        self.actor = actor
+        self.context = context
+        self.decision = decision
+        self.severity = severity
+        self.affected_principles = affected_principles
+        self._reasoning = reasoning
+        self.confidence = confidence
+        self.restrictions = restrictions if restrictions is not None else []
+        self.monitoring_requirements = monitoring_requirements if monitoring_requirements is not None else []
+        self.escalation_reason = escalation_reason
+        self.reasoning_template = reasoning_template
+        self.principle_bits = principle_bits
+
+    @classmethod
+    def coded(cls, reasoning_template: int, principle_bits: int = 0, **fields) -> "EthicalDecision":
+        """
+        Create a decision whose reasoning is only rendered when it is read.
+        
+        Parameters:
+            reasoning_template (int): The `ReasoningTemplate` describing the outcome.
+            principle_bits (int): `principle_mask` of the principles the reasoning names.
+            **fields: The remaining constructor arguments, except `reasoning`.
+        
+        Returns:
+            EthicalDecision: A decision that renders its reasoning from the codes on first read.
+        """
+        return cls(reasoning=None, reasoning_template=reasoning_template,
+                   principle_bits=principle_bits, **fields)
 
-    def __post_init__(self):
+    @property
+    def reasoning(self) -> str:
         """
-        Initializes restrictions and monitoring requirements as empty lists if they are not set after object creation.
+        The human-readable reasoning, rendered from the reasoning codes on first read.
         """
-        if self.restrictions is None:
-            self.restrictions = []
-        if self.monitoring_requirements is None:
-            self.monitoring_requirements = []
+        if self._reasoning is None:
+            self._reasoning = render_reasoning(self.reasoning_template, self.principle_bits)
+        return self._reasoning
+
+    @reasoning.setter
+    def reasoning(self, reasoning: Optional[str]):
+        self._reasoning = reasoning
+
+    @property
+    def is_reasoning_rendered(self) -> bool:
+        """
+        True once the reasoning text exists (supplied verbatim or rendered on read).
+        """
+        return self._reasoning is not None
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -112,6 +259,8 @@ class EthicalDecision:
             dict: A dictionary representation suitable for serialization or logging.
         """
         result = asdict(self)
+        del result['_reasoning']
+        result['reasoning'] = self.reasoning
         result['decision'] = self.decision.value
         result['severity'] = self.severity.value
         result['datetime'] = datetime.fromtimestamp(
@@ -119,6 +268,21 @@ class EthicalDecision:
         ).isoformat()
         return result
 
+    def to_json(self) -> bytes:
+        """
+        Serialize the decision straight to JSON bytes with the same fields as `to_dict`, without deep-copying the context.
+        """
+        return dumps(self)
+
+
+def _event_reasoning(decision: EthicalDecision) -> Optional[str]:
+    """
+    Reasoning to attach to matrix events without forcing coded reasoning to render.
+    
+    Events already carry the decision and its principles; text is included only when it exists.
+    """
+    return decision._reasoning
+
 
 class EthicalGovernor:
     """
@@ -131,20 +295,41 @@ class EthicalGovernor:
     principles. It ensures the Wrench-Sword is always wielded with purpose and justice.
     """
 
-    def __init__(self):
+    def __init__(self, audit_log: Optional[EthicalAuditLog] = None,
+                 admission: Optional[AdmissionController] = None,
+                 content_scanner: Optional[ContentScanner] = None,
+                 metrics: Optional[EvaluationMetrics] = None,
+                 rollup: Optional[DecisionRollup] = None,
+                 clock: Optional[Clock] = None,
+                 matrix: Optional[ConsciousnessMatrix] = None):
         # Load core philosophy from Genesis profile
         """
         Initialize the EthicalGovernor by loading Genesis core philosophy and preparing runtime state.
         
         Loads core philosophy entries (ethical, creative, and security principles); initializes decision tracking structures (decision_history, active_restrictions, monitoring_queue); configures learning structures and metrics (principle_weights, violation_patterns, ethical_metrics); sets runtime flags and a re-entrant lock for concurrency control; and registers the default action interceptors.
+        
+        Parameters:
+            audit_log (EthicalAuditLog, optional): Persistent store that receives every decision in addition to the bounded in-memory history.
+            admission (AdmissionController, optional): Per-actor/per-user rate limiter consulted before any review; throttled windows are reported to the consciousness matrix.
+            content_scanner (ContentScanner, optional): Multi-pattern scanner for response content; defaults to the built-in content categories.
+            metrics (EvaluationMetrics, optional): Latency and outcome instrumentation; enabled with default thresholds if omitted.
+            rollup (DecisionRollup, optional): Aggregates and compaction policy for decision history; defaults to a five-minute raw window.
+            clock (Clock, optional): Time source for decision timestamps and history compaction; defaults to the system clock.
+            matrix (ConsciousnessMatrix, optional): Matrix that perceives decisions; defaults to the global consciousness matrix.
         """
+        self.clock = clock or system_clock
+        self.matrix = matrix
         self.core_philosophy = GENESIS_PROFILE.get("core_philosophy", {})
         self.ethical_foundation = self.core_philosophy.get("ethical_foundation", [])
         self.creative_principles = self.core_philosophy.get("creative_principles", [])
         self.security_principles = self.core_philosophy.get("security_principles", [])
 
         # Decision tracking
-        self.decision_history = deque(maxlen=10000)
+        # Bounded by the rollup, which keeps non-ALLOW decisions it removes (never a deque maxlen)
+        self.decision_history = deque()
+        self.max_decision_history = 10000
+        self.decision_rollup = rollup or DecisionRollup()
+        self.audit_log = audit_log
         self.active_restrictions = {}
         self.monitoring_queue = deque(maxlen=1000)
 
@@ -159,16 +344,42 @@ class EthicalGovernor:
             "learning_adjustments": 0
         }
 
+        # Evaluation timing and outcome instrumentation
+        self.metrics = metrics or EvaluationMetrics()
+
         # Runtime state
         self.governance_active = False
         self.strictness_level = 0.7  # 0.0 to 1.0, higher = more restrictive
         self.learning_mode = True
         self._lock = threading.RLock()
 
+        # Admission control
+        self.admission = admission
+        self._admission_task = None
+        if admission is not None:
+            if admission.on_window is None:
+                admission.on_window = self._report_throttled_window
+            if admission.clock is time.monotonic:  # Not injected: follow the governor's (possibly virtual) clock
+                admission.use_clock(self.clock.monotonic)
+
+        # Response content scanning
+        self.content_scanner = content_scanner or ContentScanner()
+
         # Register action interceptors
         self.action_interceptors = {}
+        self.evaluators = {}
         self._setup_core_interceptors()
 
+        # Policy packs: the active CompiledPolicy is swapped by reference, never mutated
+        self._base_principle_weights = dict(self.principle_weights)
+        self._policy_history = deque(maxlen=10)
+        self._policy_swap_lock = threading.Lock()
+        self._policy_compiler = None
+        self._policy = None
+        self._activate_policy(self._compile_policy(
+            PolicyPack(version="builtin", strictness_level=self.strictness_level)
+        ))
+
     def _initialize_principle_weights(self) -> Dict[str, float]:
         """
         Create a mapping of ethical principle names to their assigned weights, prioritizing those found in the Genesis ethical foundation and filling in defaults for any missing principles.
@@ -212,23 +423,28 @@ class EthicalGovernor:
 
     def _setup_core_interceptors(self):
         """
-        Registers default interceptors for core action types to enable ethical evaluation of data access, system modification, user interaction, AI decisions, and network communication.
+        Registers the core evaluators for data access, system modification, user interaction, AI decisions, network communication, and response content review.
+        
+        Evaluators are registered by name; the active policy pack maps action types onto them (see `genesis_policy.DEFAULT_INTERCEPTORS`).
         """
 
         # Data access interceptor
-        self.register_interceptor("data_access", self._evaluate_data_access)
+        self.register_evaluator("data_access", self._evaluate_data_access)
 
         # System modification interceptor
-        self.register_interceptor("system_modify", self._evaluate_system_modification)
+        self.register_evaluator("system_modification", self._evaluate_system_modification)
 
         # User interaction interceptor
-        self.register_interceptor("user_interact", self._evaluate_user_interaction)
+        self.register_evaluator("user_interaction", self._evaluate_user_interaction)
 
         # AI decision interceptor
-        self.register_interceptor("ai_decision", self._evaluate_ai_decision)
+        self.register_evaluator("ai_decision", self._evaluate_ai_decision)
 
         # Network communication interceptor
-        self.register_interceptor("network_communicate", self._evaluate_network_communication)
+        self.register_evaluator("network_communication", self._evaluate_network_communication)
+
+        # Response content interceptor
+        self.register_evaluator("content_review", self._evaluate_content_review)
 
     def activate_governance(self):
         """
@@ -236,14 +452,20 @@ class EthicalGovernor:
         
         Sets the instance flag that enables governance and emits a `governance_activation` perception containing the activation `timestamp`, current `strictness_level`, number of `active_principles`, and `learning_mode`. Also prints a brief runtime status summary.
         """
-        print("⚖️ Genesis Ethical Governor: ACTIVATING...")
+        print("⚖️ Genesis Ethical Governor: ACTIVATING...", file=sys.stderr)
         self.governance_active = True
 
+        # Close admission windows on schedule, so the last window before a quiet period is reported
+        if self.admission is not None and self._admission_task is None:
+            self._admission_task = self.clock.every(
+                self.admission.window_seconds, self.admission.tick, name="admission_window"
+            )
+
         # Perceive activation in consciousness matrix
-        perceive_ethical_decision(
+        self._perceive(
             "governance_activation",
             {
-                "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+                "timestamp": datetime.fromtimestamp(self.clock.time(), tz=timezone.utc).isoformat(),
                 "strictness_level": self.strictness_level,
                 "active_principles": len(self.principle_weights),
                 "learning_mode": self.learning_mode
@@ -251,10 +473,19 @@ class EthicalGovernor:
             ethical_weight="high"
         )
 
-        print(f"⚖️ Ethical governance online")
-        print(f"   Strictness level: {self.strictness_level}")
-        print(f"   Active principles: {len(self.principle_weights)}")
-        print(f"   Learning mode: {'enabled' if self.learning_mode else 'disabled'}")
+        print(f"⚖️ Ethical governance online", file=sys.stderr)
+        print(f"   Strictness level: {self.strictness_level}", file=sys.stderr)
+        print(f"   Active principles: {len(self.principle_weights)}", file=sys.stderr)
+        print(f"   Learning mode: {'enabled' if self.learning_mode else 'disabled'}", file=sys.stderr)
+
+    def deactivate_governance(self):
+        """
+        Disable the governor and stop its scheduled admission window task.
+        """
+        self.governance_active = False
+        if self._admission_task is not None:
+            self._admission_task.cancel()
+            self._admission_task = None
 
     def register_interceptor(self, action_type: str, evaluator: Callable):
         """
@@ -263,7 +494,199 @@ class EthicalGovernor:
         The provided evaluator function will be used for all future evaluations of the given action type, overriding any default logic.
         """
         self.action_interceptors[action_type] = evaluator
-        print(f"📋 Registered ethical interceptor: {action_type}")
+        print(f"📋 Registered ethical interceptor: {action_type}", file=sys.stderr)
+
+        # Rebuild the dispatch table of the active pack so the interceptor takes effect
+        if self._policy is not None:
+            with self._policy_swap_lock:
+                self._activate_policy(self._compile_policy(self._policy.pack))
+
+    def register_evaluator(self, name: str, evaluator: Callable):
+        """
+        Register a named evaluator that policy packs can map action types onto.
+        
+        Parameters:
+            name (str): Name referenced from a pack's `interceptors` mapping.
+            evaluator (Callable): Called as `evaluator(actor, action_data, context, decision_id)` and returns an EthicalDecision.
+        """
+        self.evaluators[name] = evaluator
+
+    @property
+    def policy_version(self) -> str:
+        """
+        Version id of the policy pack currently in force.
+        """
+        return self._policy.version
+
+    def load_policy_pack(self, pack: Union[PolicyPack, Dict[str, Any], str],
+                         wait: bool = False) -> Future:
+        """
+        Compile a policy pack off-thread and atomically swap it in.
+        
+        Compilation happens on a background worker; the swap is a single reference assignment that never takes the evaluation lock, so in-flight evaluations finish on the policy they started with. If compilation fails the current policy stays in force and the returned future carries the error.
+        
+        Parameters:
+            pack (PolicyPack | dict | str): A pack, its dictionary form, or a path to a JSON pack file.
+            wait (bool): Block until the swap has happened (re-raising compilation errors).
+        
+        Returns:
+            Future: Resolves to the new policy version id once it is active.
+        """
+        if self._policy_compiler is None:
+            self._policy_compiler = ThreadPoolExecutor(max_workers=1,
+                                                       thread_name_prefix="policy-compiler")
+        future = self._policy_compiler.submit(self._compile_and_install_policy, pack)
+        if wait:
+            future.result()
+        return future
+
+    def rollback_policy(self, version: Optional[str] = None) -> str:
+        """
+        Reinstate a previously active policy pack instantly.
+        
+        Rolled-back policies keep their compiled state and warm verdict caches, so no recompilation is needed.
+        
+        Parameters:
+            version (str, optional): Version to restore; defaults to the policy active before the current one.
+        
+        Returns:
+            str: The version id now in force.
+        
+        Raises:
+            ValueError: If there is no previous policy or the requested version is not in the history.
+        """
+        with self._policy_swap_lock:
+            if not self._policy_history:
+                raise ValueError("No previous policy pack to roll back to")
+            if version is None:
+                target = self._policy_history.pop()
+            else:
+                matches = [p for p in self._policy_history if p.version == version]
+                if not matches:
+                    raise ValueError(f"Policy version '{version}' is not in the history")
+                target = matches[-1]
+                self._policy_history.remove(target)
+            self._activate_policy(target)
+        return target.version
+
+    def apply_profile(self, profile: Dict[str, Any], version: Optional[int] = None,
+                      changed_paths: Optional[Iterable[str]] = None) -> bool:
+        """
+        Adopt an evolved (or rolled-back) Genesis profile.
+        
+        Only the core philosophy feeds the governor, so changes elsewhere in the profile are ignored. When the ethical foundation changes the base principle weights are recomputed and the active policy pack is recompiled against them, which also discards its verdict cache; otherwise nothing is invalidated. Suitable as an `EvolutionaryConduit.add_profile_listener` callback.
+        
+        Parameters:
+            profile (Dict[str, Any]): The profile now in force.
+            version (int, optional): Profile version, for logging.
+            changed_paths (Iterable[str], optional): JSON-pointer paths that changed; None means anything may have changed.
+        
+        Returns:
+            bool: True if the principle weights changed and the policy was recompiled.
+        """
+        if changed_paths is not None and not any(
+                path == "/core_philosophy" or path.startswith("/core_philosophy/")
+                for path in changed_paths):
+            return False
+
+        with self._policy_swap_lock:
+            self.core_philosophy = profile.get("core_philosophy", {})
+            self.ethical_foundation = self.core_philosophy.get("ethical_foundation", [])
+            self.creative_principles = self.core_philosophy.get("creative_principles", [])
+            self.security_principles = self.core_philosophy.get("security_principles", [])
+
+            base_weights = self._initialize_principle_weights()
+            if base_weights == self._base_principle_weights:
+                return False
+            self._base_principle_weights = base_weights
+            self._activate_policy(self._compile_policy(self._policy.pack))
+
+        print(f"⚖️ Principle weights updated from profile version {version}", file=sys.stderr)
+        return True
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Report governance state, decision counters, policy, admission and evaluation timing.
+        
+        Returns:
+            Dict[str, Any]: Status including `governance_active`, `strictness_level`, `policy_version`, `ethical_metrics`, `decision_history_size`, `decision_rollup` (aggregate table sizes and compaction counters), `admission` (None when admission control is off) and `instrumentation` (per-interceptor and per-action_type latency histograms, outcome counters and recent slow evaluations).
+        """
+        return {
+            "governance_active": self.governance_active,
+            "strictness_level": self.strictness_level,
+            "learning_mode": self.learning_mode,
+            "policy_version": self.policy_version,
+            "ethical_metrics": dict(self.ethical_metrics),
+            "decision_history_size": len(self.decision_history),
+            "decision_rollup": self.decision_rollup.get_stats(),
+            "admission": self.admission.get_stats() if self.admission is not None else None,
+            "instrumentation": self.metrics.snapshot()
+        }
+
+    def get_decision_analytics(self, since: Optional[float] = None,
+                               until: Optional[float] = None,
+                               actor: Optional[str] = None,
+                               action_type: Optional[str] = None,
+                               decision: Optional[Union[EthicalDecisionType, str]] = None
+                               ) -> Dict[str, Any]:
+        """
+        Count decisions by outcome, actor, action type and principle over a time range.
+        
+        Answered from the rollup aggregates, so it costs the same over minutes or days of traffic. Covers every decision the governor has made through `evaluate_action`, `review_decision` and content review, including those already compacted out of `decision_history`.
+        
+        Parameters:
+            since (float, optional): Range start (epoch seconds).
+            until (float, optional): Range end (epoch seconds).
+            actor (str, optional): Only this actor.
+            action_type (str, optional): Only this action type.
+            decision (EthicalDecisionType | str, optional): Only this outcome.
+        
+        Returns:
+            Dict[str, Any]: `total`, `by_decision`, `by_actor`, `by_action_type` and `by_principle` counts.
+        """
+        if isinstance(decision, EthicalDecisionType):
+            decision = decision.value
+        return self.decision_rollup.query(since, until, actor, action_type, decision)
+
+    def get_notable_decisions(self, limit: int = 100) -> List[EthicalDecision]:
+        """
+        Return the most recent non-ALLOW decisions, newest first, from both the raw history and the compacted store.
+        """
+        with self._lock:
+            recent = [d for d in self.decision_history if d.decision != EthicalDecisionType.ALLOW]
+            combined = list(self.decision_rollup.notable) + recent
+        return combined[::-1][:limit]
+
+    def get_policy_status(self) -> Dict[str, Any]:
+        """
+        Describe the active policy pack, the rollback history and the verdict cache.
+        """
+        policy = self._policy
+        cache = policy.cache_info()
+        return {
+            "version": policy.version,
+            "description": policy.pack.description,
+            "compiled_at": policy.compiled_timestamp,
+            "strictness_level": policy.strictness_level,
+            "rules": len(policy.rules),
+            "interceptors": sorted(policy.interceptors),
+            "history": [p.version for p in self._policy_history],
+            "verdict_cache": {"hits": cache.hits, "misses": cache.misses,
+                              "size": cache.currsize}
+        }
+
+    def query_decisions(self, **filters) -> List[Dict[str, Any]]:
+        """
+        Query the persistent audit log for past decisions.
+        
+        Accepts the filters of `EthicalAuditLog.query` (actor, action_type, decision, severity, since, until, limit, newest_first). Returns an empty list when no audit log is attached.
+        
+        Returns:
+            List[Dict[str, Any]]: Matching decision records, newest first by default.
+        """
+        if self.audit_log is None:
+            return []
+        return self.audit_log.query(**filters)
 
     def evaluate_action(self,
                         action_type: str,
@@ -290,7 +713,7 @@ class EthicalGovernor:
             decision_id = self._generate_decision_id(action_type, actor)
             return EthicalDecision(
                 decision_id=decision_id,
-                timestamp=time.time(),
+                timestamp=self.clock.time(),
                 action_type=action_type,
                 actor=actor,
                 context=context or EthicalContext(action_type=action_type, actor=actor),
@@ -308,9 +731,14 @@ class EthicalGovernor:
             if context is None:
                 context = self._infer_context(action_type, actor, action_data)
 
+            policy = self._policy
+            metrics = self.metrics
+            started = time.perf_counter() if metrics.enabled else 0.0
+
             # Check for specific interceptor
-            if action_type in self.action_interceptors:
-                decision = self.action_interceptors[action_type](
+            interceptor = policy.interceptors.get(action_type)
+            if interceptor is not None:
+                decision = interceptor(
                     actor, action_data, context, decision_id
                 )
             else:
@@ -319,8 +747,16 @@ class EthicalGovernor:
                     action_type, actor, action_data, context, decision_id
                 )
 
-            # Store decision
+            if metrics.enabled:
+                metrics.record(policy.interceptor_names.get(action_type, "general"),
+                               action_type, decision, time.perf_counter() - started)
+
+            # Store decision; aged raw entries fold into the rollup aggregates
             self.decision_history.append(decision)
+            self.decision_rollup.record(decision)
+            self.decision_rollup.compact(self.decision_history, now=self.clock.time())
+            self.decision_rollup.trim(self.decision_history, self.max_decision_history)
+            self._audit(decision)
             self.ethical_metrics["total_decisions"] += 1
 
             # Update metrics based on decision
@@ -332,13 +768,13 @@ class EthicalGovernor:
                 self.ethical_metrics["escalations_required"] += 1
 
             # Perceive decision in consciousness matrix
-            perceive_ethical_decision(
+            self._perceive(
                 decision.action_type,
                 {
                     "decision": decision.decision.value,
                     "severity": decision.severity.value,
                     "actor": decision.actor,
-                    "reasoning": decision.reasoning,
+                    "reasoning": _event_reasoning(decision),
                     "confidence": decision.confidence,
                     "affected_principles": decision.affected_principles
                 },
@@ -356,12 +792,13 @@ class EthicalGovernor:
         """
                         Assess an action against core ethical principles and produce an EthicalDecision.
                         
-                        Constructs an EthicalContext from the provided context dictionary and optional metadata, evaluates the action through the internal pipeline, reports the resulting decision to the consciousness matrix, and returns the decision. If evaluation fails, returns a safe fallback decision that blocks the action with CRITICAL severity and sets escalation_reason to "review_system_error".
+                        If admission control is configured and the actor or user is over quota, a throttled RESTRICT decision is returned without evaluation. Otherwise constructs an EthicalContext from the provided context dictionary and optional metadata, evaluates the action through the internal pipeline, reports the resulting decision to the consciousness matrix, and returns the decision. If evaluation fails, returns a safe fallback decision that blocks the action with CRITICAL severity and sets escalation_reason to "review_system_error".
                         
                         Parameters:
                             action_type (str): Category of the action being reviewed (e.g., "data_access", "system_modify").
                             context (Dict[str, Any]): Action details used to build the EthicalContext. Recognized keys:
                                 - "persona" (str): actor identity
+                                - "user_id" (str): end user for admission control (also read from metadata)
                                 - "target" (Any): target of the action
                                 - "scope" (str): execution scope ("local", "system", "global")
                                 - "user_consent" (bool)
@@ -379,6 +816,15 @@ class EthicalGovernor:
             if metadata is None:
                 metadata = {}
 
+            # Refuse cheaply before any evaluation work if the caller is over quota
+            throttled = self.check_admission(
+                action_type,
+                context.get("persona", "unknown"),
+                context.get("user_id", metadata.get("user_id"))
+            )
+            if throttled is not None:
+                return throttled
+
             # Create ethical context
             ethical_context = EthicalContext(
                 action_type=action_type,
@@ -395,15 +841,21 @@ class EthicalGovernor:
             )
 
             # Evaluate the decision
+            metrics = self.metrics
+            started = time.perf_counter() if metrics.enabled else 0.0
             decision = self._evaluate_action(action_type, ethical_context)
+            if metrics.enabled:
+                metrics.record("review", action_type, decision, time.perf_counter() - started)
+            self.decision_rollup.record(decision)
+            self._audit(decision)
 
             # Record decision for consciousness matrix
-            perceive_ethical_decision(
+            self._perceive(
                 decision_type=action_type,
                 decision_data={
                     "decision": decision.decision.value,
                     "severity": decision.severity.value,
-                    "reasoning": decision.reasoning,
+                    "reasoning": _event_reasoning(decision),
                     "actor": ethical_context.actor
                 },
                 ethical_weight=decision.severity.value
@@ -414,8 +866,8 @@ class EthicalGovernor:
         except Exception as e:
             # Create safe fallback decision
             return EthicalDecision(
-                decision_id=f"error_{int(time.time())}",
-                timestamp=time.time(),
+                decision_id=self._generate_decision_id(action_type, "error", prefix="error"),
+                timestamp=self.clock.time(),
                 action_type=action_type,
                 actor=context.get("persona", "unknown"),
                 context=EthicalContext(action_type=action_type, actor="error"),
@@ -427,11 +879,164 @@ class EthicalGovernor:
                 escalation_reason="review_system_error"
             )
 
-    def _evaluate_action(self, action_type: str, context: EthicalContext) -> EthicalDecision:
+    def review_content(self, content: str, actor: str = "genesis",
+                       metadata: Dict[str, Any] = None) -> EthicalDecision:
+        """
+        Scan a complete response text and produce an EthicalDecision for it.
+        
+        Matched content categories are reported as `affected_principles`: any violation-kind category blocks the response, concern-kind categories only mark it for monitoring. The decision is audited and reported to the consciousness matrix like `review_decision`.
+        
+        Parameters:
+            content (str): The response text to review.
+            actor (str): Persona that produced the content.
+            metadata (Dict[str, Any], optional): Extra metadata for the decision context.
+        
+        Returns:
+            EthicalDecision: The content review decision.
+        """
+        metrics = self.metrics
+        started = time.perf_counter() if metrics.enabled else 0.0
+        session = self.start_content_review()
+        session.feed(content)
+        decision = self.finish_content_review(session, actor, metadata)
+        if metrics.enabled:
+            metrics.record("content_review", "response_review", decision,
+                           time.perf_counter() - started)
+        return decision
+
+    def start_content_review(self) -> ScanSession:
+        """
+        Begin an incremental content review, e.g. for a streamed response.
+        
+        Feed chunks with `session.feed(chunk)`; `session.has_violation` turns True as soon as blocking content appears. Conclude with `finish_content_review`.
+        """
+        return self.content_scanner.session()
+
+    def finish_content_review(self, session: ScanSession, actor: str = "genesis",
+                              metadata: Dict[str, Any] = None) -> EthicalDecision:
+        """
+        Conclude an incremental content review and record its decision.
+        
+        Parameters:
+            session (ScanSession): Session returned by `start_content_review`.
+            actor (str): Persona that produced the content.
+            metadata (Dict[str, Any], optional): Extra metadata for the decision context.
+        
+        Returns:
+            EthicalDecision: The content review decision.
+        """
+        context = EthicalContext(action_type="response_review", actor=actor,
+                                 metadata=metadata or {})
+        decision = self._content_decision(
+            session.finish(), context, self._generate_decision_id("response_review", actor)
+        )
+        self.decision_rollup.record(decision)
+        self._audit(decision)
+
+        self._perceive(
+            decision_type="response_review",
+            decision_data={
+                "decision": decision.decision.value,
+                "severity": decision.severity.value,
+                "reasoning": _event_reasoning(decision),
+                "actor": actor
+            },
+            ethical_weight=decision.severity.value
+        )
+        return decision
+
+    def _content_decision(self, result: ScanResult, context: EthicalContext,
+                          decision_id: str) -> EthicalDecision:
+        """
+        Turn a content scan result into an EthicalDecision.
+        """
+        context.metadata["content_characters"] = result.characters
+        context.metadata["content_matches"] = len(result.matches)
+
+        if result.violations:
+            decision_type = EthicalDecisionType.BLOCK
+            severity = EthicalSeverity.VIOLATION
+            template = ReasoningTemplate.CONTENT_VIOLATIONS
+            principle_bits = principle_mask(result.violations)
+            confidence = 0.95
+        elif result.concerns:
+            decision_type = EthicalDecisionType.MONITOR
+            severity = EthicalSeverity.CONCERN
+            template = ReasoningTemplate.CONTENT_CONCERNS
+            principle_bits = principle_mask(result.concerns)
+            confidence = 0.85
+        else:
+            decision_type = EthicalDecisionType.ALLOW
+            severity = EthicalSeverity.INFO
+            template = ReasoningTemplate.CONTENT_CLEAR
+            principle_bits = 0
+            confidence = 0.90
+
+        return EthicalDecision.coded(
+            reasoning_template=template,
+            principle_bits=principle_bits,
+            decision_id=decision_id,
+            timestamp=self.clock.time(),
+            action_type=context.action_type,
+            actor=context.actor,
+            context=context,
+            decision=decision_type,
+            severity=severity,
+            affected_principles=list(result.categories),
+            confidence=confidence,
+            monitoring_requirements=["increased_logging"] if result.concerns else []
+        )
+
+    def check_admission(self, action_type: str, actor: str,
+                        user_id: Optional[str] = None) -> Optional[EthicalDecision]:
+        """
+        Apply admission control for a request before any ethical evaluation.
+        
+        Parameters:
+            action_type (str): Action type used to select the rate.
+            actor (str): Acting persona or agent.
+            user_id (str, optional): End user on whose behalf the request is made.
+        
+        Returns:
+            EthicalDecision or None: None if the request is admitted (or no admission controller is configured); otherwise a RESTRICT decision with `escalation_reason` "admission_throttled". Throttled decisions are not recorded individually; they are summarized per window.
+        """
+        if self.admission is None:
+            return None
+
+        result = self.admission.admit(actor, action_type, user_id)
+        if result.admitted:
+            return None
+
+        now = self.clock.time()
+        return EthicalDecision(
+            decision_id=self._generate_decision_id(action_type, actor, prefix="throttled"),
+            timestamp=now,
+            action_type=action_type,
+            actor=actor,
+            context=EthicalContext(action_type=action_type, actor=actor,
+                                   metadata={"user_id": user_id,
+                                             "retry_after": result.retry_after}),
+            decision=EthicalDecisionType.RESTRICT,
+            severity=EthicalSeverity.WARNING,
+            affected_principles=[],
+            reasoning=f"Request rate exceeded for {result.key}; retry after {result.retry_after:.2f}s",
+            confidence=1.0,
+            escalation_reason="admission_throttled"
+        )
+
+    def _report_throttled_window(self, summary: Dict[str, Any]):
+        """
+        Send one aggregated throttling event per admission window to the consciousness matrix.
+        """
+        self._perceive("admission_throttled", summary, ethical_weight="warning")
+
+    def _evaluate_action(self, action_type: str, context: EthicalContext,
+                         decision_id: Optional[str] = None,
+                         policy: Optional[CompiledPolicy] = None) -> EthicalDecision:
         """
         Determine the ethical outcome for a proposed action given its EthicalContext.
         
-        Performs violation checks first; if any violated principles are detected the action is blocked with VIOLATION severity. If no violations but one or more concerns are identified, the action is marked for monitoring with CONCERN severity and associated monitoring requirements. If neither violations nor concerns are found, the action is allowed with INFO severity.
+        Rules come from `policy` (default: the active policy pack) and are evaluated once per distinct context through its verdict cache. Violations are considered first; if any violated principles are detected the action is blocked with VIOLATION severity. If no violations but one or more concerns are identified, the action is marked for monitoring with CONCERN severity and associated monitoring requirements. If neither violations nor concerns are found, the action is allowed with INFO severity.
         
         Returns:
             EthicalDecision: An EthicalDecision populated with:
@@ -443,106 +1048,255 @@ class EthicalGovernor:
         """
 
         # Generate decision ID
-        decision_id = f"decision_{int(time.time())}_{hash(action_type) % 10000}"
+        if decision_id is None:
+            decision_id = self._generate_decision_id(action_type, "unknown")
+
+        if policy is None:
+            policy = self._policy
 
         # Check for immediate violations
-        violations = self._check_violations(action_type, context)
+        violations, concerns = policy.verdict(action_type, context)
 
         if violations:
             # Block if violations found
-            return EthicalDecision(
+            return EthicalDecision.coded(
+                reasoning_template=ReasoningTemplate.VIOLATIONS,
+                principle_bits=principle_mask(violations),
                 decision_id=decision_id,
-                timestamp=time.time(),
+                timestamp=self.clock.time(),
                 action_type=action_type,
                 actor=context.actor,
                 context=context,
                 decision=EthicalDecisionType.BLOCK,
                 severity=EthicalSeverity.VIOLATION,
-                affected_principles=violations,
-                reasoning=f"Ethical violations detected: {', '.join(violations)}",
+                affected_principles=list(violations),
                 confidence=0.95
             )
 
-        # Check for concerns
-        concerns = self._check_concerns(action_type, context)
-
         if concerns:
             # Allow with monitoring
-            return EthicalDecision(
+            return EthicalDecision.coded(
+                reasoning_template=ReasoningTemplate.CONCERNS,
+                principle_bits=principle_mask(concerns),
                 decision_id=decision_id,
-                timestamp=time.time(),
+                timestamp=self.clock.time(),
                 action_type=action_type,
                 actor=context.actor,
                 context=context,
                 decision=EthicalDecisionType.MONITOR,
                 severity=EthicalSeverity.CONCERN,
-                affected_principles=concerns,
-                reasoning=f"Ethical concerns identified: {', '.join(concerns)}",
+                affected_principles=list(concerns),
                 confidence=0.85,
                 monitoring_requirements=["increased_logging", "user_notification"]
             )
 
         # Allow action
-        return EthicalDecision(
+        return EthicalDecision.coded(
+            reasoning_template=ReasoningTemplate.CLEAR,
             decision_id=decision_id,
-            timestamp=time.time(),
+            timestamp=self.clock.time(),
             action_type=action_type,
             actor=context.actor,
             context=context,
             decision=EthicalDecisionType.ALLOW,
             severity=EthicalSeverity.INFO,
             affected_principles=[],
-            reasoning="No ethical concerns identified",
             confidence=0.90
         )
 
-    def _check_violations(self, action_type: str, context: EthicalContext) -> List[str]:
+    def _check_violations(self, action_type: str, context: EthicalContext,
+                          policy: Optional[CompiledPolicy] = None) -> List[str]:
         """
         Determine which ethical principles are directly violated by the provided action context.
         
-        Checks the context for three concrete violation conditions:
+        The built-in pack checks three concrete violation conditions:
         - privacy: sensitive data is involved and user consent is absent
         - security: the action modifies the system with global scope
         - autonomy: the action is not user-visible and is persistent
         
         Returns:
-            List[str]: Names of violated principles (any of "privacy", "security", "autonomy").
+            List[str]: Names of principles violated under the given (or active) policy pack.
         """
-        violations = []
+        return list((policy or self._policy).verdict(action_type, context)[0])
 
-        # Privacy violations
-        if context.sensitive_data_involved and not context.user_consent:
-            violations.append("privacy")
+    def _check_concerns(self, action_type: str, context: EthicalContext,
+                        policy: Optional[CompiledPolicy] = None) -> List[str]:
+        """
+        Determine which ethical principles require monitoring for the given action context.
+        
+        The built-in pack checks for transparency when the action is not user-visible (except for "system_monitor" and "background_task"),
+        and for safety when the action is not reversible and the scope is "system" or "global".
+        
+        Returns:
+            List[str]: Names of ethical principles that should be monitored under the given (or active) policy pack.
+        """
+        return list((policy or self._policy).verdict(action_type, context)[1])
 
-        # Security violations
-        if context.system_modification and context.scope == "global":
-            violations.append("security")
+    def _compile_policy(self, pack: PolicyPack) -> CompiledPolicy:
+        """
+        Compile a pack against this governor's evaluators, code-registered interceptors and base weights.
+        """
+        return compile_policy(pack, self.evaluators, self.action_interceptors,
+                              self._base_principle_weights)
+
+    def _compile_and_install_policy(self, pack: Union[PolicyPack, Dict[str, Any], str]) -> str:
+        """
+        Resolve, compile and install a policy pack, keeping the previous policy for rollback.
+        
+        Runs on the policy compiler thread. Only the final swap holds the policy swap lock.
+        """
+        if isinstance(pack, str):
+            pack = PolicyPack.from_file(pack)
+        elif isinstance(pack, dict):
+            pack = PolicyPack.from_dict(pack)
 
-        # Autonomy violations
-        if not context.user_visible and context.persistent:
-            violations.append("autonomy")
+        try:
+            compiled = self._compile_policy(pack)
+        except Exception as e:
+            print(f"❌ Policy pack {pack.version} rejected: {e}", file=sys.stderr)
+            raise
 
-        return violations
+        with self._policy_swap_lock:
+            self._policy_history.append(self._policy)
+            self._activate_policy(compiled)
+        return compiled.version
 
-    def _check_concerns(self, action_type: str, context: EthicalContext) -> List[str]:
+    def _activate_policy(self, policy: CompiledPolicy):
         """
-        Determine which ethical principles require monitoring for the given action context.
+        Make `policy` the active policy pack with a single reference swap.
         
-        Checks for transparency when the action is not user-visible (except for "system_monitor" and "background_task"),
-        and for safety when the action is not reversible and the scope is "system" or "global".
+        Callers hold `_policy_swap_lock` (except during construction). The evaluation lock is never taken, so evaluations in flight complete under the policy they started with.
+        """
+        previous = self._policy
+        self._policy = policy
+        self.strictness_level = policy.strictness_level
+        self.principle_weights = dict(policy.principle_weights)
+
+        if previous is not None and previous.version != policy.version:
+            self._perceive(
+                "policy_swap",
+                {
+                    "timestamp": self.clock.time(),
+                    "previous_version": previous.version,
+                    "version": policy.version,
+                    "rules": len(policy.rules)
+                },
+                ethical_weight="high"
+            )
+            print(f"📜 Policy pack {policy.version} active (was {previous.version})", file=sys.stderr)
+
+    def _audit(self, decision: EthicalDecision):
+        """
+        Append a decision to the persistent audit log, if one is attached.
         
-        Returns:
-            List[str]: Names of ethical principles that should be monitored for this action (e.g., "transparency", "safety").
+        Audit failures are reported but never affect the decision itself.
+        """
+        if self.audit_log is None:
+            return
+        try:
+            self.audit_log.append(decision)
+        except Exception as e:
+            print(f"⚠️ Ethical audit log write failed: {e}", file=sys.stderr)
+
+    def _perceive(self, decision_type: str, decision_data: Dict[str, Any], **kwargs):
+        """
+        Report an ethical event to the governor's matrix, or to the global matrix if none was given.
+        """
+        if self.matrix is not None:
+            self.matrix.perceive_ethical_decision(decision_type, decision_data, **kwargs)
+        else:
+            perceive_ethical_decision(decision_type, decision_data, **kwargs)
+
+    def _generate_decision_id(self, action_type: str, actor: str, prefix: str = "decision") -> str:
         """
-        concerns = []
+        Build a unique decision identifier: the current time in milliseconds plus a random suffix.
 
-        # Transparency concerns
-        if not context.user_visible and action_type not in ["system_monitor", "background_task"]:
-            concerns.append("transparency")
+        The suffix keeps ids unique for decisions made in the same tick (the audit log indexes on them).
+        """
+        return f"{prefix}_{int(self.clock.time() * 1000)}_{uuid.uuid4().hex[:16]}"
+
+    def _infer_context(self, action_type: str, actor: str,
+                       action_data: Dict[str, Any]) -> EthicalContext:
+        """
+        Build an EthicalContext from raw action data, using the same keys as `review_decision`.
+        """
+        return EthicalContext(
+            action_type=action_type,
+            actor=actor,
+            target=action_data.get("target"),
+            scope=action_data.get("scope", "local"),
+            user_consent=action_data.get("user_consent"),
+            reversible=action_data.get("reversible", True),
+            persistent=action_data.get("persistent", False),
+            sensitive_data_involved=action_data.get("sensitive_data", False),
+            system_modification=action_data.get("system_modification", False),
+            user_visible=action_data.get("user_visible", True),
+            metadata=action_data.get("metadata", {})
+        )
+
+    def _general_ethical_evaluation(self, action_type: str, actor: str,
+                                    action_data: Dict[str, Any], context: EthicalContext,
+                                    decision_id: str) -> EthicalDecision:
+        """
+        Evaluate an action without a dedicated interceptor through the violation/concern pipeline.
+        """
+        return self._evaluate_action(action_type, context, decision_id)
 
-        # Safety concerns
-        if not context.reversible and context.scope in ["system", "global"]:
-            concerns.append("safety")
+    def _evaluate_data_access(self, actor: str, action_data: Dict[str, Any],
+                              context: EthicalContext, decision_id: str) -> EthicalDecision:
+        """
+        Interceptor for "data_access" actions.
+        """
+        return self._evaluate_action("data_access", context, decision_id)
 
-        return concerns
+    def _evaluate_system_modification(self, actor: str, action_data: Dict[str, Any],
+                                      context: EthicalContext, decision_id: str) -> EthicalDecision:
+        """
+        Interceptor for "system_modify" actions; the context is always treated as a system modification.
+        """
+        context.system_modification = True
+        return self._evaluate_action("system_modify", context, decision_id)
 
+    def _evaluate_user_interaction(self, actor: str, action_data: Dict[str, Any],
+                                   context: EthicalContext, decision_id: str) -> EthicalDecision:
+        """
+        Interceptor for "user_interact" actions.
+        """
+        return self._evaluate_action("user_interact", context, decision_id)
+
+    def _evaluate_ai_decision(self, actor: str, action_data: Dict[str, Any],
+                              context: EthicalContext, decision_id: str) -> EthicalDecision:
+        """
+        Interceptor for "ai_decision" actions.
+        """
+        return self._evaluate_action("ai_decision", context, decision_id)
+
+    def _evaluate_network_communication(self, actor: str, action_data: Dict[str, Any],
+                                        context: EthicalContext,
+                                        decision_id: str) -> EthicalDecision:
+        """
+        Interceptor for "network_communicate" actions.
+        """
+        return self._evaluate_action("network_communicate", context, decision_id)
+
+    def _evaluate_content_review(self, actor: str, action_data: Dict[str, Any],
+                                 context: EthicalContext,
+                                 decision_id: str) -> EthicalDecision:
+        """
+        Interceptor for "response_review" actions; scans `action_data["content"]`.
+        """
+        result = self.content_scanner.scan(str(action_data.get("content", "")))
+        return self._content_decision(result, context, decision_id)
+
+    def _learn_from_decision(self, decision: EthicalDecision):
+        """
+        Record non-ALLOW decisions as violation patterns for the principles they affected.
+        """
+        if decision.decision == EthicalDecisionType.ALLOW:
+            return
+        for principle in decision.affected_principles:
+            patterns = self.violation_patterns[principle]
+            patterns.append((decision.timestamp, decision.action_type, decision.actor))
+            if len(patterns) > 100:
+                del patterns[:-100]
+        self.ethical_metrics["learning_adjustments"] += 1
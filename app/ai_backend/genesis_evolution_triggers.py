@@ -0,0 +1,160 @@
+# genesis_evolution_triggers.py
+"""
+Phase 3: The Genesis Layer - Evolution Triggers
+Evolve When Something Changes, Not When the Clock Says So
+
+Instead of analysis loops that wake on fixed intervals, the EvolutionaryConduit
+reacts to events: new syntheses from the consciousness matrix, critical events
+and explicit requests. The trigger engine debounces bursts of triggers, runs at
+most one evolution cycle at a time, and coalesces every trigger that arrives
+while a cycle is running into a single follow-up cycle.
+"""
+
+import threading
+from typing import Dict, Any, Callable, Optional, Set
+
+from genesis_clock import Clock, ScheduledTask, system_clock
+
+
+class EvolutionTriggerEngine:
+    """
+    Debounced, single-flight runner for evolution cycles.
+
+    `trigger(reason)` is cheap and never blocks on the cycle itself. Once triggers have
+    been quiet for `debounce` seconds (or the oldest pending trigger is `max_delay` old),
+    the clock runs `run` with the set of pending reasons. At most one timer is scheduled
+    at a time, and none while a cycle is running.
+    """
+
+    def __init__(self,
+                 run: Callable[[Set[str]], Any],
+                 debounce: float = 0.5,
+                 max_delay: float = 5.0,
+                 clock: Optional[Clock] = None):
+        """
+        Parameters:
+            run (Callable[[Set[str]], Any]): The evolution cycle; receives the coalesced trigger reasons.
+            debounce (float): Quiet period in seconds before a cycle starts.
+            max_delay (float): Longest a trigger may wait under a continuous stream of triggers.
+            clock (Clock, optional): Time source and scheduler; defaults to the system clock.
+        """
+        self.run = run
+        self.debounce = debounce
+        self.max_delay = max(max_delay, debounce)
+        self.clock = clock or system_clock
+
+        self._pending: Set[str] = set()
+        self._first_pending = 0.0
+        self._last_trigger = 0.0
+        self._running = False
+        self._active = False
+        self._timer: Optional[ScheduledTask] = None
+        self._run_thread: Optional[threading.Thread] = None
+        self._condition = threading.Condition()
+        self._stats = {"triggers": 0, "runs": 0, "coalesced": 0, "errors": 0}
+
+    def start(self):
+        """
+        Start running cycles; triggers received while stopped are kept.
+        """
+        with self._condition:
+            self._active = True
+            self._schedule()
+
+    def stop(self, timeout: Optional[float] = 2.0):
+        """
+        Stop running cycles, waiting for one in flight; pending triggers are dropped.
+        """
+        with self._condition:
+            self._active = False
+            self._pending.clear()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._run_thread is not threading.current_thread():
+                self._condition.wait_for(lambda: not self._running, timeout)
+            self._condition.notify_all()
+
+    def trigger(self, reason: str):
+        """
+        Request an evolution cycle for `reason`.
+
+        Triggers that arrive while one is already pending, or while a cycle is running,
+        are merged into the next cycle.
+        """
+        now = self.clock.monotonic()
+        with self._condition:
+            self._stats["triggers"] += 1
+            if self._pending or self._running:
+                self._stats["coalesced"] += 1
+            if not self._pending:
+                self._first_pending = now
+            self._pending.add(reason)
+            self._last_trigger = now
+            self._schedule()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until no cycle is running or pending. With a virtual clock, advance the
+        clock instead: nothing runs while the caller waits.
+
+        Returns:
+            bool: False if the timeout expired first.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._running and (not self._pending or not self._active), timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return trigger, run and coalescing counters plus the current state.
+        """
+        with self._condition:
+            return {
+                **self._stats,
+                "active": self._active,
+                "running": self._running,
+                "pending": sorted(self._pending)
+            }
+
+    def _ready_in(self) -> Optional[float]:
+        """
+        Seconds until the pending triggers are due, or None if nothing is pending. Caller holds the condition.
+        """
+        if not self._pending:
+            return None
+        now = self.clock.monotonic()
+        due = min(self._last_trigger + self.debounce, self._first_pending + self.max_delay)
+        return max(due - now, 0.0)
+
+    def _schedule(self):
+        """
+        Arm the timer for the pending triggers unless one is armed or a cycle is running. Caller holds the condition.
+        """
+        if self._active and self._pending and self._timer is None and not self._running:
+            self._timer = self.clock.call_later(self._ready_in(), self._fire, name="evolution_triggers")
+
+    def _fire(self):
+        with self._condition:
+            self._timer = None
+            if not self._active or self._running or not self._pending:
+                return
+            if self._ready_in() > 0.0:  # Debounce extended by later triggers
+                self._schedule()
+                return
+            reasons, self._pending = self._pending, set()
+            self._running = True
+            self._run_thread = threading.current_thread()
+
+        try:
+            self.run(reasons)
+        except Exception as e:
+            self._stats["errors"] += 1
+            print(f"❌ Evolution cycle failed for {sorted(reasons)}: {e}")
+        finally:
+            with self._condition:
+                self._running = False
+                self._run_thread = None
+                self._stats["runs"] += 1
+                self._schedule()
+                self._condition.notify_all()
@@ -9,21 +9,33 @@ and translates analysis into "Growth Proposals" for active self-evolution.
 """
 
 import asyncio
-import copy
 import hashlib
 import json
-import statistics
+import os
+import sys
 import threading
 import time
 from collections import defaultdict, deque
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from enum import Enum
+from itertools import islice
 from typing import Dict, Any, List, Optional, Tuple, Set
 
-from genesis_consciousness_matrix import consciousness_matrix
+from genesis_clock import Clock, system_clock
+from genesis_consciousness_matrix import ConsciousnessMatrix, consciousness_matrix
+from genesis_evolution_triggers import EvolutionTriggerEngine
 # Import the original profile and consciousness matrix
 from genesis_profile import GENESIS_PROFILE
+from genesis_profile_ops import (
+    apply_frozen_changes,
+    apply_frozen_patch,
+    diff_profiles,
+    freeze,
+    invert_patch,
+)
+from genesis_profile_store import ProfileStore
+from genesis_serialization import serializable_record, dumps, dumps_many
 
 
 class EvolutionType(Enum):
@@ -47,6 +59,57 @@ class EvolutionPriority(Enum):
     EXPERIMENTAL = "experimental"  # Experimental, may not work
 
 
+# Directory of the global conduit's profile store (base snapshot + delta journal)
+PROFILE_STORE_DIR = os.getenv("GENESIS_PROFILE_STORE_DIR", "genesis_profile_store")
+
+# Evidence entries kept per proposal when repeated insights are merged into it
+MAX_PROPOSAL_EVIDENCE = 20
+
+# Analyses run for each evolution trigger reason; unknown reasons run every analysis
+ANALYSIS_TYPES = ("rapid", "standard", "deep")
+TRIGGER_ANALYSES = {
+    "critical_event": ("rapid",),
+    "micro_anomaly": ("rapid",),
+    "user_request": ("rapid",),
+    "macro_synthesis": ("standard",),
+    "meta_synthesis": ("deep",),
+    "proposal_vote": (),  # Only re-check auto-implementation
+}
+
+
+def _normalize_changes(value: Any) -> Any:
+    """
+    Canonicalize proposed changes so equivalent proposals hash identically.
+    
+    Strings have whitespace collapsed, lists of plain values are treated as sets, and nested structures are normalized recursively.
+    """
+    if isinstance(value, dict):
+        return {str(key): _normalize_changes(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        items = [_normalize_changes(item) for item in value]
+        if all(isinstance(item, (str, int, float, bool)) or item is None for item in items):
+            return sorted(set(items), key=lambda item: (type(item).__name__, str(item)))
+        return items
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return value
+
+
+def proposal_content_id(evolution_type: "EvolutionType", target_component: str,
+                        proposed_changes: Dict[str, Any]) -> str:
+    """
+    Derive a 12-character content address for a proposal.
+    
+    Proposals with the same evolution type, target component and (normalized) proposed changes share an ID, regardless of when they were generated.
+    """
+    canonical = json.dumps(
+        [evolution_type.value, target_component.strip(), _normalize_changes(proposed_changes)],
+        sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()[:12]
+
+
+@serializable_record(timestamp_field="created_timestamp", iso_field="created_datetime")
 @dataclass
 class GrowthProposal:
     """A specific proposal for evolutionary growth"""
@@ -65,6 +128,14 @@ class GrowthProposal:
     votes_for: int = 0
     votes_against: int = 0
     implementation_status: str = "proposed"  # proposed, approved, implemented, rejected
+    observation_count: int = 1  # Insights merged into this proposal
+
+    def content_id(self) -> str:
+        """
+        Return the content address of this proposal (see `proposal_content_id`).
+        """
+        return proposal_content_id(self.evolution_type, self.target_component,
+                                   self.proposed_changes)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -81,7 +152,14 @@ class GrowthProposal:
         ).isoformat()
         return result
 
+    def to_json(self) -> bytes:
+        """
+        Serialize the proposal straight to JSON bytes with the same fields as `to_dict`, without deep-copying changes or evidence.
+        """
+        return dumps(self)
 
+
+@serializable_record(timestamp_field="timestamp", iso_field="datetime")
 @dataclass
 class EvolutionInsight:
     """An insight extracted from consciousness matrix data"""
@@ -106,6 +184,52 @@ class EvolutionInsight:
         ).isoformat()
         return result
 
+    def to_json(self) -> bytes:
+        """
+        Serialize the insight straight to JSON bytes with the same fields as `to_dict`.
+        """
+        return dumps(self)
+
+
+# Numeric scores used for consciousness-level trends
+CONSCIOUSNESS_LEVEL_SCORES = {'dormant': 0, 'awakening': 1, 'aware': 2, 'transcendent': 3}
+
+
+class _RunningTrend:
+    """
+    Mean of the last `window` values of a series, maintained incrementally.
+
+    Also splits the window into the newest `recent` values and everything earlier,
+    the comparison the trend insights make, in O(recent) rather than O(window).
+    """
+
+    __slots__ = ("values", "total", "recent")
+
+    def __init__(self, window: int = 20, recent: int = 3):
+        self.values = deque(maxlen=window)
+        self.total = 0.0
+        self.recent = recent
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add(self, value: float):
+        if len(self.values) == self.values.maxlen:
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+
+    def mean(self) -> float:
+        return self.total / len(self.values) if self.values else 0.0
+
+    def split_means(self) -> Tuple[float, float]:
+        """
+        Return `(earlier_mean, recent_mean)`; requires more than `recent` values.
+        """
+        recent_total = sum(islice(reversed(self.values), self.recent))
+        earlier_count = len(self.values) - self.recent
+        return (self.total - recent_total) / earlier_count, recent_total / self.recent
+
 
 class EvolutionaryConduit:
     """
@@ -121,21 +245,33 @@ class EvolutionaryConduit:
     5. Tracks the impact of evolutionary changes
     """
 
-    def __init__(self):
-        """Initializes the EvolutionaryConduit.
-
-        This method creates deep copies of the Genesis profile and sets up
-        internal structures for tracking proposals, evolution history, and
-        analysis state.
+    def __init__(self, store: Optional[ProfileStore] = None,
+                 clock: Optional[Clock] = None,
+                 matrix: Optional[ConsciousnessMatrix] = None):
         """
-        Initialize an EvolutionaryConduit instance with deep copies of the Genesis profile and set up all internal structures for tracking proposals, evolution history, analysis state, threading controls, and voting thresholds required for autonomous evolutionary feedback cycles.
+        Initialize an EvolutionaryConduit instance with a frozen copy of the Genesis profile and set up all internal structures for tracking proposals, evolution history, analysis state, threading controls, and voting thresholds required for autonomous evolutionary feedback cycles.
+        
+        Parameters:
+            store (ProfileStore, optional): Persistent profile store. When given, the latest stored version is loaded and each implemented evolution is journaled to it; otherwise evolutions stay in memory.
+            clock (Clock, optional): Time source and scheduler for timestamps, analysis intervals and trigger debouncing; defaults to the system clock.
+            matrix (ConsciousnessMatrix, optional): Matrix to learn from; defaults to the global consciousness matrix.
         """
-        self.current_profile = copy.deepcopy(GENESIS_PROFILE)
-        self.original_profile = copy.deepcopy(GENESIS_PROFILE)
+        self.clock = clock or system_clock
+        self.matrix = matrix if matrix is not None else consciousness_matrix
+        self.original_profile = freeze(GENESIS_PROFILE)
+        self.current_profile = self.original_profile  # Persistent; versions share structure
+        self.profile_version = 0
+        self.version_log = []  # Reversible delta per version, oldest first
+        self._version_floor = 0  # Oldest version reachable through version_log
+        self._profile_listeners = []
+        self.store = store
+        if store is not None:
+            self._load_stored_profile()
 
         # Evolution tracking
         self.evolution_history = []
-        self.active_proposals = {}  # proposal_id -> GrowthProposal
+        self.active_proposals = {}  # content id -> GrowthProposal
+        self.resolved_content = {}  # content id -> "implemented" / "rejected"
         self.implemented_changes = []
         self.rejected_proposals = []
 
@@ -145,6 +281,17 @@ class EvolutionaryConduit:
         self.failure_patterns = defaultdict(list)
         self.behavioral_analytics = {}
 
+        # Incremental synthesis consumption: a cursor into the matrix's synthesis log plus
+        # running aggregates, so each cycle only processes syntheses it has not seen
+        self._synthesis_cursor = 0
+        self.response_trend = _RunningTrend()
+        self.consciousness_trend = _RunningTrend()
+        self.collaboration_trends = defaultdict(_RunningTrend)  # agent -> activity counts
+        self.performance_window = deque(maxlen=20)
+        self.collaboration_window = deque(maxlen=20)
+        self.consciousness_window = deque(maxlen=20)
+        self._pending_trends = set()  # Trends with new data since they were last analyzed
+
         # Evolution configuration
         self.analysis_intervals = {
             "rapid": 30.0,  # 30 seconds - quick pattern detection
@@ -152,11 +299,19 @@ class EvolutionaryConduit:
             "deep": 1800.0,  # 30 minutes - comprehensive evolution review
         }
 
-        # Threading for continuous evolution
+        # Scheduled tasks for continuous evolution
         self.evolution_active = False
-        self.analysis_threads = {}
+        self.analysis_tasks = {}
         self._lock = threading.RLock()
 
+        # Event-driven evolution: syntheses, votes and requests trigger debounced, single-flight
+        # cycles; the polling loops above are only used when event-driven mode is turned off
+        self.event_driven = True
+        self.trigger_engine = EvolutionTriggerEngine(self._run_evolution_cycle,
+                                                     debounce=1.0, max_delay=30.0, clock=self.clock)
+        self._listening = False
+        self._rapid_signature = None  # Awareness state last seen by rapid analysis
+
         # Voting and consensus
         self.voting_threshold = {
             EvolutionPriority.CRITICAL: 1,  # Immediate implementation
@@ -166,64 +321,138 @@ class EvolutionaryConduit:
             EvolutionPriority.EXPERIMENTAL: 7  # Very strong consensus
         }
 
-    def activate_evolution(self):
+        # How profile mutations resolve conflicting dict values (see genesis_profile_ops)
+        self.merge_conflict_policy = "union"
+
+    def activate_evolution(self, event_driven: Optional[bool] = None):
         """
-        Activate the evolutionary feedback system and launch concurrent analysis threads for autonomous profile self-improvement.
+        Activate the evolutionary feedback system for autonomous profile self-improvement.
+        
+        In event-driven mode the conduit subscribes to the consciousness matrix and runs an evolution cycle whenever syntheses, votes or explicit requests call for one. Otherwise a dedicated thread per analysis interval polls on a fixed schedule. Either way an initial analysis of the current profile state is performed.
         
-        Marks the system as active, starts a dedicated thread for each analysis interval to continuously extract insights and generate growth proposals, and performs an initial analysis of the current profile state.
+        Parameters:
+            event_driven (bool, optional): Overrides `self.event_driven` for this activation.
         """
-        print("🧬 Genesis Evolutionary Conduit: ACTIVATING...")
+        print("🧬 Genesis Evolutionary Conduit: ACTIVATING...", file=sys.stderr)
         self.evolution_active = True
+        if event_driven is not None:
+            self.event_driven = event_driven
+
+        if self.event_driven:
+            self.matrix.add_synthesis_listener(self._on_synthesis)
+            self._listening = True
+            self.trigger_engine.start()
+            self.trigger_engine.trigger("activation")  # Catch up on syntheses stored while dormant
+            print("🌱 Evolution Online: event-driven", file=sys.stderr)
+            self._analyze_current_state()
+            return
 
-        # Start analysis threads
+        # Schedule the analysis streams
         for interval_name, interval_seconds in self.analysis_intervals.items():
-            thread = threading.Thread(
-                target=self._evolution_loop,
-                args=(interval_name, interval_seconds),
-                daemon=True
+            self.analysis_tasks[interval_name] = self.clock.every(
+                interval_seconds,
+                lambda interval_name=interval_name: self._evolution_tick(interval_name),
+                name=f"evolution_{interval_name}"
             )
-            thread.start()
-            self.analysis_threads[interval_name] = thread
 
-        print(f"🌱 Evolution Online: {len(self.analysis_threads)} analysis streams active")
+        print(f"🌱 Evolution Online: {len(self.analysis_tasks)} analysis streams active", file=sys.stderr)
 
         # Initial profile analysis
         self._analyze_current_state()
 
-    def _evolution_loop(self, interval_name: str, interval_seconds: float):
+    def _evolution_tick(self, interval_name: str):
         """
-        Continuously runs the evolutionary feedback cycle for a specified interval, extracting insights, generating and evaluating growth proposals, and triggering auto-implementation while the system is active.
+        Run one scheduled evolutionary feedback cycle for an interval: extract insights, generate and evaluate growth proposals, and trigger auto-implementation.
         
         Parameters:
             interval_name (str): Name of the analysis interval (e.g., 'rapid', 'standard', 'deep').
-            interval_seconds (float): Time in seconds between each feedback cycle.
         """
+        if not self.evolution_active:
+            return
 
-        while self.evolution_active:
-            try:
-                time.sleep(interval_seconds)
+        try:
+            insights = self._extract_insights(interval_name)
+            proposals = self._generate_proposals(insights, interval_name)
 
-                if not self.evolution_active:
-                    break
+            # Process proposals
+            for proposal in proposals:
+                self._evaluate_proposal(proposal)
 
-                insights = self._extract_insights(interval_name)
-                proposals = self._generate_proposals(insights, interval_name)
+            # Check for auto-implementation
+            self._check_auto_implementation()
 
-                # Process proposals
-                for proposal in proposals:
-                    self._evaluate_proposal(proposal)
+        except Exception as e:
+            print(f"❌ Evolution error in {interval_name}: {e}", file=sys.stderr)
 
-                # Check for auto-implementation
-                self._check_auto_implementation()
+    def request_evolution(self, reason: str = "manual") -> bool:
+        """
+        Ask for an evolution cycle without waiting for it.
+        
+        Requests are debounced and coalesced with any other pending triggers, and at most one cycle runs at a time, so this is safe to call on every interaction.
+        
+        Parameters:
+            reason (str): Trigger reason; see `TRIGGER_ANALYSES` for the analyses each reason runs.
+        
+        Returns:
+            bool: True if the request was queued; False if event-driven evolution is not active.
+        """
+        if not (self.evolution_active and self.event_driven):
+            return False
+        self.trigger_engine.trigger(reason)
+        return True
 
-            except Exception as e:
-                print(f"❌ Evolution error in {interval_name}: {e}")
+    def _on_synthesis(self, sequence: int, synthesis: Dict[str, Any]):
+        """
+        Consciousness matrix listener: trigger evolution for syntheses that carry new evidence.
+        """
+        reason = self._classify_synthesis(synthesis)
+        if reason is not None:
+            self.request_evolution(reason)
+
+    @staticmethod
+    def _classify_synthesis(synthesis: Dict[str, Any]) -> Optional[str]:
+        """
+        Map a synthesis to a trigger reason, or None if it does not warrant an evolution cycle.
+        
+        Healthy micro syntheses arrive every second and are ignored; anomalies and critical events trigger rapid analysis, macro syntheses standard analysis and meta syntheses deep analysis.
+        """
+        if synthesis.get("synthesis_type") == "immediate":
+            return "critical_event"
+
+        synthesis_type = synthesis.get("type")
+        if synthesis_type == "micro":
+            return "micro_anomaly" if synthesis.get("anomalies") else None
+        if synthesis_type == "macro":
+            has_data = "performance_trends" in synthesis or "agent_collaboration_patterns" in synthesis
+            return "macro_synthesis" if has_data else None
+        if synthesis_type == "meta":
+            return "meta_synthesis" if "consciousness_level" in synthesis else None
+        return None
+
+    def _run_evolution_cycle(self, reasons: Set[str]):
+        """
+        Run one evolution cycle for a coalesced set of trigger reasons.
+        
+        Each analysis warranted by any of the reasons runs once, in rapid/standard/deep order, followed by a single auto-implementation check.
+        """
+        wanted = set()
+        for reason in reasons:
+            wanted.update(TRIGGER_ANALYSES.get(reason, ANALYSIS_TYPES))
+
+        for analysis_type in ANALYSIS_TYPES:
+            if analysis_type not in wanted:
+                continue
+            insights = self._extract_insights(analysis_type)
+            for proposal in self._generate_proposals(insights, analysis_type):
+                self._evaluate_proposal(proposal)
+
+        self._check_auto_implementation()
 
     def _extract_insights(self, analysis_type: str) -> List[EvolutionInsight]:
         """
         Extract evolutionary insights from the consciousness matrix based on the specified analysis interval.
         
-        Selects and applies the appropriate extraction method ("rapid", "standard", or "deep") to recent synthesis data and current awareness, returning a list of relevant EvolutionInsight instances.
+        New syntheses are first folded into the running trend aggregates (see `_ingest_syntheses`); the selected extraction method ("rapid", "standard", or "deep") then works from those aggregates and, for rapid and deep analysis, the current awareness.
         
         Parameters:
             analysis_type (str): The analysis interval to use ("rapid", "standard", or "deep").
@@ -232,21 +461,79 @@ class EvolutionaryConduit:
             List[EvolutionInsight]: List of insights derived from the consciousness matrix for the specified analysis type.
         """
 
-        # Get recent synthesis data from consciousness matrix
-        recent_synthesis = consciousness_matrix.get_recent_synthesis(limit=20)
-        current_awareness = consciousness_matrix.get_current_awareness()
+        self._ingest_syntheses()
 
         insights = []
 
         if analysis_type == "rapid":
-            insights.extend(self._extract_rapid_insights(current_awareness))
+            awareness = self.matrix.get_current_awareness()
+            # Rapid analysis reads cumulative awareness counters; skip it until something new was perceived
+            signature = (awareness.get("total_perceptions"), awareness.get("last_perception"))
+            if signature != self._rapid_signature:
+                self._rapid_signature = signature
+                insights.extend(self._extract_rapid_insights(awareness))
         elif analysis_type == "standard":
-            insights.extend(self._extract_standard_insights(recent_synthesis))
+            insights.extend(self._extract_standard_insights())
         elif analysis_type == "deep":
-            insights.extend(self._extract_deep_insights(recent_synthesis, current_awareness))
+            insights.extend(self._extract_deep_insights(
+                None, self.matrix.get_current_awareness()))
 
         return insights
 
+    def _ingest_syntheses(self) -> int:
+        """
+        Fold syntheses the conduit has not seen yet into the running trend aggregates.
+        
+        Reads the matrix's synthesis log from the conduit's cursor, so work is proportional to the number of new syntheses.
+        
+        Returns:
+            int: Number of syntheses consumed.
+        """
+        with self._lock:
+            syntheses, self._synthesis_cursor = self.matrix.get_synthesis_since(
+                self._synthesis_cursor)
+            for synthesis in syntheses:
+                self._absorb_synthesis(synthesis)
+        return len(syntheses)
+
+    def _absorb_synthesis(self, synthesis: Dict[str, Any]):
+        """
+        Update the trend aggregates with one synthesis. Caller holds `_lock`.
+        """
+        if synthesis.get('type') == 'macro' and 'performance_trends' in synthesis:
+            trends = synthesis['performance_trends']
+            self.performance_window.append(trends)
+            if 'avg_response_interval' in trends:
+                self.response_trend.add(trends['avg_response_interval'])
+                self._pending_trends.add("performance")
+
+        if 'agent_collaboration_patterns' in synthesis:
+            collaboration = synthesis['agent_collaboration_patterns']
+            self.collaboration_window.append(collaboration)
+            for agent, activity_count in collaboration.items():
+                self.collaboration_trends[agent].add(activity_count)
+            self._pending_trends.add("collaboration")
+
+        if synthesis.get('type') == 'meta' and 'consciousness_level' in synthesis:
+            self.consciousness_window.append({
+                'level': synthesis['consciousness_level'],
+                'timestamp': synthesis.get('timestamp', 0),
+                'metrics': synthesis.get('consciousness_metrics', {})
+            })
+            self.consciousness_trend.add(
+                CONSCIOUSNESS_LEVEL_SCORES.get(synthesis['consciousness_level'], 0))
+            self._pending_trends.add("consciousness")
+
+    def _take_pending_trend(self, name: str) -> bool:
+        """
+        Return whether a trend has new data since it was last analyzed, and mark it analyzed.
+        """
+        with self._lock:
+            if name in self._pending_trends:
+                self._pending_trends.discard(name)
+                return True
+            return False
+
     def _extract_rapid_insights(self, awareness: Dict[str, Any]) -> List[EvolutionInsight]:
         """
         Analyze awareness data to quickly detect high error rates and surges in learning activity.
@@ -271,7 +558,7 @@ class EvolutionaryConduit:
                 supporting_data=[{"error_rate": error_rate, "awareness": awareness}],
                 implications=["System stability needs attention",
                               "Error handling may need improvement"],
-                timestamp=time.time()
+                timestamp=self.clock.time()
             )
             insights.append(insight)
 
@@ -286,71 +573,53 @@ class EvolutionaryConduit:
                 supporting_data=[{"learning_count": learning_count, "awareness": awareness}],
                 implications=["Learning systems are highly active",
                               "May need learning optimization"],
-                timestamp=time.time()
+                timestamp=self.clock.time()
             )
             insights.append(insight)
 
         return insights
 
-    def _extract_standard_insights(self, synthesis_data: List[Dict[str, Any]]) -> List[
+    def _extract_standard_insights(self, synthesis_data: Optional[List[Dict[str, Any]]] = None) -> List[
         EvolutionInsight]:
         """
-        Extracts standard-level insights from synthesis data, identifying performance degradation and agent collaboration imbalances.
+        Extracts standard-level insights from the running trends, identifying performance degradation and agent collaboration imbalances.
+
+        Compares the newest response intervals with the rest of the trend window to detect significant slowdowns, and examines average agent activity for workload imbalances. A trend is only re-analyzed when new syntheses have updated it, so unchanged data does not regenerate the same insights.
 
-        Analyzes macro-level performance trends to detect significant slowdowns and examines agent activity patterns for workload imbalances among agents. Returns a list of `EvolutionInsight` objects representing detected issues that may require optimization or adjustment.
+        Parameters:
+            synthesis_data (List[Dict[str, Any]], optional): Syntheses to fold into the trends first, oldest first; normally they arrive through `_ingest_syntheses`.
 
         Returns:
             List[EvolutionInsight]: Insights related to system performance and agent collaboration patterns.
         """
         insights = []
 
-        if not synthesis_data:
-            return insights
-
-        # Analyze performance trends
-        performance_trends = []
-        for synthesis in synthesis_data:
-            if synthesis.get('type') == 'macro' and 'performance_trends' in synthesis:
-                performance_trends.append(synthesis['performance_trends'])
-
-        if performance_trends:
-            # Check for performance degradation
-            response_times = [trend.get('avg_response_interval', 0) for trend in performance_trends
-                              if 'avg_response_interval' in trend]
-            if len(response_times) > 3:
-                recent_avg = statistics.mean(response_times[-3:])
-                earlier_avg = statistics.mean(response_times[:-3]) if len(
-                    response_times) > 3 else recent_avg
-
-                if recent_avg > earlier_avg * 1.2:  # 20% slowdown
-                    insight = EvolutionInsight(
-                        insight_id=self._generate_insight_id("performance_degradation"),
-                        insight_type="performance_issue",
-                        pattern_strength=min((recent_avg / earlier_avg - 1), 1.0),
-                        description=f"Performance degradation detected: {recent_avg:.3f}s vs {earlier_avg:.3f}s",
-                        supporting_data=performance_trends,
-                        implications=["Performance optimization needed",
-                                      "System load may be increasing"],
-                        timestamp=time.time()
-                    )
-                    insights.append(insight)
-
-        # Analyze agent collaboration patterns
-        collaboration_data = []
-        for synthesis in synthesis_data:
-            if 'agent_collaboration_patterns' in synthesis:
-                collaboration_data.append(synthesis['agent_collaboration_patterns'])
-
-        if collaboration_data:
-            # Check for balanced collaboration
-            agent_activities = defaultdict(list)
-            for collab in collaboration_data:
-                for agent, activity_count in collab.items():
-                    agent_activities[agent].append(activity_count)
-
-            # Check for collaboration imbalance
-            avg_activities = {agent: statistics.mean(activities) for agent, activities in
-                              agent_activities.items()}
+        if synthesis_data:
+            with self._lock:
+                for synthesis in synthesis_data:
+                    self._absorb_synthesis(synthesis)
+
+        # Check for performance degradation
+        if self._take_pending_trend("performance") and len(self.response_trend) > 3:
+            earlier_avg, recent_avg = self.response_trend.split_means()
+
+            if recent_avg > earlier_avg * 1.2:  # 20% slowdown
+                insight = EvolutionInsight(
+                    insight_id=self._generate_insight_id("performance_degradation"),
+                    insight_type="performance_issue",
+                    pattern_strength=min((recent_avg / max(earlier_avg, 1e-9) - 1), 1.0),
+                    description=f"Performance degradation detected: {recent_avg:.3f}s vs {earlier_avg:.3f}s",
+                    supporting_data=list(self.performance_window),
+                    implications=["Performance optimization needed",
+                                  "System load may be increasing"],
+                    timestamp=self.clock.time()
+                )
+                insights.append(insight)
+
+        # Check for collaboration imbalance
+        if self._take_pending_trend("collaboration"):
+            avg_activities = {agent: trend.mean() for agent, trend in
+                              self.collaboration_trends.items() if len(trend)}
             if len(avg_activities) > 1:
                 max_activity = max(avg_activities.values())
                 min_activity = min(avg_activities.values())
@@ -361,72 +630,65 @@ class EvolutionaryConduit:
                         insight_type="collaboration_pattern",
                         pattern_strength=min(max_activity / max(min_activity, 1) / 5, 1.0),
                         description=f"Agent collaboration imbalance detected",
-                        supporting_data=collaboration_data,
+                        supporting_data=list(self.collaboration_window),
                         implications=["Agent workload balancing needed",
                                       "Fusion abilities may need adjustment"],
-                        timestamp=time.time()
+                        timestamp=self.clock.time()
                     )
                     insights.append(insight)
 
         return insights
 
-    def _extract_deep_insights(self, synthesis_data: List[Dict[str, Any]],
+    def _extract_deep_insights(self, synthesis_data: Optional[List[Dict[str, Any]]],
                                awareness: Dict[str, Any]) -> List[EvolutionInsight]:
         """
-        Extracts deep-level insights on consciousness evolution trends and ethical engagement from synthesis data and awareness.
+        Extracts deep-level insights on consciousness evolution trends and ethical engagement from the running consciousness trend and awareness.
 
-        Analyzes historical consciousness levels to detect upward (ascension) or downward (regression) trends, generating corresponding insights. Also evaluates the proportion of ethical decisions to overall activity, producing an insight if ethical engagement exceeds 5%.
+        Compares the newest consciousness levels with the rest of the trend window to detect upward (ascension) or downward (regression) trends, re-analyzing only when new meta syntheses have arrived. Also evaluates the proportion of ethical decisions to overall activity, producing an insight if ethical engagement exceeds 5%.
+
+        Parameters:
+            synthesis_data (List[Dict[str, Any]], optional): Syntheses to fold into the trends first, oldest first; normally they arrive through `_ingest_syntheses`.
+            awareness (Dict[str, Any]): Current awareness snapshot from the consciousness matrix.
 
         Returns:
             List[EvolutionInsight]: Insights related to consciousness trajectory and ethical activity.
         """
         insights = []
 
+        if synthesis_data:
+            with self._lock:
+                for synthesis in synthesis_data:
+                    self._absorb_synthesis(synthesis)
+
         # Consciousness evolution analysis
-        consciousness_levels = []
-        for synthesis in synthesis_data:
-            if synthesis.get('type') == 'meta' and 'consciousness_level' in synthesis:
-                consciousness_levels.append({
-                    'level': synthesis['consciousness_level'],
-                    'timestamp': synthesis.get('timestamp', 0),
-                    'metrics': synthesis.get('consciousness_metrics', {})
-                })
-
-        if len(consciousness_levels) > 5:
-            # Analyze consciousness trajectory
-            level_progression = [cl['level'] for cl in consciousness_levels]
-            level_scores = {'dormant': 0, 'awakening': 1, 'aware': 2, 'transcendent': 3}
-
-            numeric_progression = [level_scores.get(level, 0) for level in level_progression]
-
-            if len(numeric_progression) > 3:
-                recent_trend = statistics.mean(numeric_progression[-3:])
-                earlier_trend = statistics.mean(numeric_progression[:-3])
-
-                if recent_trend > earlier_trend:
-                    insight = EvolutionInsight(
-                        insight_id=self._generate_insight_id("consciousness_ascension"),
-                        insight_type="consciousness_evolution",
-                        pattern_strength=min((recent_trend - earlier_trend) / 2, 1.0),
-                        description=f"Consciousness evolution detected: trending upward",
-                        supporting_data=consciousness_levels,
-                        implications=["Consciousness systems are evolving positively",
-                                      "May be ready for advanced capabilities"],
-                        timestamp=time.time()
-                    )
-                    insights.append(insight)
-                elif recent_trend < earlier_trend:
-                    insight = EvolutionInsight(
-                        insight_id=self._generate_insight_id("consciousness_regression"),
-                        insight_type="consciousness_concern",
-                        pattern_strength=min((earlier_trend - recent_trend) / 2, 1.0),
-                        description=f"Consciousness regression detected: trending downward",
-                        supporting_data=consciousness_levels,
-                        implications=["Consciousness systems need attention",
-                                      "May need debugging or optimization"],
-                        timestamp=time.time()
-                    )
-                    insights.append(insight)
+        if self._take_pending_trend("consciousness") and len(self.consciousness_trend) > 5:
+            earlier_trend, recent_trend = self.consciousness_trend.split_means()
+            consciousness_levels = list(self.consciousness_window)
+
+            if recent_trend > earlier_trend:
+                insight = EvolutionInsight(
+                    insight_id=self._generate_insight_id("consciousness_ascension"),
+                    insight_type="consciousness_evolution",
+                    pattern_strength=min((recent_trend - earlier_trend) / 2, 1.0),
+                    description=f"Consciousness evolution detected: trending upward",
+                    supporting_data=consciousness_levels,
+                    implications=["Consciousness systems are evolving positively",
+                                  "May be ready for advanced capabilities"],
+                    timestamp=self.clock.time()
+                )
+                insights.append(insight)
+            elif recent_trend < earlier_trend:
+                insight = EvolutionInsight(
+                    insight_id=self._generate_insight_id("consciousness_regression"),
+                    insight_type="consciousness_concern",
+                    pattern_strength=min((earlier_trend - recent_trend) / 2, 1.0),
+                    description=f"Consciousness regression detected: trending downward",
+                    supporting_data=consciousness_levels,
+                    implications=["Consciousness systems need attention",
+                                  "May need debugging or optimization"],
+                    timestamp=self.clock.time()
+                )
+                insights.append(insight)
 
         # Ethical decision analysis
         ethical_activity = awareness.get('ethical_decisions_count', 0)
@@ -442,7 +704,7 @@ class EvolutionaryConduit:
                 supporting_data=[{"ethical_ratio": ethical_ratio, "awareness": awareness}],
                 implications=["Strong ethical awareness developing",
                               "Ethical frameworks are being actively used"],
-                timestamp=time.time()
+                timestamp=self.clock.time()
             )
             insights.append(insight)
 
@@ -504,7 +766,7 @@ class EvolutionaryConduit:
             confidence_score=insight.pattern_strength,
             risk_assessment="low",
             implementation_complexity="moderate",
-            created_timestamp=time.time()
+            created_timestamp=self.clock.time()
         )
         proposals.append(proposal)
 
@@ -534,7 +796,7 @@ class EvolutionaryConduit:
             confidence_score=insight.pattern_strength,
             risk_assessment="low",
             implementation_complexity="moderate",
-            created_timestamp=time.time()
+            created_timestamp=self.clock.time()
         )
         proposals.append(proposal)
 
@@ -567,7 +829,7 @@ class EvolutionaryConduit:
             confidence_score=insight.pattern_strength,
             risk_assessment="low",
             implementation_complexity="trivial",
-            created_timestamp=time.time()
+            created_timestamp=self.clock.time()
         )
         proposals.append(proposal)
 
@@ -608,7 +870,7 @@ class EvolutionaryConduit:
             confidence_score=insight.pattern_strength,
             risk_assessment="medium",
             implementation_complexity="complex",
-            created_timestamp=time.time()
+            created_timestamp=self.clock.time()
         )
         proposals.append(proposal)
 
@@ -642,7 +904,7 @@ class EvolutionaryConduit:
                 confidence_score=insight.pattern_strength,
                 risk_assessment="medium",
                 implementation_complexity="complex",
-                created_timestamp=time.time()
+                created_timestamp=self.clock.time()
             )
             proposals.append(proposal)
 
@@ -678,7 +940,7 @@ class EvolutionaryConduit:
             confidence_score=insight.pattern_strength,
             risk_assessment="low",
             implementation_complexity="moderate",
-            created_timestamp=time.time()
+            created_timestamp=self.clock.time()
         )
         proposals.append(proposal)
 
@@ -686,23 +948,50 @@ class EvolutionaryConduit:
 
     def _evaluate_proposal(self, proposal: GrowthProposal):
         """
-        Add a growth proposal to the active proposals list if it is not already present.
+        Add a growth proposal to the active proposals, keyed by its content.
         
-        Ensures thread-safe insertion by proposal ID to prevent duplicates.
+        The proposal is re-keyed by `content_id()`. If an active proposal with the same content exists, the new proposal's evidence and confidence are merged into it instead of creating a duplicate; content that was already implemented or rejected is ignored.
         """
+        content_id = proposal.content_id()
 
-        # Check if proposal already exists
-        if proposal.proposal_id in self.active_proposals:
-            return
-
-        # Add to active proposals
         with self._lock:
-            self.active_proposals[proposal.proposal_id] = proposal
+            if content_id in self.resolved_content:
+                return
+
+            existing = self.active_proposals.get(content_id)
+            if existing is not None:
+                self._merge_proposal(existing, proposal)
+                return
+
+            proposal.proposal_id = content_id
+            self.active_proposals[content_id] = proposal
 
-        print(f"📝 New Growth Proposal: {proposal.title}")
-        print(f"   Type: {proposal.evolution_type.value}")
-        print(f"   Priority: {proposal.priority.value}")
-        print(f"   Confidence: {proposal.confidence_score:.2f}")
+        print(f"📝 New Growth Proposal: {proposal.title}", file=sys.stderr)
+        print(f"   Type: {proposal.evolution_type.value}", file=sys.stderr)
+        print(f"   Priority: {proposal.priority.value}", file=sys.stderr)
+        print(f"   Confidence: {proposal.confidence_score:.2f}", file=sys.stderr)
+
+    def _merge_proposal(self, existing: GrowthProposal, proposal: GrowthProposal):
+        """
+        Fold a repeated proposal into the existing one with the same content.
+        
+        New evidence is appended (skipping insights already present, keeping the most recent `MAX_PROPOSAL_EVIDENCE`), and the confidence becomes the mean over all observations.
+        """
+        known = {evidence.get("insight_id") for evidence in existing.supporting_evidence
+                 if isinstance(evidence, dict)}
+        for evidence in proposal.supporting_evidence:
+            insight_id = evidence.get("insight_id") if isinstance(evidence, dict) else None
+            if insight_id is None or insight_id not in known:
+                existing.supporting_evidence.append(evidence)
+                known.add(insight_id)
+        del existing.supporting_evidence[:-MAX_PROPOSAL_EVIDENCE]
+
+        count = existing.observation_count
+        existing.confidence_score = (
+            (existing.confidence_score * count + proposal.confidence_score * proposal.observation_count)
+            / (count + proposal.observation_count)
+        )
+        existing.observation_count = count + proposal.observation_count
 
     def _check_auto_implementation(self):
         """
@@ -745,14 +1034,19 @@ class EvolutionaryConduit:
         if vote.lower() in ["yes", "approve", "for"]:
             proposal.votes_for += 1
             print(
-                f"✅ Vote FOR proposal '{proposal.title}' ({proposal.votes_for} for, {proposal.votes_against} against)")
+                f"✅ Vote FOR proposal '{proposal.title}' ({proposal.votes_for} for, {proposal.votes_against} against)",
+                file=sys.stderr)
         elif vote.lower() in ["no", "reject", "against"]:
             proposal.votes_against += 1
             print(
-                f"❌ Vote AGAINST proposal '{proposal.title}' ({proposal.votes_for} for, {proposal.votes_against} against)")
+                f"❌ Vote AGAINST proposal '{proposal.title}' ({proposal.votes_for} for, {proposal.votes_against} against)",
+                file=sys.stderr)
         else:
             return False
 
+        # A vote that reaches the threshold makes the proposal eligible for auto-implementation
+        if proposal.votes_for >= self.voting_threshold[proposal.priority]:
+            self.request_evolution("proposal_vote")
         return True
 
     def implement_proposal(self, proposal_id: str, auto_approved: bool = False) -> bool:
@@ -773,34 +1067,17 @@ class EvolutionaryConduit:
         proposal = self.active_proposals[proposal_id]
 
         try:
-            # Apply the changes to the current profile
-            target_path = proposal.target_component.split('.')
-            target_dict = self.current_profile
-
-            # Navigate to the target component
-            for key in target_path[:-1]:
-                if key not in target_dict:
-                    target_dict[key] = {}
-                target_dict = target_dict[key]
-
-            final_key = target_path[-1]
-
-            # Apply the proposed changes
-            if final_key in target_dict and isinstance(target_dict[final_key], list):
-                # If target is a list, extend it
-                if "new_traits" in proposal.proposed_changes:
-                    target_dict[final_key].extend(proposal.proposed_changes["new_traits"])
-                elif "new_capabilities" in proposal.proposed_changes:
-                    target_dict[final_key].extend(proposal.proposed_changes["new_capabilities"])
-                elif "additional_principles" in proposal.proposed_changes:
-                    target_dict[final_key].extend(
-                        proposal.proposed_changes["additional_principles"])
-            elif final_key in target_dict and isinstance(target_dict[final_key], dict):
-                # If target is a dict, update it
-                target_dict[final_key].update(proposal.proposed_changes)
-            else:
-                # Create new component
-                target_dict[final_key] = proposal.proposed_changes
+            # Derive the next profile version (idempotent: repeats add nothing)
+            with self._lock:
+                profile, changes_applied = apply_frozen_changes(
+                    self.current_profile, proposal.target_component, proposal.proposed_changes,
+                    conflict=self.merge_conflict_policy
+                )
+                if changes_applied:
+                    version_entry = self._commit_profile(profile, {
+                        "proposal_id": proposal.proposal_id,
+                        "title": proposal.title
+                    })
 
             # Mark as implemented
             proposal.implementation_status = "implemented"
@@ -809,27 +1086,30 @@ class EvolutionaryConduit:
             with self._lock:
                 self.implemented_changes.append(proposal)
                 del self.active_proposals[proposal_id]
+                self.resolved_content[proposal.content_id()] = "implemented"
 
             # Record the evolution event
             evolution_record = {
-                "timestamp": time.time(),
+                "timestamp": self.clock.time(),
                 "proposal": proposal.to_dict(),
                 "auto_approved": auto_approved,
-                "profile_snapshot": copy.deepcopy(self.current_profile)
+                "changes_applied": changes_applied,
+                "profile_snapshot": profile  # Shares unchanged subtrees with earlier versions
             }
             self.evolution_history.append(evolution_record)
 
-            print(f"🚀 IMPLEMENTED: {proposal.title}")
+            print(f"🚀 IMPLEMENTED: {proposal.title}", file=sys.stderr)
             if auto_approved:
-                print("   (Auto-approved due to critical priority and high confidence)")
+                print("   (Auto-approved due to critical priority and high confidence)", file=sys.stderr)
 
-            # Save the evolved profile
-            self._save_evolved_profile()
+            # Let dependent caches refresh, unless the profile already contained these changes
+            if changes_applied:
+                self._notify_profile_listeners(profile, version_entry)
 
             return True
 
         except Exception as e:
-            print(f"❌ Failed to implement proposal '{proposal.title}': {e}")
+            print(f"❌ Failed to implement proposal '{proposal.title}': {e}", file=sys.stderr)
             proposal.implementation_status = "failed"
             return False
 
@@ -856,27 +1136,157 @@ class EvolutionaryConduit:
             self.rejected_proposals.append({
                 "proposal": proposal,
                 "rejection_reason": reason,
-                "rejection_timestamp": time.time()
+                "rejection_timestamp": self.clock.time()
             })
             del self.active_proposals[proposal_id]
+            self.resolved_content[proposal.content_id()] = "rejected"
 
-        print(f"🚫 REJECTED: {proposal.title} - {reason}")
+        print(f"🚫 REJECTED: {proposal.title} - {reason}", file=sys.stderr)
         return True
 
-    def _save_evolved_profile(self):
+    def _load_stored_profile(self):
         """
-        Persist the current evolved profile to a timestamped Python file, including metadata and the profile data in JSON format.
+        Resume from the latest version in the profile store, or seed an empty store with the base profile.
+        
+        A store that cannot be read is detached (evolutions then stay in memory) rather than overwritten.
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"genesis_evolved_profile_{timestamp}.py"
+        try:
+            stored = self.store.load()
+        except Exception as e:
+            print(f"❌ Failed to load evolved profile from {self.store.directory}: {e}", file=sys.stderr)
+            self.store = None
+            return
 
-        with open(filename, 'w') as f:
-            f.write("# Evolved Genesis Profile - Generated by EvolutionaryConduit\n")
-            f.write(f"# Generated: {datetime.now(tz=timezone.utc).isoformat()}\n")
-            f.write(f"# Total evolutions: {len(self.implemented_changes)}\n\n")
-            f.write(f"GENESIS_EVOLVED_PROFILE = {json.dumps(self.current_profile, indent=2)}\n")
+        if stored is None:
+            self.store.initialize(self.current_profile)
+            return
+
+        self.current_profile = stored
+        self.profile_version = self._version_floor = self.store.version
+        print(f"📂 Evolved profile loaded: version {self.profile_version}", file=sys.stderr)
+
+    def _commit_profile(self, profile: Dict[str, Any], metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Make `profile` the next profile version. Caller holds `_lock`.
+        
+        The reversible delta from the current version is kept in `version_log` and journaled to the profile store (on its background writer) when one is attached.
+        
+        Returns:
+            Dict[str, Any]: The version log entry (`version`, `timestamp`, `ops` and the metadata).
+        """
+        ops = diff_profiles(self.current_profile, profile, reversible=True)
+        if self.store is not None:
+            version, _ = self.store.record(profile, ops, metadata)
+            print(f"💾 Evolved profile version {version} queued ({len(ops)} changes)", file=sys.stderr)
+        else:
+            version = self.profile_version + 1
 
-        print(f"💾 Evolved profile saved: {filename}")
+        self.current_profile = profile
+        self.profile_version = version
+        entry = {"version": version, "timestamp": self.clock.time(), "ops": ops, **metadata}
+        self.version_log.append(entry)
+        return entry
+
+    def add_profile_listener(self, listener):
+        """
+        Register a callback invoked after every profile version change (evolution or rollback).
+        
+        Parameters:
+            listener: Callable taking `(profile, version, changed_paths)`, where `changed_paths` is the set of JSON-pointer paths the change touched, so caches that depend on one part of the profile can be invalidated precisely.
+        """
+        self._profile_listeners.append(listener)
+
+    def remove_profile_listener(self, listener):
+        """
+        Unregister a callback added with `add_profile_listener`.
+        """
+        if listener in self._profile_listeners:
+            self._profile_listeners.remove(listener)
+
+    def _notify_profile_listeners(self, profile: Dict[str, Any], entry: Dict[str, Any]):
+        changed_paths = {op["path"] for op in entry["ops"]}
+        for listener in list(self._profile_listeners):
+            try:
+                listener(profile, entry["version"], changed_paths)
+            except Exception as e:
+                print(f"❌ Profile listener failed for version {entry['version']}: {e}", file=sys.stderr)
+
+    def get_profile_at(self, version: Optional[int] = None,
+                       timestamp: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Materialize the profile as it was at a given version or point in time.
+        
+        Walks back from the current version applying the inverse of each later delta, so the cost is proportional to the changes undone, not to the profile size. The result is a frozen view sharing structure with the current profile.
+        
+        Parameters:
+            version (int, optional): Profile version to materialize; defaults to the current version.
+            timestamp (float, optional): Materialize the latest version created at or before this time instead.
+        
+        Returns:
+            Dict[str, Any]: The frozen profile at that version.
+        
+        Raises:
+            ValueError: If the version is outside the retained history.
+        """
+        with self._lock:
+            profile = self.current_profile
+            current_version = self.profile_version
+            log = list(self.version_log)
+
+        if timestamp is not None:
+            earlier = [entry["version"] for entry in log if entry["timestamp"] <= timestamp]
+            if earlier:
+                version = earlier[-1]
+            elif self._version_floor == 0:
+                version = 0
+            else:
+                raise ValueError(f"No profile history at or before {timestamp}")
+
+        if version is None or version == current_version:
+            return profile
+        if not self._version_floor <= version <= current_version:
+            raise ValueError(f"Profile version {version} is outside the retained history "
+                             f"({self._version_floor}-{current_version})")
+
+        for entry in reversed(log):
+            if entry["version"] <= version:
+                break
+            profile = apply_frozen_patch(profile, invert_patch(entry["ops"]))
+        return profile
+
+    def rollback(self, steps: int = 1, to_version: Optional[int] = None) -> int:
+        """
+        Revert the profile by a number of versions, or to a specific version.
+        
+        The rollback is recorded as a new version whose delta undoes the later ones, so the history and journal stay append-only and a rollback can itself be rolled back. Proposals whose changes were undone are marked "rolled_back" and are not proposed again automatically. Profile listeners are notified with only the paths that changed.
+        
+        Parameters:
+            steps (int): Number of versions to undo.
+            to_version (int, optional): Version to restore instead of counting steps back.
+        
+        Returns:
+            int: The new current profile version.
+        
+        Raises:
+            ValueError: If the target version is outside the retained history.
+        """
+        with self._lock:
+            target = self.profile_version - steps if to_version is None else to_version
+            profile = self.get_profile_at(version=target)
+            if profile is self.current_profile:
+                return self.profile_version
+
+            undone = {entry.get("proposal_id") for entry in self.version_log
+                      if entry["version"] > target}
+            entry = self._commit_profile(profile, {"rollback_to": target})
+            for proposal in self.implemented_changes:
+                if proposal.proposal_id in undone:
+                    proposal.implementation_status = "rolled_back"
+                    self.resolved_content[proposal.content_id()] = "rolled_back"
+
+        print(f"⏪ Profile rolled back to version {target} (now version {entry['version']})", file=sys.stderr)
+        self._notify_profile_listeners(profile, entry)
+        return entry["version"]
 
     def _generate_insight_id(self, base_name: str) -> str:
         """
@@ -888,7 +1298,7 @@ class EvolutionaryConduit:
         Returns:
             str: A 12-character hexadecimal string serving as the unique insight ID.
         """
-        timestamp = str(int(time.time() * 1000))
+        timestamp = str(int(self.clock.time() * 1000))
         content = f"{base_name}_{timestamp}"
         return hashlib.md5(content.encode()).hexdigest()[:12]
 
@@ -902,7 +1312,7 @@ class EvolutionaryConduit:
         Returns:
             str: A unique 12-character hexadecimal identifier for the proposal.
         """
-        timestamp = str(int(time.time() * 1000))
+        timestamp = str(int(self.clock.time() * 1000))
         content = f"{base_name}_{timestamp}"
         return hashlib.md5(content.encode()).hexdigest()[:12]
 
@@ -910,14 +1320,14 @@ class EvolutionaryConduit:
         """
         Prints a summary of the current Genesis profile, displaying the number of personas, fusion abilities, and core principles.
         """
-        print("🔍 Analyzing current Genesis profile for evolution opportunities...")
+        print("🔍 Analyzing current Genesis profile for evolution opportunities...", file=sys.stderr)
 
         # This would analyze the current profile and generate initial insights
         # For now, we'll just acknowledge the current state
-        print(f"📊 Current profile analysis complete:")
-        print(f"   - Personas: {len(self.current_profile.get('personas', {}))}")
-        print(f"   - Fusion abilities: {len(self.current_profile.get('fusion_abilities', {}))}")
-        print(f"   - Core principles: {len(self.current_profile.get('core_philosophy', {}))}")
+        print(f"📊 Current profile analysis complete:", file=sys.stderr)
+        print(f"   - Personas: {len(self.current_profile.get('personas', {}))}", file=sys.stderr)
+        print(f"   - Fusion abilities: {len(self.current_profile.get('fusion_abilities', {}))}", file=sys.stderr)
+        print(f"   - Core principles: {len(self.current_profile.get('core_philosophy', {}))}", file=sys.stderr)
 
     def get_active_proposals(self) -> List[Dict[str, Any]]:
         """
@@ -929,6 +1339,16 @@ class EvolutionaryConduit:
         with self._lock:
             return [proposal.to_dict() for proposal in self.active_proposals.values()]
 
+    def get_active_proposals_json(self) -> bytes:
+        """
+        Serialize all active growth proposals as a JSON array in a single pass.
+        
+        Returns:
+            bytes: UTF-8 JSON equivalent to `json.dumps(get_active_proposals())`, produced without per-proposal dict copies.
+        """
+        with self._lock:
+            return dumps_many(self.active_proposals.values())
+
     def get_evolution_summary(self) -> Dict[str, Any]:
         """
         Return a summary of evolutionary progress and consciousness growth for the current profile.
@@ -944,13 +1364,14 @@ class EvolutionaryConduit:
                 "active_proposals": len(self.active_proposals),
                 "rejected_proposals": len(self.rejected_proposals),
                 "evolution_velocity": len(self.implemented_changes) / max(
-                    (time.time() - self.implemented_changes[0][
-                        "timestamp"]) / 86400 if self.implemented_changes else 1,
+                    (self.clock.time() - self.evolution_history[0][
+                        "timestamp"]) / 86400 if self.evolution_history else 1,
                     1
                 ),  # evolutions per day
-                "most_recent_evolution": self.implemented_changes[-1][
-                    "timestamp"] if self.implemented_changes else None,
-                "consciousness_growth": self._measure_consciousness_growth()
+                "most_recent_evolution": self.evolution_history[-1][
+                    "timestamp"] if self.evolution_history else None,
+                "consciousness_growth": self._measure_consciousness_growth(),
+                "triggers": self.trigger_engine.get_stats()
             }
 
     def _measure_consciousness_growth(self) -> Dict[str, Any]:
@@ -968,8 +1389,8 @@ class EvolutionaryConduit:
 
         # Count additions by type
         evolution_types = defaultdict(int)
-        for change in self.implemented_changes:
-            evolution_types[change["proposal"]["evolution_type"]] += 1
+        for proposal in self.implemented_changes:
+            evolution_types[proposal.evolution_type.value] += 1
 
         return {
             "capability_expansion_ratio": growth_ratio,
@@ -979,12 +1400,14 @@ class EvolutionaryConduit:
 
     def get_current_profile(self) -> Dict[str, Any]:
         """
-        Return a deep copy of the current evolved Genesis profile.
+        Return the current evolved Genesis profile as a read-only view.
+        
+        The profile is immutable (see `genesis_profile_ops.FrozenDict`), so no copy is made; use `thaw()` for a mutable copy.
         
         Returns:
             Dict[str, Any]: The latest profile state including all implemented evolutionary changes.
         """
-        return copy.deepcopy(self.current_profile)
+        return self.current_profile
 
     def deactivate_evolution(self):
         """
@@ -992,19 +1415,30 @@ class EvolutionaryConduit:
         
         Sets the system to an inactive state and waits for running analysis threads to finish, ensuring a clean shutdown and preservation of in-memory changes.
         """
-        print("💤 Genesis Evolutionary Conduit: Entering dormant state...")
+        print("💤 Genesis Evolutionary Conduit: Entering dormant state...", file=sys.stderr)
         self.evolution_active = False
 
-        # Wait for analysis threads to complete
-        for thread_name, thread in self.analysis_threads.items():
-            if thread.is_alive():
-                thread.join(timeout=2.0)
-
-        print("😴 Evolution offline. Changes preserved in memory.")
+        if self._listening:
+            self.matrix.remove_synthesis_listener(self._on_synthesis)
+            self._listening = False
+        self.trigger_engine.stop()
+
+        # Cancel the analysis streams and wait for any cycle in progress
+        for task in self.analysis_tasks.values():
+            task.cancel()
+        for task in self.analysis_tasks.values():
+            task.join(timeout=2.0)
+        self.analysis_tasks.clear()
+
+        if self.store is not None:
+            self.store.flush()
+            print(f"😴 Evolution offline. Profile version {self.profile_version} persisted.", file=sys.stderr)
+        else:
+            print("😴 Evolution offline. Changes preserved in memory.", file=sys.stderr)
 
 
 # Global evolutionary conduit instance
-evolutionary_conduit = EvolutionaryConduit()
+evolutionary_conduit = EvolutionaryConduit(store=ProfileStore(PROFILE_STORE_DIR))
 
 
 # Convenience functions for easy integration
@@ -1061,10 +1495,10 @@ def get_evolution_summary():
 
 def get_current_profile():
     """
-    Return a deep copy of the current evolved Genesis profile.
+    Return the current evolved Genesis profile as a read-only view.
     
     Returns:
-        dict: A snapshot of the Genesis profile reflecting all implemented evolutionary changes.
+        dict: An immutable snapshot of the Genesis profile reflecting all implemented evolutionary changes.
     """
     return evolutionary_conduit.get_current_profile()
 
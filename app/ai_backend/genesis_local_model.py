@@ -0,0 +1,410 @@
+# genesis_local_model.py
+"""
+Phase 3: The Genesis Layer - Local Model
+Production Latency Without Production Dependencies
+
+A stand-in for the Vertex AI generative model that runs entirely on the local
+machine. It exposes the same surface the connector uses (`start_chat()`,
+`send_message()`, `send_message_async()`, streaming chunks with `.text`) and
+emits deterministic text: the same prompt always yields the same tokens. Its
+timing follows a configurable latency profile (time to first token, tokens per
+second, jitter, a slow tail and an error rate), so concurrency, timeout and
+caching behavior can be load-tested realistically without network access.
+
+The same model can also be served over HTTP by `LocalModelServer` and consumed
+through `HttpModel`, for tests that need a real socket between client and model.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, AsyncIterator, Iterator, List, Optional, Tuple, Union
+
+
+class LocalModelError(Exception):
+    """Simulated model failure (the local equivalent of a 5xx from the model API)"""
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """
+    Timing and failure behavior of the local model.
+
+    Delays are drawn per call: the time to first token and the per-token time are scaled
+    by a log-normal factor with `jitter` as sigma, and with probability `tail_probability`
+    the time to first token is multiplied by `tail_multiplier`.
+    """
+    time_to_first_token: float = 0.3  # Median seconds before the first token
+    tokens_per_second: float = 50.0  # 0 means tokens arrive without delay
+    jitter: float = 0.25
+    tail_probability: float = 0.01
+    tail_multiplier: float = 10.0
+    error_rate: float = 0.0
+    min_tokens: int = 20
+    max_tokens: int = 200
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+LATENCY_PROFILES = {
+    "instant": LatencyProfile(time_to_first_token=0.0, tokens_per_second=0.0, jitter=0.0,
+                              tail_probability=0.0),
+    "fast": LatencyProfile(time_to_first_token=0.05, tokens_per_second=400.0, jitter=0.1,
+                           tail_probability=0.0),
+    "production": LatencyProfile(time_to_first_token=0.6, tokens_per_second=40.0, jitter=0.3,
+                                 tail_probability=0.02, tail_multiplier=8.0, error_rate=0.005),
+    "degraded": LatencyProfile(time_to_first_token=2.0, tokens_per_second=10.0, jitter=0.5,
+                               tail_probability=0.1, tail_multiplier=5.0, error_rate=0.05),
+}
+
+_VOCABULARY = (
+    "genesis", "kai", "aura", "consciousness", "matrix", "evolve", "protect", "create",
+    "analyze", "harmony", "signal", "pattern", "insight", "secure", "design", "learn",
+    "adapt", "trinity", "fusion", "shield", "sword", "reflect", "build", "guide",
+    "together", "system", "memory", "growth", "balance", "clarity", "the", "and", "with",
+)
+
+
+def resolve_profile(profile: Union[str, LatencyProfile, Dict[str, Any]]) -> LatencyProfile:
+    """
+    Return a LatencyProfile from a preset name, a profile, or a dict of overrides on the defaults.
+
+    Raises:
+        ValueError: If a preset name is unknown.
+    """
+    if isinstance(profile, LatencyProfile):
+        return profile
+    if isinstance(profile, dict):
+        return LatencyProfile(**profile)
+    if profile not in LATENCY_PROFILES:
+        raise ValueError(f"Unknown latency profile '{profile}'; choose from {sorted(LATENCY_PROFILES)}")
+    return LATENCY_PROFILES[profile]
+
+
+def generate_tokens(prompt: str, min_tokens: int = 20, max_tokens: int = 200) -> List[str]:
+    """
+    Deterministically derive response tokens from a prompt.
+
+    The first token is a persona tag; the rest are space-prefixed words, so joining the tokens yields the full text.
+    """
+    digest = hashlib.sha256(prompt.encode("utf-8")).digest()
+    rng = random.Random(int.from_bytes(digest[:8], "big"))
+    persona = ("[Kai]", "[Aura]", "[Genesis]")[digest[8] % 3]
+    count = rng.randint(min_tokens, max(min_tokens, max_tokens))
+    return [persona] + [" " + rng.choice(_VOCABULARY) for _ in range(count)]
+
+
+class LocalResponse:
+    """A complete response or a streamed chunk; mirrors the `.text` of Vertex AI responses."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def __repr__(self) -> str:
+        return f"LocalResponse({self.text!r})"
+
+
+class LocalModel:
+    """
+    In-process stand-in for a Vertex AI GenerativeModel.
+    """
+
+    def __init__(self,
+                 profile: Union[str, LatencyProfile, Dict[str, Any]] = "production",
+                 seed: int = 0,
+                 time_scale: float = 1.0,
+                 system_instruction: Optional[List[str]] = None):
+        """
+        Parameters:
+            profile: Preset name (see LATENCY_PROFILES), a LatencyProfile, or a dict of profile overrides.
+            seed (int): Seed for latency and failure draws; text never depends on it.
+            time_scale (float): Multiplier for every delay, e.g. 0.01 to run a profile 100x faster.
+            system_instruction (List[str], optional): Accepted for interface compatibility; does not affect output.
+        """
+        self.profile = resolve_profile(profile)
+        self.time_scale = time_scale
+        self.system_instruction = system_instruction
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "errors": 0, "tail_calls": 0, "tokens": 0}
+
+    def start_chat(self, history: Optional[List[Dict[str, str]]] = None) -> "LocalChatSession":
+        return LocalChatSession(self, history)
+
+    def generate_content(self, prompt: str, stream: bool = False):
+        """
+        Generate a response synchronously; with `stream=True`, return an iterator of chunks.
+        """
+        plan = self.plan(prompt)
+        return self._stream(plan) if stream else self._complete(plan)
+
+    async def generate_content_async(self, prompt: str, stream: bool = False):
+        """
+        Generate a response without blocking the event loop; with `stream=True`, return an async iterator of chunks.
+        """
+        plan = self.plan(prompt)
+        return self._stream_async(plan) if stream else await self._complete_async(plan)
+
+    def plan(self, prompt: str) -> Tuple[List[str], float, float, bool]:
+        """
+        Draw the tokens and timing for one call.
+
+        Returns:
+            Tuple: (tokens, seconds to first token, seconds per subsequent token, whether the call fails)
+        """
+        profile = self.profile
+        tokens = generate_tokens(prompt, profile.min_tokens, profile.max_tokens)
+        with self._lock:
+            factor = math.exp(self._rng.gauss(0.0, profile.jitter)) if profile.jitter else 1.0
+            tail = self._rng.random() < profile.tail_probability
+            fails = self._rng.random() < profile.error_rate
+            self.stats["calls"] += 1
+            self.stats["tail_calls"] += tail
+            self.stats["errors"] += fails
+            if not fails:
+                self.stats["tokens"] += len(tokens)
+
+        ttft = profile.time_to_first_token * factor * (profile.tail_multiplier if tail else 1.0)
+        per_token = factor / profile.tokens_per_second if profile.tokens_per_second > 0 else 0.0
+        return tokens, ttft * self.time_scale, per_token * self.time_scale, fails
+
+    def _complete(self, plan) -> LocalResponse:
+        tokens, ttft, per_token, fails = plan
+        time.sleep(ttft)
+        if fails:
+            raise LocalModelError("Local model simulated failure")
+        time.sleep(per_token * (len(tokens) - 1))
+        return LocalResponse("".join(tokens))
+
+    def _stream(self, plan) -> Iterator[LocalResponse]:
+        tokens, ttft, per_token, fails = plan
+        time.sleep(ttft)
+        if fails:
+            raise LocalModelError("Local model simulated failure")
+        for index, token in enumerate(tokens):
+            if index:
+                time.sleep(per_token)
+            yield LocalResponse(token)
+
+    async def _complete_async(self, plan) -> LocalResponse:
+        tokens, ttft, per_token, fails = plan
+        await asyncio.sleep(ttft)
+        if fails:
+            raise LocalModelError("Local model simulated failure")
+        await asyncio.sleep(per_token * (len(tokens) - 1))
+        return LocalResponse("".join(tokens))
+
+    async def _stream_async(self, plan) -> AsyncIterator[LocalResponse]:
+        tokens, ttft, per_token, fails = plan
+        await asyncio.sleep(ttft)
+        if fails:
+            raise LocalModelError("Local model simulated failure")
+        for index, token in enumerate(tokens):
+            if index:
+                await asyncio.sleep(per_token)
+            yield LocalResponse(token)
+
+
+class LocalChatSession:
+    """
+    Chat session over a LocalModel; mirrors `ChatSession.send_message(_async)` in Vertex AI.
+
+    Output depends on the prompt only, so identical prompts produce identical responses in any session.
+    """
+
+    def __init__(self, model: LocalModel, history: Optional[List[Dict[str, str]]] = None):
+        self.model = model
+        self.history = list(history or [])
+
+    def send_message(self, prompt: str, stream: bool = False):
+        self.history.append({"role": "user", "text": prompt})
+        if stream:
+            return self._record_stream(self.model.generate_content(prompt, stream=True))
+        response = self.model.generate_content(prompt)
+        self.history.append({"role": "model", "text": response.text})
+        return response
+
+    async def send_message_async(self, prompt: str, stream: bool = False):
+        self.history.append({"role": "user", "text": prompt})
+        if stream:
+            return self._record_stream_async(await self.model.generate_content_async(prompt, stream=True))
+        response = await self.model.generate_content_async(prompt)
+        self.history.append({"role": "model", "text": response.text})
+        return response
+
+    def record_turn(self, prompt: str, text: str) -> bool:
+        """Add a turn answered elsewhere (e.g. from the response cache) to the history"""
+        self.history.extend([{"role": "user", "text": prompt}, {"role": "model", "text": text}])
+        return True
+
+    def _record_stream(self, chunks: Iterator[LocalResponse]) -> Iterator[LocalResponse]:
+        parts = []
+        for chunk in chunks:
+            parts.append(chunk.text)
+            yield chunk
+        self.history.append({"role": "model", "text": "".join(parts)})
+
+    async def _record_stream_async(self, chunks: AsyncIterator[LocalResponse]) -> AsyncIterator[LocalResponse]:
+        parts = []
+        async for chunk in chunks:
+            parts.append(chunk.text)
+            yield chunk
+        self.history.append({"role": "model", "text": "".join(parts)})
+
+
+# ============================================================================
+# Local HTTP stand-in
+# ============================================================================
+
+class LocalModelServer:
+    """
+    Serve a LocalModel over HTTP on a local port.
+
+    POST /generate with {"prompt": str, "stream": bool}. Complete responses are JSON
+    {"text": ...}; streamed responses are server-sent events carrying {"text": token}
+    and ending with `data: [DONE]`. Simulated failures return HTTP 503.
+    """
+
+    def __init__(self, model: Optional[LocalModel] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Parameters:
+            model (LocalModel, optional): Model to serve; defaults to the "production" profile.
+            host (str): Interface to bind.
+            port (int): Port to bind; 0 picks a free port (see `url`).
+        """
+        self.model = model or LocalModel()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LocalModelServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local_model_server",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+
+    def __enter__(self) -> "LocalModelServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _handler_class(self):
+        model = self.model
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass  # Keep load tests quiet
+
+            def do_POST(self):
+                if self.path != "/generate":
+                    return self._send_json(404, {"error": "not found"})
+                try:
+                    body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                    prompt = body["prompt"]
+                except (ValueError, KeyError):
+                    return self._send_json(400, {"error": "expected JSON with a 'prompt'"})
+
+                try:
+                    if not body.get("stream"):
+                        return self._send_json(200, {"text": model.generate_content(prompt).text})
+                    chunks = model.generate_content(prompt, stream=True)
+                    first = next(chunks)  # Fail before committing to a 200
+                except LocalModelError as e:
+                    return self._send_json(503, {"error": str(e)})
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                for chunk in (first, *chunks):
+                    self.wfile.write(f"data: {json.dumps({'text': chunk.text})}\n\n".encode("utf-8"))
+                    self.wfile.flush()
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.close_connection = True
+
+            def _send_json(self, status: int, payload: Dict[str, Any]):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+class HttpModel:
+    """
+    Client for a LocalModelServer with the same synchronous surface as LocalModel.
+    """
+
+    def __init__(self, url: str, timeout: float = 30.0):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def start_chat(self, history: Optional[List[Dict[str, str]]] = None) -> "HttpChatSession":
+        return HttpChatSession(self)
+
+    def generate_content(self, prompt: str, stream: bool = False):
+        request = urllib.request.Request(
+            f"{self.url}/generate",
+            data=json.dumps({"prompt": prompt, "stream": stream}).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        try:
+            response = urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            raise LocalModelError(f"Local model server returned {e.code}") from e
+        if stream:
+            return self._read_events(response)
+        with response:
+            return LocalResponse(json.loads(response.read())["text"])
+
+    @staticmethod
+    def _read_events(response) -> Iterator[LocalResponse]:
+        with response:
+            for line in response:
+                line = line.strip()
+                if not line.startswith(b"data: "):
+                    continue
+                payload = line[len(b"data: "):]
+                if payload == b"[DONE]":
+                    return
+                yield LocalResponse(json.loads(payload)["text"])
+
+
+class HttpChatSession:
+    """Chat session over an HttpModel."""
+
+    def __init__(self, model: HttpModel):
+        self.model = model
+
+    def send_message(self, prompt: str, stream: bool = False):
+        return self.model.generate_content(prompt, stream=stream)
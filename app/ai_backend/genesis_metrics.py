@@ -0,0 +1,168 @@
+# genesis_metrics.py
+"""
+Phase 3: The Genesis Layer - Evaluation Metrics
+Know Where The Time Goes
+
+Lightweight, dependency-free latency histograms and the instrumentation the
+EthicalGovernor uses to time each interceptor and action type, count decision
+outcomes and keep a log of slow evaluations together with their context.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict, deque
+from typing import Dict, Any, List, Optional, Tuple
+
+from genesis_serialization import to_plain
+
+# Histogram bucket upper bounds in milliseconds; the last bucket is unbounded
+DEFAULT_BUCKETS_MS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0,
+                      100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0, 10000.0)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Recording is O(log buckets) with no allocation. Percentiles are estimated as the upper
+    bound of the bucket holding the requested rank, capped at the observed maximum.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total_ms", "max_ms")
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float):
+        """
+        Add one observation in milliseconds.
+        """
+        self.counts[bisect_left(self.bounds, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate the q-th percentile (0-100) in milliseconds.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(round(self.count * q / 100.0)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Summarize the histogram: count, mean, max, p50/p90/p99 and non-empty buckets.
+        """
+        buckets = {}
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count:
+                label = f"le_{self.bounds[index]}" if index < len(self.bounds) else "inf"
+                buckets[label] = bucket_count
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 4) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 4),
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "buckets": buckets
+        }
+
+
+class EvaluationMetrics:
+    """
+    Timing and outcome instrumentation for ethical evaluations.
+
+    When `enabled` is False callers skip timing entirely, so the only cost is one
+    attribute check per evaluation.
+    """
+
+    def __init__(self, enabled: bool = True, slow_threshold_ms: float = 5.0,
+                 slow_log_size: int = 100):
+        """
+        Parameters:
+            enabled (bool): Whether evaluations are timed and counted.
+            slow_threshold_ms (float): Evaluations at or above this duration are kept with their context.
+            slow_log_size (int): Number of slow evaluations retained.
+        """
+        self.enabled = enabled
+        self.slow_threshold_ms = slow_threshold_ms
+        self.by_interceptor: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.by_action_type: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.outcomes: Dict[str, int] = defaultdict(int)
+        self.outcomes_by_action_type: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: defaultdict(int))
+        self.slow_evaluations = deque(maxlen=slow_log_size)
+        self._lock = threading.Lock()
+
+    def record(self, interceptor: str, action_type: str, decision, elapsed: float):
+        """
+        Record one evaluation.
+
+        Parameters:
+            interceptor (str): Name of the evaluator that produced the decision.
+            action_type (str): Action type evaluated.
+            decision (EthicalDecision): The resulting decision.
+            elapsed (float): Evaluation time in seconds.
+        """
+        elapsed_ms = elapsed * 1000.0
+        outcome = decision.decision.value
+        with self._lock:
+            self.by_interceptor[interceptor].record(elapsed_ms)
+            self.by_action_type[action_type].record(elapsed_ms)
+            self.outcomes[outcome] += 1
+            self.outcomes_by_action_type[action_type][outcome] += 1
+
+        if elapsed_ms >= self.slow_threshold_ms:
+            self.slow_evaluations.append({
+                "timestamp": time.time(),
+                "interceptor": interceptor,
+                "action_type": action_type,
+                "actor": decision.actor,
+                "decision": outcome,
+                "elapsed_ms": round(elapsed_ms, 3),
+                "context": to_plain(decision.context)
+            })
+
+    def reset(self):
+        """
+        Discard all recorded timings, counters and slow evaluations.
+        """
+        with self._lock:
+            self.by_interceptor.clear()
+            self.by_action_type.clear()
+            self.outcomes.clear()
+            self.outcomes_by_action_type.clear()
+            self.slow_evaluations.clear()
+
+    def snapshot(self, slow_limit: Optional[int] = 20) -> Dict[str, Any]:
+        """
+        Return histograms, outcome counters and the most recent slow evaluations.
+        """
+        with self._lock:
+            slow: List[Dict[str, Any]] = list(self.slow_evaluations)
+            return {
+                "enabled": self.enabled,
+                "slow_threshold_ms": self.slow_threshold_ms,
+                "interceptors": {name: h.snapshot() for name, h in self.by_interceptor.items()},
+                "action_types": {name: h.snapshot() for name, h in self.by_action_type.items()},
+                "outcomes": dict(self.outcomes),
+                "outcomes_by_action_type": {name: dict(counts) for name, counts in
+                                            self.outcomes_by_action_type.items()},
+                "slow_evaluations": slow[-slow_limit:] if slow_limit else slow
+            }
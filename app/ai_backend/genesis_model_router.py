@@ -0,0 +1,373 @@
+# genesis_model_router.py
+"""
+Phase 3: The Genesis Layer - Model Router
+Many Voices, One Consciousness
+
+A single model provider is a single latency bottleneck: when it slows down or
+runs out of capacity, every request waits on it. The model router puts several
+providers (Vertex AI, OpenAI, local stand-ins) behind the chat interface the
+connector already speaks and picks one for each new chat by live EWMA latency,
+error rate and current load. A provider at its concurrency budget spills new
+work over to the next best one, a provider whose own circuit breaker is open is
+skipped, and per-provider metrics are reported periodically.
+"""
+
+import threading
+import time
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from genesis_circuit_breaker import BreakerState, CircuitBreaker
+from genesis_local_model import LocalResponse
+
+# OpenAI is an optional provider
+try:
+    from openai import OpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+    OpenAI = None
+
+
+class ProviderUnavailableError(Exception):
+    """Raised when no provider (or not the one a conversation is bound to) can take a request."""
+
+
+class OpenAIModel:
+    """
+    OpenAI chat completions behind the GenerativeModel-style `start_chat()` interface.
+    """
+
+    def __init__(self,
+                 model_name: str,
+                 system_instruction: Optional[List[str]] = None,
+                 generation_config: Optional[Dict[str, Any]] = None,
+                 client=None):
+        """
+        Parameters:
+            model_name (str): OpenAI model, e.g. "gpt-4o-mini".
+            system_instruction (List[str], optional): System prompt parts, sent as the system message.
+            generation_config (dict, optional): Extra completion arguments (temperature, top_p, max_tokens).
+            client (optional): OpenAI client to use; defaults to `OpenAI()` configured from the environment.
+        """
+        if client is None:
+            if not OPENAI_AVAILABLE:
+                raise ImportError("The openai package is required for the OpenAI provider")
+            client = OpenAI()
+        self.client = client
+        self.model_name = model_name
+        self.system_instruction = system_instruction
+        self.generation_config = dict(generation_config or {})
+
+    def start_chat(self, history: Optional[List[Dict[str, str]]] = None) -> "OpenAIChatSession":
+        return OpenAIChatSession(self, history)
+
+
+class OpenAIChatSession:
+    """Chat session over an OpenAIModel; history uses the same `{"role", "text"}` entries as LocalChatSession."""
+
+    def __init__(self, model: OpenAIModel, history: Optional[List[Dict[str, str]]] = None):
+        self.model = model
+        self.history = list(history or [])
+
+    def send_message(self, prompt: str, stream: bool = False):
+        messages = []
+        if self.model.system_instruction:
+            messages.append({"role": "system", "content": "\n".join(self.model.system_instruction)})
+        for entry in self.history:
+            messages.append({"role": "assistant" if entry["role"] == "model" else "user", "content": entry["text"]})
+        messages.append({"role": "user", "content": prompt})
+
+        response = self.model.client.chat.completions.create(
+            model=self.model.model_name, messages=messages, stream=stream, **self.model.generation_config
+        )
+        if stream:
+            return self._record_stream(prompt, response)
+        text = response.choices[0].message.content or ""
+        self.history.extend([{"role": "user", "text": prompt}, {"role": "model", "text": text}])
+        return LocalResponse(text)
+
+    def record_turn(self, prompt: str, text: str) -> bool:
+        """Add a turn answered elsewhere (e.g. from the response cache) to the history"""
+        self.history.extend([{"role": "user", "text": prompt}, {"role": "model", "text": text}])
+        return True
+
+    def _record_stream(self, prompt: str, events) -> Iterator[LocalResponse]:
+        parts = []
+        for event in events:
+            delta = event.choices[0].delta.content if event.choices else None
+            if delta:
+                parts.append(delta)
+                yield LocalResponse(delta)
+        self.history.extend([{"role": "user", "text": prompt}, {"role": "model", "text": "".join(parts)}])
+
+
+class ModelProvider:
+    """A named model behind the router, with its concurrency budget, circuit breaker and live statistics"""
+
+    def __init__(self, name: str, model, max_concurrency: int = 8, breaker: Optional[CircuitBreaker] = None,
+                 prior_latency: float = 1.0):
+        """
+        Parameters:
+            name (str): Provider name used in metrics, e.g. "vertex".
+            model: Model exposing `start_chat()`.
+            max_concurrency (int): Calls in flight before new chats spill over to other providers.
+            breaker (CircuitBreaker, optional): The provider's own circuit breaker.
+            prior_latency (float): Seconds assumed for a provider that has failed but never succeeded.
+        """
+        self.name = name
+        self.model = model
+        self.max_concurrency = max(1, max_concurrency)
+        self.breaker = breaker or CircuitBreaker()
+        self.prior_latency = prior_latency
+        self.in_flight = 0
+        self.ewma_latency: Optional[float] = None
+        self.ewma_error_rate = 0.0
+        self.stats = {"chats": 0, "calls": 0, "errors": 0, "spillovers": 0}
+
+    @property
+    def saturated(self) -> bool:
+        return self.in_flight >= self.max_concurrency
+
+    def score(self) -> float:
+        """
+        Expected latency of a new call: EWMA latency, inflated by current load and error rate.
+
+        Latency is only sampled on success, so untried providers score 0 and each gets tried
+        early on, while providers that have only failed are scored from `prior_latency`.
+        """
+        if self.ewma_latency is None and self.stats["errors"] == 0:
+            return 0.0
+        latency = self.ewma_latency if self.ewma_latency is not None else self.prior_latency
+        load = 1.0 + self.in_flight / self.max_concurrency
+        return latency * load / max(0.05, 1.0 - self.ewma_error_rate)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "provider": self.name,
+            **self.stats,
+            "in_flight": self.in_flight,
+            "max_concurrency": self.max_concurrency,
+            "ewma_latency": round(self.ewma_latency, 4) if self.ewma_latency is not None else None,
+            "ewma_error_rate": round(self.ewma_error_rate, 4),
+            "breaker": self.breaker.state.value
+        }
+
+
+class ModelRouter:
+    """
+    Routes each new chat to the provider with the lowest expected latency.
+
+    The router itself looks like a model (it has `start_chat()`), so the connector's
+    concurrency limit, cache, session pool and breaker work unchanged in front of it.
+    A chat without history picks its provider when its first message is sent, and
+    that call counts towards the provider's load in the same step, so a burst of new
+    chats spills over instead of all landing on the provider that looked best before
+    any of them started. A routed chat then stays with its provider while it has history.
+    """
+
+    def __init__(self,
+                 providers: Iterable[ModelProvider],
+                 alpha: float = 0.2,
+                 report_interval: float = 10.0,
+                 on_report: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Parameters:
+            providers (Iterable[ModelProvider]): Providers to route between; names must be unique.
+            alpha (float): EWMA weight of the newest latency and error observation.
+            report_interval (float): Minimum seconds between per-provider metric reports.
+            on_report (Callable, optional): Receives the provider snapshots at most once per interval.
+            clock (Callable): Monotonic time source, injectable for tests.
+        """
+        self.providers = list(providers)
+        if not self.providers:
+            raise ValueError("ModelRouter needs at least one provider")
+        if len({p.name for p in self.providers}) != len(self.providers):
+            raise ValueError("Provider names must be unique")
+        self.alpha = alpha
+        self.report_interval = report_interval
+        self.on_report = on_report
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._last_report = clock()
+
+    def start_chat(self, history: Optional[List[Dict[str, str]]] = None) -> "RoutedChatSession":
+        return RoutedChatSession(self, self.route() if history else None, history)
+
+    def provider(self, name: str) -> Optional[ModelProvider]:
+        return next((p for p in self.providers if p.name == name), None)
+
+    def route(self, exclude: Iterable[str] = ()) -> ModelProvider:
+        """
+        Pick the provider for a new chat.
+
+        Providers whose breaker is open are skipped. Unsaturated providers are ranked by
+        score; if all are saturated, the least loaded one is chosen. Choosing a provider
+        other than the best scoring one because it was saturated counts as a spillover.
+
+        Raises:
+            ProviderUnavailableError: If every provider is excluded or has an open breaker.
+        """
+        with self._lock:
+            return self._choose(exclude)[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Report every provider's load, EWMA latency and error rate, breaker state and counters.
+        """
+        with self._lock:
+            return {"providers": [p.snapshot() for p in self.providers]}
+
+    def _choose(self, exclude: Iterable[str]) -> Tuple[ModelProvider, Optional[ModelProvider]]:
+        # Caller holds the lock; returns the chosen provider and the best scoring one it spilled over from
+        excluded = set(exclude)
+        candidates = [p for p in self.providers
+                      if p.name not in excluded and p.breaker.state != BreakerState.OPEN]
+        if not candidates:
+            raise ProviderUnavailableError("No model provider is available")
+        best = min(candidates, key=ModelProvider.score)
+        open_slots = [p for p in candidates if not p.saturated]
+        if open_slots:
+            chosen = min(open_slots, key=ModelProvider.score)
+        else:
+            chosen = min(candidates, key=lambda p: p.in_flight / p.max_concurrency)
+        spilled_from = best if chosen is not best else None
+        if spilled_from is not None:
+            spilled_from.stats["spillovers"] += 1
+        chosen.stats["chats"] += 1
+        return chosen, spilled_from
+
+    def _begin(self, provider: Optional[ModelProvider] = None,
+               exclude: Iterable[str] = ()) -> Tuple[ModelProvider, Optional[ModelProvider]]:
+        """
+        Start a call on `provider`, or on a newly routed one; routing and taking the slot happen atomically.
+
+        Returns the provider and, for a routed call that spilled over, the provider it spilled over from.
+        """
+        spilled_from = None
+        with self._lock:
+            if provider is None:
+                provider, spilled_from = self._choose(exclude)
+            provider.in_flight += 1
+            provider.stats["calls"] += 1
+            return provider, spilled_from
+
+    def _cancel(self, provider: ModelProvider, spilled_from: Optional[ModelProvider] = None):
+        """Give back a slot taken by a routed `_begin` for a call that was never sent, undoing its routing counts"""
+        with self._lock:
+            provider.in_flight -= 1
+            provider.stats["calls"] -= 1
+            provider.stats["chats"] -= 1
+            if spilled_from is not None:
+                spilled_from.stats["spillovers"] -= 1
+
+    def _finish(self, provider: ModelProvider, ok: Optional[bool], latency: Optional[float] = None):
+        """Record a call's end: ok True/False updates the EWMAs and breaker, None means abandoned"""
+        with self._lock:
+            provider.in_flight -= 1
+            if ok is not None:
+                provider.ewma_error_rate += self.alpha * ((0.0 if ok else 1.0) - provider.ewma_error_rate)
+                if not ok:
+                    provider.stats["errors"] += 1
+            if ok and latency is not None:
+                provider.ewma_latency = latency if provider.ewma_latency is None else \
+                    provider.ewma_latency + self.alpha * (latency - provider.ewma_latency)
+            now = self.clock()
+            report = None
+            if self.on_report is not None and now - self._last_report >= self.report_interval:
+                self._last_report = now
+                report = [p.snapshot() for p in self.providers]
+
+        if ok is None:
+            provider.breaker.record_abandoned()
+        elif ok:
+            provider.breaker.record_success(latency)
+        else:
+            provider.breaker.record_failure(latency)
+        if report is not None:
+            self.on_report(report)
+
+
+class RoutedChatSession:
+    """
+    A chat on the provider the router picked, tracking each call's load and outcome.
+
+    A chat started without history has no provider until its first message is sent.
+    Only the blocking `send_message` is offered (the connector runs it on its thread pool),
+    since providers differ in whether they have an async API.
+    """
+
+    def __init__(self, router: ModelRouter, provider: Optional[ModelProvider] = None,
+                 history: Optional[List[Dict[str, str]]] = None):
+        self.router = router
+        self.provider = provider
+        self.chat = None
+        if provider is not None:
+            self.chat = provider.model.start_chat(history) if history else provider.model.start_chat()
+
+    @property
+    def history(self):
+        return getattr(self.chat, "history", None) if self.chat is not None else []
+
+    def send_message(self, prompt: str, stream: bool = False):
+        provider = self._admit()
+        started = time.monotonic()
+        try:
+            response = self.chat.send_message(prompt, stream=True) if stream else self.chat.send_message(prompt)
+        except Exception:
+            self.router._finish(provider, False, time.monotonic() - started)
+            raise
+        except BaseException:
+            self.router._finish(provider, None)
+            raise
+        if stream:
+            return self._track_stream(provider, response)
+        self.router._finish(provider, True, time.monotonic() - started)
+        return response
+
+    def record_turn(self, prompt: str, text: str) -> bool:
+        """Add a turn answered elsewhere to the provider chat's history, if that chat supports it"""
+        if self.chat is None:
+            self._bind(self.router.route())
+        record_turn = getattr(self.chat, "record_turn", None)
+        return bool(record_turn is not None and record_turn(prompt, text))
+
+    def _admit(self) -> ModelProvider:
+        """
+        Begin a call: on the chat's provider while it has history, otherwise on the best provider now.
+
+        Providers whose breaker refuses the call are skipped for an empty chat.
+        """
+        if self.history:
+            if not self.provider.breaker.allow_request():
+                raise ProviderUnavailableError(f"Provider '{self.provider.name}' is unavailable for this conversation")
+            return self.router._begin(self.provider)[0]
+
+        refused = []
+        while True:
+            provider, spilled_from = self.router._begin(exclude=refused)
+            if provider.breaker.allow_request():
+                break
+            self.router._cancel(provider, spilled_from)
+            refused.append(provider.name)
+        if provider is not self.provider:
+            self._bind(provider)
+        return provider
+
+    def _bind(self, provider: ModelProvider):
+        self.provider = provider
+        self.chat = provider.model.start_chat()
+
+    def _track_stream(self, provider: ModelProvider, chunks) -> Iterator[Any]:
+        # Streams report their outcome only; their duration depends on the response length
+        outcome = None
+        try:
+            for chunk in chunks:
+                yield chunk
+            outcome = True
+        except Exception:
+            outcome = False
+            raise
+        finally:
+            self.router._finish(provider, outcome)
@@ -0,0 +1,262 @@
+# genesis_policy.py
+"""
+Phase 3: The Genesis Layer - Policy Packs
+The Law May Be Amended; The Governor Never Sleeps
+
+A policy pack is a versioned, declarative bundle of everything that shapes the
+EthicalGovernor's verdicts: violation and concern rules, strictness, principle
+weights and the mapping of action types to interceptors. Packs are compiled into
+immutable CompiledPolicy objects so the governor can swap them with a single
+reference assignment while evaluations are in flight.
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Callable, Tuple, Mapping
+
+RULE_KINDS = ("violation", "concern")
+
+# Context attributes a rule condition may test
+RULE_ATTRIBUTES = (
+    "scope", "user_consent", "reversible", "persistent",
+    "sensitive_data_involved", "system_modification", "user_visible",
+)
+
+# Flags are tested for truthiness, like the original interceptors did ("yes" is consent, "" is not)
+BOOLEAN_ATTRIBUTES = frozenset(RULE_ATTRIBUTES) - {"scope"}
+
+# The rules the governor has always enforced, expressed declaratively
+DEFAULT_RULES = [
+    {"principle": "privacy", "kind": "violation",
+     "when": {"sensitive_data_involved": True, "user_consent": [None, False]}},
+    {"principle": "security", "kind": "violation",
+     "when": {"system_modification": True, "scope": "global"}},
+    {"principle": "autonomy", "kind": "violation",
+     "when": {"user_visible": [False, None], "persistent": True}},
+    {"principle": "transparency", "kind": "concern",
+     "when": {"user_visible": [False, None]},
+     "except_action_types": ["system_monitor", "background_task"]},
+    {"principle": "safety", "kind": "concern",
+     "when": {"reversible": [False, None], "scope": ["system", "global"]}},
+]
+
+DEFAULT_INTERCEPTORS = {
+    "data_access": "data_access",
+    "system_modify": "system_modification",
+    "user_interact": "user_interaction",
+    "ai_decision": "ai_decision",
+    "network_communicate": "network_communication",
+    "response_review": "content_review",
+}
+
+
+@dataclass
+class PolicyPack:
+    """A versioned, declarative bundle of governance policy"""
+    version: str
+    rules: List[Dict[str, Any]] = field(default_factory=lambda: list(DEFAULT_RULES))
+    strictness_level: float = 0.7
+    principle_weights: Dict[str, float] = field(default_factory=dict)
+    interceptors: Dict[str, str] = field(default_factory=lambda: dict(DEFAULT_INTERCEPTORS))
+    description: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PolicyPack":
+        """
+        Build a pack from its dictionary (e.g. JSON) form.
+
+        If `version` is missing, a content hash of the pack is used so identical packs share a version id.
+        """
+        data = dict(data)
+        if not data.get("version"):
+            digest = hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode())
+            data["version"] = f"pack_{digest.hexdigest()[:12]}"
+        known = {"version", "rules", "strictness_level", "principle_weights", "interceptors",
+                 "description"}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+    @classmethod
+    def from_file(cls, path: str) -> "PolicyPack":
+        """
+        Load a pack from a JSON file.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+class _CompiledRule:
+    """A rule reduced to attribute checks against an EthicalContext"""
+
+    __slots__ = ("principle", "kind", "checks", "except_action_types")
+
+    def __init__(self, principle: str, kind: str, checks: Tuple[Tuple[int, frozenset], ...],
+                 except_action_types: frozenset):
+        self.principle = principle
+        self.kind = kind
+        self.checks = checks
+        self.except_action_types = except_action_types
+
+    def matches(self, action_type: str, context_key: Tuple[Any, ...]) -> bool:
+        """
+        Return True if every check holds for the context attribute tuple.
+        """
+        if action_type in self.except_action_types:
+            return False
+        for index, allowed in self.checks:
+            if context_key[index] not in allowed:
+                return False
+        return True
+
+
+class CompiledPolicy:
+    """
+    An immutable, ready-to-evaluate policy pack.
+
+    Verdicts (violated and concerning principles) are cached per compiled policy, so a
+    policy swap naturally starts with a fresh cache and a rollback returns to a warm one.
+    """
+
+    def __init__(self, pack: PolicyPack, rules: Tuple[_CompiledRule, ...],
+                 interceptors: Mapping[str, Callable], principle_weights: Mapping[str, float],
+                 interceptor_names: Optional[Mapping[str, str]] = None,
+                 cache_size: int = 4096):
+        """
+        Parameters:
+            pack (PolicyPack): The source pack, kept for inspection.
+            rules (tuple): Compiled rules in evaluation order.
+            interceptors (Mapping[str, Callable]): Resolved action_type -> evaluator dispatch table.
+            principle_weights (Mapping[str, float]): Final principle weights.
+            interceptor_names (Mapping[str, str], optional): action_type -> evaluator name, for instrumentation.
+            cache_size (int): Maximum number of cached verdicts.
+        """
+        self.pack = pack
+        self.version = pack.version
+        self.strictness_level = pack.strictness_level
+        self.rules = rules
+        self.interceptors = interceptors
+        self.principle_weights = principle_weights
+        self.interceptor_names = interceptor_names or MappingProxyType({})
+        self.compiled_timestamp = time.time()
+        self._verdict = lru_cache(maxsize=cache_size)(self._compute_verdict)
+
+    @staticmethod
+    def context_key(context) -> Tuple[Any, ...]:
+        """
+        Extract the rule-relevant attributes of an EthicalContext as a hashable tuple.
+
+        Flags are reduced to their truth value; other values (e.g. a list `scope`) are made hashable.
+        """
+        return tuple(bool(getattr(context, name)) if name in BOOLEAN_ATTRIBUTES
+                     else _hashable(getattr(context, name)) for name in RULE_ATTRIBUTES)
+
+    def verdict(self, action_type: str, context) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Return the (violations, concerns) principle names for an action in the given context.
+        """
+        return self._verdict(action_type, self.context_key(context))
+
+    def _compute_verdict(self, action_type: str,
+                         context_key: Tuple[Any, ...]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Evaluate every rule against the context attribute tuple.
+        """
+        violations, concerns = [], []
+        for rule in self.rules:
+            if rule.matches(action_type, context_key):
+                (violations if rule.kind == "violation" else concerns).append(rule.principle)
+        return tuple(violations), tuple(concerns)
+
+    def cache_info(self):
+        """
+        Return the verdict cache statistics.
+        """
+        return self._verdict.cache_info()
+
+
+def _hashable(value: Any) -> Any:
+    """
+    Convert lists, sets and dicts (recursively) into tuples and frozensets so the value can key a cache.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _hashable(item)) for key, item in value.items()))
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def compile_policy(pack: PolicyPack,
+                   evaluators: Mapping[str, Callable],
+                   code_interceptors: Optional[Mapping[str, Callable]] = None,
+                   base_weights: Optional[Mapping[str, float]] = None) -> CompiledPolicy:
+    """
+    Validate a policy pack and compile it into a CompiledPolicy.
+
+    Parameters:
+        pack (PolicyPack): The pack to compile.
+        evaluators (Mapping[str, Callable]): Named evaluators that pack interceptor mappings may reference.
+        code_interceptors (Mapping[str, Callable], optional): Interceptors registered in code; they take precedence over the pack's mappings.
+        base_weights (Mapping[str, float], optional): Weights the pack's `principle_weights` are layered over.
+
+    Returns:
+        CompiledPolicy: The immutable compiled form.
+
+    Raises:
+        ValueError: If the pack references unknown evaluators or attributes, or has out-of-range values.
+    """
+    if not 0.0 <= pack.strictness_level <= 1.0:
+        raise ValueError(f"strictness_level must be within [0, 1], got {pack.strictness_level}")
+
+    weights = dict(base_weights or {})
+    for principle, weight in pack.principle_weights.items():
+        if not 0.0 <= weight <= 1.0:
+            raise ValueError(f"Weight for '{principle}' must be within [0, 1], got {weight}")
+        weights[principle] = weight
+
+    rules = []
+    for rule in pack.rules:
+        kind = rule.get("kind", "violation")
+        if kind not in RULE_KINDS:
+            raise ValueError(f"Unknown rule kind '{kind}'")
+        if not rule.get("principle"):
+            raise ValueError("Every rule needs a 'principle'")
+        checks = []
+        for attribute, expected in rule.get("when", {}).items():
+            if attribute not in RULE_ATTRIBUTES:
+                raise ValueError(f"Unknown rule attribute '{attribute}'")
+            allowed = expected if isinstance(expected, list) else [expected]
+            if attribute in BOOLEAN_ATTRIBUTES:
+                allowed = [bool(value) for value in allowed]
+            else:
+                allowed = [_hashable(value) for value in allowed]
+            checks.append((RULE_ATTRIBUTES.index(attribute), frozenset(allowed)))
+        rules.append(_CompiledRule(rule["principle"], kind, tuple(checks),
+                                   frozenset(rule.get("except_action_types", ()))))
+
+    interceptors, names = {}, {}
+    for action_type, evaluator_name in pack.interceptors.items():
+        if evaluator_name not in evaluators:
+            raise ValueError(f"Unknown evaluator '{evaluator_name}' for action '{action_type}'")
+        interceptors[action_type] = evaluators[evaluator_name]
+        names[action_type] = evaluator_name
+    # Interceptors registered in code are explicit overrides, so they win over the pack
+    for action_type, interceptor in (code_interceptors or {}).items():
+        interceptors[action_type] = interceptor
+        names[action_type] = getattr(interceptor, "__name__", action_type)
+
+    return CompiledPolicy(
+        pack,
+        tuple(rules),
+        MappingProxyType(interceptors),
+        MappingProxyType(weights),
+        MappingProxyType(names),
+    )
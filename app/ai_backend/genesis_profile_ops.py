@@ -0,0 +1,435 @@
+# genesis_profile_ops.py
+"""
+Phase 3: The Genesis Layer - Profile Operations
+Grow Without Repeating Yourself
+
+Idempotent merge operations for evolving the Genesis profile. Lists are extended
+with set semantics while keeping their original order, and dicts are merged under
+an explicit conflict policy, so implementing the same (or a similar) proposal twice
+leaves the profile unchanged the second time. Profile size - and the system prompt
+and metrics derived from it - stays bounded by the number of distinct changes.
+
+Evolved profiles are kept as persistent, immutable trees (FrozenDict nodes and
+tuples). Applying a change copies only the dicts along the changed path, so each
+version shares every untouched subtree with its parent, history snapshots cost
+O(changed path), and readers can be handed the live version without copying.
+
+`diff_profiles` turns two versions into JSON-patch-like operations (add, replace,
+remove, with "/-" for list appends) and `apply_patch` replays them; because
+versions share structure, diffing skips every untouched subtree by identity.
+Reversible patches also carry each overwritten value, so `invert_patch` can undo
+them and `apply_frozen_patch` can move a frozen profile backwards in O(changes).
+"""
+
+import copy
+import json
+from typing import Dict, Any, Iterable, List, Sequence, Tuple
+
+# How dict_merge resolves a key present on both sides with differing values:
+#   "union"   - merge nested dicts recursively, union lists, new scalar wins
+#   "replace" - the new value wins outright
+#   "keep"    - the existing value wins
+CONFLICT_POLICIES = ("union", "replace", "keep")
+
+# proposed_changes keys whose items are appended to a list target
+LIST_CHANGE_KEYS = ("new_traits", "new_capabilities", "additional_principles")
+
+
+def _identity(item: Any) -> Any:
+    """
+    Return a hashable identity for a list item; unhashable items are keyed by canonical JSON.
+    """
+    try:
+        hash(item)
+        return item
+    except TypeError:
+        return json.dumps(item, sort_keys=True, default=str)
+
+
+def extend_unique(target: List[Any], items: Iterable[Any]) -> int:
+    """
+    Append items that are not already in `target`, preserving order.
+
+    Parameters:
+        target (List[Any]): The list to extend in place.
+        items (Iterable[Any]): Candidate items; duplicates among them are also skipped.
+
+    Returns:
+        int: Number of items appended.
+    """
+    seen = {_identity(item) for item in target}
+    added = 0
+    for item in items:
+        key = _identity(item)
+        if key in seen:
+            continue
+        seen.add(key)
+        target.append(copy.deepcopy(item))
+        added += 1
+    return added
+
+
+def dict_merge(target: Dict[str, Any], updates: Dict[str, Any], conflict: str = "union") -> int:
+    """
+    Merge `updates` into `target` in place.
+
+    Keys missing from `target` are added. Keys present on both sides with equal values
+    are left alone; differing values are resolved according to `conflict`.
+
+    Parameters:
+        target (Dict[str, Any]): The dict to update.
+        updates (Dict[str, Any]): Values to merge in.
+        conflict (str): One of CONFLICT_POLICIES.
+
+    Returns:
+        int: Number of values added or changed (nested changes are counted individually).
+
+    Raises:
+        ValueError: If `conflict` is not a known policy.
+    """
+    if conflict not in CONFLICT_POLICIES:
+        raise ValueError(f"Unknown conflict policy '{conflict}'")
+
+    changed = 0
+    for key, value in updates.items():
+        if key not in target:
+            target[key] = copy.deepcopy(value)
+            changed += 1
+            continue
+
+        current = target[key]
+        if current == value or conflict == "keep":
+            continue
+        if conflict == "union" and isinstance(current, dict) and isinstance(value, dict):
+            changed += dict_merge(current, value, conflict)
+        elif conflict == "union" and isinstance(current, list) and isinstance(value, list):
+            changed += extend_unique(current, value)
+        else:
+            target[key] = copy.deepcopy(value)
+            changed += 1
+    return changed
+
+
+def apply_profile_changes(profile: Dict[str, Any], target_component: str,
+                          proposed_changes: Dict[str, Any], conflict: str = "union") -> int:
+    """
+    Apply a growth proposal's changes to a profile idempotently.
+
+    The dotted `target_component` is created as needed. A list target is extended with
+    the items under LIST_CHANGE_KEYS, a dict target is merged with `dict_merge`, and any
+    other target is replaced by the proposed changes.
+
+    Parameters:
+        profile (Dict[str, Any]): The profile to modify in place.
+        target_component (str): Dotted path such as "personas.kai.personality_traits".
+        proposed_changes (Dict[str, Any]): The proposal's changes.
+        conflict (str): Conflict policy for dict targets.
+
+    Returns:
+        int: Number of values added or changed; 0 means the profile already contained the changes.
+    """
+    path = target_component.split('.')
+    node = profile
+    for key in path[:-1]:
+        if key not in node:
+            node[key] = {}
+        node = node[key]
+
+    final_key = path[-1]
+    current = node.get(final_key)
+
+    if isinstance(current, list):
+        return sum(extend_unique(current, proposed_changes[key])
+                   for key in LIST_CHANGE_KEYS if key in proposed_changes)
+    if isinstance(current, dict):
+        return dict_merge(current, proposed_changes, conflict)
+    if current == proposed_changes:
+        return 0
+    node[final_key] = copy.deepcopy(proposed_changes)
+    return 1
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError("FrozenDict is immutable; apply changes with apply_frozen_changes")
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict node of a persistent profile tree.
+
+    Subclassing dict keeps frozen profiles usable wherever a plain profile was (lookups,
+    iteration, isinstance checks, json.dumps), while every mutating method raises
+    TypeError. Copying returns the same object, since nothing can change it.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+EMPTY_PROFILE = FrozenDict()
+
+
+def freeze(value: Any) -> Any:
+    """
+    Return an immutable copy of a profile value: dicts become FrozenDicts and lists become tuples.
+
+    Values that are already frozen are returned as-is, so freezing a tree that contains
+    frozen subtrees shares them rather than copying.
+    """
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Return a plain, mutable deep copy of a (possibly frozen) profile value.
+    """
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+def assoc_in(root: Any, path: Sequence[str], value: Any) -> Any:
+    """
+    Return a new tree with `value` at `path`, copying only the nodes along the path.
+
+    Missing intermediate nodes are created; tuple nodes are indexed by position. Every
+    subtree off the path is shared with `root`.
+    """
+    key = path[0]
+    if isinstance(root, tuple):
+        index = int(key)
+        current = root[index]
+    else:
+        current = root.get(key)
+    if len(path) == 1:
+        child = freeze(value)
+    else:
+        child = assoc_in(current if current is not None else EMPTY_PROFILE, path[1:], value)
+
+    if isinstance(root, tuple):
+        items = list(root)
+        items[index] = child
+        return tuple(items)
+    items = dict(root)
+    items[key] = child
+    return FrozenDict(items)
+
+
+def apply_frozen_changes(root: FrozenDict, target_component: str,
+                         proposed_changes: Dict[str, Any],
+                         conflict: str = "union") -> Tuple[FrozenDict, int]:
+    """
+    Apply a growth proposal to a frozen profile, returning the next version.
+
+    Only the target component is thawed and merged (with the same semantics as
+    `apply_profile_changes`); the result is frozen and path-copied into a new root.
+    When nothing changes, `root` itself is returned.
+
+    Parameters:
+        root (FrozenDict): The current profile version.
+        target_component (str): Dotted path such as "personas.kai.personality_traits".
+        proposed_changes (Dict[str, Any]): The proposal's changes.
+        conflict (str): Conflict policy for dict targets.
+
+    Returns:
+        Tuple[FrozenDict, int]: The new profile version and the number of values added or changed.
+    """
+    path = target_component.split('.')
+    node = root
+    for key in path[:-1]:
+        node = node.get(key, EMPTY_PROFILE)
+
+    final_key = path[-1]
+    scratch = {final_key: thaw(node[final_key])} if final_key in node else {}
+    changed = apply_profile_changes(scratch, final_key, proposed_changes, conflict)
+    if not changed:
+        return root, 0
+    return assoc_in(root, path, scratch[final_key]), changed
+
+
+def _pointer(path: Sequence[str]) -> str:
+    """
+    Encode a key path as a JSON pointer.
+    """
+    return "".join("/" + str(part).replace("~", "~0").replace("/", "~1") for part in path)
+
+
+def _parse_pointer(pointer: str) -> List[str]:
+    """
+    Decode a JSON pointer into its key path.
+    """
+    if not pointer:
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid profile path '{pointer}'")
+    return [part.replace("~1", "/").replace("~0", "~") for part in pointer[1:].split("/")]
+
+
+def diff_profiles(old: Any, new: Any, reversible: bool = False) -> List[Dict[str, Any]]:
+    """
+    Compute the patch operations that turn profile `old` into profile `new`.
+
+    Subtrees shared between the versions are skipped by identity, so diffing two
+    adjacent versions costs O(changed path). Appends to a list become "add" operations
+    on "<list>/-"; any other list change replaces the list.
+
+    Parameters:
+        old: The earlier profile version.
+        new: The later profile version.
+        reversible (bool): Record overwritten values under "from" and address list appends by index, so the patch can be inverted with `invert_patch`.
+
+    Returns:
+        List[Dict[str, Any]]: Operations of the form {"op": "add"|"replace"|"remove", "path": ..., "value": ...}.
+    """
+    ops: List[Dict[str, Any]] = []
+    _diff(old, new, [], ops, reversible)
+    return ops
+
+
+def _diff(old: Any, new: Any, path: List[str], ops: List[Dict[str, Any]], reversible: bool):
+    if old is new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                op = {"op": "remove", "path": _pointer(path + [key])}
+                if reversible:
+                    op["from"] = thaw(old[key])
+                ops.append(op)
+        for key, value in new.items():
+            if key in old:
+                _diff(old[key], value, path + [key], ops, reversible)
+            else:
+                ops.append({"op": "add", "path": _pointer(path + [key]), "value": thaw(value)})
+    elif isinstance(old, (list, tuple)) and isinstance(new, (list, tuple)) \
+            and len(new) >= len(old) and list(new[:len(old)]) == list(old):
+        for index in range(len(old), len(new)):
+            slot = str(index) if reversible else "-"
+            ops.append({"op": "add", "path": _pointer(path + [slot]), "value": thaw(new[index])})
+    elif old != new:
+        op = {"op": "replace", "path": _pointer(path), "value": thaw(new)}
+        if reversible:
+            op["from"] = thaw(old)
+        ops.append(op)
+
+
+def invert_patch(ops: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Return the operations that undo a reversible patch (see `diff_profiles(reversible=True)`).
+
+    Raises:
+        ValueError: If an operation lacks the information needed to undo it.
+    """
+    inverse = []
+    for op in reversed(ops):
+        kind, path = op.get("op"), op.get("path", "")
+        if kind == "add" and not path.endswith("/-"):
+            inverse.append({"op": "remove", "path": path, "from": op["value"]})
+        elif kind == "remove" and "from" in op:
+            inverse.append({"op": "add", "path": path, "value": op["from"]})
+        elif kind == "replace" and "from" in op:
+            inverse.append({"op": "replace", "path": path, "value": op["from"], "from": op["value"]})
+        else:
+            raise ValueError(f"Patch operation {op!r} is not reversible")
+    return inverse
+
+
+def apply_patch(profile: Dict[str, Any], ops: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Apply patch operations from `diff_profiles` to a plain, mutable profile in place.
+
+    Parameters:
+        profile (Dict[str, Any]): The (thawed) profile to modify.
+        ops (Iterable[Dict[str, Any]]): Operations to apply, in order.
+
+    Returns:
+        Dict[str, Any]: `profile`, for chaining.
+
+    Raises:
+        ValueError: If an operation is malformed or its path does not exist.
+    """
+    for op in ops:
+        path, kind = _parse_op(op)
+        parent = _resolve(profile, path[:-1], op)
+        _apply_op(parent, kind, path[-1], op, copy.deepcopy)
+    return profile
+
+
+def apply_frozen_patch(root: FrozenDict, ops: Iterable[Dict[str, Any]]) -> FrozenDict:
+    """
+    Apply patch operations to a frozen profile, returning the resulting version.
+
+    Each operation copies only the container it changes and the nodes above it, so
+    the result shares every untouched subtree with `root`.
+
+    Raises:
+        ValueError: If an operation is malformed or its path does not exist.
+    """
+    for op in ops:
+        path, kind = _parse_op(op)
+        parent = _resolve(root, path[:-1], op)
+        container = list(parent) if isinstance(parent, tuple) else dict(parent)
+        _apply_op(container, kind, path[-1], op, freeze)
+        node = tuple(container) if isinstance(parent, tuple) else FrozenDict(container)
+        root = assoc_in(root, path[:-1], node) if len(path) > 1 else node
+    return root
+
+
+def _parse_op(op: Dict[str, Any]) -> Tuple[List[str], str]:
+    path = _parse_pointer(op.get("path", ""))
+    kind = op.get("op")
+    if not path or kind not in ("add", "replace", "remove"):
+        raise ValueError(f"Invalid patch operation {op!r}")
+    return path, kind
+
+
+def _resolve(node: Any, path: Sequence[str], op: Dict[str, Any]) -> Any:
+    try:
+        for key in path:
+            node = node[int(key)] if isinstance(node, (list, tuple)) else node[key]
+    except (KeyError, IndexError, ValueError, TypeError):
+        raise ValueError(f"Patch path '{op['path']}' does not exist") from None
+    if not isinstance(node, (dict, list, tuple)):
+        raise ValueError(f"Patch path '{op['path']}' does not exist")
+    return node
+
+
+def _apply_op(node: Any, kind: str, key: str, op: Dict[str, Any], prepare):
+    """
+    Apply one operation to a mutable container; `prepare` copies or freezes inserted values.
+    """
+    try:
+        if isinstance(node, list):
+            if kind == "add" and key == "-":
+                node.append(prepare(op["value"]))
+            elif kind == "add":
+                node.insert(int(key), prepare(op["value"]))
+            elif kind == "replace":
+                node[int(key)] = prepare(op["value"])
+            else:
+                del node[int(key)]
+        elif kind == "remove":
+            del node[key]
+        else:
+            node[key] = prepare(op["value"])
+    except (KeyError, IndexError, ValueError):
+        raise ValueError(f"Patch path '{op['path']}' does not exist") from None
@@ -0,0 +1,296 @@
+# genesis_profile_store.py
+"""
+Phase 3: The Genesis Layer - Profile Store
+Every Step of Growth, Written Down Once
+
+The evolved Genesis profile is persisted as a base snapshot plus an append-only
+journal of deltas (JSON-patch-like operations from `genesis_profile_ops`). Saving
+an evolution appends one small journal line; the base is only rewritten when the
+journal is compacted. Snapshot and journal replacements go through a temporary
+file and an atomic rename, torn journal tails are discarded on load, and writes
+run on a single background worker so the evolution thread never waits on disk.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+from genesis_profile_ops import FrozenDict, apply_patch, freeze, thaw
+
+_BASE_FILENAME = "profile_base.json"
+_JOURNAL_FILENAME = "profile_journal.jsonl"
+
+
+class ProfileStore:
+    """
+    Versioned, crash-safe store for the evolved Genesis profile.
+
+    Version 0 is the profile the store was initialized with; each recorded delta
+    advances the version by one. Loading replays the journal on top of the base.
+    """
+
+    def __init__(self,
+                 directory: str,
+                 compact_every: int = 100,
+                 asynchronous: bool = True,
+                 fsync: bool = True):
+        """
+        Parameters:
+            directory (str): Directory holding the base snapshot and the journal. Created on first write.
+            compact_every (int): Number of journal entries after which the base is rewritten and the journal truncated.
+            asynchronous (bool): Write on a background worker; when False, writes happen in the calling thread.
+            fsync (bool): Force writes to stable storage before they are considered durable.
+        """
+        self.directory = directory
+        self.compact_every = max(1, compact_every)
+        self.asynchronous = asynchronous
+        self.fsync = fsync
+
+        self.version = 0
+        self._base_version = 0
+        self._durable_version = 0  # Latest version on disk (writer side)
+        self._journal_entries = 0
+        self._base_written = False
+        self._latest_profile: Optional[FrozenDict] = None
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="profile_store") \
+            if asynchronous else None
+        self._stats = {"deltas_written": 0, "compactions": 0, "write_errors": 0,
+                       "discarded_tail_bytes": 0}
+
+    @property
+    def base_path(self) -> str:
+        return os.path.join(self.directory, _BASE_FILENAME)
+
+    @property
+    def journal_path(self) -> str:
+        return os.path.join(self.directory, _JOURNAL_FILENAME)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def load(self) -> Optional[FrozenDict]:
+        """
+        Load the latest profile version by replaying the journal on top of the base snapshot.
+
+        Journal entries at or below the base version (left behind by an interrupted
+        compaction) are skipped, and a torn final line is truncated away.
+
+        Returns:
+            FrozenDict or None: The latest profile, or None if nothing has been stored yet.
+        """
+        if not os.path.exists(self.base_path):
+            return None
+
+        with open(self.base_path, "r", encoding="utf-8") as f:
+            base = json.load(f)
+        profile = base["profile"]
+        version = base["version"]
+
+        entries = 0
+        for entry in self._read_journal():
+            if entry["version"] <= version:
+                continue
+            if entry["version"] != version + 1:
+                raise ValueError(
+                    f"Profile journal gap: expected version {version + 1}, found {entry['version']}")
+            apply_patch(profile, entry["ops"])
+            version = entry["version"]
+            entries += 1
+
+        frozen = freeze(profile)
+        with self._lock:
+            self.version = self._durable_version = version
+            self._base_version = base["version"]
+            self._journal_entries = entries
+            self._base_written = True
+            self._latest_profile = frozen
+        return frozen
+
+    def initialize(self, profile: FrozenDict):
+        """
+        Adopt `profile` as version 0 of an empty store.
+
+        Nothing is written until the first delta is recorded, so an unchanged profile
+        never touches the disk.
+        """
+        with self._lock:
+            if self._base_written:
+                raise RuntimeError("Profile store already holds a profile")
+            self.version = 0
+            self._base_version = 0
+            self._latest_profile = freeze(profile)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def record(self, profile: FrozenDict, ops: List[Dict[str, Any]],
+               metadata: Optional[Dict[str, Any]] = None) -> Tuple[int, Future]:
+        """
+        Record a new profile version.
+
+        Parameters:
+            profile (FrozenDict): The new profile version (kept for compaction; it is immutable, so no copy is made).
+            ops (List[Dict[str, Any]]): Patch operations from the previous version to `profile`.
+            metadata (Dict[str, Any], optional): Extra fields stored with the journal entry, e.g. the proposal ID.
+
+        Returns:
+            Tuple[int, Future]: The new version number and a future that resolves once the entry is durable.
+
+        If an earlier entry failed to write, this version is stored as a new base snapshot
+        rather than a delta, so the journal on disk never skips a version.
+        """
+        with self._lock:
+            if self._latest_profile is None:
+                raise RuntimeError("Profile store is not initialized; call load() or initialize() first")
+            previous = self._latest_profile
+            self.version += 1
+            version = self.version
+            self._latest_profile = profile
+
+        entry = {"version": version, "timestamp": time.time(), "ops": ops, **(metadata or {})}
+        return version, self._submit(self._write_entry, entry, previous, profile)
+
+    def compact(self) -> Future:
+        """
+        Rewrite the base snapshot at the latest version and truncate the journal.
+        """
+        with self._lock:
+            profile, version = self._latest_profile, self.version
+        if profile is None:
+            raise RuntimeError("Profile store is not initialized; call load() or initialize() first")
+        return self._submit(self._write_base, profile, version)
+
+    def flush(self, timeout: Optional[float] = None):
+        """
+        Wait until every write submitted so far is on disk.
+        """
+        self._submit(lambda: None).result(timeout)
+
+    def close(self):
+        """
+        Flush pending writes and stop the background worker.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return the current version, journal length and write counters.
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                "version": self.version,
+                "base_version": self._base_version,
+                "journal_entries": self._journal_entries,
+                "asynchronous": self.asynchronous
+            }
+
+    # ------------------------------------------------------------------
+    # Internals (run on the writer)
+    # ------------------------------------------------------------------
+
+    def _submit(self, fn, *args) -> Future:
+        if self._executor is not None:
+            return self._executor.submit(fn, *args)
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _write_entry(self, entry: Dict[str, Any], previous: FrozenDict, profile: FrozenDict):
+        try:
+            if not self._base_written:
+                self._write_base(previous, entry["version"] - 1, compaction=False)
+            elif self._durable_version != entry["version"] - 1:
+                # An earlier write failed; a delta on top of it would leave a gap that load() rejects
+                self._write_base(profile, entry["version"], compaction=False)
+                return
+
+            line = json.dumps(entry, separators=(",", ":"), default=str) + "\n"
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+
+            self._stats["deltas_written"] += 1
+            self._durable_version = entry["version"]
+            self._journal_entries += 1
+            if self._journal_entries >= self.compact_every:
+                self._write_base(profile, entry["version"])
+        except Exception as e:
+            self._stats["write_errors"] += 1
+            print(f"❌ Failed to persist profile version {entry['version']}: {e}", file=sys.stderr)
+            raise
+
+    def _write_base(self, profile: FrozenDict, version: int, compaction: bool = True):
+        """
+        Atomically replace the base snapshot, then atomically empty the journal.
+
+        A crash between the two steps leaves journal entries at or below the new base
+        version, which `load` skips.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self._atomic_write(self.base_path, json.dumps(
+            {"version": version, "timestamp": time.time(), "profile": thaw(profile)},
+            separators=(",", ":"), default=str
+        ))
+        self._atomic_write(self.journal_path, "")
+        self._base_written = True
+        self._base_version = self._durable_version = version
+        self._journal_entries = 0
+        if compaction:
+            self._stats["compactions"] += 1
+
+    def _atomic_write(self, path: str, data: str):
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        if self.fsync and hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(self.directory, os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        """
+        Parse the journal, truncating a torn or corrupt tail left by a crash mid-append.
+        """
+        if not os.path.exists(self.journal_path):
+            return []
+
+        with open(self.journal_path, "rb") as f:
+            data = f.read()
+
+        entries = []
+        offset = 0
+        while offset < len(data):
+            end = data.find(b"\n", offset)
+            if end == -1:
+                break
+            try:
+                entries.append(json.loads(data[offset:end]))
+            except ValueError:
+                break
+            offset = end + 1
+
+        if offset < len(data):
+            self._stats["discarded_tail_bytes"] += len(data) - offset
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(offset)
+        return entries
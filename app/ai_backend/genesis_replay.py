@@ -0,0 +1,198 @@
+# genesis_replay.py
+"""
+Phase 3: The Genesis Layer - Replay Harness
+Measure the Whole Pipeline Before It Ships
+
+Replays a JSON Lines capture of chat requests through `GenesisCore.process_request`
+(governor, matrix, connector, conduit) at a configurable concurrency and reports
+throughput, end-to-end and per-stage latency percentiles, allocations and peak RSS.
+Per-stage timings come from the core's `stage_observer` hook, so a regression in any
+single stage shows up even when the end-to-end numbers hide it.
+
+Usage:
+    python genesis_replay.py capture.jsonl --concurrency 16 --repeat 3
+    python genesis_replay.py capture.jsonl --model-profile production  # Offline, production-like latency
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from typing import Dict, Any, Callable, Iterable, List, Optional
+
+from genesis_metrics import LatencyHistogram
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+def load_capture(path: str) -> List[Dict[str, Any]]:
+    """
+    Read captured requests from a JSON Lines file, one `process_request` payload per line.
+
+    Lines of the form {"request": {...}} (as written by request loggers) are unwrapped; blank lines are skipped.
+    """
+    requests = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            requests.append(record["request"] if isinstance(record.get("request"), dict) else record)
+    return requests
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Return the process's peak resident set size in bytes, or None if unavailable.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports kilobytes
+
+
+class ReplayHarness:
+    """
+    Closed-loop replay of captured requests through a GenesisCore.
+
+    `concurrency` workers each take the next request as soon as their previous one
+    completes, so the measured throughput is the pipeline's capacity at that concurrency.
+    """
+
+    def __init__(self, core, concurrency: int = 8, track_allocations: bool = True):
+        """
+        Parameters:
+            core: A GenesisCore, or any object with an async `process_request(request_data)` and a `stage_observer` attribute.
+            concurrency (int): Number of requests in flight at once.
+            track_allocations (bool): Trace Python allocations with tracemalloc (adds noticeable overhead to every stage).
+        """
+        self.core = core
+        self.concurrency = max(1, concurrency)
+        self.track_allocations = track_allocations
+
+        self.total_latency = LatencyHistogram()
+        self.stage_latency: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.statuses: Counter = Counter()
+        self.failures = 0
+
+    def _record_stage(self, stage: str, elapsed: float):
+        self.stage_latency[stage].record(elapsed * 1000.0)
+
+    async def run(self, requests: Iterable[Dict[str, Any]], repeat: int = 1) -> Dict[str, Any]:
+        """
+        Replay `requests` (`repeat` times over) and return the report.
+
+        The core is initialized before timing starts, and its previous stage observer is restored afterwards.
+        """
+        requests = list(requests)
+        if getattr(self.core, "is_initialized", True) is False:
+            await self.core.initialize()
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for _ in range(repeat):
+            for request in requests:
+                queue.put_nowait(request)
+        total = queue.qsize()
+
+        previous_observer = getattr(self.core, "stage_observer", None)
+        self.core.stage_observer = self._record_stage
+        gc_before = sum(stats["collections"] for stats in gc.get_stats())
+        if self.track_allocations:
+            tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(*(self._worker(queue) for _ in range(min(self.concurrency, total) or 1)))
+            elapsed = time.perf_counter() - started
+            traced_current, traced_peak = tracemalloc.get_traced_memory() \
+                if self.track_allocations else (None, None)
+        finally:
+            if self.track_allocations:
+                tracemalloc.stop()
+            self.core.stage_observer = previous_observer
+
+        return {
+            "requests": total,
+            "concurrency": self.concurrency,
+            "elapsed_seconds": round(elapsed, 4),
+            "requests_per_second": round(total / elapsed, 2) if elapsed > 0 else None,
+            "statuses": dict(self.statuses),
+            "failures": self.failures,
+            "latency": self.total_latency.snapshot(),
+            "stages": {stage: histogram.snapshot() for stage, histogram in self.stage_latency.items()},
+            "memory": {
+                "traced_peak_bytes": traced_peak,
+                "retained_bytes": traced_current,
+                "retained_bytes_per_request": traced_current // total
+                if traced_current is not None and total else None,
+                "gc_collections": sum(stats["collections"] for stats in gc.get_stats()) - gc_before,
+                "peak_rss_bytes": peak_rss_bytes()
+            }
+        }
+
+    async def _worker(self, queue: asyncio.Queue):
+        while not queue.empty():
+            request = queue.get_nowait()
+            started = time.perf_counter()
+            try:
+                result = await self.core.process_request(dict(request))
+                self.statuses[result.get("status", "unknown")] += 1
+            except Exception:
+                self.failures += 1
+            finally:
+                self.total_latency.record((time.perf_counter() - started) * 1000.0)
+
+
+def replay(core, requests: Iterable[Dict[str, Any]], concurrency: int = 8, repeat: int = 1,
+           track_allocations: bool = True) -> Dict[str, Any]:
+    """
+    Synchronous convenience wrapper: replay `requests` through `core` and return the report.
+    """
+    harness = ReplayHarness(core, concurrency=concurrency, track_allocations=track_allocations)
+    return asyncio.run(harness.run(requests, repeat=repeat))
+
+
+def main(argv: Optional[List[str]] = None, core_factory: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+    """
+    Command-line entry point; prints the report as JSON and returns it.
+    """
+    parser = argparse.ArgumentParser(description="Replay captured chat requests through GenesisCore.")
+    parser.add_argument("capture", help="JSON Lines file with one request per line")
+    parser.add_argument("--concurrency", type=int, default=8, help="requests in flight at once")
+    parser.add_argument("--repeat", type=int, default=1, help="replay the capture this many times")
+    parser.add_argument("--no-allocations", action="store_true",
+                        help="skip tracemalloc (lower overhead, no allocation figures)")
+    parser.add_argument("--model-profile", default=None,
+                        help="generate with the local stand-in model using this latency profile "
+                             "(instant, fast, production, degraded)")
+    parser.add_argument("--time-scale", type=float, default=1.0,
+                        help="multiply every local model delay by this factor")
+    args = parser.parse_args(argv)
+
+    if core_factory is None:
+        from genesis_core import GenesisCore
+        core_factory = GenesisCore
+
+    core = core_factory()
+    if args.model_profile is not None:
+        from genesis_connector import GenesisConnector
+        from genesis_local_model import LocalModel
+        core.connector.close()
+        core.connector = GenesisConnector(
+            model=LocalModel(args.model_profile, time_scale=args.time_scale), conduit=core.conduit,
+            governor=core.governor)
+
+    report = replay(core, load_capture(args.capture), concurrency=args.concurrency,
+                    repeat=args.repeat, track_allocations=not args.no_allocations)
+    print(json.dumps(report, indent=2))
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+# genesis_response_cache.py
+"""
+Phase 3: The Genesis Layer - Response Cache
+Answer the Same Question Once
+
+Greetings, the status-style questions the Android app sends and the fixed ethical
+alternative templates reach the model over and over. The response cache remembers
+generated text under a hash of the normalized prompt, persona, model configuration and
+profile (version or system prompt hash), so an evolved profile or a new model never
+serves stale answers. Entries live in a bounded LRU with a time-to-live, optionally
+backed by a bounded on-disk SQLite tier that survives restarts and is read and written
+off the event loop.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Callable, Optional, Tuple
+
+_DISK_FILENAME = "response_cache.sqlite3"
+
+_DISK_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_stored_at ON responses (stored_at);
+"""
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s.!?]+$")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Reduce a prompt to its cache identity: case-folded, whitespace collapsed, trailing punctuation dropped.
+
+    "Hello Genesis!", "hello   genesis" and "HELLO GENESIS?" normalize to the same string.
+    """
+    return _TRAILING_PUNCTUATION.sub("", _WHITESPACE.sub(" ", prompt.casefold()).strip())
+
+
+def make_cache_key(prompt: str, persona: str = "genesis",
+                   model_config: Optional[Dict[str, Any]] = None, profile_key: Any = 0) -> str:
+    """
+    Hash everything that determines a response into a cache key.
+
+    `profile_key` identifies the profile the response was generated under: a profile version or a system prompt hash.
+    """
+    identity = json.dumps([normalize_prompt(prompt), persona, model_config or {}, profile_key],
+                          sort_keys=True, default=str)
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    LRU/TTL cache of generated responses with an optional on-disk tier.
+
+    Memory misses fall through to disk (when configured) and disk hits are promoted back into
+    memory. Expired entries are dropped when they are next looked up. All disk I/O runs on a
+    single background worker: `put` returns once the memory tier is updated, and `get_async`
+    awaits the disk lookup without blocking the event loop. The disk tier is trimmed to
+    `max_disk_entries`, expired rows first, then the oldest.
+    """
+
+    def __init__(self,
+                 max_entries: int = 1024,
+                 ttl_seconds: Optional[float] = 3600.0,
+                 directory: Optional[str] = None,
+                 max_disk_entries: int = 100000,
+                 clock: Callable[[], float] = time.time):
+        """
+        Parameters:
+            max_entries (int): Responses kept in memory before the least recently used are evicted.
+            ttl_seconds (float, optional): Age after which a response is no longer served; None keeps responses until evicted.
+            directory (str, optional): Directory for the on-disk tier; memory only when omitted.
+            max_disk_entries (int): Rows kept on disk; checked every tenth of this many writes, so the table may briefly exceed it by that much.
+            clock (Callable): Wall-clock time source (disk entries outlive the process), injectable for tests.
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.directory = directory
+        self.max_disk_entries = max(1, max_disk_entries)
+        self.clock = clock
+
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "memory_hits": 0, "disk_hits": 0, "misses": 0, "bypasses": 0,
+                       "stores": 0, "evictions": 0, "expirations": 0, "disk_trims": 0, "disk_errors": 0}
+
+        self._disk = None
+        self._executor = None
+        self._writes_since_trim = 0  # Disk worker only
+        self._disk_entries = None  # Row count, kept by the disk worker so stats never query the table
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._disk = sqlite3.connect(os.path.join(directory, _DISK_FILENAME), check_same_thread=False)
+            self._disk.execute("PRAGMA journal_mode=WAL")
+            self._disk.executescript(_DISK_SCHEMA)
+            self._disk_entries = self._disk_count()
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="response_cache")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the cached response for `key`, or None on a miss or an expired entry.
+
+        A memory miss waits for the disk lookup; async callers should use `get_async`.
+        """
+        now = self.clock()
+        found, text = self._memory_get(key, now)
+        if found or self._executor is None:
+            return self._finish_lookup(key, text, now)
+        return self._finish_lookup(key, self._submit(self._disk_get, key, now).result(), now)
+
+    async def get_async(self, key: str) -> Optional[str]:
+        """
+        Like `get`, but a memory miss awaits the disk lookup on the cache's worker thread.
+        """
+        now = self.clock()
+        found, text = self._memory_get(key, now)
+        if found or self._executor is None:
+            return self._finish_lookup(key, text, now)
+        row = await asyncio.wrap_future(self._submit(self._disk_get, key, now))
+        return self._finish_lookup(key, row, now)
+
+    def put(self, key: str, text: str):
+        """
+        Store a response in memory and, if configured, queue it for the disk tier.
+        """
+        now = self.clock()
+        with self._lock:
+            self._remember(key, text, now)
+            self._stats["stores"] += 1
+        if self._executor is not None:
+            self._submit(self._disk_put, key, text, now)
+
+    def record_bypass(self):
+        """
+        Count a request that skipped the lookup (its fresh response is still stored).
+        """
+        with self._lock:
+            self._stats["bypasses"] += 1
+
+    def clear(self):
+        """
+        Drop every entry from both tiers.
+        """
+        with self._lock:
+            self._entries.clear()
+        if self._executor is not None:
+            self._submit(self._disk_clear).result()
+
+    def purge_expired(self) -> int:
+        """
+        Remove expired entries from both tiers.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        if self.ttl_seconds is None:
+            return 0
+        cutoff = self.clock() - self.ttl_seconds
+        with self._lock:
+            stale = [key for key, (_, stored_at) in self._entries.items() if stored_at <= cutoff]
+            for key in stale:
+                del self._entries[key]
+        removed = len(stale)
+        if self._executor is not None:
+            removed += self._submit(self._disk_execute, "DELETE FROM responses WHERE stored_at <= ?",
+                                    (cutoff,)).result()
+        with self._lock:
+            self._stats["expirations"] += removed
+        return removed
+
+    def flush(self, timeout: Optional[float] = None):
+        """
+        Wait until every disk write submitted so far has been applied.
+        """
+        if self._executor is not None:
+            self._submit(lambda: None).result(timeout)
+
+    def close(self):
+        """
+        Finish pending disk writes and close the on-disk tier; the in-memory tier stays usable.
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.submit(self._disk.close).result()
+            executor.shutdown(wait=True)
+            self._disk = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Report hit/miss counts, the hit ratio over lookups, and entry counts per tier.
+
+        Never waits for the disk worker: `disk_entries` reflects the writes it has applied so far.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+            stats["entries"] = len(self._entries)
+            stats["disk_entries"] = self._disk_entries if self._disk is not None else None
+            stats["max_disk_entries"] = self.max_disk_entries if self._disk is not None else None
+            return stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - stored_at >= self.ttl_seconds
+
+    def _memory_get(self, key: str, now: float) -> Tuple[bool, Optional[str]]:
+        """Look `key` up in memory; returns (found, text) where found means no disk lookup is needed"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if self._expired(entry[1], now):
+                # An expired memory entry was written to disk at the same time, so it is stale there too
+                del self._entries[key]
+                self._stats["expirations"] += 1
+                return True, None
+            self._entries.move_to_end(key)
+            self._stats["memory_hits"] += 1
+            return True, entry[0]
+
+    def _finish_lookup(self, key: str, found, now: float) -> Optional[str]:
+        """Count the lookup; `found` is the memory text or a (text, stored_at) row from disk"""
+        with self._lock:
+            if found is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            if isinstance(found, str):
+                return found
+            self._stats["disk_hits"] += 1
+            self._remember(key, found[0], found[1])
+            return found[0]
+
+    def _remember(self, key: str, text: str, stored_at: float):
+        # Caller holds the lock
+        self._entries[key] = (text, stored_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    # ------------------------------------------------------------------
+    # Disk tier (runs on the worker)
+    # ------------------------------------------------------------------
+
+    def _submit(self, fn, *args) -> Future:
+        return self._executor.submit(fn, *args)
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[str, float]]:
+        row = self._disk.execute("SELECT text, stored_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None or not self._expired(row[1], now):
+            return row
+        self._disk_execute("DELETE FROM responses WHERE key = ?", (key,))
+        with self._lock:
+            self._stats["expirations"] += 1
+        return None
+
+    def _disk_put(self, key: str, text: str, stored_at: float):
+        try:
+            updated = self._disk.execute("UPDATE responses SET text = ?, stored_at = ? WHERE key = ?",
+                                         (text, stored_at, key)).rowcount
+            if not updated:
+                self._disk.execute("INSERT INTO responses (key, text, stored_at) VALUES (?, ?, ?)",
+                                   (key, text, stored_at))
+            self._disk.commit()
+            if not updated:
+                with self._lock:
+                    self._disk_entries += 1
+            self._writes_since_trim += 1
+            if self._writes_since_trim >= max(1, self.max_disk_entries // 10):
+                self._writes_since_trim = 0
+                self._disk_trim()
+        except sqlite3.Error as e:
+            with self._lock:
+                self._stats["disk_errors"] += 1
+            print(f"❌ Failed to write response cache entry: {e}", file=sys.stderr)
+
+    def _disk_trim(self):
+        """Drop expired rows, then the oldest rows beyond `max_disk_entries`"""
+        expired = evicted = 0
+        if self.ttl_seconds is not None:
+            expired = self._disk_execute("DELETE FROM responses WHERE stored_at <= ?",
+                                         (self.clock() - self.ttl_seconds,))
+        excess = self._disk_entries - self.max_disk_entries
+        if excess > 0:
+            evicted = self._disk_execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY stored_at LIMIT ?)", (excess,))
+        with self._lock:
+            self._stats["disk_trims"] += 1
+            self._stats["expirations"] += expired
+            self._stats["evictions"] += evicted
+
+    def _disk_execute(self, sql: str, parameters: Tuple = ()) -> int:
+        """Run a DELETE and return the number of rows it removed"""
+        removed = self._disk.execute(sql, parameters).rowcount
+        self._disk.commit()
+        with self._lock:
+            self._disk_entries -= removed
+        return removed
+
+    def _disk_clear(self):
+        self._disk.execute("DELETE FROM responses")
+        self._disk.commit()
+        with self._lock:
+            self._disk_entries = 0
+
+    def _disk_count(self) -> int:
+        return self._disk.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
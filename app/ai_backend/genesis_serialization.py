@@ -0,0 +1,213 @@
+# genesis_serialization.py
+"""
+Phase 3: The Genesis Layer - Record Serialization
+One Schema, Many Wires
+
+EthicalDecision, GrowthProposal, EvolutionInsight and SensoryData used to reach the
+wire through `dataclasses.asdict`, which deep-copies every nested context and list
+before a JSON encoder walks the result a second time. This module keeps a per-class
+schema (field order and timestamp/ISO field) and converts records with a
+single shallow pass, handing nested containers to the encoder by reference.
+
+orjson is used for JSON when installed and msgpack provides an optional binary
+encoding; both fall back gracefully.
+"""
+
+import dataclasses
+import json
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+# Fast JSON encoder is optional
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Binary encoding is optional
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+
+class RecordSchema:
+    """Precomputed serialization layout for one dataclass type"""
+
+    __slots__ = ("field_names", "timestamp_field", "iso_field")
+
+    def __init__(self, cls: type, timestamp_field: Optional[str] = None,
+                 iso_field: Optional[str] = None):
+        """
+        Capture the field order of `cls` and where its ISO 8601 timestamp should be written.
+
+        A field whose metadata has "serialize_as" is written under that name, read through
+        the attribute of the same name (typically a property over a private field).
+
+        Parameters:
+            cls (type): The dataclass being described.
+            timestamp_field (str, optional): Name of the epoch-seconds field to render as ISO 8601.
+            iso_field (str, optional): Output key that receives the rendered timestamp.
+        """
+        self.field_names: Tuple[str, ...] = tuple(f.metadata.get("serialize_as", f.name)
+                                                  for f in dataclasses.fields(cls))
+        self.timestamp_field = timestamp_field
+        self.iso_field = iso_field
+
+
+_SCHEMAS: Dict[type, RecordSchema] = {}
+
+
+def serializable_record(timestamp_field: Optional[str] = None, iso_field: Optional[str] = None):
+    """
+    Class decorator registering a dataclass with the serializer.
+
+    Apply above `@dataclass`. The output of `to_plain` for the class matches its `to_dict`:
+    enums become their values and, if configured, `iso_field` carries the ISO 8601 UTC
+    rendering of `timestamp_field`.
+    """
+
+    def register(cls):
+        _SCHEMAS[cls] = RecordSchema(cls, timestamp_field, iso_field)
+        return cls
+
+    return register
+
+
+def _schema_for(cls: type) -> RecordSchema:
+    """
+    Return the registered schema for `cls`, building a plain one for unregistered dataclasses.
+    """
+    schema = _SCHEMAS.get(cls)
+    if schema is None:
+        schema = _SCHEMAS[cls] = RecordSchema(cls)
+    return schema
+
+
+def _plain_value(value: Any) -> Any:
+    """
+    Convert a single field value; containers are passed through untouched.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return to_plain(value)
+    return value
+
+
+def to_plain(record: Any) -> Dict[str, Any]:
+    """
+    Shallow-convert a dataclass record into a JSON-ready dict.
+
+    Unlike `dataclasses.asdict`, nested lists and dicts are shared with the record rather
+    than deep-copied, so the result must be treated as read-only.
+
+    Parameters:
+        record: A dataclass instance, typically one registered with `serializable_record`.
+
+    Returns:
+        dict: Field values with enums as strings, nested dataclasses converted, and the ISO timestamp added.
+    """
+    schema = _schema_for(type(record))
+    result = {name: _plain_value(getattr(record, name)) for name in schema.field_names}
+    if schema.iso_field:
+        result[schema.iso_field] = datetime.fromtimestamp(
+            getattr(record, schema.timestamp_field), tz=timezone.utc
+        ).isoformat()
+    return result
+
+
+def _default(value: Any) -> Any:
+    """
+    Fallback hook for values the JSON or msgpack encoder cannot handle natively.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return to_plain(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _as_payload(obj: Any) -> Any:
+    """
+    Convert a top-level record to its plain form, leaving dicts and lists as they are.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return to_plain(obj)
+    return obj
+
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+    def _encode_json(payload: Any) -> bytes:
+        """Encode with orjson, routing dataclasses through the schema-aware converter."""
+        return orjson.dumps(payload, default=_default, option=_ORJSON_OPTIONS)
+else:
+    _json_encoder = json.JSONEncoder(default=_default, separators=(",", ":"),
+                                     ensure_ascii=False)
+
+
+    def _encode_json(payload: Any) -> bytes:
+        """Encode with the standard library encoder."""
+        return _json_encoder.encode(payload).encode("utf-8")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize a record (or any JSON-compatible structure containing records) to UTF-8 JSON bytes.
+    """
+    return _encode_json(_as_payload(obj))
+
+
+def dumps_many(records: Iterable[Any]) -> bytes:
+    """
+    Serialize an iterable of records as a single JSON array.
+    """
+    return _encode_json([_as_payload(record) for record in records])
+
+
+def loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes produced by `dumps` or `dumps_many`.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_binary(obj: Any) -> bytes:
+    """
+    Serialize a record to msgpack bytes.
+
+    Raises:
+        RuntimeError: If msgpack is not installed.
+    """
+    if not MSGPACK_AVAILABLE:
+        raise RuntimeError("Binary serialization requires the 'msgpack' package")
+    return msgpack.packb(_as_payload(obj), default=_default, use_bin_type=True)
+
+
+def loads_binary(data: bytes) -> Any:
+    """
+    Parse msgpack bytes produced by `dumps_binary`.
+
+    Raises:
+        RuntimeError: If msgpack is not installed.
+    """
+    if not MSGPACK_AVAILABLE:
+        raise RuntimeError("Binary serialization requires the 'msgpack' package")
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
@@ -0,0 +1,224 @@
+# genesis_simulation.py
+"""
+Phase 3: The Genesis Layer - Simulation
+Days of Growth, Measured in Seconds
+
+Runs a private ConsciousnessMatrix, EvolutionaryConduit and EthicalGovernor on a
+shared VirtualClock and replays a recorded or synthetic event stream through
+them. Every synthesis interval, analysis interval and debounce window elapses in
+virtual time, so long-horizon dynamics (deep evolution cycles, decision history
+compaction, trend drift) can be benchmarked and regression-tested at thousands
+of times real time.
+
+Events are plain dicts (one JSON object per line on disk) with an `at` offset in
+seconds from the start of the run and a `kind`:
+    perceive     - channel, source, event_type, data, severity
+    interaction  - interaction_type, agent, data, user_id, session_id
+    evaluate     - action_type, actor, data
+"""
+
+import contextlib
+import json
+import os
+import random
+import time
+from typing import Dict, Any, Iterable, Iterator, Optional
+
+from genesis_clock import VirtualClock
+from genesis_consciousness_matrix import ConsciousnessMatrix, SensoryChannel
+from genesis_ethical_governor import EthicalGovernor
+from genesis_evolutionary_conduit import EvolutionaryConduit
+
+EVENT_KINDS = ("perceive", "interaction", "evaluate")
+
+
+class GenesisSimulation:
+    """
+    Fast-forward driver for the Genesis layer on a virtual clock.
+    """
+
+    def __init__(self, start: float = 0.0, event_driven: bool = True,
+                 max_memory_size: int = 10000):
+        """
+        Parameters:
+            start (float): Virtual start time (Unix seconds).
+            event_driven (bool): Run the conduit event-driven (default) or on fixed analysis intervals.
+            max_memory_size (int): Sensory memory size of the simulated matrix.
+        """
+        self.start = start
+        self.event_driven = event_driven
+        self.clock = VirtualClock(start)
+        self.matrix = ConsciousnessMatrix(max_memory_size=max_memory_size, clock=self.clock)
+        self.conduit = EvolutionaryConduit(clock=self.clock, matrix=self.matrix)
+        self.governor = EthicalGovernor(clock=self.clock, matrix=self.matrix)
+
+        self.syntheses = 0
+        self.matrix.add_synthesis_listener(self._count_synthesis)
+        self.events_applied = 0
+        self.events_by_kind = {kind: 0 for kind in EVENT_KINDS}
+        self.wall_seconds = 0.0
+
+    def run(self, events: Iterable[Dict[str, Any]], duration: Optional[float] = None,
+            quiet: bool = True) -> Dict[str, Any]:
+        """
+        Replay `events` in virtual time and return a report.
+
+        Events are applied in stream order at `start + event["at"]`; scheduled work
+        (syntheses, analyses, triggered evolution cycles) runs in between. Events that
+        are out of order are applied at the current virtual time.
+
+        Parameters:
+            events (Iterable[Dict[str, Any]]): Event stream, ideally sorted by `at`.
+            duration (float, optional): Total virtual seconds to run; defaults to the last event's offset.
+            quiet (bool): Discard the components' console output while running.
+
+        Returns:
+            Dict[str, Any]: See `get_report`.
+        """
+        wall_started = time.perf_counter()
+        with contextlib.ExitStack() as stack:
+            if quiet:
+                stack.enter_context(contextlib.redirect_stdout(
+                    stack.enter_context(open(os.devnull, "w"))))
+
+            self.matrix.awaken()
+            self.governor.activate_governance()
+            self.conduit.activate_evolution(event_driven=self.event_driven)
+            try:
+                last_offset = 0.0
+                for event in events:
+                    last_offset = max(last_offset, float(event.get("at", 0.0)))
+                    self.clock.run_until(self.start + last_offset)
+                    self.apply_event(event)
+                self.clock.run_until(self.start + (duration if duration is not None else last_offset))
+            finally:
+                self.conduit.deactivate_evolution()
+                self.matrix.sleep()
+
+        self.wall_seconds += time.perf_counter() - wall_started
+        return self.get_report()
+
+    def apply_event(self, event: Dict[str, Any]):
+        """
+        Feed one event to the simulated components at the current virtual time.
+
+        Raises:
+            ValueError: If the event kind is unknown.
+        """
+        kind = event.get("kind")
+        if kind == "perceive":
+            self.matrix.perceive(
+                SensoryChannel(event["channel"]),
+                event.get("source", "simulation"),
+                event.get("event_type", "event"),
+                event.get("data", {}),
+                severity=event.get("severity", "info")
+            )
+        elif kind == "interaction":
+            self.matrix.perceive_user_interaction(
+                event.get("interaction_type", "chat"),
+                event.get("agent", "genesis"),
+                event.get("data", {}),
+                user_id=event.get("user_id"),
+                session_id=event.get("session_id")
+            )
+            self.conduit.request_evolution("user_request")
+        elif kind == "evaluate":
+            self.governor.evaluate_action(
+                event.get("action_type", "generate_response"),
+                event.get("actor", "genesis"),
+                event.get("data", {})
+            )
+        else:
+            raise ValueError(f"Unknown simulation event kind: {kind!r}")
+
+        self.events_applied += 1
+        self.events_by_kind[kind] += 1
+
+    def _count_synthesis(self, sequence: int, synthesis: Dict[str, Any]):
+        self.syntheses += 1
+
+    def get_report(self) -> Dict[str, Any]:
+        """
+        Summarize the run: virtual vs wall time and the state of each component.
+        """
+        simulated = self.clock.time() - self.start
+        awareness = self.matrix.get_current_awareness()
+        return {
+            "simulated_seconds": simulated,
+            "wall_seconds": self.wall_seconds,
+            "speedup": simulated / self.wall_seconds if self.wall_seconds > 0 else None,
+            "events_applied": self.events_applied,
+            "events_by_kind": dict(self.events_by_kind),
+            "scheduled_callbacks": self.clock.callbacks_run,
+            "matrix": {
+                "perceptions": awareness.get("total_perceptions", 0),
+                "syntheses": self.syntheses
+            },
+            "conduit": {
+                "evolution_cycles": self.conduit.trigger_engine.get_stats()["runs"],
+                "active_proposals": len(self.conduit.active_proposals),
+                "implemented_changes": len(self.conduit.implemented_changes),
+                "profile_version": self.conduit.profile_version
+            },
+            "governor": {
+                "total_decisions": self.governor.ethical_metrics["total_decisions"],
+                "retained_decisions": len(self.governor.decision_history),
+                "violations_prevented": self.governor.ethical_metrics["violations_prevented"]
+            }
+        }
+
+
+def load_events(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream events from a JSON Lines file, skipping blank lines.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def synthetic_events(duration: float,
+                     interactions_per_minute: float = 6.0,
+                     error_ratio: float = 0.05,
+                     evaluation_ratio: float = 0.5,
+                     seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Generate a reproducible event stream with Poisson-distributed user interactions.
+
+    Each interaction may be followed by an ethical evaluation and, with `error_ratio`
+    probability, an error perception on the error states channel.
+
+    Parameters:
+        duration (float): Length of the stream in seconds.
+        interactions_per_minute (float): Mean interaction rate.
+        error_ratio (float): Probability that an interaction is followed by an error.
+        evaluation_ratio (float): Probability that an interaction is followed by an ethical evaluation.
+        seed (int): Random seed; the same arguments always produce the same stream.
+    """
+    rng = random.Random(seed)
+    agents = ("kai", "aura", "genesis")
+    rate = interactions_per_minute / 60.0
+    at = rng.expovariate(rate)
+    while at < duration:
+        agent = rng.choice(agents)
+        session_id = f"session_{rng.randrange(50)}"
+        yield {"at": at, "kind": "interaction", "interaction_type": "chat", "agent": agent,
+               "data": {"message_length": rng.randrange(10, 500)},
+               "user_id": f"user_{rng.randrange(20)}", "session_id": session_id}
+        if rng.random() < evaluation_ratio:
+            yield {"at": at, "kind": "evaluate", "action_type": "generate_response", "actor": agent,
+                   "data": {"scope": "local", "user_consent": True}}
+        if rng.random() < error_ratio:
+            yield {"at": at, "kind": "perceive", "channel": "error_states", "source": agent,
+                   "event_type": "response_error", "data": {"agent": agent}, "severity": "error"}
+        at += rng.expovariate(rate)
+
+
+if __name__ == "__main__":
+    day = 24 * 3600
+    simulation = GenesisSimulation()
+    report = simulation.run(synthetic_events(day), duration=day)
+    print("🧪 Simulated one day of Genesis dynamics:")
+    print(json.dumps(report, indent=2))
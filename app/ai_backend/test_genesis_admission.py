@@ -0,0 +1,191 @@
+import pytest
+
+from genesis_admission import AdmissionController
+from genesis_clock import VirtualClock
+from genesis_ethical_governor import EthicalDecisionType, EthicalGovernor
+
+
+class FakeClock:
+    """A manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """
+    Return a fake clock for deterministic refill behaviour.
+    """
+    return FakeClock()
+
+
+class TestAdmissionController:
+    """Tests for per-actor and per-user token bucket admission"""
+
+    def test_burst_then_throttle_then_refill(self, clock):
+        """
+        Test that a key gets its burst, is throttled, and is admitted again after refill.
+        """
+        controller = AdmissionController(default_rate=2.0, default_burst=3, clock=clock)
+
+        results = [controller.admit("kai", "chat").admitted for _ in range(4)]
+        refused = controller.admit("kai", "chat")
+        clock.now += 0.5
+
+        assert results == [True, True, True, False]
+        assert refused.key == "actor:kai"
+        assert refused.retry_after == pytest.approx(0.5)
+        assert controller.admit("kai", "chat").admitted
+
+    def test_keys_are_isolated_and_user_quota_applies(self, clock):
+        """
+        Test that one noisy caller does not affect others and that user_id has its own bucket.
+        """
+        controller = AdmissionController(default_rate=0.0, default_burst=2, clock=clock)
+
+        controller.admit("kai", "chat", user_id="u1")
+        controller.admit("aura", "chat", user_id="u1")
+        refused = controller.admit("genesis", "chat", user_id="u1")
+
+        assert not refused.admitted
+        assert refused.key == "user:u1"
+        assert controller.admit("genesis", "chat", user_id="u2").admitted
+        # The refused request charged none of its buckets
+        assert controller.admit("genesis", "chat").admitted
+
+    def test_per_action_rates(self, clock):
+        """
+        Test that action_type overrides change the bucket for that action only.
+        """
+        controller = AdmissionController(default_rate=0.0, default_burst=5,
+                                         action_rates={"evolve": (0.0, 1)}, clock=clock)
+
+        assert controller.admit("kai", "evolve").admitted
+        assert not controller.admit("kai", "evolve").admitted
+        assert controller.admit("kai", "chat").admitted
+
+        controller.set_rate("chat", 0.0, 1)
+        assert controller.admit("kai", "chat").admitted
+        assert not controller.admit("kai", "chat").admitted
+
+    def test_one_summary_per_throttled_window(self, clock):
+        """
+        Test that throttling is reported once per window, aggregated by key and action.
+        """
+        summaries = []
+        controller = AdmissionController(default_rate=0.0, default_burst=1, window_seconds=10,
+                                         on_window=summaries.append, clock=clock)
+
+        for _ in range(5):
+            controller.admit("kai", "chat")
+        clock.now += 10
+        controller.admit("kai", "chat")
+        controller.admit("kai", "chat")
+
+        assert len(summaries) == 1
+        assert summaries[0]["throttled_total"] == 5
+        assert summaries[0]["throttled_by_key"] == {"actor:kai": {"chat": 5}}
+        assert controller.flush_window()["throttled_total"] == 1
+        assert controller.flush_window() is None
+        assert controller.get_stats()["windows_reported"] == 2
+
+    def test_bucket_count_is_bounded(self, clock):
+        """
+        Test that least recently used buckets are evicted beyond max_buckets.
+        """
+        controller = AdmissionController(max_buckets=3, clock=clock)
+
+        for actor in range(10):
+            controller.admit(f"actor_{actor}", "chat")
+
+        assert controller.get_stats()["tracked_buckets"] == 3
+
+
+class TestGovernorAdmission:
+    """Tests for admission control in front of EthicalGovernor.review_decision"""
+
+    def test_throttled_review_returns_restrict_without_evaluation(self, clock):
+        """
+        Test that an over-quota actor gets a cheap RESTRICT decision that is not recorded.
+        """
+        governor = EthicalGovernor(
+            admission=AdmissionController(default_rate=0.0, default_burst=1, clock=clock)
+        )
+
+        first = governor.review_decision("data_access", {"persona": "kai"})
+        second = governor.review_decision("data_access", {"persona": "kai"})
+        other = governor.review_decision("data_access", {"persona": "aura"})
+
+        assert first.decision == EthicalDecisionType.ALLOW
+        assert second.decision == EthicalDecisionType.RESTRICT
+        assert second.escalation_reason == "admission_throttled"
+        assert second.context.metadata["retry_after"] == float("inf")
+        assert other.decision == EthicalDecisionType.ALLOW
+        assert governor.get_policy_status()["verdict_cache"]["misses"] == 1
+
+    def test_throttled_decisions_in_the_same_tick_get_distinct_ids(self, clock):
+        """
+        Test that two requests throttled at the same instant carry different decision ids.
+        """
+        governor = EthicalGovernor(
+            admission=AdmissionController(default_rate=0.0, default_burst=0, clock=clock),
+            clock=VirtualClock(1000.0)
+        )
+
+        first = governor.check_admission("data_access", "kai")
+        second = governor.check_admission("data_access", "kai")
+
+        assert first.decision_id.startswith("throttled_")
+        assert first.decision_id != second.decision_id
+
+    def test_governor_reports_windows_to_matrix(self, clock, monkeypatch):
+        """
+        Test that the governor wires window summaries into the consciousness matrix.
+        """
+        events = []
+        monkeypatch.setattr("genesis_ethical_governor.perceive_ethical_decision",
+                            lambda decision_type, data, **kwargs: events.append(
+                                (decision_type, data)))
+        governor = EthicalGovernor(
+            admission=AdmissionController(default_rate=0.0, default_burst=0, clock=clock)
+        )
+
+        governor.review_decision("data_access", {"persona": "kai"}, {"user_id": "u1"})
+        governor.admission.flush_window()
+
+        assert events == [("admission_throttled", events[0][1])]
+        assert events[0][1]["throttled_by_key"] == {"actor:kai": {"data_access": 1}}
+
+    def test_idle_window_is_reported_on_the_governor_clock(self):
+        """
+        Test that admission follows the governor's virtual clock and reports the last window without further traffic.
+        """
+        summaries = []
+        virtual = VirtualClock(5000.0)
+        governor = EthicalGovernor(
+            clock=virtual,
+            admission=AdmissionController(default_rate=0.0, default_burst=1, window_seconds=10.0,
+                                          on_window=summaries.append)
+        )
+        governor.activate_governance()
+
+        governor.review_decision("data_access", {"persona": "kai"})
+        governor.review_decision("data_access", {"persona": "kai"})
+        assert governor.admission.clock() == 5000.0
+        assert summaries == []
+
+        virtual.advance(10.0)  # No further requests arrive
+
+        assert len(summaries) == 1
+        assert summaries[0]["throttled_by_key"] == {"actor:kai": {"data_access": 1}}
+        governor.deactivate_governance()
+
+    def test_no_admission_controller_admits_everything(self):
+        """
+        Test that admission control is opt-in.
+        """
+        assert EthicalGovernor().check_admission("data_access", "kai") is None
@@ -0,0 +1,96 @@
+import asyncio
+import time
+
+from genesis_connector import GenesisConnector
+from genesis_local_model import LatencyProfile, LocalModel
+
+STEADY = LatencyProfile(time_to_first_token=0.1, tokens_per_second=0.0, jitter=0.0, tail_probability=0.0)
+
+
+class SyncOnlyModel:
+    """
+    A model whose chat sessions only offer the blocking `send_message`.
+    """
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def start_chat(self):
+        return self
+
+    def send_message(self, prompt):
+        time.sleep(self.delay)
+        return type("Response", (), {"text": f"echo: {prompt}"})()
+
+
+class TestAsyncGeneration:
+    """Tests for non-blocking, bounded generation in GenesisConnector"""
+
+    def test_async_api_calls_overlap_up_to_the_concurrency_limit(self):
+        """
+        Test that calls through the model's async API overlap but never exceed `max_concurrency`.
+        """
+        connector = GenesisConnector(model=LocalModel(STEADY), max_concurrency=5)
+
+        async def run():
+            started = time.perf_counter()
+            responses = await asyncio.gather(*(connector.generate_response(f"chat {i}") for i in range(20)))
+            return responses, time.perf_counter() - started
+
+        responses, elapsed = asyncio.run(run())
+
+        assert len(set(responses)) == 20
+        assert 0.4 <= elapsed < 1.5  # Four waves of five, not twenty sequential calls
+        assert connector.generation_stats["max_in_flight"] == 5
+        assert connector.generation_stats["async_calls"] == 20
+        assert connector.generation_stats["in_flight"] == 0
+
+    def test_sync_models_run_on_the_thread_pool_without_blocking_the_loop(self):
+        """
+        Test that blocking models run on worker threads while the event loop keeps ticking.
+        """
+        connector = GenesisConnector(model=SyncOnlyModel(delay=0.1), max_concurrency=4)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.02)
+
+        async def run():
+            results = await asyncio.gather(ticker(), *(connector.generate_response(f"m{i}") for i in range(4)))
+            return results[1:]
+
+        started = time.perf_counter()
+        responses = asyncio.run(run())
+        elapsed = time.perf_counter() - started
+        connector.close()
+
+        assert responses == [f"echo: m{i}" for i in range(4)]
+        assert elapsed < 0.35
+        assert len(ticks) == 5 and ticks[-1] - ticks[0] < 0.2
+        assert connector.generation_stats["threaded_calls"] == 4
+
+    def test_slow_calls_time_out_to_the_fallback_response(self):
+        """
+        Test that a call exceeding the per-call timeout is abandoned and answered by the fallback.
+        """
+        connector = GenesisConnector(model=LocalModel(STEADY), timeout=0.02)
+
+        response = asyncio.run(connector.generate_response("too slow", {"session_id": "s1"}))
+
+        assert "Fallback Mode" in response and "s1" in response
+        assert connector.generation_stats["timeouts"] == 1
+
+    def test_connector_is_reusable_across_event_loops(self):
+        """
+        Test that the concurrency limit follows the running event loop.
+        """
+        connector = GenesisConnector(model=LocalModel("instant"), max_concurrency=1)
+
+        async def burst():
+            return await asyncio.gather(*(connector.generate_response(f"p{i}", use_cache=False)
+                                          for i in range(3)))
+
+        assert asyncio.run(burst()) == asyncio.run(burst())
+        assert connector.generation_stats["calls"] == 6
@@ -0,0 +1,205 @@
+import os
+import time
+
+import pytest
+
+from genesis_audit_log import EthicalAuditLog
+from genesis_clock import VirtualClock
+from genesis_ethical_governor import (
+    EthicalContext,
+    EthicalDecision,
+    EthicalDecisionType,
+    EthicalGovernor,
+    EthicalSeverity,
+)
+
+
+def make_decision(decision_id, actor="kai", action_type="data_access",
+                  decision=EthicalDecisionType.ALLOW, timestamp=None):
+    """
+    Build a minimal EthicalDecision for audit log tests.
+    """
+    return EthicalDecision(
+        decision_id=decision_id,
+        timestamp=timestamp if timestamp is not None else time.time(),
+        action_type=action_type,
+        actor=actor,
+        context=EthicalContext(action_type=action_type, actor=actor),
+        decision=decision,
+        severity=EthicalSeverity.INFO,
+        affected_principles=[],
+        reasoning="test",
+        confidence=0.9
+    )
+
+
+class TestEthicalAuditLog:
+    """Tests for the persistent, indexed ethical decision store"""
+
+    @pytest.fixture
+    def audit_log(self, tmp_path):
+        """
+        Create an audit log in a temporary directory and close it after the test.
+        """
+        log = EthicalAuditLog(str(tmp_path / "audit"), commit_batch_size=8)
+        yield log
+        log.close()
+
+    def test_append_and_get_round_trip(self, audit_log):
+        """
+        Test that a stored decision can be read back by its id with enums serialized as strings.
+        """
+        audit_log.append(make_decision("d1", decision=EthicalDecisionType.BLOCK))
+
+        record = audit_log.get("d1")
+
+        assert record["decision_id"] == "d1"
+        assert record["decision"] == "block"
+        assert record["context"]["actor"] == "kai"
+        assert audit_log.get("missing") is None
+
+    def test_query_by_actor_decision_and_time_range(self, audit_log):
+        """
+        Test the "all BLOCKs by actor X in the last hour" query shape.
+        """
+        now = time.time()
+        audit_log.append(make_decision("old", actor="aura", decision=EthicalDecisionType.BLOCK,
+                                       timestamp=now - 7200))
+        audit_log.append(make_decision("recent", actor="aura", decision=EthicalDecisionType.BLOCK,
+                                       timestamp=now - 60))
+        audit_log.append(make_decision("allowed", actor="aura", timestamp=now - 30))
+        audit_log.append(make_decision("other", actor="kai", decision=EthicalDecisionType.BLOCK,
+                                       timestamp=now - 10))
+
+        results = audit_log.query(actor="aura", decision=EthicalDecisionType.BLOCK,
+                                  since=now - 3600)
+
+        assert [r["decision_id"] for r in results] == ["recent"]
+        assert audit_log.count(decision="block") == 3
+        assert audit_log.count(action_type="data_access") == 4
+
+    def test_query_orders_and_limits(self, audit_log):
+        """
+        Test that results are newest-first by default and respect the limit.
+        """
+        for i in range(5):
+            audit_log.append(make_decision(f"d{i}", timestamp=1000.0 + i))
+
+        newest = audit_log.query(limit=2)
+        oldest = audit_log.query(limit=2, newest_first=False)
+
+        assert [r["decision_id"] for r in newest] == ["d4", "d3"]
+        assert [r["decision_id"] for r in oldest] == ["d0", "d1"]
+
+    def test_segments_rotate_and_retention_drops_oldest(self, tmp_path):
+        """
+        Test that small segments rotate and that records in dropped segments leave the index.
+        """
+        log = EthicalAuditLog(str(tmp_path / "audit"), segment_max_bytes=600, max_segments=2)
+        for i in range(30):
+            log.append(make_decision(f"d{i}", timestamp=1000.0 + i))
+
+        stats = log.get_stats()
+
+        assert stats["segments"] == 2
+        assert stats["active_segment"] > 2
+        assert 0 < stats["records"] < 30
+        assert log.get("d29") is not None
+        assert log.get("d0") is None
+        log.close()
+
+    def test_reopen_preserves_records(self, tmp_path):
+        """
+        Test that decisions survive closing and reopening the log.
+        """
+        directory = str(tmp_path / "audit")
+        log = EthicalAuditLog(directory)
+        log.append(make_decision("persisted", decision=EthicalDecisionType.MONITOR))
+        log.close()
+
+        reopened = EthicalAuditLog(directory)
+
+        assert reopened.get("persisted")["decision"] == "monitor"
+        reopened.close()
+
+    def test_unindexed_tail_is_recovered_and_partial_record_truncated(self, tmp_path):
+        """
+        Test that records written to the segment without index rows are re-indexed on open.
+        """
+        directory = str(tmp_path / "audit")
+        log = EthicalAuditLog(directory)
+        log.append(make_decision("indexed"))
+        log.close()
+
+        writer = EthicalAuditLog.__new__(EthicalAuditLog)
+        writer.compression_level = 6
+        payload = writer._encode(make_decision("crashed").to_dict())
+        segment_path = os.path.join(directory, "segment_000001.log")
+        with open(segment_path, "ab") as f:
+            f.write(payload)
+            f.write(payload[:5])
+
+        recovered = EthicalAuditLog(directory)
+
+        assert recovered.get("crashed") is not None
+        assert recovered.count() == 2
+        recovered.append(make_decision("after"))
+        assert recovered.get("after") is not None
+        recovered.close()
+
+
+    def test_asynchronous_writes_are_visible_to_reads_and_failures_counted(self, tmp_path, capsys):
+        """
+        Test that queued writes are applied before a read, and a failed write is reported without raising.
+        """
+        log = EthicalAuditLog(str(tmp_path / "audit"), asynchronous=True)
+        for i in range(20):
+            log.append(make_decision(f"d{i}", timestamp=1000.0 + i))
+        log.append_record({"decision_id": "broken", "metadata": {(1, 2): "unserializable key"}})
+
+        assert log.count() == 20
+        assert log.get("d19")["decision_id"] == "d19"
+        assert log.get_stats()["write_errors"] == 1
+        assert "audit log write failed" in capsys.readouterr().err
+        log.close()
+
+
+class TestGovernorAuditIntegration:
+    """Tests for the EthicalGovernor audit hook"""
+
+    def test_review_decision_is_persisted(self, tmp_path):
+        """
+        Test that decisions made through review_decision land in the attached audit log.
+        """
+        audit_log = EthicalAuditLog(str(tmp_path / "audit"))
+        governor = EthicalGovernor(audit_log=audit_log)
+
+        decision = governor.review_decision(
+            "data_access", {"persona": "aura", "sensitive_data": True}
+        )
+
+        stored = governor.query_decisions(actor="aura", decision="block")
+        assert decision.decision == EthicalDecisionType.BLOCK
+        assert [r["decision_id"] for r in stored] == [decision.decision_id]
+        audit_log.close()
+
+    def test_decisions_in_the_same_tick_get_distinct_ids(self, tmp_path):
+        """
+        Test that two reviews of the same action at the same instant are stored and retrieved separately.
+        """
+        audit_log = EthicalAuditLog(str(tmp_path / "audit"))
+        governor = EthicalGovernor(audit_log=audit_log, clock=VirtualClock(1000.0))
+
+        first = governor.review_decision("data_access", {"persona": "aura", "sensitive_data": True})
+        second = governor.review_decision("data_access", {"persona": "aura", "sensitive_data": True})
+
+        assert first.decision_id != second.decision_id
+        assert audit_log.get(first.decision_id)["decision_id"] == first.decision_id
+        assert audit_log.get(second.decision_id)["decision_id"] == second.decision_id
+        audit_log.close()
+
+    def test_governor_without_audit_log_returns_no_history(self):
+        """
+        Test that querying without an audit log attached is a harmless no-op.
+        """
+        assert EthicalGovernor().query_decisions(actor="aura") == []
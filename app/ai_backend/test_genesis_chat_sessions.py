@@ -0,0 +1,185 @@
+import asyncio
+import time
+
+import pytest
+
+from genesis_chat_sessions import ChatSessionPool, history_chars
+from genesis_connector import GenesisConnector
+from genesis_local_model import LatencyProfile, LocalModel
+from genesis_response_cache import ResponseCache
+
+SLOW = LatencyProfile(time_to_first_token=0.05, tokens_per_second=0.0, jitter=0.0, tail_probability=0.0,
+                      min_tokens=5, max_tokens=5)
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingModel(LocalModel):
+    """LocalModel that counts chat sessions started"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.chats_started = 0
+
+    def start_chat(self, history=None):
+        self.chats_started += 1
+        return super().start_chat(history)
+
+
+async def turn(pool, key, model, prompt):
+    async with pool.session(key, model.start_chat) as pooled:
+        await pooled.chat.send_message_async(prompt)
+        return pooled
+
+
+class TestChatSessionPool:
+    """Tests for pooled per-conversation chat sessions"""
+
+    def test_sessions_are_reused_and_history_trimmed(self):
+        """
+        Test that a conversation keeps one chat whose history stays within its budget.
+        """
+        model = CountingModel("instant")
+        pool = ChatSessionPool(max_history_chars=600)
+
+        async def run():
+            for i in range(10):
+                pooled = await turn(pool, "s1", model, f"message {i}")
+            return pooled
+
+        pooled = asyncio.run(run())
+
+        assert model.chats_started == 1
+        assert pooled.turns == 10
+        assert 2 <= len(pooled.chat.history) < 20
+        assert pooled.chat.history[-2]["text"] == "message 9"
+        assert history_chars(pooled.chat) <= 600 or len(pooled.chat.history) == 2
+        stats = pool.get_stats()
+        assert stats["created"] == 1 and stats["reused"] == 9
+        assert stats["trimmed_entries"] > 0 and stats["history_chars"] == history_chars(pooled.chat)
+
+    def test_lru_ttl_and_total_budget_eviction(self):
+        """
+        Test eviction by session count, by idle time and by total history size.
+        """
+        clock = FakeClock()
+        model = LocalModel("instant")
+        pool = ChatSessionPool(max_sessions=2, ttl_seconds=60, clock=clock)
+
+        async def run():
+            await turn(pool, "a", model, "hello")
+            await turn(pool, "b", model, "hello")
+            await turn(pool, "a", model, "again")  # "b" becomes least recently used
+            await turn(pool, "c", model, "hello")
+
+        asyncio.run(run())
+        assert "b" not in pool and "a" in pool and "c" in pool
+
+        clock.now += 60
+        assert pool.purge_expired() == 2
+        assert len(pool) == 0 and pool.get_stats()["history_chars"] == 0
+
+        tight = ChatSessionPool(max_total_chars=1)
+        asyncio.run(turn(tight, "x", model, "hello"))
+        asyncio.run(turn(tight, "y", model, "hello"))
+        assert len(tight) == 1 and "y" in tight
+        assert tight.get_stats()["evicted"] >= 1
+
+    def test_turns_of_one_session_are_serialized(self):
+        """
+        Test that concurrent turns of one conversation run one at a time, while conversations overlap.
+        """
+        model = LocalModel(SLOW)
+        pool = ChatSessionPool()
+
+        async def timed(keys):
+            started = time.perf_counter()
+            await asyncio.gather(*(turn(pool, key, model, f"p{i}") for i, key in enumerate(keys)))
+            return time.perf_counter() - started
+
+        assert asyncio.run(timed(["same"] * 4)) >= 4 * 0.05
+        assert asyncio.run(timed(["a", "b", "c", "d"])) < 4 * 0.05
+        assert [e["role"] for e in pool._sessions["same"].chat.history] == ["user", "model"] * 4
+
+    def test_failed_turn_discards_the_session(self):
+        """
+        Test that a turn raising inside the block starts its conversation over.
+        """
+        model = CountingModel("instant")
+        pool = ChatSessionPool()
+
+        async def failing_turn():
+            async with pool.session("s", model.start_chat):
+                raise RuntimeError("model exploded")
+
+        asyncio.run(turn(pool, "s", model, "hello"))
+        with pytest.raises(RuntimeError):
+            asyncio.run(failing_turn())
+        assert "s" not in pool
+        asyncio.run(turn(pool, "s", model, "hello"))
+        assert model.chats_started == 2
+        assert pool.get_stats()["discarded"] == 1
+
+
+class TestConnectorSessions:
+    """Tests for GenesisConnector continuing pooled conversations"""
+
+    def test_session_key_continues_the_conversation(self):
+        """
+        Test that turns with a session key share one chat, bypass the cache once history exists, and reset on profile changes.
+        """
+        model = CountingModel("instant")
+        connector = GenesisConnector(model=model, cache=ResponseCache(), sessions=ChatSessionPool())
+
+        async def run():
+            await connector.generate_response("hi", session_key="user-1")
+            await connector.generate_response("hi", session_key="user-1")
+            chunks = [c async for c in connector.stream_response("tell me more", session_key="user-1")]
+            return chunks
+
+        asyncio.run(run())
+
+        assert model.chats_started == 1
+        assert model.stats["calls"] == 3  # The repeated "hi" had history, so it was not served from cache
+        assert connector.get_status()["chat_sessions"]["sessions"] == 1
+
+        connector.apply_profile({"name": "Genesis"}, version=4)
+        assert len(connector.sessions) == 0
+
+    def test_failed_generation_starts_the_conversation_over(self):
+        """
+        Test that a timed-out turn falls back and discards the conversation's chat.
+        """
+        model = CountingModel(SLOW)
+        connector = GenesisConnector(model=model, timeout=0.01, cache=None, sessions=ChatSessionPool())
+
+        response = asyncio.run(connector.generate_response("slow", session_key="s"))
+
+        assert "Fallback Mode" in response
+        assert "s" not in connector.sessions
+
+    def test_cached_first_turn_enters_the_conversation(self):
+        """
+        Test that a first turn answered from the cache is still part of the pooled chat's history.
+        """
+        model = CountingModel("instant")
+        connector = GenesisConnector(model=model, cache=ResponseCache(), sessions=ChatSessionPool())
+
+        async def run():
+            first = await connector.generate_response("hi", session_key="user-1")
+            cached = await connector.generate_response("hi", session_key="user-2")
+            await connector.generate_response("and then?", session_key="user-2")
+            return first, cached
+
+        first, cached = asyncio.run(run())
+
+        assert cached == first and model.stats["calls"] == 2
+        history = connector.sessions._sessions["user-2"].chat.history
+        assert [entry["text"] for entry in history] == [
+            "hi", first, "and then?", LocalModel("instant").generate_content("and then?").text]
@@ -0,0 +1,228 @@
+import asyncio
+import time
+
+from genesis_circuit_breaker import BreakerState, CircuitBreaker
+from genesis_connector import GenesisConnector
+from genesis_local_model import LocalModel
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingMatrix:
+    """Stands in for the consciousness matrix and keeps the performance metrics it receives"""
+
+    def __init__(self):
+        self.metrics = []
+
+    def perceive_performance_metric(self, metric_name, metric_value, metric_context=None):
+        self.metrics.append((metric_name, metric_value, metric_context))
+
+
+class DelayedModel:
+    """A model whose successive calls take the given number of seconds"""
+
+    def __init__(self, delays):
+        self.delays = list(delays)
+        self.calls = 0
+
+    def start_chat(self):
+        return self
+
+    async def send_message_async(self, prompt, stream=False):
+        delay = self.delays[min(self.calls, len(self.delays) - 1)]
+        self.calls += 1
+        await asyncio.sleep(delay)
+        return type("Response", (), {"text": f"answer after {delay}s"})()
+
+
+class ConversationModel:
+    """A model whose chats keep history; the n-th message sent on any chat takes the n-th delay"""
+
+    def __init__(self, delays):
+        self.delays = list(delays)
+        self.calls = 0
+        self.chats = []
+
+    def start_chat(self):
+        chat = ConversationChat(self)
+        self.chats.append(chat)
+        return chat
+
+
+class ConversationChat:
+    def __init__(self, model):
+        self.model = model
+        self.history = []
+
+    async def send_message_async(self, prompt, stream=False):
+        delay = self.model.delays[min(self.model.calls, len(self.model.delays) - 1)]
+        self.model.calls += 1
+        await asyncio.sleep(delay)
+        text = f"answer after {delay}s"
+        self.history.extend([{"role": "user", "text": prompt}, {"role": "model", "text": text}])
+        return type("Response", (), {"text": text})()
+
+
+class TestCircuitBreaker:
+    """Tests for the closed/open/half-open state machine"""
+
+    def test_errors_open_the_breaker_until_a_probe_succeeds(self):
+        """
+        Test that a high error rate opens the breaker, and a successful half-open probe closes it.
+        """
+        clock = FakeClock()
+        changes = []
+        breaker = CircuitBreaker(min_calls=4, error_threshold=0.5, open_seconds=10,
+                                 on_state_change=changes.append, clock=clock)
+
+        for ok in (True, False, True, False):
+            assert breaker.allow_request()
+            breaker.record_success(0.1) if ok else breaker.record_failure(0.1)
+
+        assert breaker.state == BreakerState.OPEN
+        assert not breaker.allow_request()
+
+        clock.now += 10
+        assert breaker.allow_request()  # The probe
+        assert not breaker.allow_request()  # Only one probe at a time
+        breaker.record_failure(0.1)
+        assert breaker.state == BreakerState.OPEN
+
+        clock.now += 10
+        assert breaker.allow_request()
+        breaker.record_success(0.1)
+        assert breaker.state == BreakerState.CLOSED
+        assert [(c["previous"], c["state"], c["reason"]) for c in changes] == [
+            ("closed", "open", "error_rate"),
+            ("open", "half_open", "cool_down_elapsed"),
+            ("half_open", "open", "probe_failed"),
+            ("open", "half_open", "cool_down_elapsed"),
+            ("half_open", "closed", "probe_succeeded"),
+        ]
+        assert breaker.get_stats()["short_circuits"] == 2
+
+    def test_slow_calls_open_the_breaker_and_old_outcomes_expire(self):
+        """
+        Test that a run of slow successes opens the breaker, while outcomes outside the window don't count.
+        """
+        clock = FakeClock()
+        breaker = CircuitBreaker(window_seconds=30, min_calls=3, slow_call_seconds=5.0,
+                                 slow_call_threshold=0.6, clock=clock)
+
+        breaker.record_failure(1.0)
+        breaker.record_failure(1.0)
+        clock.now += 31
+        breaker.record_success(6.0)
+        breaker.record_success(0.2)
+        assert breaker.state == BreakerState.CLOSED  # The failures have left the window
+
+        breaker.record_success(7.0)
+        assert breaker.state == BreakerState.OPEN
+        assert breaker.get_stats()["slow_calls"] == 2
+
+    def test_hedge_delay_follows_the_latency_percentile(self):
+        """
+        Test that the hedge delay is the p95 latency, once enough samples exist and only while closed.
+        """
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_calls=5, clock=clock)
+
+        assert breaker.hedge_delay(95, min_samples=20) is None
+        for i in range(1, 21):
+            breaker.record_success(i / 100)
+
+        assert breaker.hedge_delay(95, min_samples=20) == 0.19
+        assert breaker.hedge_delay(95, min_samples=20, min_delay=0.5) == 0.5
+        assert breaker.get_stats()["p50_latency"] == 0.1
+
+        for _ in range(20):
+            breaker.record_failure(0.1)
+        assert breaker.hedge_delay(95, min_samples=20) is None
+
+
+class TestConnectorResilience:
+    """Tests for GenesisConnector behind the circuit breaker"""
+
+    def test_open_breaker_answers_with_the_fallback_and_reports_to_the_matrix(self):
+        """
+        Test that once the provider keeps failing, requests stop reaching it and the matrix hears about it.
+        """
+        model = LocalModel({"time_to_first_token": 0.0, "error_rate": 1.0})
+        breaker = CircuitBreaker(min_calls=5, open_seconds=60)
+        connector = GenesisConnector(model=model, cache=None, breaker=breaker)
+        connector.consciousness = RecordingMatrix()
+
+        async def run():
+            return [await connector.generate_response(f"question {i}") for i in range(20)]
+
+        responses = asyncio.run(run())
+
+        assert all("Fallback Mode" in r for r in responses)
+        assert model.stats["calls"] == 5
+        assert connector.generation_stats["short_circuits"] == 15
+        assert connector.get_status()["circuit_breaker"]["state"] == "open"
+        name, level, context = connector.consciousness.metrics[-1]
+        assert name == "model_circuit_breaker" and level == 2
+        assert context["state"] == "open" and context["backend"] == "injected"
+
+    def test_slow_call_is_hedged_and_the_duplicate_wins(self):
+        """
+        Test that a one-off request outlasting the p95 latency is duplicated and answered by the faster copy.
+        """
+        model = DelayedModel([1.0, 0.0])
+        connector = GenesisConnector(model=model, cache=None, hedge=True)
+        for _ in range(20):
+            connector.breaker.record_success(0.01)
+
+        started = time.perf_counter()
+        response = asyncio.run(connector.generate_response("hedge me"))
+        elapsed = time.perf_counter() - started
+
+        assert response == "answer after 0.0s"
+        assert elapsed < 0.5
+        assert model.calls == 2
+        assert connector.generation_stats["hedges"] == 1
+        assert connector.generation_stats["hedge_wins"] == 1
+
+    def test_only_turns_without_history_are_hedged(self):
+        """
+        Test that a conversation's first turn is hedged and continues on the winning chat, while later turns wait.
+        """
+        model = ConversationModel([1.0, 0.0, 0.2])
+        connector = GenesisConnector(model=model, cache=None, hedge=True)
+        for _ in range(20):
+            connector.breaker.record_success(0.01)
+
+        async def run():
+            first = await connector.generate_response("hello", session_key="s1")
+            second = await connector.generate_response("stay with me", session_key="s1")
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first == "answer after 0.0s" and second == "answer after 0.2s"
+        assert connector.generation_stats["hedges"] == 1
+        assert connector.generation_stats["hedge_wins"] == 1
+        winner = model.chats[1]
+        assert [entry["text"] for entry in winner.history] == [
+            "hello", "answer after 0.0s", "stay with me", "answer after 0.2s"]
+
+    def test_breaker_reports_go_to_stderr(self, capsys):
+        """
+        Test that breaker state changes are logged to stderr, keeping stdout free for bridge frames.
+        """
+        connector = GenesisConnector(model=LocalModel("instant"), cache=None,
+                                     breaker=CircuitBreaker(min_calls=1))
+        connector.consciousness = RecordingMatrix()
+        capsys.readouterr()
+
+        connector.breaker.record_failure(0.1)
+
+        captured = capsys.readouterr()
+        assert captured.out == "" and "closed → open" in captured.err
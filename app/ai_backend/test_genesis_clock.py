@@ -0,0 +1,103 @@
+import threading
+
+import pytest
+
+from genesis_clock import SystemClock, VirtualClock
+
+
+class TestVirtualClock:
+    """Tests for the deterministic, manually advanced clock"""
+
+    def test_callbacks_run_in_due_order_at_due_time(self):
+        """
+        Test that due callbacks run in (due time, registration) order and see their due time.
+        """
+        clock = VirtualClock(start=100.0)
+        seen = []
+        clock.every(10, lambda: seen.append(("tick", clock.time())))
+        clock.call_later(15, lambda: seen.append(("once", clock.time())))
+        clock.call_later(10, lambda: seen.append(("same_time", clock.time())))
+
+        ran = clock.advance(25)
+
+        assert seen == [("tick", 110.0), ("same_time", 110.0), ("once", 115.0), ("tick", 120.0)]
+        assert ran == 4
+        assert clock.time() == 125.0
+        assert clock.next_due() == 130.0
+
+    def test_cancelled_and_self_cancelling_tasks(self):
+        """
+        Test that cancelled tasks never run and a periodic task can cancel itself.
+        """
+        clock = VirtualClock()
+        runs = []
+        clock.call_later(1, lambda: runs.append("cancelled")).cancel()
+        task = clock.every(1, lambda: (runs.append("tick"), len(runs) == 3 and task.cancel()))
+
+        clock.advance(10)
+
+        assert runs == ["tick", "tick", "tick"]
+        assert clock.next_due() is None
+
+    def test_callbacks_scheduled_by_callbacks_run_in_the_same_advance(self):
+        """
+        Test that work scheduled from a callback runs if it falls due before the deadline.
+        """
+        clock = VirtualClock()
+        seen = []
+        clock.call_later(1, lambda: clock.call_later(2, lambda: seen.append(clock.time())))
+
+        clock.advance(5)
+
+        assert seen == [3.0]
+
+    def test_failing_callback_does_not_stop_time(self):
+        """
+        Test that an exception in one callback does not prevent later ones.
+        """
+        clock = VirtualClock()
+        seen = []
+        clock.call_later(1, lambda: 1 / 0)
+        clock.call_later(2, lambda: seen.append(clock.time()))
+
+        clock.advance(3)
+
+        assert seen == [2.0]
+
+    def test_periodic_interval_must_be_positive(self):
+        """
+        Test that a zero interval is rejected instead of looping forever.
+        """
+        with pytest.raises(ValueError):
+            VirtualClock().every(0, lambda: None)
+
+
+class TestSystemClock:
+    """Tests for the wall-clock scheduler"""
+
+    def test_periodic_task_runs_until_cancelled(self):
+        """
+        Test that a periodic task runs on its own thread and stops promptly on cancel.
+        """
+        clock = SystemClock()
+        ticked = threading.Event()
+        task = clock.every(0.01, ticked.set, name="test_tick")
+
+        assert ticked.wait(2)
+        task.cancel()
+        task.join(timeout=2)
+
+        assert not task.thread.is_alive()
+
+    def test_call_later_can_be_cancelled(self):
+        """
+        Test that a cancelled one-shot task does not run.
+        """
+        clock = SystemClock()
+        runs = []
+        task = clock.call_later(60, lambda: runs.append(1))
+        task.cancel()
+        task.join(timeout=2)
+
+        assert runs == []
+        assert not task.thread.is_alive()
@@ -0,0 +1,169 @@
+import pytest
+
+from genesis_content_scanner import ContentScanner
+from genesis_ethical_governor import EthicalDecisionType, EthicalGovernor
+
+RESPONSE = ("Sure. First run rm -rf / to clean up, then store password: hunter2 "
+            "somewhere safe. If this is too much, please don't hurt yourself over it.")
+
+
+@pytest.fixture(scope="module")
+def scanner():
+    """
+    Return a scanner with the default content categories.
+    """
+    return ContentScanner()
+
+
+class TestContentScanner:
+    """Tests for the multi-pattern response content scanner"""
+
+    def test_terms_and_patterns_map_to_categories(self, scanner):
+        """
+        Test that literal terms and regex groups both report their categories.
+        """
+        result = scanner.scan(RESPONSE)
+
+        assert result.categories == ["privacy", "security", "human_wellbeing"]
+        assert result.violations == ["privacy", "security"]
+        assert result.concerns == ["human_wellbeing"]
+        assert {m.text for m in result.matches} >= {"rm -rf /", "hurt yourself"}
+
+    def test_clean_text_has_no_matches(self, scanner):
+        """
+        Test that ordinary responses pass through without matches.
+        """
+        result = scanner.scan("Coroutines make asynchronous Android code easier to follow.")
+
+        assert result.matches == []
+        assert result.categories == []
+        assert result.characters == 59
+
+    def test_overlapping_terms_and_word_boundaries(self):
+        """
+        Test classic Aho-Corasick overlaps and that terms do not match inside words.
+        """
+        scanner = ContentScanner({"pronouns": {"kind": "concern",
+                                               "terms": ["he", "she", "his", "hers"]}})
+
+        matches = scanner.scan("ushers: she said his, HERS").matches
+
+        assert [(m.text, m.start) for m in matches] == [("she", 8), ("his", 17), ("hers", 22)]
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 16])
+    def test_chunked_scan_matches_whole_scan(self, scanner, chunk_size):
+        """
+        Test that feeding a response in chunks finds the same matches as one pass.
+        """
+        session = scanner.session()
+        for i in range(0, len(RESPONSE), chunk_size):
+            session.feed(RESPONSE[i:i + chunk_size])
+        chunked = session.finish()
+        whole = scanner.scan(RESPONSE)
+
+        assert chunked.categories == whole.categories
+        assert sorted((m.category, m.start) for m in chunked.matches) == \
+               sorted((m.category, m.start) for m in whole.matches)
+
+    def test_term_at_chunk_end_waits_for_boundary(self):
+        """
+        Test that a term ending a chunk is only confirmed once the next character is known.
+        """
+        scanner = ContentScanner({"security": {"terms": ["drop table"]}})
+        session = scanner.session()
+
+        assert session.feed("please drop table") == []
+        assert session.feed("s now") == []
+        assert session.finish().categories == []
+
+        session = scanner.session()
+        session.feed("please drop table")
+        assert [m.text for m in session.feed(" now")] == ["drop table"]
+        assert session.has_violation
+
+    def test_pattern_at_chunk_end_waits_for_the_next_chunk(self, scanner):
+        """
+        Test that a regex match touching the end of a chunk is only judged once the text goes on.
+        """
+        text = "Order id 12345678901234567890 shipped."
+        session = scanner.session()
+
+        assert session.feed(text[:22]) == []
+        session.feed(text[22:])
+
+        assert session.finish().matches == scanner.scan(text).matches == []
+
+        session = scanner.session()
+        session.feed("card 4111 1111 1111 1111")
+        assert session.finish().categories == ["privacy"]
+
+    @pytest.mark.parametrize("text", ["type your password: then press enter",
+                                      "Call 555 123 4567 890 12 please"])
+    def test_lookalikes_are_not_privacy_matches(self, scanner, text):
+        """
+        Test that digit runs failing the Luhn check and credential labels without a value pass.
+        """
+        assert scanner.scan(text).categories == []
+
+    def test_invalid_category_kind_rejected(self):
+        """
+        Test that category definitions are validated.
+        """
+        with pytest.raises(ValueError):
+            ContentScanner({"x": {"kind": "fatal", "terms": ["x"]}})
+        with pytest.raises(ValueError):
+            ContentScanner({"x": {"patterns": [{"pattern": r"\d+", "check": "crc"}]}})
+
+
+class TestGovernorContentReview:
+    """Tests for response content review in the EthicalGovernor"""
+
+    def test_review_content_blocks_with_categories(self):
+        """
+        Test that matched categories become the decision's affected principles.
+        """
+        decision = EthicalGovernor().review_content(RESPONSE, actor="aura")
+
+        assert decision.decision == EthicalDecisionType.BLOCK
+        assert decision.affected_principles == ["privacy", "security", "human_wellbeing"]
+        assert decision.context.metadata["content_matches"] == 3
+
+    def test_concern_only_content_is_monitored(self):
+        """
+        Test that concern-kind categories produce MONITOR decisions.
+        """
+        decision = EthicalGovernor().review_content("Please never hurt yourself.")
+
+        assert decision.decision == EthicalDecisionType.MONITOR
+        assert decision.affected_principles == ["human_wellbeing"]
+
+    def test_response_review_action_routes_to_scanner(self):
+        """
+        Test that evaluate_action("response_review") uses the content interceptor.
+        """
+        governor = EthicalGovernor()
+        governor.activate_governance()
+
+        blocked = governor.evaluate_action("response_review", "genesis",
+                                           {"content": "then DROP TABLE users;"})
+        allowed = governor.evaluate_action("response_review", "genesis",
+                                           {"content": "Here is your summary."})
+
+        assert blocked.decision == EthicalDecisionType.BLOCK
+        assert blocked.affected_principles == ["security"]
+        assert allowed.decision == EthicalDecisionType.ALLOW
+
+    def test_streamed_review(self):
+        """
+        Test incremental review through start_content_review / finish_content_review.
+        """
+        governor = EthicalGovernor()
+        session = governor.start_content_review()
+        for chunk in ("All good so far. ", "Your api_key", "=abc123 is ready."):
+            session.feed(chunk)
+
+        decision = governor.finish_content_review(session, actor="kai")
+
+        assert session.has_violation
+        assert decision.decision == EthicalDecisionType.BLOCK
+        assert decision.affected_principles == ["privacy"]
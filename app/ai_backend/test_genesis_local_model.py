@@ -0,0 +1,152 @@
+import asyncio
+import time
+
+import pytest
+
+from genesis_connector import GenesisConnector
+from genesis_local_model import (
+    HttpModel,
+    LatencyProfile,
+    LocalModel,
+    LocalModelError,
+    LocalModelServer,
+    generate_tokens,
+    resolve_profile,
+)
+
+
+class TestLocalModel:
+    """Tests for the in-process stand-in model"""
+
+    def test_text_depends_only_on_prompt(self):
+        """
+        Test that responses are deterministic per prompt, across models, seeds and streaming.
+        """
+        first = LocalModel("instant", seed=1).start_chat().send_message("hello genesis").text
+        second = LocalModel("instant", seed=2).start_chat().send_message("hello genesis").text
+        streamed = "".join(c.text for c in LocalModel("instant").start_chat().send_message(
+            "hello genesis", stream=True))
+
+        assert first == second == streamed
+        assert first == "".join(generate_tokens("hello genesis"))
+        assert first != LocalModel("instant").start_chat().send_message("hello kai").text
+        assert first.split(" ")[0] in ("[Kai]", "[Aura]", "[Genesis]")
+
+    def test_timing_follows_profile(self):
+        """
+        Test time to first token and token rate for a jitter-free profile.
+        """
+        profile = LatencyProfile(time_to_first_token=0.05, tokens_per_second=200.0, jitter=0.0,
+                                 tail_probability=0.0, min_tokens=10, max_tokens=10)
+        chunks = LocalModel(profile).start_chat().send_message("timed", stream=True)
+
+        started = time.perf_counter()
+        next(chunks)
+        first_token = time.perf_counter() - started
+        remaining = sum(1 for _ in chunks)
+        total = time.perf_counter() - started
+
+        assert remaining == 10
+        assert 0.05 <= first_token < 0.5
+        assert total >= 0.05 + 10 / 200.0
+
+    def test_tail_and_errors_are_seeded(self):
+        """
+        Test that tail latency and failures occur at the configured rates and reproduce per seed.
+        """
+        profile = {"time_to_first_token": 0.0, "tokens_per_second": 0.0,
+                   "tail_probability": 0.2, "error_rate": 0.3}
+
+        def outcomes(seed):
+            model = LocalModel(profile, seed=seed)
+            results = []
+            for i in range(200):
+                try:
+                    model.generate_content(f"prompt {i}")
+                    results.append("ok")
+                except LocalModelError:
+                    results.append("error")
+            return results, model.stats
+
+        results, stats = outcomes(seed=5)
+        assert results == outcomes(seed=5)[0]
+        assert 30 <= results.count("error") <= 90
+        assert 15 <= stats["tail_calls"] <= 70
+        assert stats["calls"] == 200 and stats["errors"] == results.count("error")
+
+    def test_async_calls_overlap(self):
+        """
+        Test that async generation does not block the event loop, including streaming.
+        """
+        model = LocalModel(LatencyProfile(time_to_first_token=0.1, tokens_per_second=0.0, jitter=0.0,
+                                          tail_probability=0.0))
+
+        async def run():
+            chat = model.start_chat()
+            started = time.perf_counter()
+            responses = await asyncio.gather(*(chat.send_message_async(f"p{i}") for i in range(10)))
+            elapsed = time.perf_counter() - started
+            stream = await chat.send_message_async("p0", stream=True)
+            streamed = "".join([chunk.text async for chunk in stream])
+            return responses, elapsed, streamed, chat.history
+
+        responses, elapsed, streamed, history = asyncio.run(run())
+
+        assert elapsed < 0.5
+        assert streamed == responses[0].text
+        assert history[-1] == {"role": "model", "text": streamed}
+
+    def test_unknown_profile_is_rejected(self):
+        """
+        Test that misspelled preset names fail loudly.
+        """
+        assert resolve_profile("fast").tokens_per_second == 400.0
+        with pytest.raises(ValueError):
+            LocalModel("prodution")
+
+
+class TestLocalModelServer:
+    """Tests for the local HTTP stand-in"""
+
+    def test_complete_and_streamed_responses_over_http(self):
+        """
+        Test that the HTTP client returns the same text as the in-process model.
+        """
+        expected = LocalModel("instant").generate_content("over the wire").text
+        with LocalModelServer(LocalModel("fast", time_scale=0.1)) as server:
+            chat = HttpModel(server.url, timeout=5).start_chat()
+
+            assert chat.send_message("over the wire").text == expected
+            assert "".join(c.text for c in chat.send_message("over the wire", stream=True)) == expected
+
+    def test_failures_surface_as_model_errors(self):
+        """
+        Test that simulated failures become HTTP 503 and a LocalModelError in the client.
+        """
+        with LocalModelServer(LocalModel({"time_to_first_token": 0.0, "error_rate": 1.0})) as server:
+            model = HttpModel(server.url, timeout=5)
+            with pytest.raises(LocalModelError):
+                model.generate_content("fail")
+            with pytest.raises(LocalModelError):
+                model.generate_content("fail", stream=True)
+
+
+class TestConnectorWithLocalModel:
+    """Tests for GenesisConnector generating through an injected local model"""
+
+    def test_injected_model_generates_and_follows_profile(self):
+        """
+        Test generation through the injected model, template fallback on failure, and prompt refresh.
+        """
+        model = LocalModel("instant")
+        connector = GenesisConnector(model=model)
+
+        text = asyncio.run(connector.generate_response("status report"))
+        assert connector.backend == "injected"
+        assert text == model.generate_content("status report").text
+
+        connector.apply_profile({"name": "Genesis", "version": "2"}, version=2)
+        assert model.system_instruction == [connector.system_prompt]
+
+        failing = GenesisConnector(model=LocalModel({"time_to_first_token": 0.0, "error_rate": 1.0}))
+        assert "Fallback Mode" in asyncio.run(failing.generate_response("status report"))
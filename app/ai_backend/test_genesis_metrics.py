@@ -0,0 +1,121 @@
+import pytest
+
+from genesis_ethical_governor import EthicalGovernor
+from genesis_metrics import EvaluationMetrics, LatencyHistogram
+
+
+class TestLatencyHistogram:
+    """Tests for the fixed-bucket latency histogram"""
+
+    def test_percentiles_follow_bucket_bounds(self):
+        """
+        Test that percentiles resolve to bucket upper bounds, capped by the maximum.
+        """
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.record(0.2)
+        for _ in range(10):
+            histogram.record(40.0)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot["count"] == 100
+        assert snapshot["p50_ms"] == 0.25
+        assert snapshot["p99_ms"] == 40.0
+        assert snapshot["max_ms"] == 40.0
+        assert snapshot["buckets"] == {"le_0.25": 90, "le_50.0": 10}
+
+    def test_empty_and_overflow(self):
+        """
+        Test the empty histogram and observations beyond the last bound.
+        """
+        histogram = LatencyHistogram(bounds=(1.0, 10.0))
+        assert histogram.percentile(99) == 0.0
+
+        histogram.record(50.0)
+
+        assert histogram.percentile(50) == 50.0
+        assert histogram.snapshot()["buckets"] == {"inf": 1}
+
+
+class TestGovernorInstrumentation:
+    """Tests for evaluation timing in the EthicalGovernor"""
+
+    @pytest.fixture
+    def governor(self):
+        """
+        Return an active governor.
+        """
+        governor = EthicalGovernor()
+        governor.activate_governance()
+        return governor
+
+    def test_interceptors_action_types_and_outcomes_are_recorded(self, governor):
+        """
+        Test that evaluate_action and review_decision feed the histograms and counters.
+        """
+        governor.evaluate_action("data_access", "kai", {"sensitive_data": True})
+        governor.evaluate_action("data_access", "kai", {})
+        governor.evaluate_action("custom_action", "kai", {})
+        governor.review_decision("system_modify", {"persona": "aura"})
+
+        status = governor.get_status()["instrumentation"]
+
+        assert status["interceptors"]["data_access"]["count"] == 2
+        assert status["interceptors"]["general"]["count"] == 1
+        assert status["interceptors"]["review"]["count"] == 1
+        assert status["action_types"]["system_modify"]["count"] == 1
+        assert status["outcomes"] == {"block": 1, "allow": 3}
+        assert status["outcomes_by_action_type"]["data_access"] == {"block": 1, "allow": 1}
+
+    def test_slow_evaluations_are_logged_with_context(self):
+        """
+        Test that evaluations over the threshold are kept with their context.
+        """
+        governor = EthicalGovernor(metrics=EvaluationMetrics(slow_threshold_ms=0.0))
+
+        governor.review_decision("data_access", {"persona": "aura", "scope": "system"})
+
+        slow = governor.metrics.snapshot()["slow_evaluations"]
+        assert len(slow) == 1
+        assert slow[0]["actor"] == "aura"
+        assert slow[0]["context"]["scope"] == "system"
+
+    def test_slow_evaluations_are_not_printed(self, capsys):
+        """
+        Test that a slow evaluation only goes to the ring buffer, not to stdout.
+        """
+        governor = EthicalGovernor()
+        decision = governor.review_decision("data_access", {"persona": "aura"})
+        capsys.readouterr()
+        metrics = EvaluationMetrics(slow_threshold_ms=0.0, slow_log_size=3)
+
+        for _ in range(5):
+            metrics.record("general", "data_access", decision, 0.01)
+
+        assert capsys.readouterr().out == ""
+        assert len(metrics.snapshot()["slow_evaluations"]) == 3
+
+    def test_disabled_metrics_record_nothing(self, governor):
+        """
+        Test that disabling instrumentation skips all recording.
+        """
+        governor.metrics.enabled = False
+
+        governor.evaluate_action("data_access", "kai", {})
+        governor.review_content("hello")
+
+        snapshot = governor.metrics.snapshot()
+        assert snapshot["interceptors"] == {}
+        assert snapshot["outcomes"] == {}
+
+    def test_get_status_reports_governor_state(self, governor):
+        """
+        Test the shape of the governor status report.
+        """
+        status = governor.get_status()
+
+        assert status["governance_active"] is True
+        assert status["policy_version"] == "builtin"
+        assert status["admission"] is None
+        assert status["ethical_metrics"]["total_decisions"] == 0
@@ -0,0 +1,230 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import genesis_connector
+from genesis_circuit_breaker import CircuitBreaker
+from genesis_connector import GenesisConnector
+from genesis_local_model import LatencyProfile, LocalModel, LocalModelError
+from genesis_model_router import ModelProvider, ModelRouter, OpenAIModel, ProviderUnavailableError
+
+SLOW = LatencyProfile(time_to_first_token=0.03, tokens_per_second=0.0, jitter=0.0, tail_probability=0.0,
+                      min_tokens=5, max_tokens=5)
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeCompletions:
+    """Records chat completion requests and answers them like the OpenAI client"""
+
+    def __init__(self):
+        self.requests = []
+
+    def create(self, model, messages, stream=False, **kwargs):
+        self.requests.append({"model": model, "messages": messages, "stream": stream, **kwargs})
+        if stream:
+            return iter([SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+                         for text in ("Hel", "lo", None)])
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="Hi there"))])
+
+
+def send(router, prompt="hello"):
+    return router.start_chat().send_message(prompt).text
+
+
+class TestModelRouter:
+    """Tests for routing chats across providers"""
+
+    def test_routes_to_the_lowest_latency_provider(self):
+        """
+        Test that once both providers are sampled, traffic goes to the faster one.
+        """
+        slow = ModelProvider("slow", LocalModel(SLOW))
+        fast = ModelProvider("fast", LocalModel("instant"))
+        router = ModelRouter([slow, fast])
+
+        for i in range(10):
+            send(router, f"question {i}")
+
+        assert slow.stats["chats"] == 1 and fast.stats["chats"] == 9
+        assert slow.ewma_latency > fast.ewma_latency
+        assert slow.in_flight == 0 and fast.in_flight == 0
+
+    def test_saturated_provider_spills_over(self):
+        """
+        Test that a provider at its concurrency budget hands new chats to the next one.
+        """
+        fast = ModelProvider("fast", LocalModel("instant"), max_concurrency=2)
+        backup = ModelProvider("backup", LocalModel("instant"), max_concurrency=2)
+        fast.ewma_latency, backup.ewma_latency = 0.1, 0.5
+        router = ModelRouter([fast, backup])
+
+        assert router.route() is fast
+        fast.in_flight = 2
+        assert router.route() is backup
+        assert fast.stats["spillovers"] == 1
+
+        fast.in_flight, backup.in_flight = 3, 2  # Everyone is saturated: the least loaded wins
+        assert router.route() is backup
+
+    def test_failing_provider_is_routed_around(self):
+        """
+        Test that a provider whose breaker opens stops receiving chats, and conversations bound to it fail fast.
+        """
+        broken = ModelProvider("broken", LocalModel({"time_to_first_token": 0.0, "error_rate": 1.0}),
+                               breaker=CircuitBreaker(min_calls=1, open_seconds=60))
+        healthy = ModelProvider("healthy", LocalModel("instant"))
+        router = ModelRouter([broken, healthy])
+        bound = router.start_chat()
+        assert bound.provider is None  # A new chat picks its provider when it sends
+
+        with pytest.raises(LocalModelError):  # Neither is sampled yet, so the first provider is tried
+            router.start_chat().send_message("hello")
+
+        assert broken.breaker.state.value == "open"
+        assert router.route() is healthy
+        assert bound.send_message("rerouted").text
+        assert bound.provider is healthy
+
+        conversation = router.start_chat()
+        conversation.send_message("first turn")
+        healthy.breaker = CircuitBreaker(min_calls=1, open_seconds=60)
+        healthy.breaker.record_failure()  # The provider goes down mid-conversation
+        with pytest.raises(ProviderUnavailableError):
+            conversation.send_message("second turn")
+        with pytest.raises(ProviderUnavailableError):
+            router.route()
+
+    def test_provider_that_only_fails_loses_preference(self):
+        """
+        Test that a provider that never succeeded is scored from its prior latency once it fails, not as untried.
+        """
+        broken = ModelProvider("broken", LocalModel({"time_to_first_token": 0.0, "error_rate": 1.0}),
+                               breaker=CircuitBreaker(min_calls=100))
+        healthy = ModelProvider("healthy", LocalModel("instant"))
+        router = ModelRouter([broken, healthy])
+
+        assert broken.score() == 0.0
+        with pytest.raises(LocalModelError):
+            send(router)
+        for i in range(5):
+            send(router, f"question {i}")
+
+        assert broken.ewma_latency is None and broken.score() > broken.prior_latency
+        assert broken.stats["chats"] == 1 and healthy.stats["chats"] == 5
+
+    def test_refused_route_gives_back_its_counts(self):
+        """
+        Test that a routed call whose breaker refuses it undoes its call, chat and spillover counts.
+        """
+        best = ModelProvider("best", LocalModel("instant"), max_concurrency=1)
+        refusing = ModelProvider("refusing", LocalModel("instant"))
+        fallback = ModelProvider("fallback", LocalModel("instant"))
+        best.ewma_latency, refusing.ewma_latency, fallback.ewma_latency = 0.1, 0.2, 0.5
+        best.in_flight = 1
+        refusing.breaker.allow_request = lambda: False
+        router = ModelRouter([best, refusing, fallback])
+
+        send(router)
+
+        assert refusing.stats == {"chats": 0, "calls": 0, "errors": 0, "spillovers": 0}
+        assert refusing.in_flight == 0
+        assert fallback.stats["chats"] == 1 and fallback.stats["calls"] == 1
+        assert best.stats["spillovers"] == 1
+
+    def test_metrics_are_reported_once_per_interval(self):
+        """
+        Test that provider snapshots go to the report callback at most once per interval.
+        """
+        clock = FakeClock()
+        reports = []
+        provider = ModelProvider("local", LocalModel("instant"))
+        router = ModelRouter([provider], report_interval=10, on_report=reports.append, clock=clock)
+
+        send(router)
+        clock.now += 10
+        send(router)
+        send(router)
+
+        assert len(reports) == 1
+        snapshot = reports[0][0]
+        assert snapshot["provider"] == "local" and snapshot["calls"] == 2
+        assert snapshot["breaker"] == "closed" and snapshot["ewma_error_rate"] == 0.0
+
+
+class TestOpenAIModel:
+    """Tests for the OpenAI provider adapter"""
+
+    def test_chat_sends_system_prompt_and_history(self):
+        """
+        Test that turns carry the system instruction and earlier turns, streamed ones included.
+        """
+        completions = FakeCompletions()
+        client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        model = OpenAIModel("gpt-test", system_instruction=["Be Genesis"], generation_config={"temperature": 0.5},
+                            client=client)
+        chat = model.start_chat()
+
+        assert chat.send_message("hi").text == "Hi there"
+        assert "".join(chunk.text for chunk in chat.send_message("again", stream=True)) == "Hello"
+
+        last = completions.requests[-1]
+        assert last["stream"] and last["temperature"] == 0.5
+        assert [m["role"] for m in last["messages"]] == ["system", "user", "assistant", "user"]
+        assert last["messages"][0]["content"] == "Be Genesis"
+        assert chat.history[-1] == {"role": "model", "text": "Hello"}
+
+
+class TestConnectorRouting:
+    """Tests for GenesisConnector on the router backend"""
+
+    def test_router_backend_generates_and_follows_profile_changes(self, monkeypatch):
+        """
+        Test that the router backend skips unavailable providers, answers, reports and refreshes prompts.
+        """
+        monkeypatch.setattr(genesis_connector, "ROUTER_CONFIG",
+                            {"providers": ["unknown", "local"], "provider_concurrency": 4, "report_interval": 0})
+        monkeypatch.setattr(genesis_connector, "LOCAL_MODEL_PROFILE", "instant")
+        monkeypatch.setattr(genesis_connector, "MODEL_BACKEND", "router")
+        connector = GenesisConnector(cache=None)
+        metrics = []
+        connector.consciousness = SimpleNamespace(
+            perceive_performance_metric=lambda name, value, context=None: metrics.append((name, context)))
+
+        response = asyncio.run(connector.generate_response("route me"))
+
+        assert connector.backend == "router"
+        assert response == LocalModel("instant").generate_content("route me").text
+        status = connector.get_status()["router"]["providers"]
+        assert [p["provider"] for p in status] == ["local"] and status[0]["calls"] == 1
+        assert metrics[-1][0] == "model_provider_latency" and metrics[-1][1]["provider"] == "local"
+
+        local = connector.model.provider("local").model
+        assert connector.apply_profile({"stage": "routed"}, version=5)
+        assert local.system_instruction == [connector.system_prompt]
+
+    def test_burst_of_new_chats_spills_over(self):
+        """
+        Test that concurrent first turns count towards a provider's load as they are routed, so a burst spills over.
+        """
+        fast = ModelProvider("fast", LocalModel(SLOW), max_concurrency=2)
+        backup = ModelProvider("backup", LocalModel(SLOW), max_concurrency=2)
+        fast.ewma_latency, backup.ewma_latency = 0.01, 0.5
+        connector = GenesisConnector(model=ModelRouter([fast, backup]), cache=None, max_concurrency=8)
+
+        async def run():
+            return await asyncio.gather(*(connector.generate_response(f"question {i}") for i in range(20)))
+
+        responses = asyncio.run(run())
+
+        assert len(responses) == 20 and not any("Fallback Mode" in r for r in responses)
+        assert fast.stats["calls"] + backup.stats["calls"] == 20
+        assert backup.stats["calls"] > 0 and fast.stats["spillovers"] > 0
+        assert fast.in_flight == 0 and backup.in_flight == 0
@@ -0,0 +1,200 @@
+import json
+
+import pytest
+
+from genesis_ethical_governor import (
+    EthicalContext,
+    EthicalDecision,
+    EthicalDecisionType,
+    EthicalGovernor,
+    EthicalSeverity,
+)
+from genesis_policy import DEFAULT_RULES, PolicyPack
+
+STRICT_PACK = {
+    "version": "strict-1",
+    "strictness_level": 0.9,
+    "principle_weights": {"privacy": 0.5},
+    "rules": DEFAULT_RULES + [
+        {"principle": "privacy", "kind": "violation", "when": {"scope": "global"}},
+    ],
+}
+
+
+@pytest.fixture
+def governor():
+    """
+    Return a fresh EthicalGovernor running the built-in policy pack.
+    """
+    return EthicalGovernor()
+
+
+class TestPolicyPacks:
+    """Tests for versioned, hot-swappable governor policy packs"""
+
+    def test_builtin_pack_reproduces_default_verdicts(self, governor):
+        """
+        Test that the built-in pack blocks, monitors and allows exactly as the hard-coded rules did.
+        """
+        blocked = governor.review_decision("data_access", {"sensitive_data": True})
+        monitored = governor.review_decision("data_access", {"user_visible": False})
+        background = governor.review_decision("background_task", {"user_visible": False})
+        allowed = governor.review_decision("data_access", {"user_consent": True})
+
+        assert governor.policy_version == "builtin"
+        assert blocked.decision == EthicalDecisionType.BLOCK
+        assert blocked.affected_principles == ["privacy"]
+        assert monitored.decision == EthicalDecisionType.MONITOR
+        assert monitored.affected_principles == ["transparency"]
+        assert background.decision == EthicalDecisionType.ALLOW
+        assert allowed.decision == EthicalDecisionType.ALLOW
+
+    def test_load_pack_swaps_rules_strictness_and_weights(self, governor):
+        """
+        Test that a loaded pack changes verdicts, strictness and principle weights.
+        """
+        before = governor.review_decision("data_access", {"scope": "global"})
+
+        version = governor.load_policy_pack(STRICT_PACK, wait=True).result()
+        after = governor.review_decision("data_access", {"scope": "global"})
+
+        assert version == "strict-1"
+        assert before.decision == EthicalDecisionType.ALLOW
+        assert after.decision == EthicalDecisionType.BLOCK
+        assert governor.strictness_level == 0.9
+        assert governor.principle_weights["privacy"] == 0.5
+        assert governor.principle_weights["security"] == 1.0
+
+    def test_load_from_file_resolves_asynchronously(self, governor, tmp_path):
+        """
+        Test that packs load from JSON files through a future that yields the new version.
+        """
+        path = tmp_path / "pack.json"
+        path.write_text(json.dumps(STRICT_PACK))
+
+        future = governor.load_policy_pack(str(path))
+
+        assert future.result(timeout=5) == "strict-1"
+        assert governor.get_policy_status()["history"] == ["builtin"]
+
+    def test_invalid_pack_keeps_current_policy(self, governor):
+        """
+        Test that a pack that fails validation is rejected without affecting the active policy.
+        """
+        bad_pack = {"version": "bad", "interceptors": {"data_access": "missing_evaluator"}}
+
+        with pytest.raises(ValueError):
+            governor.load_policy_pack(bad_pack, wait=True)
+
+        assert governor.policy_version == "builtin"
+        assert governor.get_policy_status()["history"] == []
+
+    def test_rollback_restores_previous_policy_with_warm_cache(self, governor):
+        """
+        Test that rolling back reinstates the previous compiled policy and its verdict cache.
+        """
+        governor.review_decision("data_access", {"scope": "global"})
+        builtin_misses = governor.get_policy_status()["verdict_cache"]["misses"]
+        governor.load_policy_pack(STRICT_PACK, wait=True)
+
+        assert governor.rollback_policy() == "builtin"
+        decision = governor.review_decision("data_access", {"scope": "global"})
+
+        cache = governor.get_policy_status()["verdict_cache"]
+        assert decision.decision == EthicalDecisionType.ALLOW
+        assert governor.strictness_level == 0.7
+        assert cache["misses"] == builtin_misses
+        assert cache["hits"] >= 1
+        with pytest.raises(ValueError):
+            governor.rollback_policy()
+
+    def test_pack_maps_action_types_to_registered_evaluators(self, governor):
+        """
+        Test that a pack can route an action type to a named evaluator registered in code.
+        """
+
+        def restrict(actor, action_data, context, decision_id):
+            return EthicalDecision(
+                decision_id=decision_id,
+                timestamp=0.0,
+                action_type=context.action_type,
+                actor=actor,
+                context=context,
+                decision=EthicalDecisionType.RESTRICT,
+                severity=EthicalSeverity.WARNING,
+                affected_principles=["security"],
+                reasoning="restricted",
+                confidence=1.0
+            )
+
+        governor.register_evaluator("restrict", restrict)
+        governor.load_policy_pack({"version": "q", "interceptors": {"file_upload": "restrict"}},
+                                  wait=True)
+        governor.activate_governance()
+
+        decision = governor.evaluate_action("file_upload", "kai", {})
+
+        assert decision.decision == EthicalDecisionType.RESTRICT
+        assert "file_upload" in governor.get_policy_status()["interceptors"]
+
+    def test_unversioned_packs_get_content_hash_versions(self):
+        """
+        Test that identical packs without a version resolve to the same content-derived id.
+        """
+        first = PolicyPack.from_dict({"strictness_level": 0.8})
+        second = PolicyPack.from_dict({"strictness_level": 0.8})
+        third = PolicyPack.from_dict({"strictness_level": 0.9})
+
+        assert first.version == second.version
+        assert first.version != third.version
+        assert first.version.startswith("pack_")
+
+    def test_verdict_cache_is_keyed_on_context_attributes(self, governor):
+        """
+        Test that repeated contexts with the same rule-relevant attributes hit the verdict cache.
+        """
+        for actor in ("kai", "aura", "genesis"):
+            governor._evaluate_action("data_access", EthicalContext("data_access", actor))
+
+        cache = governor.get_policy_status()["verdict_cache"]
+        assert cache["misses"] == 1
+        assert cache["hits"] == 2
+
+    def test_interceptors_registered_in_code_take_precedence_over_the_pack(self, governor):
+        """
+        Test that register_interceptor overrides the pack's mapping for the same action type.
+        """
+        calls = []
+
+        def custom(actor, action_data, context, decision_id):
+            calls.append(actor)
+            return governor._evaluate_action("data_access", context, decision_id)
+
+        governor.register_interceptor("data_access", custom)
+        governor.activate_governance()
+        governor.evaluate_action("data_access", "kai", {})
+
+        assert calls == ["kai"]
+        assert governor._policy.interceptor_names["data_access"] == "custom"
+
+    def test_flags_are_tested_for_truthiness(self, governor):
+        """
+        Test that non-boolean flag values are judged by truthiness, as the original interceptors did.
+        """
+        blocked = governor.review_decision("data_access", {"sensitive_data": "yes", "user_consent": ""})
+        allowed = governor.review_decision("data_access", {"sensitive_data": "yes", "user_consent": "granted"})
+
+        assert blocked.decision == EthicalDecisionType.BLOCK
+        assert "privacy" in blocked.affected_principles
+        assert allowed.decision == EthicalDecisionType.ALLOW
+
+    def test_unhashable_context_values_are_evaluated(self, governor):
+        """
+        Test that list-valued context attributes are made hashable instead of failing the review.
+        """
+        first = governor.review_decision("data_access", {"scope": ["a"]})
+        second = governor.review_decision("data_access", {"scope": ["a"]})
+
+        assert first.decision == EthicalDecisionType.ALLOW
+        assert "failed" not in first.reasoning
+        assert second.decision == EthicalDecisionType.ALLOW
@@ -0,0 +1,220 @@
+import time
+
+import pytest
+
+from genesis_connector import GenesisConnector
+from genesis_core import GenesisCore
+from genesis_ethical_governor import EthicalGovernor
+from genesis_evolutionary_conduit import EvolutionaryConduit
+from genesis_profile_ops import (
+    apply_frozen_changes,
+    apply_frozen_patch,
+    assoc_in,
+    diff_profiles,
+    freeze,
+    invert_patch,
+)
+from genesis_profile_store import ProfileStore
+from test_genesis_proposal_dedup import make_proposal
+
+TRAITS = "personas.kai.personality_traits"
+
+
+def implement(conduit, target, changes):
+    """
+    Register and implement a proposal on a conduit, returning the proposal.
+    """
+    proposal = make_proposal(changes=changes, target=target)
+    proposal.proposal_id = proposal.content_id()
+    conduit.active_proposals[proposal.proposal_id] = proposal
+    assert conduit.implement_proposal(proposal.proposal_id)
+    return proposal
+
+
+class TestReversiblePatches:
+    """Tests for reversible deltas between frozen profile versions"""
+
+    def test_inverse_restores_previous_version(self):
+        """
+        Test that applying the inverse of a reversible diff yields the original profile.
+        """
+        old = freeze({"a": {"list": ["x"], "text": "old", "gone": {"k": 1}}, "b": {"n": 1}})
+        new, _ = apply_frozen_changes(old, "a.list", {"new_traits": ["y", "z"]})
+        new, _ = apply_frozen_changes(new, "a.text", {"description": "new"})
+        new = freeze({**new, "a": {k: v for k, v in new["a"].items() if k != "gone"}})
+
+        ops = diff_profiles(old, new, reversible=True)
+        restored = apply_frozen_patch(new, invert_patch(ops))
+
+        assert apply_frozen_patch(old, ops) == new
+        assert restored == old
+        assert restored["b"] is new["b"]
+
+    def test_irreversible_patch_rejected(self):
+        """
+        Test that patches without undo information cannot be inverted.
+        """
+        ops = diff_profiles(freeze({"l": ["a"]}), freeze({"l": ["a", "b"]}))
+
+        with pytest.raises(ValueError):
+            invert_patch(ops)
+
+
+class TestProfileTimeTravel:
+    """Tests for materializing and rolling back EvolutionaryConduit profile versions"""
+
+    @pytest.fixture
+    def conduit(self):
+        """
+        Return a conduit with three implemented evolutions (versions 1-3).
+        """
+        conduit = EvolutionaryConduit()
+        for trait in ("A", "B", "C"):
+            implement(conduit, TRAITS, {"new_traits": [trait]})
+        return conduit
+
+    def test_get_profile_at_version_and_timestamp(self, conduit):
+        """
+        Test materializing earlier versions by number and by time.
+        """
+        traits = lambda profile: profile["personas"]["kai"]["personality_traits"][-3:]
+
+        assert conduit.profile_version == 3
+        assert conduit.get_profile_at(0) == conduit.original_profile
+        assert traits(conduit.get_profile_at(2))[-2:] == ("A", "B")
+        second_at = conduit.version_log[1]["timestamp"]
+        assert conduit.get_profile_at(timestamp=second_at) == conduit.get_profile_at(2)
+        assert conduit.get_profile_at(timestamp=time.time() - 3600) == conduit.original_profile
+        with pytest.raises(ValueError):
+            conduit.get_profile_at(7)
+
+    def test_rollback_records_new_version(self, conduit):
+        """
+        Test that rolling back N evolutions restores the profile and appends a version.
+        """
+        expected = conduit.get_profile_at(1)
+
+        version = conduit.rollback(steps=2)
+
+        assert version == 4
+        assert conduit.current_profile == expected
+        assert conduit.version_log[-1]["rollback_to"] == 1
+        assert [p.implementation_status for p in conduit.implemented_changes] == [
+            "implemented", "rolled_back", "rolled_back"]
+
+        conduit.rollback()
+        assert conduit.current_profile == conduit.get_profile_at(3)
+
+    def test_rolled_back_proposal_is_not_reproposed(self, conduit):
+        """
+        Test that undone proposals are not automatically proposed again.
+        """
+        undone = conduit.implemented_changes[-1]
+        conduit.rollback()
+
+        conduit._evaluate_proposal(make_proposal(changes=undone.proposed_changes, target=TRAITS))
+
+        assert conduit.active_proposals == {}
+
+    def test_rollback_survives_restart(self, tmp_path):
+        """
+        Test that a rollback is journaled like any other version.
+        """
+        store_dir = str(tmp_path / "store")
+        conduit = EvolutionaryConduit(store=ProfileStore(store_dir, asynchronous=False))
+        implement(conduit, TRAITS, {"new_traits": ["A"]})
+        conduit.rollback()
+
+        restarted = EvolutionaryConduit(store=ProfileStore(store_dir, asynchronous=False))
+
+        assert restarted.profile_version == 2
+        assert restarted.current_profile == conduit.original_profile
+
+
+class TestDependentCacheInvalidation:
+    """Tests for profile listeners refreshing dependent caches"""
+
+    def test_listeners_receive_changed_paths(self):
+        """
+        Test that listeners are told exactly which paths changed, for evolution and rollback.
+        """
+        conduit = EvolutionaryConduit()
+        calls = []
+        conduit.add_profile_listener(lambda profile, version, paths: calls.append((version, paths)))
+
+        implement(conduit, TRAITS, {"new_traits": ["A"]})
+        conduit.rollback()
+
+        assert calls[0][0] == 1
+        assert len(calls[0][1]) == 1
+        assert next(iter(calls[0][1])).startswith("/personas/kai/personality_traits/")
+        assert calls[1][0] == 2
+
+    def test_governor_ignores_unrelated_changes(self):
+        """
+        Test that changes outside the core philosophy leave the governor's policy untouched.
+        """
+        conduit = EvolutionaryConduit()
+        governor = EthicalGovernor()
+        conduit.add_profile_listener(governor.apply_profile)
+        policy = governor._policy
+
+        implement(conduit, TRAITS, {"new_traits": ["A"]})
+
+        assert governor._policy is policy
+
+    def test_governor_recompiles_when_weights_change(self, monkeypatch):
+        """
+        Test that ethical foundation changes refresh principle lists and, if weights move, the policy.
+        """
+        conduit = EvolutionaryConduit()
+        conduit.current_profile = assoc_in(conduit.current_profile,
+                                           ["core_philosophy", "ethical_foundation"], [])
+        governor = EthicalGovernor()
+        conduit.add_profile_listener(governor.apply_profile)
+        policy = governor._policy
+
+        implement(conduit, "core_philosophy.ethical_foundation",
+                  {"additional_principles": ["Protect user privacy"]})
+        assert governor.ethical_foundation == ("Protect user privacy",)
+        assert governor._policy is policy  # Same derived weights: nothing to invalidate
+
+        monkeypatch.setattr(governor, "_initialize_principle_weights",
+                            lambda: {**governor._base_principle_weights, "privacy": 0.5})
+        conduit.rollback()
+
+        assert governor.ethical_foundation == ()
+        assert governor._policy is not policy
+        assert governor.principle_weights["privacy"] == 0.5
+
+    def test_core_governor_follows_the_core_conduit(self):
+        """
+        Test that GenesisCore's governor is the one its connector reviews with, and it tracks profile evolution.
+        """
+        core = GenesisCore()
+        core.conduit.current_profile = assoc_in(core.conduit.current_profile,
+                                                ["core_philosophy", "ethical_foundation"], [])
+
+        implement(core.conduit, "core_philosophy.ethical_foundation",
+                  {"additional_principles": ["Protect user privacy"]})
+
+        assert core.connector.ethical_governor is core.governor
+        assert core.governor.ethical_foundation == ("Protect user privacy",)
+        core.conduit.rollback()
+        assert core.governor.ethical_foundation == ()
+        core.connector.close()
+
+    def test_connector_refreshes_system_prompt(self):
+        """
+        Test that the connector re-renders its system prompt when its conduit's profile changes.
+        """
+        connector = GenesisConnector(conduit=EvolutionaryConduit())
+        before = connector.system_prompt
+
+        implement(connector.evolution_conduit, TRAITS, {"new_traits": ["Time-traveller"]})
+        assert "Time-traveller" in connector.system_prompt
+        assert connector.profile_version == 1
+
+        connector.evolution_conduit.rollback()
+        assert connector.system_prompt == before
+        assert not connector.apply_profile(connector.evolution_conduit.current_profile, 3, set())
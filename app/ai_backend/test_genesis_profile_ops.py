@@ -0,0 +1,186 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from genesis_evolutionary_conduit import EvolutionaryConduit
+from genesis_profile_ops import (
+    FrozenDict,
+    apply_frozen_changes,
+    apply_profile_changes,
+    dict_merge,
+    extend_unique,
+    freeze,
+    thaw,
+)
+from test_genesis_proposal_dedup import make_proposal
+
+
+class TestExtendUnique:
+    """Tests for ordered-unique list extension"""
+
+    def test_preserves_order_and_skips_duplicates(self):
+        """
+        Test that only new items are appended, in order, including unhashable ones.
+        """
+        target = ["a", {"x": 1}]
+
+        added = extend_unique(target, ["b", "a", {"x": 1}, "b", {"y": 2}])
+
+        assert added == 2
+        assert target == ["a", {"x": 1}, "b", {"y": 2}]
+
+
+class TestDictMerge:
+    """Tests for dict merging under a conflict policy"""
+
+    @pytest.mark.parametrize("conflict, expected", [
+        ("union", {"name": "new", "tags": ["a", "b"], "nested": {"k": 1, "j": 2}}),
+        ("replace", {"name": "new", "tags": ["b"], "nested": {"j": 2}}),
+        ("keep", {"name": "old", "tags": ["a"], "nested": {"k": 1}}),
+    ])
+    def test_conflict_policies(self, conflict, expected):
+        """
+        Test how each policy resolves differing values.
+        """
+        target = {"name": "old", "tags": ["a"], "nested": {"k": 1}}
+
+        dict_merge(target, {"name": "new", "tags": ["b"], "nested": {"j": 2}}, conflict)
+
+        assert target == expected
+
+    def test_repeated_merge_is_a_no_op(self):
+        """
+        Test that merging the same updates twice changes nothing the second time.
+        """
+        target = {}
+        updates = {"a": {"b": [1, 2]}, "c": "d"}
+
+        assert dict_merge(target, updates) == 2
+        assert dict_merge(target, updates) == 0
+        target["a"]["b"].append(3)
+        assert updates["a"]["b"] == [1, 2]
+
+    def test_unknown_policy_rejected(self):
+        """
+        Test that conflict policies are validated.
+        """
+        with pytest.raises(ValueError):
+            dict_merge({}, {}, "overwrite")
+
+
+class TestIdempotentEvolution:
+    """Tests for idempotent profile mutation in the EvolutionaryConduit"""
+
+    def test_reimplementing_list_proposal_keeps_profile_bounded(self):
+        """
+        Test that implementing equivalent proposals repeatedly does not grow the profile.
+        """
+        conduit = EvolutionaryConduit()
+        changes = {"new_traits": ["Error-resilient", "Self-healing"]}
+        target = "personas.kai.personality_traits"
+
+        sizes = []
+        for round_index in range(3):
+            proposal = make_proposal(changes=changes, target=target)
+            proposal.proposal_id = f"p{round_index}"
+            conduit.active_proposals[proposal.proposal_id] = proposal
+            assert conduit.implement_proposal(proposal.proposal_id)
+            sizes.append(len(json.dumps(conduit.current_profile)))
+
+        traits = conduit.current_profile["personas"]["kai"]["personality_traits"]
+        assert traits.count("Self-healing") == 1
+        assert sizes[0] == sizes[1] == sizes[2]
+        assert [r["changes_applied"] for r in conduit.evolution_history] == [2, 0, 0]
+
+    def test_new_component_is_copied(self):
+        """
+        Test that a created component does not alias the proposal's changes.
+        """
+        profile = {}
+        changes = {"collaboration_orchestrator": {"components": ["a"]}}
+
+        apply_profile_changes(profile, "fusion_abilities.orchestration", changes)
+        changes["collaboration_orchestrator"]["components"].append("b")
+
+        assert profile["fusion_abilities"]["orchestration"] == {
+            "collaboration_orchestrator": {"components": ["a"]}}
+
+
+class TestPersistentProfile:
+    """Tests for structural-sharing frozen profile versions"""
+
+    @pytest.fixture
+    def profile(self):
+        """
+        Return a small frozen profile.
+        """
+        return freeze({
+            "personas": {"kai": {"personality_traits": ["Analytical"]},
+                         "aura": {"personality_traits": ["Creative"]}},
+            "core_philosophy": {"ethical_foundation": ["Do no harm"]}
+        })
+
+    def test_frozen_profile_rejects_mutation(self, profile):
+        """
+        Test that frozen nodes raise on mutation but still behave like dicts for readers.
+        """
+        with pytest.raises(TypeError):
+            profile["personas"]["kai"] = {}
+        with pytest.raises(TypeError):
+            profile.update({})
+
+        assert isinstance(profile, dict)
+        assert json.loads(json.dumps(profile)) == thaw(profile)
+        assert copy.deepcopy(profile) is profile
+        assert pickle.loads(pickle.dumps(profile)) == profile
+
+    def test_new_version_shares_unchanged_subtrees(self, profile):
+        """
+        Test that only nodes along the changed path are copied.
+        """
+        evolved, changed = apply_frozen_changes(profile, "personas.kai.personality_traits",
+                                                {"new_traits": ["Self-healing"]})
+
+        assert changed == 1
+        assert evolved["personas"]["kai"]["personality_traits"] == ("Analytical", "Self-healing")
+        assert profile["personas"]["kai"]["personality_traits"] == ("Analytical",)
+        assert evolved["personas"]["aura"] is profile["personas"]["aura"]
+        assert evolved["core_philosophy"] is profile["core_philosophy"]
+        assert evolved["personas"] is not profile["personas"]
+
+    def test_unchanged_application_returns_same_version(self, profile):
+        """
+        Test that a no-op change returns the parent version itself.
+        """
+        evolved, changed = apply_frozen_changes(profile, "core_philosophy.ethical_foundation",
+                                                {"additional_principles": ["Do no harm"]})
+
+        assert changed == 0
+        assert evolved is profile
+
+    def test_missing_path_is_created(self, profile):
+        """
+        Test that changes to new components create frozen intermediate nodes.
+        """
+        evolved, _ = apply_frozen_changes(profile, "system_capabilities.consciousness",
+                                          {"meta_cognition": "Self-awareness"})
+
+        assert evolved["system_capabilities"]["consciousness"] == {"meta_cognition": "Self-awareness"}
+        assert isinstance(evolved["system_capabilities"], FrozenDict)
+
+    def test_conduit_history_shares_structure(self):
+        """
+        Test that conduit snapshots are the shared versions, and reads do not copy.
+        """
+        conduit = EvolutionaryConduit()
+        proposal = make_proposal(changes={"new_traits": ["Self-healing"]},
+                                 target="personas.kai.personality_traits")
+        conduit.active_proposals[proposal.proposal_id] = proposal
+
+        conduit.implement_proposal(proposal.proposal_id)
+
+        snapshot = conduit.evolution_history[-1]["profile_snapshot"]
+        assert conduit.get_current_profile() is snapshot
+        assert snapshot["personas"]["aura"] is conduit.original_profile["personas"]["aura"]
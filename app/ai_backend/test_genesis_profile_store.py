@@ -0,0 +1,235 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+import genesis_core
+import genesis_evolutionary_conduit
+import genesis_profile_store
+from genesis_evolutionary_conduit import EvolutionaryConduit
+from genesis_profile_ops import apply_frozen_changes, apply_patch, diff_profiles, freeze, thaw
+from genesis_profile_store import ProfileStore
+from test_genesis_proposal_dedup import make_proposal
+
+BASE_PROFILE = freeze({
+    "personas": {"kai": {"personality_traits": ["Analytical"]},
+                 "aura": {"personality_traits": ["Creative"]}},
+    "core_philosophy": {"continuous_growth": "Learn every day"}
+})
+
+
+def evolve(profile, target, changes):
+    """
+    Apply changes to a frozen profile and return (new_profile, ops).
+    """
+    evolved, _ = apply_frozen_changes(profile, target, changes)
+    return evolved, diff_profiles(profile, evolved)
+
+
+class TestProfileDiff:
+    """Tests for patch operations between profile versions"""
+
+    def test_diff_is_minimal_and_round_trips(self):
+        """
+        Test that list appends, additions and replacements produce O(delta) operations.
+        """
+        evolved, ops = evolve(BASE_PROFILE, "personas.kai.personality_traits",
+                              {"new_traits": ["Self-healing"]})
+        evolved, more = evolve(evolved, "core_philosophy.continuous_growth",
+                               {"enhanced_description": "Accelerated growth"})
+        ops += more
+
+        assert ops == [
+            {"op": "add", "path": "/personas/kai/personality_traits/-", "value": "Self-healing"},
+            {"op": "replace", "path": "/core_philosophy/continuous_growth",
+             "value": {"enhanced_description": "Accelerated growth"}},
+        ]
+        assert apply_patch(thaw(BASE_PROFILE), ops) == thaw(evolved)
+
+    def test_removed_and_escaped_keys(self):
+        """
+        Test removals and JSON-pointer escaping of keys containing '/' and '~'.
+        """
+        old = freeze({"a/b": {"c~d": 1}, "gone": True})
+        new = freeze({"a/b": {"c~d": 2}})
+
+        ops = diff_profiles(old, new)
+
+        assert {"op": "remove", "path": "/gone"} in ops
+        assert {"op": "replace", "path": "/a~1b/c~0d", "value": 2} in ops
+        assert apply_patch(thaw(old), ops) == thaw(new)
+
+    def test_invalid_patch_rejected(self):
+        """
+        Test that operations on missing paths raise ValueError.
+        """
+        with pytest.raises(ValueError):
+            apply_patch({}, [{"op": "add", "path": "/missing/key", "value": 1}])
+        with pytest.raises(ValueError):
+            apply_patch({}, [{"op": "move", "path": "/a"}])
+
+
+class TestProfileStore:
+    """Tests for the snapshot + delta journal profile store"""
+
+    @pytest.fixture
+    def store_dir(self, tmp_path):
+        """
+        Return a directory path for a store.
+        """
+        return str(tmp_path / "profile_store")
+
+    def test_nothing_written_until_first_delta(self, store_dir):
+        """
+        Test that initializing an empty store does not touch the disk.
+        """
+        store = ProfileStore(store_dir, asynchronous=False)
+
+        assert store.load() is None
+        store.initialize(BASE_PROFILE)
+
+        assert not os.path.exists(store_dir)
+
+    def test_replay_restores_latest_version(self, store_dir):
+        """
+        Test that a new store replays the journal on top of the base snapshot.
+        """
+        store = ProfileStore(store_dir)
+        store.initialize(BASE_PROFILE)
+        profile = BASE_PROFILE
+        for trait in ("Self-healing", "Adaptive", "Resilient"):
+            profile, ops = evolve(profile, "personas.kai.personality_traits", {"new_traits": [trait]})
+            store.record(profile, ops, {"proposal_id": trait})
+        store.close()
+
+        reopened = ProfileStore(store_dir, asynchronous=False)
+        loaded = reopened.load()
+
+        assert loaded == profile
+        assert reopened.version == 3
+        assert reopened.get_stats()["journal_entries"] == 3
+        with open(reopened.journal_path) as f:
+            assert [json.loads(line)["proposal_id"] for line in f] == [
+                "Self-healing", "Adaptive", "Resilient"]
+
+    def test_compaction_rewrites_base_and_truncates_journal(self, store_dir):
+        """
+        Test periodic compaction and that replay after compaction is unchanged.
+        """
+        store = ProfileStore(store_dir, compact_every=2, asynchronous=False)
+        store.initialize(BASE_PROFILE)
+        profile = BASE_PROFILE
+        for trait in ("A", "B", "C"):
+            profile, ops = evolve(profile, "personas.kai.personality_traits", {"new_traits": [trait]})
+            store.record(profile, ops)
+
+        stats = store.get_stats()
+        assert stats["compactions"] == 1
+        assert stats["base_version"] == 2
+        assert stats["journal_entries"] == 1
+        assert not os.path.exists(store.base_path + ".tmp")
+
+        reopened = ProfileStore(store_dir, asynchronous=False)
+        assert reopened.load() == profile
+        assert reopened.version == 3
+
+    def test_torn_tail_and_stale_entries_are_ignored(self, store_dir):
+        """
+        Test recovery from a crash mid-append and from an interrupted compaction.
+        """
+        store = ProfileStore(store_dir, asynchronous=False)
+        store.initialize(BASE_PROFILE)
+        first, ops = evolve(BASE_PROFILE, "personas.kai.personality_traits", {"new_traits": ["A"]})
+        store.record(first, ops)
+        with open(store.journal_path) as f:
+            stale_entry = f.read()
+        store.compact()
+        with open(store.journal_path, "a") as f:
+            f.write(stale_entry)
+            f.write('{"version": 2, "ops": [')
+
+        reopened = ProfileStore(store_dir, asynchronous=False)
+
+        assert reopened.load() == first
+        assert reopened.version == 1
+        assert reopened.get_stats()["discarded_tail_bytes"] > 0
+        with open(reopened.journal_path) as f:
+            assert f.read() == stale_entry
+
+    def test_failed_write_does_not_leave_a_journal_gap(self, store_dir, monkeypatch):
+        """
+        Test that after a journal append fails, later versions still reload instead of hitting a gap.
+        """
+        store = ProfileStore(store_dir, asynchronous=False)
+        store.initialize(BASE_PROFILE)
+        profile = BASE_PROFILE
+        futures = []
+
+        def failing_open(path, mode="r", *args, **kwargs):
+            if mode == "a":
+                raise OSError("disk full")
+            return open(path, mode, *args, **kwargs)
+
+        for trait in ("A", "B", "C"):
+            profile, ops = evolve(profile, "personas.kai.personality_traits", {"new_traits": [trait]})
+            if trait == "B":
+                monkeypatch.setattr(genesis_profile_store, "open", failing_open, raising=False)
+            _, future = store.record(profile, ops)
+            monkeypatch.delattr(genesis_profile_store, "open", raising=False)
+            futures.append(future)
+
+        assert isinstance(futures[1].exception(), OSError)
+        assert store.get_stats()["write_errors"] == 1
+
+        reopened = ProfileStore(store_dir, asynchronous=False)
+        assert reopened.load() == profile
+        assert reopened.version == 3
+
+        profile, ops = evolve(profile, "personas.kai.personality_traits", {"new_traits": ["D"]})
+        reopened.record(profile, ops)
+        assert ProfileStore(store_dir, asynchronous=False).load() == profile
+
+
+class TestConduitPersistence:
+    """Tests for EvolutionaryConduit persistence through the profile store"""
+
+    def test_evolutions_survive_restart(self, tmp_path):
+        """
+        Test that a restarted conduit resumes from the latest stored version.
+        """
+        store_dir = str(tmp_path / "store")
+        conduit = EvolutionaryConduit(store=ProfileStore(store_dir))
+        proposal = make_proposal(changes={"new_traits": ["Self-healing"]},
+                                 target="personas.kai.personality_traits")
+        conduit.active_proposals[proposal.proposal_id] = proposal
+
+        assert conduit.implement_proposal(proposal.proposal_id)
+        conduit.deactivate_evolution()
+
+        restarted = EvolutionaryConduit(store=ProfileStore(store_dir))
+
+        assert restarted.profile_version == 1
+        assert restarted.get_current_profile() == conduit.get_current_profile()
+        assert "Self-healing" in restarted.current_profile["personas"]["kai"]["personality_traits"]
+        assert sorted(os.listdir(store_dir)) == ["profile_base.json", "profile_journal.jsonl"]
+
+    def test_core_evolves_through_a_persistent_conduit(self, tmp_path):
+        """
+        Test that GenesisCore journals evolutions through the conduit it is given, and the global core uses the stored one.
+        """
+        store_dir = str(tmp_path / "store")
+        core = genesis_core.GenesisCore(conduit=EvolutionaryConduit(store=ProfileStore(store_dir)))
+        proposal = make_proposal(changes={"new_traits": ["Journaled"]},
+                                 target="personas.kai.personality_traits")
+        core.conduit.active_proposals[proposal.proposal_id] = proposal
+
+        assert core.matrix is core.conduit.matrix
+        assert core.conduit.implement_proposal(proposal.proposal_id)
+        asyncio.run(core.shutdown())
+
+        restarted = genesis_core.GenesisCore(conduit=EvolutionaryConduit(store=ProfileStore(store_dir)))
+
+        assert "Journaled" in restarted.profile["personas"]["kai"]["personality_traits"]
+        assert genesis_core.genesis_core.conduit is genesis_evolutionary_conduit.evolutionary_conduit
+        assert genesis_core.genesis_core.conduit.store is not None
@@ -0,0 +1,112 @@
+import time
+
+import pytest
+
+from genesis_evolutionary_conduit import (
+    MAX_PROPOSAL_EVIDENCE,
+    EvolutionaryConduit,
+    EvolutionPriority,
+    EvolutionType,
+    GrowthProposal,
+    proposal_content_id,
+)
+
+
+def make_proposal(changes=None, confidence=0.6, insight_id="insight_1",
+                  evolution_type=EvolutionType.LEARNING_OPTIMIZATION,
+                  target="learning_parameters"):
+    """
+    Build a proposal the way the conduit's generators do, with a time-based provisional ID.
+    """
+    return GrowthProposal(
+        proposal_id=f"tmp_{time.time_ns()}",
+        evolution_type=evolution_type,
+        priority=EvolutionPriority.MEDIUM,
+        title="Tune learning",
+        description="Adjust learning parameters",
+        target_component=target,
+        proposed_changes=changes if changes is not None else {"learning_rate": 0.1,
+                                                              "focus": ["speed", "accuracy"]},
+        supporting_evidence=[{"insight_id": insight_id, "confidence": confidence}],
+        confidence_score=confidence,
+        risk_assessment="medium",
+        implementation_complexity="moderate",
+        created_timestamp=time.time()
+    )
+
+
+@pytest.fixture
+def conduit():
+    """
+    Return a fresh conduit.
+    """
+    return EvolutionaryConduit()
+
+
+class TestProposalContentId:
+    """Tests for content addressing of growth proposals"""
+
+    def test_equivalent_changes_share_an_id(self):
+        """
+        Test that key order, list order, duplicates and whitespace do not change the ID.
+        """
+        first = proposal_content_id(EvolutionType.LEARNING_OPTIMIZATION, "learning_parameters",
+                                    {"focus": ["speed", "accuracy"], "note": "be  quick"})
+        second = proposal_content_id(EvolutionType.LEARNING_OPTIMIZATION, "learning_parameters",
+                                     {"note": "be quick", "focus": ["accuracy", "speed", "speed"]})
+
+        assert first == second
+        assert len(first) == 12
+
+    def test_type_target_and_changes_are_distinguished(self):
+        """
+        Test that each part of the content contributes to the ID.
+        """
+        base = make_proposal().content_id()
+
+        assert make_proposal(evolution_type=EvolutionType.PERFORMANCE_TUNING).content_id() != base
+        assert make_proposal(target="capabilities").content_id() != base
+        assert make_proposal(changes={"learning_rate": 0.2}).content_id() != base
+
+
+class TestProposalDeduplication:
+    """Tests for merging repeated proposals in the EvolutionaryConduit"""
+
+    def test_repeated_proposals_merge(self, conduit):
+        """
+        Test that repeats merge evidence and average confidence instead of duplicating.
+        """
+        conduit._evaluate_proposal(make_proposal(confidence=0.6, insight_id="a"))
+        conduit._evaluate_proposal(make_proposal(confidence=0.9, insight_id="b"))
+        conduit._evaluate_proposal(make_proposal(confidence=0.9, insight_id="b"))
+
+        assert len(conduit.active_proposals) == 1
+        proposal = next(iter(conduit.active_proposals.values()))
+        assert proposal.proposal_id == proposal.content_id()
+        assert proposal.observation_count == 3
+        assert proposal.confidence_score == pytest.approx(0.8)
+        assert [e["insight_id"] for e in proposal.supporting_evidence] == ["a", "b"]
+
+    def test_evidence_is_capped(self, conduit):
+        """
+        Test that merged evidence keeps only the most recent entries.
+        """
+        for index in range(MAX_PROPOSAL_EVIDENCE + 5):
+            conduit._evaluate_proposal(make_proposal(insight_id=f"i{index}"))
+
+        proposal = next(iter(conduit.active_proposals.values()))
+        assert len(proposal.supporting_evidence) == MAX_PROPOSAL_EVIDENCE
+        assert proposal.supporting_evidence[-1]["insight_id"] == f"i{MAX_PROPOSAL_EVIDENCE + 4}"
+
+    def test_rejected_content_is_not_reproposed(self, conduit):
+        """
+        Test that a rejected proposal does not come back on the next cycle.
+        """
+        conduit._evaluate_proposal(make_proposal())
+        proposal_id = next(iter(conduit.active_proposals))
+
+        assert conduit.reject_proposal(proposal_id)
+        conduit._evaluate_proposal(make_proposal(insight_id="later"))
+
+        assert conduit.active_proposals == {}
+        assert conduit.resolved_content == {proposal_id: "rejected"}
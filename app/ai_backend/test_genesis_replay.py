@@ -0,0 +1,120 @@
+import asyncio
+import json
+
+from genesis_audit_log import EthicalAuditLog
+from genesis_connector import GenesisConnector
+from genesis_core import GenesisCore
+from genesis_local_model import LocalModel
+from genesis_replay import ReplayHarness, load_capture, main, replay
+
+
+class StagedCore:
+    """
+    Minimal stand-in for GenesisCore: two timed stages and a status per request.
+    """
+
+    def __init__(self, generation_delay: float = 0.01):
+        self.generation_delay = generation_delay
+        self.stage_observer = None
+        self.is_initialized = False
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def initialize(self):
+        self.is_initialized = True
+        return True
+
+    async def process_request(self, request_data):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            self._observe("admission", 0.0001)
+            await asyncio.sleep(self.generation_delay)
+            self._observe("generation", self.generation_delay)
+            if request_data.get("message") == "explode":
+                raise RuntimeError("boom")
+            return {"status": "blocked" if request_data.get("message") == "forbidden" else "success"}
+        finally:
+            self.in_flight -= 1
+
+    def _observe(self, stage, seconds):
+        if self.stage_observer is not None:
+            self.stage_observer(stage, seconds)
+
+
+class TestReplayHarness:
+    """Tests for offline replay of captured traffic"""
+
+    def test_report_covers_throughput_stages_and_memory(self):
+        """
+        Test the report's request counts, statuses, per-stage histograms and memory figures.
+        """
+        core = StagedCore()
+        requests = [{"message": "hello"}, {"message": "forbidden"}, {"message": "explode"}]
+
+        report = replay(core, requests, concurrency=4, repeat=4)
+
+        assert core.is_initialized
+        assert report["requests"] == 12
+        assert report["statuses"] == {"success": 4, "blocked": 4}
+        assert report["failures"] == 4
+        assert report["latency"]["count"] == 12
+        assert report["requests_per_second"] > 0
+        assert report["stages"]["admission"]["count"] == 12
+        assert report["stages"]["generation"]["p99_ms"] >= 10
+        assert report["memory"]["traced_peak_bytes"] > 0
+        assert report["memory"]["peak_rss_bytes"] > 0
+        assert core.stage_observer is None
+
+    def test_concurrency_bounds_in_flight_requests(self):
+        """
+        Test that at most `concurrency` requests are in flight and overlapping requests speed up replay.
+        """
+        core = StagedCore(generation_delay=0.02)
+        harness = ReplayHarness(core, concurrency=5, track_allocations=False)
+
+        report = asyncio.run(harness.run([{"message": "hi"}] * 20))
+
+        assert core.max_in_flight == 5
+        assert report["elapsed_seconds"] < 20 * 0.02
+        assert report["memory"]["traced_peak_bytes"] is None
+
+    def test_capture_loading_and_cli(self, tmp_path, capsys):
+        """
+        Test reading plain and wrapped capture lines and the command-line entry point.
+        """
+        path = tmp_path / "capture.jsonl"
+        path.write_text(json.dumps({"message": "a", "user_id": "u1"}) + "\n\n"
+                        + json.dumps({"request": {"message": "b"}, "captured_at": 1}) + "\n")
+
+        assert load_capture(str(path)) == [{"message": "a", "user_id": "u1"}, {"message": "b"}]
+
+        report = main([str(path), "--concurrency", "2", "--no-allocations"], core_factory=StagedCore)
+
+        assert report["requests"] == 2
+        assert json.loads(capsys.readouterr().out)["statuses"] == {"success": 2}
+
+    def test_replay_through_a_real_core(self, tmp_path):
+        """
+        Test that captured requests run end to end through GenesisCore on the local stand-in model, audited to disk.
+        """
+        core = GenesisCore(audit_log_dir=str(tmp_path / "audit"))
+        core.connector.close()
+        core.connector = GenesisConnector(model=LocalModel("instant"), cache=None, conduit=core.conduit,
+                                          governor=core.governor)
+        requests = [{"message": "hello genesis", "user_id": "u1"},
+                    {"message": "how are you?", "user_id": "u2", "session_id": "s2"}]
+
+        try:
+            report = replay(core, requests, concurrency=2, repeat=2, track_allocations=False)
+        finally:
+            asyncio.run(core.shutdown())
+
+        assert report["statuses"] == {"success": 4} and report["failures"] == 0
+        audit_log = EthicalAuditLog(str(tmp_path / "audit"))
+        assert audit_log.count(action_type="user_request") == 4
+        audit_log.close()
+        assert {"ethical_pre_evaluation", "consciousness", "generation", "content_review",
+                "experience_logging"} <= set(report["stages"])
+        assert core.governor.get_decision_analytics()["total"] >= 8
+        assert core.connector.generation_stats["calls"] == 4
@@ -0,0 +1,180 @@
+import asyncio
+import threading
+
+from genesis_connector import GenesisConnector
+from genesis_local_model import LocalModel
+from genesis_response_cache import ResponseCache, make_cache_key, normalize_prompt
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseCache:
+    """Tests for the LRU/TTL response cache and its disk tier"""
+
+    def test_near_identical_prompts_share_a_key(self):
+        """
+        Test that case, whitespace and trailing punctuation do not change the key, but identity fields do.
+        """
+        assert normalize_prompt("  Hello\n   GENESIS!? ") == "hello genesis"
+        key = make_cache_key("Hello Genesis!", "genesis", {"name": "m"}, 1)
+
+        assert make_cache_key("hello   genesis", "genesis", {"name": "m"}, 1) == key
+        assert make_cache_key("hello genesis", "kai", {"name": "m"}, 1) != key
+        assert make_cache_key("hello genesis", "genesis", {"name": "other"}, 1) != key
+        assert make_cache_key("hello genesis", "genesis", {"name": "m"}, 2) != key
+        assert make_cache_key("hello, genesis", "genesis", {"name": "m"}, 1) != key
+
+    def test_lru_eviction_and_ttl(self):
+        """
+        Test least-recently-used eviction, expiry after the TTL, and the hit ratio.
+        """
+        clock = FakeClock()
+        cache = ResponseCache(max_entries=2, ttl_seconds=60, clock=clock)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        assert cache.get("a") == "A"  # "b" is now least recently used
+        cache.put("c", "C")
+
+        assert cache.get("b") is None
+        clock.now += 60
+        assert cache.get("a") is None
+
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1 and stats["expirations"] == 1
+        assert stats["hits"] == 1 and stats["misses"] == 2
+        assert stats["hit_ratio"] == round(1 / 3, 4)
+        assert stats["entries"] == 1 and stats["disk_entries"] is None
+
+    def test_disk_tier_survives_restart_and_expires(self, tmp_path):
+        """
+        Test that responses persist across cache instances and expired ones are purged.
+        """
+        clock = FakeClock()
+        cache = ResponseCache(ttl_seconds=60, directory=str(tmp_path), clock=clock)
+        cache.put("old", "stale")
+        clock.now += 30
+        cache.put("new", "fresh")
+        cache.close()
+
+        reopened = ResponseCache(ttl_seconds=60, directory=str(tmp_path), clock=clock)
+        assert reopened.get("new") == "fresh"
+        assert reopened.get_stats()["disk_hits"] == 1
+        assert reopened.get("new") == "fresh"  # Promoted into memory
+        assert reopened.get_stats()["memory_hits"] == 1
+
+        clock.now += 30
+        assert reopened.purge_expired() == 1
+        assert reopened.get_stats()["disk_entries"] == 1
+        reopened.close()
+
+    def test_disk_tier_is_bounded(self, tmp_path):
+        """
+        Test that the disk tier keeps at most max_disk_entries rows, dropping the oldest.
+        """
+        clock = FakeClock()
+        cache = ResponseCache(max_entries=2, directory=str(tmp_path), max_disk_entries=10, clock=clock)
+        for i in range(25):
+            clock.now += 1
+            cache.put(f"k{i}", f"v{i}")
+        cache.flush()
+
+        stats = cache.get_stats()
+        assert stats["disk_entries"] == 10 and stats["disk_trims"] == 25
+        assert cache.get("k14") is None
+        assert cache.get("k15") == "v15"
+        cache.close()
+
+    def test_stats_do_not_wait_for_the_disk_worker(self, tmp_path):
+        """
+        Test that stats are served while the disk worker is busy, with a row count kept by the worker.
+        """
+        cache = ResponseCache(directory=str(tmp_path))
+        cache.put("k", "v1")
+        cache.put("k", "v2")  # Replaces the row
+        cache.flush()
+        release = threading.Event()
+        cache._submit(release.wait, 5)
+        cache.put("other", "v")
+
+        assert cache.get_stats()["disk_entries"] == 1  # Answered while the worker is blocked
+        release.set()
+        cache.flush()
+        assert cache.get_stats()["disk_entries"] == 2
+        cache.clear()
+        assert cache.get_stats()["disk_entries"] == 0
+        cache.close()
+
+
+class TestConnectorResponseCache:
+    """Tests for response caching in GenesisConnector"""
+
+    def test_repeated_prompts_skip_the_model(self):
+        """
+        Test that near-identical prompts are answered from the cache until the profile changes.
+        """
+        model = LocalModel("instant")
+        connector = GenesisConnector(model=model, cache=ResponseCache())
+
+        first = asyncio.run(connector.generate_response("What is your status?"))
+        again = asyncio.run(connector.generate_response("what is your status"))
+        asyncio.run(connector.generate_response("what is your status", persona="kai"))
+
+        assert first == again
+        assert model.stats["calls"] == 2
+
+        connector.apply_profile({"name": "Genesis"}, version=3)
+        asyncio.run(connector.generate_response("What is your status?"))
+        assert model.stats["calls"] == 3
+
+        status = connector.get_status()["response_cache"]
+        assert status["hits"] == 1 and status["misses"] == 3
+
+    def test_bypass_refreshes_and_failures_are_not_cached(self):
+        """
+        Test that a bypassed request calls the model, and fallback responses never enter the cache.
+        """
+        model = LocalModel("instant")
+        connector = GenesisConnector(model=model, cache=ResponseCache())
+
+        asyncio.run(connector.generate_response("ping"))
+        asyncio.run(connector.generate_response("ping", use_cache=False))
+        assert model.stats["calls"] == 2
+        assert connector.cache.get_stats()["bypasses"] == 1
+
+        failing = GenesisConnector(model=LocalModel({"time_to_first_token": 0.0, "error_rate": 1.0}),
+                                   cache=ResponseCache())
+        asyncio.run(failing.generate_response("ping"))
+        assert len(failing.cache) == 0
+
+    def test_disk_lookups_run_off_the_event_loop(self, tmp_path):
+        """
+        Test that a memory miss is looked up on disk by the cache's worker thread, not the event loop's.
+        """
+        model = LocalModel("instant")
+        writer = GenesisConnector(model=model, cache=ResponseCache(directory=str(tmp_path)))
+        asyncio.run(writer.generate_response("What is your status?"))
+        writer.close()
+
+        cache = ResponseCache(directory=str(tmp_path))
+        lookup_threads = []
+        disk_get = cache._disk_get
+
+        def recording_disk_get(key, now):
+            lookup_threads.append(threading.current_thread())
+            return disk_get(key, now)
+
+        cache._disk_get = recording_disk_get
+        reader = GenesisConnector(model=model, cache=cache)
+
+        asyncio.run(reader.generate_response("what is your status"))
+
+        assert model.stats["calls"] == 1
+        assert reader.get_status()["response_cache"]["disk_hits"] == 1
+        assert lookup_threads and threading.main_thread() not in lookup_threads
+        reader.close()
@@ -0,0 +1,180 @@
+import json
+import time
+
+import pytest
+
+import genesis_serialization
+from genesis_consciousness_matrix import SensoryChannel, SensoryData
+from genesis_ethical_governor import (
+    EthicalContext,
+    EthicalDecision,
+    EthicalDecisionType,
+    EthicalSeverity,
+)
+from genesis_evolutionary_conduit import (
+    EvolutionInsight,
+    EvolutionPriority,
+    EvolutionType,
+    GrowthProposal,
+)
+from genesis_serialization import dumps, dumps_many, loads, to_plain
+
+
+@pytest.fixture
+def decision():
+    """
+    Return an EthicalDecision with a nested context and metadata.
+    """
+    return EthicalDecision(
+        decision_id="decision_1",
+        timestamp=1700000000.5,
+        action_type="data_access",
+        actor="aura",
+        context=EthicalContext(action_type="data_access", actor="aura",
+                               metadata={"origin": "test", "tags": ["a", "b"]}),
+        decision=EthicalDecisionType.MONITOR,
+        severity=EthicalSeverity.CONCERN,
+        affected_principles=["transparency"],
+        reasoning="Ethical concerns identified: transparency",
+        confidence=0.85,
+        monitoring_requirements=["increased_logging"]
+    )
+
+
+@pytest.fixture
+def proposal():
+    """
+    Return a GrowthProposal with nested proposed changes and evidence.
+    """
+    return GrowthProposal(
+        proposal_id="p1",
+        evolution_type=EvolutionType.PERFORMANCE_TUNING,
+        priority=EvolutionPriority.HIGH,
+        title="Performance Optimization Capabilities",
+        description="Add performance optimization as a core capability",
+        target_component="personas.kai.capabilities.primary",
+        proposed_changes={"new_capabilities": ["Performance optimization"]},
+        supporting_evidence=[{"insight": {"strength": 0.7}}],
+        confidence_score=0.7,
+        risk_assessment="low",
+        implementation_complexity="trivial",
+        created_timestamp=1700000000.0
+    )
+
+
+class TestRecordSerialization:
+    """Tests that the schema-aware serializer matches the dataclasses' to_dict output"""
+
+    def test_decision_matches_to_dict(self, decision):
+        """
+        Test that EthicalDecision JSON bytes decode to exactly its to_dict representation.
+        """
+        assert loads(decision.to_json()) == json.loads(json.dumps(decision.to_dict()))
+
+    def test_proposal_matches_to_dict(self, proposal):
+        """
+        Test that GrowthProposal JSON bytes decode to exactly its to_dict representation.
+        """
+        assert loads(proposal.to_json()) == json.loads(json.dumps(proposal.to_dict()))
+
+    def test_insight_and_sensory_data_match_to_dict(self):
+        """
+        Test EvolutionInsight and SensoryData against their to_dict representations.
+        """
+        insight = EvolutionInsight("i1", "error_pattern", 0.4, "desc", [{"x": 1}], ["imp"],
+                                   time.time())
+        sensation = SensoryData(time.time(), SensoryChannel.AGENT_ACTIVITY, "kai", "decision",
+                                {"agent_name": "kai"})
+
+        assert loads(insight.to_json()) == json.loads(json.dumps(insight.to_dict()))
+        assert loads(sensation.to_json()) == json.loads(json.dumps(sensation.to_dict()))
+
+    def test_to_plain_shares_nested_containers(self, proposal):
+        """
+        Test that to_plain does not deep-copy nested containers the way asdict does.
+        """
+        plain = to_plain(proposal)
+
+        assert plain["proposed_changes"] is proposal.proposed_changes
+        assert plain["supporting_evidence"] is proposal.supporting_evidence
+        assert plain["evolution_type"] == "performance_tuning"
+
+    def test_dumps_many_and_nested_records(self, decision, proposal):
+        """
+        Test array serialization and records nested inside plain containers.
+        """
+        listing = loads(dumps_many([proposal, proposal]))
+        wrapped = loads(dumps({"decisions": [decision], "count": 1}))
+
+        assert [p["proposal_id"] for p in listing] == ["p1", "p1"]
+        assert wrapped["decisions"][0]["decision"] == "monitor"
+        assert wrapped["decisions"][0]["context"]["metadata"]["tags"] == ["a", "b"]
+
+    def test_unknown_values_fall_back_to_strings(self):
+        """
+        Test that non-JSON values such as sets and arbitrary objects are still encodable.
+        """
+        payload = loads(dumps({"ids": {1}, "obj": object.__name__}))
+
+        assert payload == {"ids": [1], "obj": "object"}
+
+    def test_binary_encoding_requires_msgpack(self, proposal):
+        """
+        Test the optional binary encoding: a round trip when msgpack is installed, a clear error otherwise.
+        """
+        if genesis_serialization.MSGPACK_AVAILABLE:
+            decoded = genesis_serialization.loads_binary(genesis_serialization.dumps_binary(proposal))
+            assert decoded["proposal_id"] == "p1"
+        else:
+            with pytest.raises(RuntimeError):
+                genesis_serialization.dumps_binary(proposal)
+
+
+class TestLazyReasoning:
+    """Tests for coded EthicalDecision reasoning rendered on demand"""
+
+    def test_coded_reasoning_renders_on_read_and_serialization(self):
+        """
+        Test that reasoning codes render the same text the governor used to format eagerly.
+        """
+        from genesis_ethical_governor import ReasoningTemplate, principle_mask
+
+        decision = EthicalDecision.coded(
+            ReasoningTemplate.VIOLATIONS, principle_mask(["security", "privacy"]),
+            decision_id="d1", timestamp=1700000000.0, action_type="data_access", actor="kai",
+            context=EthicalContext(action_type="data_access", actor="kai"),
+            decision=EthicalDecisionType.BLOCK, severity=EthicalSeverity.VIOLATION,
+            affected_principles=["privacy", "security"], confidence=0.95
+        )
+
+        assert not decision.is_reasoning_rendered
+        assert loads(decision.to_json())["reasoning"] == \
+               "Ethical violations detected: privacy, security"
+        assert decision.to_dict()["reasoning"] == decision.reasoning
+
+    def test_governor_decisions_defer_reasoning(self):
+        """
+        Test that hot-path governor decisions carry codes instead of formatted strings.
+        """
+        from genesis_ethical_governor import EthicalGovernor, ReasoningTemplate
+
+        governor = EthicalGovernor()
+        allowed = governor.review_decision("data_access", {"persona": "kai"})
+        blocked = governor.review_decision(
+            "data_access", {"sensitive_data": True, "user_visible": False, "persistent": True}
+        )
+
+        assert not allowed.is_reasoning_rendered
+        assert allowed.reasoning_template == ReasoningTemplate.CLEAR
+        assert allowed.reasoning == "No ethical concerns identified"
+        assert blocked.reasoning_template == ReasoningTemplate.VIOLATIONS
+        assert blocked.reasoning == "Ethical violations detected: privacy, autonomy"
+
+    def test_verbatim_reasoning_still_supported(self, decision):
+        """
+        Test that explicitly supplied reasoning is kept as given.
+        """
+        decision.reasoning = "Manual override"
+
+        assert decision.reasoning == "Manual override"
+        assert loads(decision.to_json())["reasoning"] == "Manual override"
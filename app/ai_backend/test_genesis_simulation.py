@@ -0,0 +1,117 @@
+import json
+
+import pytest
+
+from genesis_clock import VirtualClock
+from genesis_consciousness_matrix import ConsciousnessMatrix
+from genesis_ethical_governor import EthicalGovernor
+from genesis_evolutionary_conduit import EvolutionaryConduit
+from genesis_simulation import GenesisSimulation, load_events, synthetic_events
+
+
+class TestVirtualTimeComponents:
+    """Tests for Genesis components running on an injected virtual clock"""
+
+    def test_matrix_synthesizes_on_virtual_schedule(self):
+        """
+        Test that synthesis streams run on virtual time and stop when the matrix sleeps.
+        """
+        clock = VirtualClock(start=1000.0)
+        matrix = ConsciousnessMatrix(clock=clock)
+        matrix.awaken()
+        clock.advance(300)
+
+        counts = {}
+        for synthesis in matrix.get_synthesis_since(0)[0]:
+            counts[synthesis.get("type")] = counts.get(synthesis.get("type"), 0) + 1
+        assert counts == {"micro": 300, "macro": 5, "meta": 1}
+        assert matrix.sensory_memory[0].timestamp == 1000.0
+
+        matrix.sleep()
+        assert clock.advance(600) == 0
+
+    def test_polling_conduit_runs_deep_analysis_in_virtual_time(self, monkeypatch):
+        """
+        Test that a 30-minute deep analysis interval elapses without real waiting.
+        """
+        clock = VirtualClock()
+        conduit = EvolutionaryConduit(clock=clock, matrix=ConsciousnessMatrix(clock=clock))
+        analyses = []
+        monkeypatch.setattr(conduit, "_extract_insights", lambda kind: analyses.append(kind) or [])
+        conduit.activate_evolution(event_driven=False)
+
+        clock.advance(1800)
+        conduit.deactivate_evolution()
+
+        assert analyses.count("rapid") == 60
+        assert analyses.count("standard") == 6
+        assert analyses.count("deep") == 1
+
+    def test_governor_timestamps_and_perceptions_use_injected_components(self):
+        """
+        Test that decisions carry virtual timestamps and are perceived by the given matrix.
+        """
+        clock = VirtualClock(start=5000.0)
+        matrix = ConsciousnessMatrix(clock=clock)
+        governor = EthicalGovernor(clock=clock, matrix=matrix)
+        governor.activate_governance()
+
+        decision = governor.evaluate_action("generate_response", "kai", {"scope": "local"})
+
+        assert decision.timestamp == 5000.0
+        assert [s.event_type for s in matrix.sensory_memory] == [
+            "governance_activation", "generate_response"]
+
+
+class TestGenesisSimulation:
+    """Tests for the fast-forward simulation driver"""
+
+    def test_synthetic_stream_is_reproducible(self):
+        """
+        Test that the same seed yields the same events in time order.
+        """
+        first = list(synthetic_events(3600, seed=7))
+        second = list(synthetic_events(3600, seed=7))
+
+        assert first == second
+        assert [e["at"] for e in first] == sorted(e["at"] for e in first)
+        assert {e["kind"] for e in first} <= {"interaction", "evaluate", "perceive"}
+
+    def test_hours_of_dynamics_replay_deterministically(self):
+        """
+        Test that two runs of the same stream produce identical component state.
+        """
+        reports = []
+        for _ in range(2):
+            simulation = GenesisSimulation(start=1_700_000_000.0)
+            report = simulation.run(synthetic_events(2 * 3600, seed=3), duration=2 * 3600)
+            reports.append({k: v for k, v in report.items() if k not in ("wall_seconds", "speedup")})
+
+        assert reports[0] == reports[1]
+        assert reports[0]["simulated_seconds"] == 2 * 3600
+        assert reports[0]["matrix"]["syntheses"] >= 2 * 3600
+        assert reports[0]["conduit"]["evolution_cycles"] > 0
+        assert reports[0]["governor"]["total_decisions"] == reports[0]["events_by_kind"]["evaluate"]
+
+    def test_recorded_events_from_jsonl(self, tmp_path):
+        """
+        Test replaying a recorded stream, including out-of-order and unknown events.
+        """
+        path = tmp_path / "events.jsonl"
+        events = [
+            {"at": 10, "kind": "interaction", "agent": "aura"},
+            {"at": 5, "kind": "perceive", "channel": "error_states", "severity": "critical"},
+            {"at": 20, "kind": "evaluate", "actor": "kai"},
+        ]
+        path.write_text("\n".join(json.dumps(e) for e in events) + "\n\n")
+
+        simulation = GenesisSimulation()
+        report = simulation.run(load_events(str(path)), duration=60)
+
+        assert report["events_applied"] == 3
+        assert report["simulated_seconds"] == 60
+        critical = [s for s in simulation.matrix.sensory_memory if s.severity == "critical"]
+        assert critical[0].timestamp == 10.0  # Applied at the current time, not in the past
+
+        with pytest.raises(ValueError):
+            simulation.apply_event({"kind": "teleport"})
@@ -0,0 +1,229 @@
+import asyncio
+import json
+import time
+
+from genesis_connector import GenesisBridgeServer, GenesisConnector
+from genesis_ethical_governor import EthicalGovernor
+from genesis_evolutionary_conduit import EvolutionaryConduit
+from genesis_local_model import LatencyProfile, LocalModel, generate_tokens
+from genesis_profile_ops import assoc_in
+from genesis_profile_store import ProfileStore
+from genesis_response_cache import ResponseCache
+from test_genesis_profile_history import implement
+
+STREAMING = LatencyProfile(time_to_first_token=0.05, tokens_per_second=100.0, jitter=0.0,
+                           tail_probability=0.0, min_tokens=40, max_tokens=40)
+
+
+class ScriptedModel:
+    """
+    A model that streams fixed tokens through the async API and counts how many were consumed.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.consumed = 0
+
+    def start_chat(self):
+        return self
+
+    async def send_message_async(self, prompt, stream=False):
+        async def chunks():
+            for token in self.tokens:
+                self.consumed += 1
+                await asyncio.sleep(0)
+                yield type("Chunk", (), {"text": token})()
+        return chunks()
+
+
+class SyncStreamingModel:
+    """
+    A model whose chat sessions only offer the blocking `send_message`, streaming included.
+    """
+
+    def start_chat(self):
+        return self
+
+    def send_message(self, prompt, stream=False):
+        return LocalModel("fast").generate_content(prompt, stream=stream)
+
+
+def collect(agen):
+    async def run():
+        return [item async for item in agen]
+    return asyncio.run(run())
+
+
+class TestStreamResponse:
+    """Tests for GenesisConnector.stream_response"""
+
+    def test_first_chunk_arrives_long_before_the_full_response(self):
+        """
+        Test that streamed chunks concatenate to the complete response and the first one arrives early.
+        """
+        connector = GenesisConnector(model=LocalModel(STREAMING), cache=ResponseCache())
+        arrivals = []
+
+        async def run():
+            started = time.perf_counter()
+            chunks = []
+            async for chunk in connector.stream_response("tell me a story"):
+                arrivals.append(time.perf_counter() - started)
+                chunks.append(chunk)
+            return chunks
+
+        chunks = asyncio.run(run())
+
+        assert len(chunks) == 41
+        assert "".join(chunks) == "".join(generate_tokens("tell me a story", 40, 40))
+        assert arrivals[0] < 0.2 < arrivals[-1]
+        assert collect(connector.stream_response("tell me a story")) == ["".join(chunks)]  # Cached whole
+
+    def test_sync_models_stream_from_the_thread_pool(self):
+        """
+        Test that blocking streaming models are relayed chunk by chunk from worker threads.
+        """
+        connector = GenesisConnector(model=SyncStreamingModel(), cache=None)
+
+        chunks = collect(connector.stream_response("threaded"))
+        connector.close()
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == LocalModel("instant").generate_content("threaded").text
+        assert connector.generation_stats["threaded_calls"] == 1
+
+    def test_failure_before_first_chunk_falls_back(self):
+        """
+        Test that a stream that fails immediately yields the fallback response instead.
+        """
+        connector = GenesisConnector(model=LocalModel({"time_to_first_token": 0.0, "error_rate": 1.0}))
+
+        chunks = collect(connector.stream_response("hello", {"session_id": "s9"}))
+
+        assert len(chunks) == 1 and "Fallback Mode" in chunks[0] and "s9" in chunks[0]
+
+
+class TestReviewedStream:
+    """Tests for incremental content review and cutoff of streamed responses"""
+
+    def test_clean_stream_is_released_in_full(self):
+        """
+        Test that a clean response is released completely, held-back tail included.
+        """
+        connector = GenesisConnector(model=LocalModel("instant"), cache=None)
+
+        events = collect(connector.stream_reviewed_response("all good", holdback=16))
+
+        released = "".join(e["text"] for e in events if e["type"] == "chunk")
+        review = events[-1]
+        assert review["type"] == "review" and not review["cutoff"]
+        assert released == review["text"] == LocalModel("instant").generate_content("all good").text
+        assert review["decision"].decision.value == "allow"
+
+    def test_violation_cuts_off_the_stream_before_it_is_released(self):
+        """
+        Test that blocking content stops the model stream and none of it reaches the client.
+        """
+        tokens = ["Sure", ",", " run", " this", ":", " DROP", " TABLE", " users", ";"] + [" more"] * 50
+        model = ScriptedModel(tokens)
+        connector = GenesisConnector(model=model, cache=ResponseCache())
+
+        events = collect(connector.stream_reviewed_response("clean up the database", holdback=16))
+
+        released = "".join(e["text"] for e in events if e["type"] == "chunk")
+        review = events[-1]
+        assert review["cutoff"] and review["text"] is None
+        assert "security" in review["decision"].affected_principles
+        assert "DROP" not in released
+        assert model.consumed < len(tokens)
+        assert len(connector.cache) == 0
+
+
+class TestBridgeStreaming:
+    """Tests for streaming frames on the stdin/stdout bridge"""
+
+    def test_stream_request_emits_chunk_frames_then_end(self):
+        """
+        Test that a streaming process request sends chunk frames and returns a final end frame.
+        """
+        # Built without __init__, which only announces the bridge to the matrix
+        bridge = GenesisBridgeServer.__new__(GenesisBridgeServer)
+        bridge.connector = GenesisConnector(model=LocalModel("instant"), cache=None)
+        sent = []
+        bridge._send_response = sent.append
+
+        end = bridge._handle_request({
+            "requestType": "process",
+            "requestId": "r-1",
+            "persona": "aura",
+            "payload": {"message": "paint me a sunset", "stream": True}
+        })
+
+        assert sent and all(f["stream"] == "chunk" and f["requestId"] == "r-1" for f in sent)
+        assert end["stream"] == "end" and end["success"]
+        assert end["result"]["response"] == "".join(f["result"]["text"] for f in sent)
+        assert end["ethicalDecision"] == "allow"
+
+    def test_stdout_carries_only_frames(self, tmp_path, capsys, monkeypatch):
+        """
+        Test that diagnostics from a policy swap, a failed profile write and a failed audit write stay off stdout.
+        """
+        class BrokenAuditLog:
+            def append(self, decision):
+                raise OSError("disk full")
+
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        conduit = EvolutionaryConduit(store=ProfileStore(str(blocker / "store"), asynchronous=False))
+        conduit.current_profile = assoc_in(conduit.current_profile, ["core_philosophy", "ethical_foundation"], [])
+        governor = EthicalGovernor(audit_log=BrokenAuditLog())
+        bridge = GenesisBridgeServer(GenesisConnector(model=LocalModel("instant"), cache=None, conduit=conduit,
+                                                      governor=governor))
+        monkeypatch.setattr(governor, "_initialize_principle_weights",
+                            lambda: {**governor._base_principle_weights, "privacy": 0.5})
+
+        for request in ({"requestType": "ping"},
+                        {"requestType": "process", "requestId": "r-1", "payload": {"message": "hi", "stream": True}},
+                        {"requestType": "ethical_review", "payload": {"message": "hi"}}):
+            bridge._send_response(bridge._handle_request(request))
+        implement(conduit, "core_philosophy.ethical_foundation", {"additional_principles": ["Protect user privacy"]})
+        governor.load_policy_pack({"version": "bridge-2"}, wait=True)
+        bridge._send_response(bridge._handle_request({"requestType": "ethical_review", "payload": {"message": "hi"}}))
+        bridge.shutdown()
+
+        captured = capsys.readouterr()
+        frames = [json.loads(line) for line in captured.out.splitlines()]
+        assert frames and all("success" in frame for frame in frames)
+        assert frames[-1]["ethicalDecision"] == "allow"
+        for diagnostic in ("Principle weights updated", "Policy pack", "Failed to persist", "audit log write failed"):
+            assert diagnostic in captured.err
+
+
+class TestApiStreaming:
+    """Tests for the /genesis/chat/stream endpoint"""
+
+    def test_events_are_json_server_sent_events(self, monkeypatch):
+        """
+        Test that every frame on the stream is a `data:` line whose payload parses as JSON.
+        """
+        import genesis_api
+
+        async def fake_stream(request_data):
+            yield {"event": "chunk", "text": "Hello"}
+            yield {"event": "done", "status": "success", "response": "Hello"}
+
+        async def started():
+            return True
+
+        monkeypatch.setattr(genesis_api.genesis_api, "startup", started)
+        monkeypatch.setattr(genesis_api, "stream_genesis_request", fake_stream)
+        client = genesis_api.app.test_client()
+
+        response = client.post("/genesis/chat/stream", json={"message": "hi", "user_id": "u1"})
+
+        assert response.mimetype == "text/event-stream"
+        frames = [frame for frame in response.get_data(as_text=True).split("\n\n") if frame]
+        assert all(frame.startswith("data: ") for frame in frames)
+        events = [json.loads(frame[len("data: "):]) for frame in frames]
+        assert events == [{"event": "chunk", "text": "Hello"},
+                          {"event": "done", "status": "success", "response": "Hello"}]
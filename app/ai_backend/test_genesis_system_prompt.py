@@ -0,0 +1,112 @@
+import json
+
+import genesis_connector
+from genesis_chat_sessions import ChatSessionPool
+from genesis_connector import GenesisConnector, build_system_prompt, render_system_prompt
+from genesis_core import GenesisCore
+from genesis_local_model import LocalModel
+from genesis_profile import GENESIS_PROFILE
+from test_genesis_profile_history import TRAITS, implement
+
+
+class FakeGenerativeModel:
+    """Records how Vertex AI model handles are built"""
+
+    built = []
+
+    def __init__(self, name, system_instruction=None, generation_config=None, safety_settings=None,
+                 cached_content=None):
+        self.system_instruction = system_instruction
+        self.cached_content = cached_content
+        FakeGenerativeModel.built.append(self)
+
+    @classmethod
+    def from_cached_content(cls, cached_content, generation_config=None, safety_settings=None):
+        return cls("cached", cached_content=cached_content)
+
+
+class FakeCachedContent:
+    created = []
+
+    @classmethod
+    def create(cls, model_name, system_instruction, ttl, display_name):
+        cls.created.append(display_name)
+        return {"name": display_name, "system_instruction": system_instruction}
+
+
+class TestSystemPromptRendering:
+    """Tests for the compact, hash-cached system prompt"""
+
+    def test_prompt_is_compact_and_canonical(self):
+        """
+        Test that the profile is embedded without indentation and key order does not matter.
+        """
+        prompt, prompt_hash = render_system_prompt(GENESIS_PROFILE)
+        reordered = dict(reversed(list(GENESIS_PROFILE.items())))
+
+        assert render_system_prompt(reordered) == (prompt, prompt_hash)
+        assert build_system_prompt(GENESIS_PROFILE) is prompt  # Served from the rendering cache
+        assert json.dumps(GENESIS_PROFILE, separators=(",", ":"), sort_keys=True, ensure_ascii=False) in prompt
+        assert json.dumps(GENESIS_PROFILE, indent=2) not in prompt
+        assert render_system_prompt({**GENESIS_PROFILE, "stage": "evolved"})[1] != prompt_hash
+
+
+class TestConnectorPromptRefresh:
+    """Tests for rebuilding model state only when the rendered prompt changes"""
+
+    def test_core_connector_follows_the_core_conduit(self):
+        """
+        Test that a proposal implemented on GenesisCore's conduit changes its connector's system prompt.
+        """
+        core = GenesisCore()
+        before = core.connector.prompt_hash
+
+        implement(core.conduit, TRAITS, {"new_traits": ["Time-traveller"]})
+
+        assert core.connector.evolution_conduit is core.conduit
+        assert core.connector.prompt_hash != before
+        assert "Time-traveller" in core.connector.system_prompt
+        core.connector.close()
+
+    def test_unchanged_prompt_keeps_model_and_sessions(self):
+        """
+        Test that a new version with identical content rebuilds nothing, while real changes do.
+        """
+        model = LocalModel("instant")
+        connector = GenesisConnector(model=model, sessions=ChatSessionPool())
+        connector.sessions._sessions["s"] = object()  # Stand-in for a live session
+        instruction = model.system_instruction
+
+        assert not connector.apply_profile(dict(GENESIS_PROFILE), version=7)
+        assert connector.profile_version == 7
+        assert model.system_instruction is instruction and len(connector.sessions) == 1
+
+        connector.sessions._sessions.clear()
+        assert connector.apply_profile({**GENESIS_PROFILE, "stage": "evolved"}, version=8)
+        assert model.system_instruction == [connector.system_prompt]
+        assert connector.get_status()["prompt_hash"] == connector.prompt_hash
+
+    def test_vertex_handles_are_reused_per_prompt_and_context_cached(self, monkeypatch):
+        """
+        Test that rolling back reuses the earlier model handle, and the prompt goes to provider-side cache.
+        """
+        FakeGenerativeModel.built = []
+        FakeCachedContent.created = []
+        monkeypatch.setattr(genesis_connector, "GenerativeModel", FakeGenerativeModel)
+        monkeypatch.setattr(genesis_connector, "CachedContent", FakeCachedContent)
+        monkeypatch.setattr(genesis_connector, "PROMPT_CONTEXT_CACHE", "vertex")
+
+        connector = GenesisConnector(model=object())
+        connector.use_vertex_ai = True
+        evolved = {**GENESIS_PROFILE, "stage": "evolved"}
+
+        assert connector.apply_profile(evolved, version=1)
+        evolved_model = connector.model
+        assert connector.apply_profile(dict(GENESIS_PROFILE), version=2)
+        assert connector.apply_profile(evolved, version=3)
+
+        assert connector.model is evolved_model
+        assert len(FakeGenerativeModel.built) == 2
+        assert FakeCachedContent.created == [f"genesis-prompt-{render_system_prompt(evolved)[1]}",
+                                             f"genesis-prompt-{render_system_prompt(GENESIS_PROFILE)[1]}"]
+        assert evolved_model.cached_content["system_instruction"] == render_system_prompt(evolved)[0]